@@ -46,6 +46,9 @@ API Reference
 # Imports should also be placed in `if TYPE_CHECKING` blocks if they are only used as type
 # hints - again, to avoid circular dependencies.
 # Once those issues are resolved, the below can be sorted with isort.
+import importlib as _importlib
+from typing import TYPE_CHECKING, Any, List
+
 import dunamai as _dunamai
 
 from .config_observation import (
@@ -80,56 +83,6 @@ from .sources.concurrent_source.concurrent_source import ConcurrentSource
 from .sources.concurrent_source.concurrent_source_adapter import ConcurrentSourceAdapter
 from .sources.config import BaseConfig
 from .sources.connector_state_manager import ConnectorStateManager
-from .sources.declarative.auth import DeclarativeOauth2Authenticator
-from .sources.declarative.auth.declarative_authenticator import DeclarativeAuthenticator, NoAuth
-from .sources.declarative.auth.oauth import DeclarativeSingleUseRefreshTokenOauth2Authenticator
-from .sources.declarative.auth.token import (
-    ApiKeyAuthenticator,
-    BasicHttpAuthenticator,
-    BearerAuthenticator,
-)
-from .sources.declarative.datetime.min_max_datetime import MinMaxDatetime
-from .sources.declarative.declarative_stream import DeclarativeStream
-from .sources.declarative.decoders import Decoder, JsonDecoder
-from .sources.declarative.exceptions import ReadException
-from .sources.declarative.extractors import DpathExtractor, RecordSelector
-from .sources.declarative.extractors.record_extractor import RecordExtractor
-from .sources.declarative.extractors.record_filter import RecordFilter
-from .sources.declarative.incremental import DatetimeBasedCursor
-from .sources.declarative.interpolation import InterpolatedBoolean, InterpolatedString
-from .sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
-from .sources.declarative.migrations.legacy_to_per_partition_state_migration import (
-    LegacyToPerPartitionStateMigration,
-)
-from .sources.declarative.partition_routers import (
-    CartesianProductStreamSlicer,
-    SinglePartitionRouter,
-    SubstreamPartitionRouter,
-)
-from .sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
-from .sources.declarative.requesters import HttpRequester, Requester
-from .sources.declarative.requesters.error_handlers import BackoffStrategy
-from .sources.declarative.requesters.paginators import DefaultPaginator, PaginationStrategy
-from .sources.declarative.requesters.paginators.strategies import (
-    CursorPaginationStrategy,
-    OffsetIncrement,
-    PageIncrement,
-    StopConditionPaginationStrategyDecorator,
-)
-from .sources.declarative.requesters.request_option import RequestOption, RequestOptionType
-from .sources.declarative.requesters.request_options.default_request_options_provider import (
-    DefaultRequestOptionsProvider,
-)
-from .sources.declarative.requesters.request_options.interpolated_request_input_provider import (
-    InterpolatedRequestInputProvider,
-)
-from .sources.declarative.requesters.requester import HttpMethod
-from .sources.declarative.retrievers import SimpleRetriever
-from .sources.declarative.schema import JsonFileSchemaLoader
-from .sources.declarative.transformations.add_fields import AddedFieldDefinition, AddFields
-from .sources.declarative.transformations.transformation import RecordTransformation
-from .sources.declarative.types import FieldPointer
-from .sources.declarative.yaml_declarative_source import YamlDeclarativeSource
 from .sources.message import InMemoryMessageRepository, MessageRepository
 from .sources.source import TState
 from .sources.streams.availability_strategy import AvailabilityStrategy
@@ -141,6 +94,7 @@ from .sources.streams.call_rate import (
     LimiterSession,
     MovingWindowCallRatePolicy,
     Rate,
+    TokenBucketCallRatePolicy,
 )
 from .sources.streams.checkpoint import Cursor as LegacyCursor
 from .sources.streams.checkpoint import ResumableFullRefreshCursor
@@ -187,6 +141,122 @@ from .utils.oneof_option_config import OneOfOptionConfig
 from .utils.spec_schema_transformations import resolve_refs
 from .utils.stream_status_utils import as_airbyte_message
 
+# The declarative framework, and the pydantic models and pandas it depends on, take longer to import than the rest of the CDK. Its
+# classes are imported on first access so that connectors which do not use it, and commands such as `spec`, start faster.
+_LAZY_IMPORTS = {
+    "DeclarativeOauth2Authenticator": "airbyte_cdk.sources.declarative.auth",
+    "DeclarativeAuthenticator": "airbyte_cdk.sources.declarative.auth.declarative_authenticator",
+    "NoAuth": "airbyte_cdk.sources.declarative.auth.declarative_authenticator",
+    "DeclarativeSingleUseRefreshTokenOauth2Authenticator": "airbyte_cdk.sources.declarative.auth.oauth",
+    "ApiKeyAuthenticator": "airbyte_cdk.sources.declarative.auth.token",
+    "BasicHttpAuthenticator": "airbyte_cdk.sources.declarative.auth.token",
+    "BearerAuthenticator": "airbyte_cdk.sources.declarative.auth.token",
+    "MinMaxDatetime": "airbyte_cdk.sources.declarative.datetime.min_max_datetime",
+    "DeclarativeStream": "airbyte_cdk.sources.declarative.declarative_stream",
+    "Decoder": "airbyte_cdk.sources.declarative.decoders",
+    "JsonDecoder": "airbyte_cdk.sources.declarative.decoders",
+    "ReadException": "airbyte_cdk.sources.declarative.exceptions",
+    "DpathExtractor": "airbyte_cdk.sources.declarative.extractors",
+    "RecordSelector": "airbyte_cdk.sources.declarative.extractors",
+    "RecordExtractor": "airbyte_cdk.sources.declarative.extractors.record_extractor",
+    "RecordFilter": "airbyte_cdk.sources.declarative.extractors.record_filter",
+    "DatetimeBasedCursor": "airbyte_cdk.sources.declarative.incremental",
+    "InterpolatedBoolean": "airbyte_cdk.sources.declarative.interpolation",
+    "InterpolatedString": "airbyte_cdk.sources.declarative.interpolation",
+    "ManifestDeclarativeSource": "airbyte_cdk.sources.declarative.manifest_declarative_source",
+    "LegacyToPerPartitionStateMigration": "airbyte_cdk.sources.declarative.migrations.legacy_to_per_partition_state_migration",
+    "CartesianProductStreamSlicer": "airbyte_cdk.sources.declarative.partition_routers",
+    "SinglePartitionRouter": "airbyte_cdk.sources.declarative.partition_routers",
+    "SubstreamPartitionRouter": "airbyte_cdk.sources.declarative.partition_routers",
+    "ParentStreamConfig": "airbyte_cdk.sources.declarative.partition_routers.substream_partition_router",
+    "HttpRequester": "airbyte_cdk.sources.declarative.requesters",
+    "Requester": "airbyte_cdk.sources.declarative.requesters",
+    "BackoffStrategy": "airbyte_cdk.sources.declarative.requesters.error_handlers",
+    "DefaultPaginator": "airbyte_cdk.sources.declarative.requesters.paginators",
+    "PaginationStrategy": "airbyte_cdk.sources.declarative.requesters.paginators",
+    "CursorPaginationStrategy": "airbyte_cdk.sources.declarative.requesters.paginators.strategies",
+    "OffsetIncrement": "airbyte_cdk.sources.declarative.requesters.paginators.strategies",
+    "PageIncrement": "airbyte_cdk.sources.declarative.requesters.paginators.strategies",
+    "StopConditionPaginationStrategyDecorator": "airbyte_cdk.sources.declarative.requesters.paginators.strategies",
+    "RequestOption": "airbyte_cdk.sources.declarative.requesters.request_option",
+    "RequestOptionType": "airbyte_cdk.sources.declarative.requesters.request_option",
+    "DefaultRequestOptionsProvider": "airbyte_cdk.sources.declarative.requesters.request_options.default_request_options_provider",
+    "InterpolatedRequestInputProvider": "airbyte_cdk.sources.declarative.requesters.request_options.interpolated_request_input_provider",
+    "HttpMethod": "airbyte_cdk.sources.declarative.requesters.requester",
+    "SimpleRetriever": "airbyte_cdk.sources.declarative.retrievers",
+    "JsonFileSchemaLoader": "airbyte_cdk.sources.declarative.schema",
+    "AddedFieldDefinition": "airbyte_cdk.sources.declarative.transformations.add_fields",
+    "AddFields": "airbyte_cdk.sources.declarative.transformations.add_fields",
+    "RecordTransformation": "airbyte_cdk.sources.declarative.transformations.transformation",
+    "FieldPointer": "airbyte_cdk.sources.declarative.types",
+    "YamlDeclarativeSource": "airbyte_cdk.sources.declarative.yaml_declarative_source",
+}
+
+if TYPE_CHECKING:
+    from .sources.declarative.auth import DeclarativeOauth2Authenticator
+    from .sources.declarative.auth.declarative_authenticator import DeclarativeAuthenticator, NoAuth
+    from .sources.declarative.auth.oauth import DeclarativeSingleUseRefreshTokenOauth2Authenticator
+    from .sources.declarative.auth.token import (
+        ApiKeyAuthenticator,
+        BasicHttpAuthenticator,
+        BearerAuthenticator,
+    )
+    from .sources.declarative.datetime.min_max_datetime import MinMaxDatetime
+    from .sources.declarative.declarative_stream import DeclarativeStream
+    from .sources.declarative.decoders import Decoder, JsonDecoder
+    from .sources.declarative.exceptions import ReadException
+    from .sources.declarative.extractors import DpathExtractor, RecordSelector
+    from .sources.declarative.extractors.record_extractor import RecordExtractor
+    from .sources.declarative.extractors.record_filter import RecordFilter
+    from .sources.declarative.incremental import DatetimeBasedCursor
+    from .sources.declarative.interpolation import InterpolatedBoolean, InterpolatedString
+    from .sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+    from .sources.declarative.migrations.legacy_to_per_partition_state_migration import (
+        LegacyToPerPartitionStateMigration,
+    )
+    from .sources.declarative.partition_routers import (
+        CartesianProductStreamSlicer,
+        SinglePartitionRouter,
+        SubstreamPartitionRouter,
+    )
+    from .sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
+    from .sources.declarative.requesters import HttpRequester, Requester
+    from .sources.declarative.requesters.error_handlers import BackoffStrategy
+    from .sources.declarative.requesters.paginators import DefaultPaginator, PaginationStrategy
+    from .sources.declarative.requesters.paginators.strategies import (
+        CursorPaginationStrategy,
+        OffsetIncrement,
+        PageIncrement,
+        StopConditionPaginationStrategyDecorator,
+    )
+    from .sources.declarative.requesters.request_option import RequestOption, RequestOptionType
+    from .sources.declarative.requesters.request_options.default_request_options_provider import (
+        DefaultRequestOptionsProvider,
+    )
+    from .sources.declarative.requesters.request_options.interpolated_request_input_provider import (
+        InterpolatedRequestInputProvider,
+    )
+    from .sources.declarative.requesters.requester import HttpMethod
+    from .sources.declarative.retrievers import SimpleRetriever
+    from .sources.declarative.schema import JsonFileSchemaLoader
+    from .sources.declarative.transformations.add_fields import AddedFieldDefinition, AddFields
+    from .sources.declarative.transformations.transformation import RecordTransformation
+    from .sources.declarative.types import FieldPointer
+    from .sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(_importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # Availability strategy
     "AvailabilityStrategy",
@@ -287,6 +357,7 @@ __all__ = [
     "Rate",
     "SingleUseRefreshTokenOauth2Authenticator",
     "TokenAuthenticator",
+    "TokenBucketCallRatePolicy",
     "UserDefinedBackoffException",
     # Logger
     "AirbyteLogFormatter",
@@ -17,6 +17,7 @@ source-declarative-manifest spec
 from __future__ import annotations
 
 import json
+import os
 import pkgutil
 import sys
 import traceback
@@ -43,6 +44,7 @@ from airbyte_cdk.sources.declarative.concurrent_declarative_source import (
 )
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
 from airbyte_cdk.sources.source import TState
+from airbyte_cdk.utils.constants import ENV_MANIFEST_CACHE_PATH
 from airbyte_cdk.utils.datetime_helpers import ab_datetime_now
 
 
@@ -231,6 +233,25 @@ def _parse_inputs_into_config_catalog_state(
     return config, catalog, state
 
 
+def _default_manifest_cache_path() -> str | None:
+    """
+    Return a directory in the cache directory of the current user. A directory shared with other users, such as the system temp directory,
+    would let them provide manifests that are not validated.
+    """
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = str(Path.home() / ".cache")
+        except RuntimeError:
+            # The home directory of the user can't be determined
+            return None
+    return str(Path(cache_home) / "airbyte-manifest-cache")
+
+
 def run() -> None:
     args: list[str] = sys.argv[1:]
+    # Every command validates and resolves the same manifest so the result is cached across the runs of the connector
+    manifest_cache_path = _default_manifest_cache_path()
+    if manifest_cache_path:
+        os.environ.setdefault(ENV_MANIFEST_CACHE_PATH, manifest_cache_path)
     handle_command(args)
@@ -3,8 +3,14 @@
 #
 
 
-from collections import defaultdict
-from typing import Dict, Iterable, List, Tuple
+import hashlib
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from cachetools import LRUCache
 
 from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
 from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk, DocumentProcessor
@@ -21,9 +27,17 @@ class Writer:
     * The embedder embeds the chunks
     * The indexer deletes old chunks by the associated record id before indexing the new ones
 
+    The three steps run as a pipeline: while a batch is embedded and indexed in the background, the next one is read and processed.
+    Each (namespace, stream) group of a batch is embedded as a separate task, at most max_concurrent_embedding_requests at a time.
+    Batches are indexed one after the other in the order they were read, so deletes and upserts are applied in the same order as without the pipeline.
+    Reading blocks once max_pending_batches batches are waiting to be indexed, and every state message waits for all batches to be indexed before it is emitted.
+
     The destination connector is responsible to create a writer instance and pass the input messages iterable to the write method.
     The batch size can be configured by the destination connector to give the freedom of either letting the user configure it or hardcoding it to a sensible value depending on the destination.
+    A batch is also flushed once flush_interval_seconds have passed since its first chunk, which is checked whenever a record is read.
     The omit_raw_text parameter can be used to omit the raw text from the chunks. This can be useful if the raw text is very large and not needed for the destination.
+    The embedding_cache_size parameter enables an LRU cache of embeddings keyed by the hash of the chunk text, so that chunks with unchanged text are not embedded again.
+    It must not be used with embedders that do not compute the embedding from the chunk text, such as the FromFieldEmbedder.
     """
 
     def __init__(
@@ -33,18 +47,35 @@ class Writer:
         embedder: Embedder,
         batch_size: int,
         omit_raw_text: bool,
+        max_concurrent_embedding_requests: int = 1,
+        max_pending_batches: int = 2,
+        flush_interval_seconds: Optional[float] = None,
+        embedding_cache_size: int = 0,
     ) -> None:
+        if max_concurrent_embedding_requests < 1:
+            raise ValueError("max_concurrent_embedding_requests must be at least 1")
+        if max_pending_batches < 1:
+            raise ValueError("max_pending_batches must be at least 1")
         self.processing_config = processing_config
         self.indexer = indexer
         self.embedder = embedder
         self.batch_size = batch_size
         self.omit_raw_text = omit_raw_text
+        self.max_concurrent_embedding_requests = max_concurrent_embedding_requests
+        self.max_pending_batches = max_pending_batches
+        self.flush_interval_seconds = flush_interval_seconds
+        self._embedding_cache: Optional[LRUCache[bytes, Optional[List[float]]]] = (
+            LRUCache(maxsize=embedding_cache_size) if embedding_cache_size > 0 else None
+        )
+        self._embedding_cache_lock = threading.Lock()
+        self._pending_batches: Deque[Future[None]] = deque()
         self._init_batch()
 
     def _init_batch(self) -> None:
         self.chunks: Dict[Tuple[str, str], List[Chunk]] = defaultdict(list)
         self.ids_to_delete: Dict[Tuple[str, str], List[str]] = defaultdict(list)
         self.number_of_chunks = 0
+        self._batch_started_at: Optional[float] = None
 
     def _convert_to_document(self, chunk: Chunk) -> Document:
         """
@@ -54,51 +85,120 @@ class Writer:
             raise ValueError("Cannot embed a chunk without page content")
         return Document(page_content=chunk.page_content, record=chunk.record)
 
-    def _process_batch(self) -> None:
-        for (namespace, stream), ids in self.ids_to_delete.items():
+    def _embed_chunks(self, chunks: List[Chunk]) -> None:
+        """
+        Set the embeddings of the chunks, only calling the embedder for the chunks whose text is not in the embedding cache.
+        """
+        documents = [self._convert_to_document(chunk) for chunk in chunks]
+        if self._embedding_cache is None:
+            embeddings = self.embedder.embed_documents(documents)
+        else:
+            keys = [
+                hashlib.sha256(document.page_content.encode()).digest() for document in documents
+            ]
+            with self._embedding_cache_lock:
+                cached_embeddings = [self._embedding_cache.get(key) for key in keys]
+            missing = [i for i, embedding in enumerate(cached_embeddings) if embedding is None]
+            embeddings = cached_embeddings
+            if missing:
+                new_embeddings = self.embedder.embed_documents([documents[i] for i in missing])
+                with self._embedding_cache_lock:
+                    for i, embedding in zip(missing, new_embeddings):
+                        embeddings[i] = embedding
+                        if embedding is not None:
+                            self._embedding_cache[keys[i]] = embedding
+        for i, chunk in enumerate(chunks):
+            chunk.embedding = embeddings[i]
+            if self.omit_raw_text:
+                chunk.page_content = None
+
+    def _index_batch(
+        self,
+        ids_to_delete: Dict[Tuple[str, str], List[str]],
+        embedded_chunks: Dict[Tuple[str, str], Tuple[List[Chunk], Future[None]]],
+    ) -> None:
+        for (namespace, stream), ids in ids_to_delete.items():
             self.indexer.delete(ids, namespace, stream)
 
-        for (namespace, stream), chunks in self.chunks.items():
-            embeddings = self.embedder.embed_documents(
-                [self._convert_to_document(chunk) for chunk in chunks]
-            )
-            for i, document in enumerate(chunks):
-                document.embedding = embeddings[i]
-                if self.omit_raw_text:
-                    document.page_content = None
+        for (namespace, stream), (chunks, embedding) in embedded_chunks.items():
+            embedding.result()
             self.indexer.index(chunks, namespace, stream)
 
+    def _process_batch(self) -> None:
+        """
+        Submit the current batch to the pipeline, waiting for the oldest batches to be indexed if too many are pending.
+        """
+        if self.chunks or self.ids_to_delete:
+            embedded_chunks = {
+                group: (chunks, self._embedding_executor.submit(self._embed_chunks, chunks))
+                for group, chunks in self.chunks.items()
+            }
+            self._pending_batches.append(
+                self._indexing_executor.submit(
+                    self._index_batch, self.ids_to_delete, embedded_chunks
+                )
+            )
         self._init_batch()
+        while len(self._pending_batches) > self.max_pending_batches:
+            self._pending_batches.popleft().result()
+
+    def _flush(self) -> None:
+        """
+        Submit the current batch and wait for all pending batches to be indexed.
+        """
+        self._process_batch()
+        while self._pending_batches:
+            self._pending_batches.popleft().result()
+
+    def _is_batch_due(self) -> bool:
+        if self.number_of_chunks >= self.batch_size:
+            return True
+        return (
+            self.flush_interval_seconds is not None
+            and self._batch_started_at is not None
+            and time.monotonic() - self._batch_started_at >= self.flush_interval_seconds
+        )
 
     def write(
         self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
     ) -> Iterable[AirbyteMessage]:
         self.processor = DocumentProcessor(self.processing_config, configured_catalog)
         self.indexer.pre_sync(configured_catalog)
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
-                # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
-                self._process_batch()
-                yield message
-            elif message.type == Type.RECORD:
-                record_chunks, record_id_to_delete = self.processor.process(message.record)
-                self.chunks[
-                    (  # type: ignore [index] # expected "tuple[str, str]", got "tuple[str | Any | None, str | Any]"
-                        message.record.namespace,  # type: ignore [union-attr] # record not None
-                        message.record.stream,  # type: ignore [union-attr] # record not None
-                    )
-                ].extend(record_chunks)
-                if record_id_to_delete is not None:
-                    self.ids_to_delete[
+        self._embedding_executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_embedding_requests, thread_name_prefix="embedder"
+        )
+        self._indexing_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="indexer")
+        try:
+            for message in input_messages:
+                if message.type == Type.STATE:
+                    # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
+                    # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
+                    self._flush()
+                    yield message
+                elif message.type == Type.RECORD:
+                    record_chunks, record_id_to_delete = self.processor.process(message.record)
+                    self.chunks[
                         (  # type: ignore [index] # expected "tuple[str, str]", got "tuple[str | Any | None, str | Any]"
                             message.record.namespace,  # type: ignore [union-attr] # record not None
                             message.record.stream,  # type: ignore [union-attr] # record not None
                         )
-                    ].append(record_id_to_delete)
-                self.number_of_chunks += len(record_chunks)
-                if self.number_of_chunks >= self.batch_size:
-                    self._process_batch()
+                    ].extend(record_chunks)
+                    if record_id_to_delete is not None:
+                        self.ids_to_delete[
+                            (  # type: ignore [index] # expected "tuple[str, str]", got "tuple[str | Any | None, str | Any]"
+                                message.record.namespace,  # type: ignore [union-attr] # record not None
+                                message.record.stream,  # type: ignore [union-attr] # record not None
+                            )
+                        ].append(record_id_to_delete)
+                    if self._batch_started_at is None:
+                        self._batch_started_at = time.monotonic()
+                    self.number_of_chunks += len(record_chunks)
+                    if self._is_batch_due():
+                        self._process_batch()
 
-        self._process_batch()
+            self._flush()
+        finally:
+            self._pending_batches.clear()
+            self._embedding_executor.shutdown(cancel_futures=True)
+            self._indexing_executor.shutdown(cancel_futures=True)
         yield from self.indexer.post_sync()
@@ -33,6 +33,8 @@ from airbyte_cdk.models import (
     Status,
     Type,
 )
+from airbyte_cdk.models.record_message_encoder import RecordMessageEncoder
+from airbyte_cdk.models.serialized_airbyte_message import SerializedAirbyteMessage
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.connector_state_manager import HashableStreamDescriptor
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
@@ -40,7 +42,8 @@ from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_o
 # from airbyte_cdk.utils import PrintBuffer, is_cloud_environment, message_utils  # add PrintBuffer back once fixed
 from airbyte_cdk.utils import is_cloud_environment, message_utils
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
-from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.constants import ENV_BUFFERED_OUTPUT, ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.message_writer import BufferedMessageWriter
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 logger = init_logger("airbyte")
@@ -48,6 +51,7 @@ logger = init_logger("airbyte")
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
 _HAS_LOGGED_FOR_SERIALIZATION_ERROR = False
+_RECORD_MESSAGE_ENCODER = RecordMessageEncoder()
 
 
 class AirbyteEntrypoint(object):
@@ -118,6 +122,10 @@ class AirbyteEntrypoint(object):
         return main_parser.parse_args(args)
 
     def run(self, parsed_args: argparse.Namespace) -> Iterable[str]:
+        for message in self._run_messages(parsed_args):
+            yield self.airbyte_message_to_string(message)
+
+    def _run_messages(self, parsed_args: argparse.Namespace) -> Iterable[AirbyteMessage]:
         cmd = parsed_args.command
         if not cmd:
             raise Exception("No command passed")
@@ -141,44 +149,26 @@ class AirbyteEntrypoint(object):
                 )
                 if cmd == "spec":
                     message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                    yield from [
-                        self.airbyte_message_to_string(queued_message)
-                        for queued_message in self._emit_queued_messages(self.source)
-                    ]
-                    yield self.airbyte_message_to_string(message)
+                    yield from list(self._emit_queued_messages(self.source))
+                    yield message
                 else:
                     raw_config = self.source.read_config(parsed_args.config)
                     config = self.source.configure(raw_config, temp_dir)
 
-                    yield from [
-                        self.airbyte_message_to_string(queued_message)
-                        for queued_message in self._emit_queued_messages(self.source)
-                    ]
+                    yield from list(self._emit_queued_messages(self.source))
                     if cmd == "check":
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.check(source_spec, config),
-                        )
+                        yield from self.check(source_spec, config)
                     elif cmd == "discover":
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.discover(source_spec, config),
-                        )
+                        yield from self.discover(source_spec, config)
                     elif cmd == "read":
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.read(source_spec, config, config_catalog, state),
-                        )
+                        yield from self.read(source_spec, config, config_catalog, state)
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
-            yield from [
-                self.airbyte_message_to_string(queued_message)
-                for queued_message in self._emit_queued_messages(self.source)
-            ]
+            yield from list(self._emit_queued_messages(self.source))
 
     def check(
         self, source_spec: ConnectorSpecification, config: TConfig
@@ -293,17 +283,24 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> str:
+        return AirbyteEntrypoint.airbyte_message_to_bytes(airbyte_message).decode()
+
+    @staticmethod
+    def airbyte_message_to_bytes(airbyte_message: AirbyteMessage) -> bytes:
         global _HAS_LOGGED_FOR_SERIALIZATION_ERROR
-        serialized_message = AirbyteMessageSerializer.dump(airbyte_message)
+        if isinstance(airbyte_message, SerializedAirbyteMessage):
+            return airbyte_message.serialized
         try:
-            return orjson.dumps(serialized_message).decode()
+            if airbyte_message.type == Type.RECORD:
+                return _RECORD_MESSAGE_ENCODER.encode(airbyte_message)
+            return orjson.dumps(AirbyteMessageSerializer.dump(airbyte_message))
         except Exception as exception:
             if not _HAS_LOGGED_FOR_SERIALIZATION_ERROR:
                 logger.warning(
                     f"There was an error during the serialization of an AirbyteMessage: `{exception}`. This might impact the sync performances."
                 )
                 _HAS_LOGGED_FOR_SERIALIZATION_ERROR = True
-            return json.dumps(serialized_message)
+            return json.dumps(AirbyteMessageSerializer.dump(airbyte_message)).encode()
 
     @classmethod
     def extract_state(cls, args: List[str]) -> Optional[Any]:
@@ -337,11 +334,27 @@ def launch(source: Source, args: List[str]) -> None:
     parsed_args = source_entrypoint.parse_args(args)
     # temporarily removes the PrintBuffer because we're seeing weird print behavior for concurrent syncs
     # Refer to: https://github.com/airbytehq/oncall/issues/6235
+    stdout = sys.stdout
+    binary_stdout = getattr(stdout, "buffer", None)
     with PRINT_BUFFER:
-        for message in source_entrypoint.run(parsed_args):
-            # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
-            # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
-            print(f"{message}\n", end="")
+        if binary_stdout is None or not _is_buffered_output_enabled():
+            for message in source_entrypoint.run(parsed_args):
+                # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
+                # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
+                print(f"{message}\n", end="")
+            return
+
+        # Text written to sys.stdout (e.g. logs going through the PRINT_BUFFER) is flushed before the messages to keep the output ordered
+        with BufferedMessageWriter(binary_stdout, text_stream=sys.stdout) as writer:
+            for airbyte_message in source_entrypoint._run_messages(parsed_args):
+                writer.write(
+                    AirbyteEntrypoint.airbyte_message_to_bytes(airbyte_message),
+                    flush=airbyte_message.type == Type.STATE,
+                )
+
+
+def _is_buffered_output_enabled() -> bool:
+    return os.environ.get(ENV_BUFFERED_OUTPUT, "true").lower() != "false"
 
 
 def _init_internal_request_filter() -> None:
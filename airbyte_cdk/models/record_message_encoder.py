@@ -0,0 +1,60 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+from typing import Any, Dict, Mapping, Optional
+
+import orjson
+
+from airbyte_cdk.models.airbyte_protocol import (  # type: ignore[attr-defined] # all classes are imported to airbyte_protocol via *
+    AirbyteMessage,
+    AirbyteRecordMessage,
+)
+from airbyte_cdk.models.airbyte_protocol_serializers import AirbyteMessageSerializer
+
+
+class RecordMessageEncoder:
+    """
+    Serializes RECORD messages to JSON without going through AirbyteMessageSerializer.
+
+    The output is byte-identical to `orjson.dumps(AirbyteMessageSerializer.dump(message))`: the bytes surrounding the data of a record only
+    depend on the stream, so they are computed once per stream and the data is passed to orjson as is. Like AirbyteMessageSerializer, None
+    values at the root of the data are omitted. Records with fields that the fast path does not know about (e.g. `meta` or file transfer
+    records) are serialized with AirbyteMessageSerializer.
+
+    Errors raised by orjson are propagated so that the caller can apply the same fallback it applies for other messages.
+    """
+
+    def __init__(self) -> None:
+        # Worker threads can share an encoder: concurrent writes of the same key store the same value
+        self._prefix_by_stream: Dict[str, bytes] = {}
+        self._suffix_by_namespace: Dict[Optional[str], bytes] = {None: b"}}"}
+
+    def encode(self, message: AirbyteMessage) -> bytes:
+        record = message.record
+        if (
+            not isinstance(record, AirbyteRecordMessage)
+            or record.meta is not None
+            or type(record.emitted_at) is not int
+        ):
+            return orjson.dumps(AirbyteMessageSerializer.dump(message))
+        return self.encode_record(record.stream, record.data, record.emitted_at, record.namespace)
+
+    def encode_record(
+        self,
+        stream: str,
+        data: Mapping[str, Any],
+        emitted_at: int,
+        namespace: Optional[str] = None,
+    ) -> bytes:
+        prefix = self._prefix_by_stream.get(stream)
+        if prefix is None:
+            prefix = b'{"type":"RECORD","record":{"stream":' + orjson.dumps(stream) + b',"data":'
+            self._prefix_by_stream[stream] = prefix
+        suffix = self._suffix_by_namespace.get(namespace)
+        if suffix is None:
+            suffix = b',"namespace":' + orjson.dumps(namespace) + b"}}"
+            self._suffix_by_namespace[namespace] = suffix
+        if None in data.values():
+            data = {key: value for key, value in data.items() if value is not None}
+        elif not isinstance(data, dict):
+            data = dict(data)
+        return b"".join((prefix, orjson.dumps(data), b',"emitted_at":', b"%d" % emitted_at, suffix))
@@ -0,0 +1,41 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+from dataclasses import fields
+from typing import Union
+
+from airbyte_cdk.models.airbyte_protocol import (  # type: ignore[attr-defined] # all classes are imported to airbyte_protocol via *
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    Type,
+)
+from airbyte_cdk.models.file_transfer_record_message import AirbyteFileTransferRecordMessage
+
+
+class SerializedAirbyteMessage(AirbyteMessage):
+    """
+    A RECORD AirbyteMessage that also holds its JSON serialization.
+
+    The serialization is computed ahead of time, typically by the worker thread that read the record, so that the thread writing the
+    messages only has to output the bytes. Apart from `serialized`, it behaves like the AirbyteMessage it was created from, including
+    when compared with plain AirbyteMessages.
+    """
+
+    def __init__(
+        self,
+        record: Union[AirbyteRecordMessage, AirbyteFileTransferRecordMessage],
+        serialized: bytes,
+    ) -> None:
+        """
+        :param record: The record of the message
+        :param serialized: The JSON serialization of the whole message, without trailing newline
+        """
+        super().__init__(type=Type.RECORD, record=record)
+        self.serialized = serialized
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AirbyteMessage):
+            return NotImplemented
+        return all(
+            getattr(self, field.name) == getattr(other, field.name)
+            for field in fields(AirbyteMessage)
+        )
@@ -37,6 +37,7 @@ from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.streams.http.response_cache import log_response_cache_statistics
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
@@ -197,6 +198,7 @@ class AbstractSource(Source, ABC):
                         logger.info(f"Finished syncing {configured_stream.stream.name}")
                         logger.info(timer.report())
 
+        log_response_cache_statistics(logger)
         if len(stream_name_to_exception) > 0:
             error_message = generate_failed_streams_error_message(
                 {key: [value] for key, value in stream_name_to_exception.items()}
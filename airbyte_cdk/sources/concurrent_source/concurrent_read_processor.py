@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import logging
-from typing import Dict, Iterable, List, Optional, Set
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set
 
 from airbyte_cdk.exception_handler import generate_failed_streams_error_message
 from airbyte_cdk.models import AirbyteMessage, AirbyteStreamStatus, FailureType, StreamDescriptor
@@ -14,10 +15,16 @@ from airbyte_cdk.sources.concurrent_source.stream_thread_exception import Stream
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
+from airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PartitionCompleteSentinel,
+    RecordBatch,
+)
 from airbyte_cdk.sources.types import Record
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
@@ -37,6 +44,7 @@ class ConcurrentReadProcessor:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         partition_reader: PartitionReader,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
     ):
         """
         This class is responsible for handling items from a concurrent stream read process.
@@ -47,6 +55,8 @@ class ConcurrentReadProcessor:
         :param slice_logger: SliceLogger instance
         :param message_repository: MessageRepository instance
         :param partition_reader: PartitionReader instance
+        :param concurrency_controller: If provided, partitions are only submitted to the thread pool manager once the controller allows them
+          to be read. The other partitions wait in this processor so that no worker is blocked waiting for the controller.
         """
         self._stream_name_to_instance = {s.name: s for s in stream_instances_to_read_from}
         self._record_counter = {}
@@ -62,6 +72,8 @@ class ConcurrentReadProcessor:
         self._slice_logger = slice_logger
         self._message_repository = message_repository
         self._partition_reader = partition_reader
+        self._concurrency_controller = concurrency_controller
+        self._partitions_to_submit: Deque[Partition] = deque()
         self._streams_done: Set[str] = set()
         self._exceptions_per_stream_name: dict[str, List[Exception]] = {}
 
@@ -91,7 +103,7 @@ class ConcurrentReadProcessor:
         This method is called when a partition is generated.
         1. Add the partition to the set of partitions for the stream
         2. Log the slice if necessary
-        3. Submit the partition to the thread pool manager
+        3. Submit the partition to the thread pool manager, or hold it until the concurrency controller allows it to be read
         """
         stream_name = partition.stream_name()
         self._streams_to_running_partitions[stream_name].add(partition)
@@ -99,7 +111,21 @@ class ConcurrentReadProcessor:
             self._message_repository.emit_message(
                 self._slice_logger.create_slice_log_message(partition.to_slice())
             )
-        self._thread_pool_manager.submit(self._partition_reader.process_partition, partition)
+        if self._concurrency_controller:
+            self._partitions_to_submit.append(partition)
+            self._submit_allowed_partitions()
+        else:
+            self._thread_pool_manager.submit(self._partition_reader.process_partition, partition)
+
+    def _submit_allowed_partitions(self) -> None:
+        while (
+            self._partitions_to_submit
+            and self._concurrency_controller
+            and self._concurrency_controller.try_acquire()
+        ):
+            self._thread_pool_manager.submit(
+                self._partition_reader.process_partition, self._partitions_to_submit.popleft()
+            )
 
     def on_partition_complete_sentinel(
         self, sentinel: PartitionCompleteSentinel
@@ -109,8 +135,12 @@ class ConcurrentReadProcessor:
         1. Close the partition
         2. If the stream is done, mark it as such and return a stream status message
         3. Emit messages that were added to the message repository
+        4. Submit the partitions the concurrency controller now allows to be read
         """
         partition = sentinel.partition
+        if self._concurrency_controller:
+            self._concurrency_controller.release()
+            self._submit_allowed_partitions()
 
         try:
             if sentinel.is_successful:
@@ -142,15 +172,40 @@ class ConcurrentReadProcessor:
         4. Ensures the cursor knows the record has been successfully emitted
         5. Emit the message
         6. Emit messages that were added to the message repository
+        7. Submit the partitions the concurrency controller now allows to be read as the limit can increase while partitions are read
         """
-        # Do not pass a transformer or a schema
-        # AbstractStreams are expected to return data as they are expected.
-        # Any transformation on the data should be done before reaching this point
-        message = stream_data_to_airbyte_message(
-            stream_name=record.stream_name,
-            data_or_message=record.data,
-            is_file_transfer_message=record.is_file_transfer_message,
-        )
+        yield from self._on_record(record)
+        yield from self._message_repository.consume_queue()
+        self._submit_allowed_partitions()
+
+    def on_record_batch(self, batch: RecordBatch) -> Iterable[AirbyteMessage]:
+        """
+        This method is called when a batch of records is read from a partition.
+        1. Handle each record the same way `on_record` does, re-using the messages if the worker already converted the records
+        2. Emit messages that were added to the message repository once for the whole batch
+        3. Submit the partitions the concurrency controller now allows to be read as the limit can increase while partitions are read
+        """
+        if batch.messages is None:
+            for record in batch.records:
+                yield from self._on_record(record)
+        else:
+            for record, message in zip(batch.records, batch.messages):
+                yield from self._on_record(record, message)
+        yield from self._message_repository.consume_queue()
+        self._submit_allowed_partitions()
+
+    def _on_record(
+        self, record: Record, message: Optional[AirbyteMessage] = None
+    ) -> Iterable[AirbyteMessage]:
+        if message is None:
+            # Do not pass a transformer or a schema
+            # AbstractStreams are expected to return data as they are expected.
+            # Any transformation on the data should be done before reaching this point
+            message = stream_data_to_airbyte_message(
+                stream_name=record.stream_name,
+                data_or_message=record.data,
+                is_file_transfer_message=record.is_file_transfer_message,
+            )
         stream = self._stream_name_to_instance[record.stream_name]
 
         if message.type == MessageType.RECORD:
@@ -162,7 +217,6 @@ class ConcurrentReadProcessor:
             self._record_counter[stream.name] += 1
             stream.cursor.observe(record)
         yield message
-        yield from self._message_repository.consume_queue()
 
     def on_exception(self, exception: StreamThreadException) -> Iterable[AirbyteMessage]:
         """
@@ -3,26 +3,35 @@
 #
 import concurrent
 import logging
+from concurrent.futures import Executor
 from queue import Queue
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Optional
 
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
 )
+from airbyte_cdk.sources.concurrent_source.record_count_bounded_queue import (
+    RecordCountBoundedQueue,
+)
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
+from airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
+    RecordBatch,
 )
 from airbyte_cdk.sources.types import Record
+from airbyte_cdk.sources.utils.record_helper import record_to_serialized_airbyte_message
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
 
 
@@ -35,6 +44,8 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    DEFAULT_RECORD_BATCH_SIZE = 100
+    DEFAULT_MAX_RECORD_BATCH_WAIT_SECONDS = 1.0
 
     @staticmethod
     def create(
@@ -44,6 +55,9 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+        serialize_records_in_workers: bool = False,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
     ) -> "ConcurrentSource":
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = (
@@ -65,6 +79,9 @@ class ConcurrentSource:
             message_repository,
             initial_number_of_partitions_to_generate,
             timeout_seconds,
+            record_batch_size,
+            serialize_records_in_workers=serialize_records_in_workers,
+            concurrency_controller=concurrency_controller,
         )
 
     def __init__(
@@ -75,6 +92,10 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+        max_record_batch_wait_seconds: float = DEFAULT_MAX_RECORD_BATCH_WAIT_SECONDS,
+        serialize_records_in_workers: bool = False,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -83,6 +104,10 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param record_batch_size: The maximum number of records a worker groups in a single queue item. Batching records reduces the lock contention on the queue. Setting it to 1 disables batching.
+        :param max_record_batch_wait_seconds: The maximum time a record can wait in a partially filled batch before being handed to the main thread.
+        :param serialize_records_in_workers: If True, the worker threads convert the records to serialized messages so that the main thread only observes, counts and writes them.
+        :param concurrency_controller: If provided, limits the number of partitions read at the same time to the limit of the controller. The threadpool is then expected to have enough workers for the maximum concurrency of the controller.
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -90,6 +115,14 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._record_batch_size = record_batch_size
+        self._max_record_batch_wait_seconds = max_record_batch_wait_seconds
+        self._serialize_records_in_workers = serialize_records_in_workers
+        self._concurrency_controller = concurrency_controller
+
+    @property
+    def executor(self) -> Executor:
+        return self._threadpool.executor
 
     def read(
         self,
@@ -100,8 +133,11 @@ class ConcurrentSource:
         # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
         # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
         # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
-        # information and might even need to be configurable depending on the source
-        queue: Queue[QueueItem] = Queue(maxsize=10_000)
+        # information and might even need to be configurable depending on the source. The size is counted in records so that batching
+        # records does not change the memory bound.
+        queue: Queue[QueueItem] = RecordCountBoundedQueue(maxsize=10_000)
+        if self._concurrency_controller:
+            self._concurrency_controller.watch_queue(queue)
         concurrent_stream_processor = ConcurrentReadProcessor(
             streams,
             PartitionEnqueuer(queue, self._threadpool),
@@ -109,7 +145,15 @@ class ConcurrentSource:
             self._logger,
             self._slice_logger,
             self._message_repository,
-            PartitionReader(queue),
+            PartitionReader(
+                queue,
+                self._record_batch_size,
+                self._max_record_batch_wait_seconds,
+                record_to_serialized_airbyte_message
+                if self._serialize_records_in_workers
+                else None,
+            ),
+            self._concurrency_controller,
         )
 
         # Enqueue initial partition generation tasks
@@ -150,8 +194,11 @@ class ConcurrentSource:
         queue_item: QueueItem,
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
-        # handle queue item and call the appropriate handler depending on the type of the queue item
-        if isinstance(queue_item, StreamThreadException):
+        # handle queue item and call the appropriate handler depending on the type of the queue item. Record batches are checked first
+        # as they are by far the most frequent items
+        if isinstance(queue_item, RecordBatch):
+            yield from concurrent_stream_processor.on_record_batch(queue_item)
+        elif isinstance(queue_item, StreamThreadException):
             yield from concurrent_stream_processor.on_exception(queue_item)
         elif isinstance(queue_item, PartitionGenerationCompletedSentinel):
             yield from concurrent_stream_processor.on_partition_generation_completed(queue_item)
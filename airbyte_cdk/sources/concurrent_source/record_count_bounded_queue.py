@@ -0,0 +1,39 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+from collections import deque
+from queue import Queue
+from typing import Deque
+
+from airbyte_cdk.sources.streams.concurrent.partitions.types import QueueItem, RecordBatch
+
+
+class RecordCountBoundedQueue(Queue[QueueItem]):
+    """
+    Queue whose size is measured in records instead of items.
+
+    A RecordBatch counts for the number of records it holds while any other item counts for one. This way, `maxsize` keeps bounding
+    the number of records held in memory even when workers put records in batches. As `Queue.put` only blocks once the queue is full,
+    the queue can exceed `maxsize` by at most the size of one batch.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self.queue: Deque[QueueItem] = deque()
+        self._size = 0
+
+    def _qsize(self) -> int:
+        return self._size
+
+    def _put(self, item: QueueItem) -> None:
+        self.queue.append(item)
+        self._size += self._weight(item)
+
+    def _get(self) -> QueueItem:
+        item = self.queue.popleft()
+        self._size -= self._weight(item)
+        return item
+
+    @staticmethod
+    def _weight(item: QueueItem) -> int:
+        # an empty batch still takes a slot so that `get` does not consider the queue empty while it holds an item
+        return max(len(item), 1) if isinstance(item, RecordBatch) else 1
@@ -3,7 +3,7 @@
 #
 import logging
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from typing import Any, Callable, List, Optional
 
 
@@ -42,6 +42,13 @@ class ThreadPoolManager:
             )
         return len(self._futures) >= self._max_concurrent_tasks
 
+    @property
+    def executor(self) -> Executor:
+        """
+        The threadpool, for tasks that wait for their own results. These tasks are not tracked by this manager.
+        """
+        return self._threadpool
+
     def submit(self, function: Callable[..., Any], *args: Any) -> None:
         self._futures.append(self._threadpool.submit(function, *args))
 
@@ -17,14 +17,21 @@ class ConcurrencyLevel:
     Attributes:
         default_concurrency (Union[int, str]): The hardcoded integer or interpolation of how many worker threads to use during a sync
         max_concurrency (Optional[int]): The maximum number of worker threads to use when the default_concurrency is exceeded
+        adaptive (bool): If True, the number of partitions read at the same time starts at the default_concurrency and is adjusted up to
+            max_concurrency based on the latency and the rate limits of the API
     """
 
     default_concurrency: Union[int, str]
     max_concurrency: Optional[int]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
+    adaptive: bool = False
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        if self.adaptive and not self.max_concurrency:
+            raise ValueError(
+                "ConcurrencyLevel requires that max_concurrency be defined if adaptive"
+            )
         if isinstance(self.default_concurrency, int):
             self._default_concurrency: Union[int, InterpolatedString] = self.default_concurrency
         elif "config" in self.default_concurrency and not self.max_concurrency:
@@ -3,6 +3,8 @@
 #
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Any, Generic, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.models import (
@@ -48,6 +50,9 @@ from airbyte_cdk.sources.source import TState
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
 from airbyte_cdk.sources.streams.concurrent.abstract_stream_facade import AbstractStreamFacade
+from airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.streams.concurrent.availability_strategy import (
     AlwaysAvailableAvailabilityStrategy,
 )
@@ -95,6 +100,7 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
         )
 
         concurrency_level_from_manifest = self._source_config.get("concurrency_level")
+        concurrency_controller = None
         if concurrency_level_from_manifest:
             concurrency_level_component = self._constructor.create_component(
                 model_type=ConcurrencyLevelModel,
@@ -110,16 +116,45 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
             initial_number_of_partitions_to_generate = max(
                 concurrency_level // 2, 1
             )  # Partition_generation iterates using range based on this value. If this is floored to zero we end up in a dead lock during start up
+            if concurrency_level_component.adaptive and concurrency_level_component.max_concurrency:
+                max_concurrency = concurrency_level_component.max_concurrency
+                concurrency_controller = AdaptiveConcurrencyController(
+                    initial_concurrency=min(concurrency_level, max_concurrency),
+                    max_concurrency=max_concurrency,
+                )
+                self._constructor.set_concurrency_controller(concurrency_controller)
+                # The threadpool is sized for the maximum concurrency while the controller limits the number of partitions read at once
+                initial_number_of_partitions_to_generate = max(
+                    min(concurrency_level, max_concurrency) // 2, 1
+                )
+                concurrency_level = max_concurrency
         else:
             concurrency_level = self._LOWEST_SAFE_CONCURRENCY_LEVEL
             initial_number_of_partitions_to_generate = self._LOWEST_SAFE_CONCURRENCY_LEVEL // 2
 
+        # The threads reading parent slices are taken out of the workers so that no more than concurrency_level requests are sent at
+        # once. The workers keep one more thread than the partition generators so that partitions can still be read. The Connector
+        # Builder shows the requests made to read parent streams in the order they are sent
+        self._max_prefetched_parent_slices = (
+            0
+            if emit_connector_builder_messages
+            else max(
+                min(
+                    initial_number_of_partitions_to_generate,
+                    concurrency_level - initial_number_of_partitions_to_generate - 1,
+                ),
+                0,
+            )
+        )
+        # Each worker and parent stream reader can send a request at the same time so the connection pools are sized for all of them
+        self._constructor.set_connection_pool_size(concurrency_level)
         self._concurrent_source = ConcurrentSource.create(
-            num_workers=concurrency_level,
+            num_workers=concurrency_level - self._max_prefetched_parent_slices,
             initial_number_of_partitions_to_generate=initial_number_of_partitions_to_generate,
             logger=self.logger,
             slice_logger=self._slice_logger,
             message_repository=self.message_repository,
+            concurrency_controller=concurrency_controller,
         )
 
     # TODO: Remove this. This property is necessary to safely migrate Stripe during the transition state.
@@ -135,34 +170,62 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
         catalog: ConfiguredAirbyteCatalog,
         state: Optional[List[AirbyteStateMessage]] = None,
     ) -> Iterator[AirbyteMessage]:
-        concurrent_streams, _ = self._group_streams(config=config)
-
-        # ConcurrentReadProcessor pops streams that are finished being read so before syncing, the names of
-        # the concurrent streams must be saved so that they can be removed from the catalog before starting
-        # synchronous streams
-        if len(concurrent_streams) > 0:
-            concurrent_stream_names = set(
-                [concurrent_stream.name for concurrent_stream in concurrent_streams]
-            )
+        # Parent records are shared by the concurrent and the synchronous substreams of this read
+        with self._constructor.parent_record_cache_scope(), self._parent_stream_executor_scope():
+            # The streams that are not part of the catalog are not built. ManifestDeclarativeSource.read does the same for the
+            # synchronous streams
+            with self._only_build_streams(
+                configured_stream.stream.name for configured_stream in catalog.streams
+            ):
+                concurrent_streams, _ = self._group_streams(config=config)
+
+            # ConcurrentReadProcessor pops streams that are finished being read so before syncing, the names of
+            # the concurrent streams must be saved so that they can be removed from the catalog before starting
+            # synchronous streams
+            if len(concurrent_streams) > 0:
+                concurrent_stream_names = set(
+                    [concurrent_stream.name for concurrent_stream in concurrent_streams]
+                )
 
-            selected_concurrent_streams = self._select_streams(
-                streams=concurrent_streams, configured_catalog=catalog
-            )
-            # It would appear that passing in an empty set of streams causes an infinite loop in ConcurrentReadProcessor.
-            # This is also evident in concurrent_source_adapter.py so I'll leave this out of scope to fix for now
-            if selected_concurrent_streams:
-                yield from self._concurrent_source.read(selected_concurrent_streams)
-
-            # Sync all streams that are not concurrent compatible. We filter out concurrent streams because the
-            # existing AbstractSource.read() implementation iterates over the catalog when syncing streams. Many
-            # of which were already synced using the Concurrent CDK
-            filtered_catalog = self._remove_concurrent_streams_from_catalog(
-                catalog=catalog, concurrent_stream_names=concurrent_stream_names
-            )
-        else:
-            filtered_catalog = catalog
+                selected_concurrent_streams = self._select_streams(
+                    streams=concurrent_streams, configured_catalog=catalog
+                )
+                # It would appear that passing in an empty set of streams causes an infinite loop in ConcurrentReadProcessor.
+                # This is also evident in concurrent_source_adapter.py so I'll leave this out of scope to fix for now
+                if selected_concurrent_streams:
+                    yield from self._concurrent_source.read(selected_concurrent_streams)
+
+                # Sync all streams that are not concurrent compatible. We filter out concurrent streams because the
+                # existing AbstractSource.read() implementation iterates over the catalog when syncing streams. Many
+                # of which were already synced using the Concurrent CDK
+                filtered_catalog = self._remove_concurrent_streams_from_catalog(
+                    catalog=catalog, concurrent_stream_names=concurrent_stream_names
+                )
+            else:
+                filtered_catalog = catalog
 
-        yield from super().read(logger, config, filtered_catalog, state)
+            yield from super().read(logger, config, filtered_catalog, state)
+
+    @contextmanager
+    def _parent_stream_executor_scope(self) -> Iterator[None]:
+        """
+        Read the slices of parent streams on a pool that lives for the whole read. The pool of the concurrent source can't be used as it is
+        shut down once the concurrent streams are read, before the synchronous streams are.
+        """
+        if self._max_prefetched_parent_slices < 1:
+            yield
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_prefetched_parent_slices,
+            thread_name_prefix="parent_stream_reader",
+        )
+        self._constructor.set_parent_stream_executor(executor, self._max_prefetched_parent_slices)
+        try:
+            yield
+        finally:
+            self._constructor.set_parent_stream_executor(None, 0)
+            # Slices that are still being read stop once their parent reader is closed
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def discover(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteCatalog:
         concurrent_streams, synchronous_streams = self._group_streams(config=config)
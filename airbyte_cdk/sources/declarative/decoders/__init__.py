@@ -7,6 +7,7 @@ from airbyte_cdk.sources.declarative.decoders.composite_raw_decoder import (
     GzipParser,
     JsonParser,
     Parser,
+    StreamingJsonParser,
 )
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import (
@@ -28,6 +29,7 @@ __all__ = [
     "IterableDecoder",
     "NoopDecoder",
     "PaginationDecoderDecorator",
+    "StreamingJsonParser",
     "XmlDecoder",
     "ZipfileDecoder",
 ]
@@ -2,14 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
 import gzip
 import io
 import json
 import logging
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from io import BufferedIOBase, TextIOWrapper
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import orjson
 import requests
@@ -23,6 +25,7 @@ from airbyte_cdk.sources.declarative.decoders.decoder_parser import (
     Parser,
 )
 from airbyte_cdk.utils import AirbyteTracedException
+from airbyte_cdk.utils.line_reader import read_lines
 
 logger = logging.getLogger("airbyte")
 
@@ -86,16 +89,236 @@ class JsonParser(Parser):
             return None
 
 
+_JSON_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+# Content of a string after its opening quote, up to the closing quote excluded or to the end of the buffer
+_JSON_STRING_CONTENT = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+# Content of an object or an array up to the next bracket, skipping complete strings
+_JSON_CONTAINER_CONTENT = re.compile(
+    rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.DOTALL
+)
+_JSON_SCALAR = re.compile(rb"[^,\]}\s]*")
+_QUOTE, _COLON, _COMMA = ord('"'), ord(":"), ord(",")
+_OPENING_BRACKETS, _CLOSING_BRACKETS = (ord("{"), ord("[")), (ord("}"), ord("]"))
+
+
+class _JsonStreamReader:
+    """
+    Reads JSON values from a binary stream without loading the whole document in memory.
+
+    Only the bytes of the value being read are kept in the buffer, along with at most one chunk of data. The values are located by
+    scanning the brackets and strings and are then deserialized by orjson, so the JSON is only validated for the values that are read.
+    """
+
+    def __init__(self, data: BufferedIOBase, encoding: str, chunk_size: int) -> None:
+        self._data = data
+        self._chunk_size = chunk_size
+        # orjson only deserializes UTF-8 so other encodings are transcoded as the data is read
+        self._decoder = (
+            None
+            if codecs.lookup(encoding).name == "utf-8"
+            else codecs.getincrementaldecoder(encoding)()
+        )
+        self._buffer = bytearray()
+        self._position = 0
+        self._is_exhausted = False
+
+    def peek(self) -> Optional[int]:
+        """
+        Skip whitespaces and return the next byte without consuming it, or None if the end of the stream is reached.
+        """
+        while True:
+            self._position = _JSON_WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]  # the pattern matches empty strings
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_chunk():
+                return None
+
+    def consume(self, expected: int) -> None:
+        if self.peek() != expected:
+            raise self._parsing_error(f"Expected {chr(expected)!r}")
+        self._position += 1
+
+    def read_value(self) -> Any:
+        end = self._find_value_end(keep=True)
+        try:
+            value = orjson.loads(self._buffer[self._position : end])
+        except orjson.JSONDecodeError as exception:
+            raise self._parsing_error(str(exception)) from exception
+        self._position = end
+        return value
+
+    def skip_value(self) -> None:
+        self._position = self._find_value_end(keep=False)
+
+    def _find_value_end(self, keep: bool) -> int:
+        """
+        Return the index following the value starting at the next non-whitespace byte. If `keep` is True, the position stays at the
+        start of the value so that its bytes are kept in the buffer.
+        """
+        first = self.peek()
+        if first is None:
+            raise self._parsing_error("Unexpected end of data")
+        if first == _QUOTE:
+            return self._find_string_end(self._position)
+        if first not in _OPENING_BRACKETS:
+            return self._find_scalar_end()
+
+        depth = 0
+        index = self._position
+        while True:
+            index = _JSON_CONTAINER_CONTENT.match(self._buffer, index).end()  # type: ignore[union-attr]  # the pattern matches empty strings
+            if index < len(self._buffer):
+                byte = self._buffer[index]
+                if byte == _QUOTE:
+                    # the string is not complete in the buffer
+                    index = self._find_string_end(index)
+                    continue
+                depth += 1 if byte in _OPENING_BRACKETS else -1
+                index += 1
+                if depth == 0:
+                    return index
+                continue
+
+            if not keep:
+                self._position = index
+            offset = index - self._position
+            if not self._read_chunk():
+                raise self._parsing_error("Unexpected end of data")
+            index = self._position + offset
+
+    def _find_string_end(self, start: int) -> int:
+        offset = start + 1 - self._position
+        while True:
+            index = _JSON_STRING_CONTENT.match(self._buffer, self._position + offset).end()  # type: ignore[union-attr]  # the pattern matches empty strings
+            if index < len(self._buffer) and self._buffer[index] == _QUOTE:
+                return index + 1
+            # the string continues in the next chunk. The last byte might be the start of an escape sequence so it is scanned again
+            offset = index - self._position
+            if not self._read_chunk():
+                raise self._parsing_error("Unexpected end of data")
+
+    def _find_scalar_end(self) -> int:
+        while True:
+            index = _JSON_SCALAR.match(self._buffer, self._position).end()  # type: ignore[union-attr]  # the pattern matches empty strings
+            if index < len(self._buffer) or not self._read_chunk():
+                return index
+
+    def _read_chunk(self) -> bool:
+        """
+        Append the next chunk to the buffer after dropping the bytes before the current position, which resets the position to 0.
+        """
+        while not self._is_exhausted:
+            chunk = self._data.read(self._chunk_size)
+            if not chunk:
+                self._is_exhausted = True
+            if self._decoder:
+                chunk = self._decoder.decode(chunk, final=self._is_exhausted).encode("utf-8")
+            if chunk:
+                del self._buffer[: self._position]
+                self._position = 0
+                self._buffer += chunk
+                return True
+        return False
+
+    def _parsing_error(self, message: str) -> AirbyteTracedException:
+        return AirbyteTracedException(
+            message="Response JSON data failed to be parsed. See logs for more information.",
+            internal_message=f"Response JSON data failed to be parsed: {message}.",
+            failure_type=FailureType.system_error,
+        )
+
+
+@dataclass
+class StreamingJsonParser(Parser):
+    """
+    Parser yielding the elements of the array found at `field_path` as the data is read, instead of deserializing the whole document
+    like JsonParser. The memory used is therefore bounded by the size of the largest element rather than by the size of the response.
+
+    If the value at `field_path` is not an array, it is yielded as is and if the path does not exist, nothing is yielded. Numeric path
+    segments can be used to select an element of an array. Since the parser already extracts the records, a DpathExtractor using the
+    decoder should have an empty `field_path`, and paginators can't use the decoder to read the response body.
+
+    The document is only read up to the end of the array so data after it is neither read nor validated.
+    """
+
+    field_path: List[str] = field(default_factory=list)
+    encoding: str = "utf-8"
+    chunk_size: int = 64 * 1024
+
+    def parse(self, data: BufferedIOBase) -> PARSER_OUTPUT_TYPE:
+        reader = _JsonStreamReader(data, self.encoding, self.chunk_size)
+        for segment in self.field_path:
+            if not self._move_to(reader, segment):
+                return
+
+        if reader.peek() != _OPENING_BRACKETS[1]:
+            yield reader.read_value()
+            return
+
+        reader.consume(_OPENING_BRACKETS[1])
+        if reader.peek() == _CLOSING_BRACKETS[1]:
+            return
+        while True:
+            yield reader.read_value()
+            if reader.peek() == _CLOSING_BRACKETS[1]:
+                return
+            reader.consume(_COMMA)
+
+    @staticmethod
+    def _move_to(reader: _JsonStreamReader, segment: str) -> bool:
+        """
+        Move the reader to the value at `segment` in the current object or array and return whether it exists.
+        """
+        first = reader.peek()
+        if first == _OPENING_BRACKETS[0]:
+            reader.consume(_OPENING_BRACKETS[0])
+            if reader.peek() == _CLOSING_BRACKETS[0]:
+                return False
+            while True:
+                if reader.peek() != _QUOTE:
+                    reader.consume(_QUOTE)
+                key = reader.read_value()
+                reader.consume(_COLON)
+                if key == segment:
+                    return True
+                reader.skip_value()
+                if reader.peek() == _CLOSING_BRACKETS[0]:
+                    return False
+                reader.consume(_COMMA)
+        elif first == _OPENING_BRACKETS[1] and segment.isdigit():
+            reader.consume(_OPENING_BRACKETS[1])
+            if reader.peek() == _CLOSING_BRACKETS[1]:
+                return False
+            for _ in range(int(segment)):
+                reader.skip_value()
+                if reader.peek() == _CLOSING_BRACKETS[1]:
+                    return False
+                reader.consume(_COMMA)
+            return True
+        elif first is None:
+            reader.skip_value()  # raises an error as there is no data
+        return False
+
+
 @dataclass
 class JsonLineParser(Parser):
     encoding: Optional[str] = "utf-8"
 
     def parse(self, data: BufferedIOBase) -> PARSER_OUTPUT_TYPE:
-        for line in data:
+        encoding = self.encoding or "utf-8"
+        # orjson parses bytes as UTF-8 so lines in this encoding don't need to be decoded
+        is_utf8 = codecs.lookup(encoding).name == "utf-8"
+        for line in read_lines(data):
             try:
-                yield json.loads(line.decode(encoding=self.encoding or "utf-8"))
-            except json.JSONDecodeError as e:
-                logger.warning(f"Cannot decode/parse line {line!r} as JSON, error: {e}")
+                record = orjson.loads(line) if is_utf8 else json.loads(line.decode(encoding))
+            except json.JSONDecodeError:
+                # orjson does not support everything the json library does like integers over 64 bits
+                try:
+                    record = json.loads(line.decode(encoding))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Cannot decode/parse line {line!r} as JSON, error: {e}")
+                    continue
+            yield record
 
 
 @dataclass
@@ -2,8 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import re
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Union
+from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import dpath
 import requests
@@ -13,6 +14,18 @@ from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordEx
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.types import Config
 
+# Characters making a path segment a glob pattern for dpath
+_GLOB_CHARACTERS = re.compile(r"[*?\[]")
+_LIST_INDEX = re.compile(r"-?[0-9]+")
+_WILDCARD = "*"
+_MISSING = object()
+
+
+class _UnsupportedPathError(Exception):
+    """
+    The path can't be followed without dpath, e.g. because it contains a glob pattern other than `*`.
+    """
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -68,19 +81,112 @@ class DpathExtractor(RecordExtractor):
                     self.field_path[path_index], parameters=parameters
                 )
 
+        # Paths only depending on the config are evaluated and compiled once, other paths each time they change
+        self._is_static_path = all(path.depends_only_on_config() for path in self._field_path)
+        self._compiled_path: Optional[Tuple[List[Any], Callable[[Any], Any]]] = None
+
     def extract_records(self, response: requests.Response) -> Iterable[MutableMapping[Any, Any]]:
         for body in self.decoder.decode(response):
             if len(self._field_path) == 0:
                 extracted = body
             else:
-                path = [path.eval(self.config) for path in self._field_path]
-                if "*" in path:
-                    extracted = dpath.values(body, path)
-                else:
-                    extracted = dpath.get(body, path, default=[])  # type: ignore # extracted will be a MutableMapping, given input data structure
+                extracted = self._get_path_extractor()(body)
             if isinstance(extracted, list):
                 yield from extracted
             elif extracted:
                 yield extracted
             else:
                 yield from []
+
+    def _get_path_extractor(self) -> Callable[[Any], Any]:
+        compiled_path = self._compiled_path
+        if compiled_path is not None and self._is_static_path:
+            return compiled_path[1]
+        path = [path.eval(self.config) for path in self._field_path]
+        if compiled_path is None or compiled_path[0] != path:
+            compiled_path = (path, _compile_path(path))
+            self._compiled_path = compiled_path
+        return compiled_path[1]
+
+
+def _compile_path(path: List[Any]) -> Callable[[Any], Any]:
+    """
+    Return a function extracting `path` from a body like `dpath.values` (if the path contains a wildcard) or `dpath.get` would, but
+    following the path directly instead of walking the whole body. Paths with other glob patterns and values that the compiled path can't
+    follow are extracted with dpath.
+    """
+    if _WILDCARD in path:
+        if any(segment != _WILDCARD and not _is_literal(segment) for segment in path):
+            return lambda body: dpath.values(body, path)
+
+        def extract_values(body: Any) -> Any:
+            try:
+                return list(_walk(body, path, 0))
+            except _UnsupportedPathError:
+                return dpath.values(body, path)
+
+        return extract_values
+
+    if not all(_is_literal(segment) for segment in path):
+        return lambda body: dpath.get(body, path, default=[])
+
+    def extract(body: Any) -> Any:
+        value = body
+        try:
+            for segment in path:
+                value = _get_child(value, segment)
+                if value is _MISSING:
+                    return []
+        except _UnsupportedPathError:
+            return dpath.get(body, path, default=[])
+        return value
+
+    return extract
+
+
+def _is_literal(segment: Any) -> bool:
+    if isinstance(segment, str):
+        return bool(segment) and not _GLOB_CHARACTERS.search(segment)
+    return type(segment) is int
+
+
+def _get_child(value: Any, segment: Any) -> Any:
+    """
+    Return the child of `value` matching the literal `segment` like dpath would: mappings are indexed by string keys and sequences by
+    integers (possibly negative) or their string representation.
+    """
+    if isinstance(value, Mapping):
+        return value.get(segment, _MISSING)
+    if isinstance(value, (list, tuple)):
+        if type(segment) is str:
+            if not _LIST_INDEX.fullmatch(segment):
+                return _MISSING
+            segment = int(segment)
+        if -len(value) <= segment < len(value):
+            return value[segment]
+        return _MISSING
+    if isinstance(value, (bytes, str, int, float, bool, type(None))):
+        return _MISSING
+    raise _UnsupportedPathError()
+
+
+def _walk(value: Any, path: List[Any], index: int) -> Iterable[Any]:
+    if index == len(path):
+        yield value
+        return
+    segment = path[index]
+    if segment == _WILDCARD:
+        if isinstance(value, Mapping):
+            children: Iterable[Any] = value.values()
+        elif isinstance(value, (list, tuple)):
+            children = value
+        elif isinstance(value, (bytes, str, int, float, bool, type(None))):
+            return
+        else:
+            raise _UnsupportedPathError()
+        for child in children:
+            yield from _walk(child, path, index + 1)
+    else:
+        child = _get_child(value, segment)
+        if child is not _MISSING:
+            yield from _walk(child, path, index + 1)
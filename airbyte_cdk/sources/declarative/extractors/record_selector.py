@@ -16,6 +16,9 @@ from airbyte_cdk.sources.declarative.extractors.type_transformer import (
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.models import SchemaNormalization
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
+from airbyte_cdk.sources.declarative.transformations.record_transformation_pipeline import (
+    RecordTransformationPipeline,
+)
 from airbyte_cdk.sources.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.sources.utils.transform import TypeTransformer
 
@@ -45,6 +48,9 @@ class RecordSelector(HttpSelector):
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._parameters = parameters
+        self._transformation_pipeline = RecordTransformationPipeline(
+            self.transformations, self.config
+        )
         self._name = (
             InterpolatedString(self._name, parameters=parameters)
             if isinstance(self._name, str)
@@ -123,9 +129,10 @@ class RecordSelector(HttpSelector):
         self, records: Iterable[Mapping[str, Any]], schema: Optional[Mapping[str, Any]]
     ) -> Iterable[Mapping[str, Any]]:
         if schema:
-            # record has type Mapping[str, Any], but dict[str, Any] expected
+            # record has type Mapping[str, Any], but dict[str, Any] expected. Records are only copied if they are not dicts as the
+            # transformations already update them in place
             for record in records:
-                normalized_record = dict(record)
+                normalized_record = record if isinstance(record, dict) else dict(record)
                 self.schema_normalization.transform(normalized_record, schema)
                 yield normalized_record
         else:
@@ -154,12 +161,17 @@ class RecordSelector(HttpSelector):
         stream_state: StreamState,
         stream_slice: Optional[StreamSlice] = None,
     ) -> Iterable[Mapping[str, Any]]:
+        if not self.transformations:
+            yield from records
+            return
+        # The transformations can be changed after the selector is created
+        if not self._transformation_pipeline.is_compiled_from(self.transformations):
+            self._transformation_pipeline = RecordTransformationPipeline(
+                self.transformations, self.config
+            )
         for record in records:
-            for transformation in self.transformations:
-                transformation.transform(
-                    record,  # type: ignore  # record has type Mapping[str, Any], but Dict[str, Any] expected
-                    config=self.config,
-                    stream_state=stream_state,
-                    stream_slice=stream_slice,
-                )
-            yield record
+            yield self._transformation_pipeline.transform(
+                record,  # type: ignore  # record has type Mapping[str, Any], but Dict[str, Any] expected
+                stream_state=stream_state,
+                stream_slice=stream_slice,
+            )
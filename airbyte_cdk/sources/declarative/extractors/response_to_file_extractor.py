@@ -9,9 +9,7 @@ from contextlib import closing
 from dataclasses import InitVar, dataclass
 from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
-import pandas as pd
 import requests
-from numpy import nan
 
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 
@@ -134,6 +132,10 @@ class ResponseToFileExtractor(RecordExtractor):
             ValueError: If an IO/Error occurs while reading the temporary data.
         """
 
+        # pandas is imported on first use as it takes longer to import than the rest of the declarative framework
+        import pandas as pd
+        from numpy import nan
+
         try:
             with open(path, "r", encoding=file_encoding) as data:
                 chunks = pd.read_csv(
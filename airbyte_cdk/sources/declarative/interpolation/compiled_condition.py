@@ -0,0 +1,238 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+import operator
+from typing import Any, Callable, FrozenSet, List, Mapping, Optional, Tuple
+
+from jinja2 import nodes
+from jinja2.exceptions import TemplateSyntaxError
+
+from airbyte_cdk.sources.declarative.interpolation.jinja import (
+    _ALIASES,
+    _ENVIRONMENT,
+    _UNSUPPORTED_INTERPOLATION_VARIABLES,
+    _has_alias,
+)
+from airbyte_cdk.sources.types import Config
+
+_Expression = Callable[[Config, Mapping[str, Any]], Any]
+
+_COMPARISON_OPERATORS: Mapping[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda left, right: left in right,
+    "notin": lambda left, right: left not in right,
+}
+_TESTS: Mapping[str, Callable[[Any], bool]] = {
+    "none": lambda value: value is None,
+    "true": lambda value: value is True,
+    "false": lambda value: value is False,
+    # Values that are not defined are not supported by the compiled expressions so any value is defined
+    "defined": lambda value: True,
+    "undefined": lambda value: False,
+}
+
+
+class _UnsupportedExpressionError(Exception):
+    """
+    The expression is not supported by the compiled conditions, it has to be rendered by Jinja.
+    """
+
+
+class CompiledCondition:
+    """
+    A Jinja condition like `{{ record['updated_at'] >= stream_interval['start_time'] and record.status in ['open', 'closed'] }}`
+    compiled to Python functions so that it can be evaluated without rendering a template.
+
+    Only comparisons, membership tests, `and`, `or`, `not`, `is none`-like tests, constants and lookups of items or attributes from the
+    interpolation context are supported. Evaluating a condition returns None instead of a boolean whenever the result could differ from the
+    one of the Jinja template, e.g. when a value is missing (Jinja would use an undefined value) or when an operation fails. The caller is
+    then expected to render the template.
+    """
+
+    def __init__(self, expression: _Expression, variables: FrozenSet[str]) -> None:
+        """
+        :param expression: The compiled expression
+        :param variables: The parameters the condition refers to, including the ones that short-circuited operators might not evaluate
+        """
+        self._expression = expression
+        self._variables = variables
+
+    def eval(self, config: Config, **additional_parameters: Any) -> Optional[bool]:
+        # Jinja fails if a variable is missing from the context or if an alias is part of the context
+        if _has_alias(additional_parameters) or not all(
+            variable in additional_parameters for variable in self._variables
+        ):
+            return None
+        try:
+            result = self._expression(config, additional_parameters)
+        except Exception:
+            return None
+        return result if type(result) is bool else None
+
+
+def compile_condition(condition: str) -> Optional[CompiledCondition]:
+    """
+    Compile a condition into a CompiledCondition. Returns None if the condition is not supported.
+    """
+    if not isinstance(condition, str) or any(
+        variable_name in condition for variable_name in _UNSUPPORTED_INTERPOLATION_VARIABLES
+    ):
+        return None
+    try:
+        template = _ENVIRONMENT.parse(condition)
+    except TemplateSyntaxError:
+        return None
+    if (
+        len(template.body) != 1
+        or not isinstance(template.body[0], nodes.Output)
+        or len(template.body[0].nodes) != 1
+    ):
+        return None
+
+    node = template.body[0].nodes[0]
+    if not _is_boolean(node):
+        return None
+    try:
+        expression = _compile(node)
+    except _UnsupportedExpressionError:
+        return None
+    variables = frozenset(
+        _ALIASES.get(name.name, name.name)
+        for name in node.find_all(nodes.Name)
+        if name.name != "config"
+    )
+    return CompiledCondition(expression, variables)
+
+
+def _is_boolean(node: nodes.Node) -> bool:
+    if isinstance(node, (nodes.Compare, nodes.Not, nodes.Test)):
+        return True
+    if isinstance(node, (nodes.And, nodes.Or)):
+        return _is_boolean(node.left) and _is_boolean(node.right)
+    return False
+
+
+def _compile(node: nodes.Node) -> _Expression:
+    if isinstance(node, nodes.Const):
+        return _compile_constant(node.value)
+    if isinstance(node, (nodes.List, nodes.Tuple)) and all(
+        isinstance(item, nodes.Const) for item in node.items
+    ):
+        items = [item.value for item in node.items if isinstance(item, nodes.Const)]
+        return _compile_constant(items if isinstance(node, nodes.List) else tuple(items))
+    if isinstance(node, nodes.Name) and node.ctx == "load":
+        return _compile_name(node.name)
+    if isinstance(node, nodes.Getitem) and node.ctx == "load":
+        return _compile_lookup(_compile(node.node), _compile(node.arg), is_attribute=False)
+    if isinstance(node, nodes.Getattr) and node.ctx == "load":
+        return _compile_lookup(_compile(node.node), _compile_constant(node.attr), is_attribute=True)
+    if isinstance(node, nodes.Compare):
+        return _compile_comparison(
+            _compile(node.expr),
+            [(_comparison_operator(operand.op), _compile(operand.expr)) for operand in node.ops],
+        )
+    if isinstance(node, nodes.And):
+        return _compile_and(_compile(node.left), _compile(node.right))
+    if isinstance(node, nodes.Or):
+        return _compile_or(_compile(node.left), _compile(node.right))
+    if isinstance(node, nodes.Not):
+        return _compile_not(_compile(node.node))
+    if (
+        isinstance(node, nodes.Test)
+        and node.name in _TESTS
+        and not node.args
+        and not node.kwargs
+        and node.dyn_args is None
+        and node.dyn_kwargs is None
+    ):
+        return _compile_test(_TESTS[node.name], _compile(node.node))
+    raise _UnsupportedExpressionError()
+
+
+def _comparison_operator(op: str) -> Callable[[Any, Any], Any]:
+    if op not in _COMPARISON_OPERATORS:
+        raise _UnsupportedExpressionError()
+    return _COMPARISON_OPERATORS[op]
+
+
+def _compile_constant(value: Any) -> _Expression:
+    return lambda config, parameters: value
+
+
+def _compile_name(name: str) -> _Expression:
+    if name == "config":
+        return lambda config, parameters: config
+
+    # Aliases are only part of the context if the variable they refer to is
+    name = _ALIASES.get(name, name)
+
+    def evaluate(config: Config, parameters: Mapping[str, Any]) -> Any:
+        if name not in parameters:
+            raise _UnsupportedExpressionError()
+        return parameters[name]
+
+    return evaluate
+
+
+def _compile_lookup(container: _Expression, key: _Expression, is_attribute: bool) -> _Expression:
+    def evaluate(config: Config, parameters: Mapping[str, Any]) -> Any:
+        value = container(config, parameters)
+        key_value = key(config, parameters)
+        if is_attribute:
+            # Like the sandboxed Jinja environment, attributes are looked up before items when using the dot notation
+            try:
+                attribute = getattr(value, key_value)
+            except AttributeError:
+                pass
+            else:
+                if not _ENVIRONMENT.is_safe_attribute(value, key_value, attribute):
+                    raise _UnsupportedExpressionError()
+                return attribute
+        elif type(value) is list and type(key_value) is int:
+            if not -len(value) <= key_value < len(value):
+                raise _UnsupportedExpressionError()
+            return value[key_value]
+        # Jinja falls back to attributes for missing items
+        if not isinstance(value, Mapping) or key_value not in value:
+            raise _UnsupportedExpressionError()
+        return value[key_value]
+
+    return evaluate
+
+
+def _compile_comparison(
+    left: _Expression, operands: List[Tuple[Callable[[Any, Any], Any], _Expression]]
+) -> _Expression:
+    def evaluate(config: Config, parameters: Mapping[str, Any]) -> Any:
+        # Chained comparisons behave like in Python: `a < b < c` is `a < b and b < c`
+        left_value = left(config, parameters)
+        result: Any = True
+        for compare, right in operands:
+            right_value = right(config, parameters)
+            result = compare(left_value, right_value)
+            if not result:
+                return result
+            left_value = right_value
+        return result
+
+    return evaluate
+
+
+def _compile_and(left: _Expression, right: _Expression) -> _Expression:
+    return lambda config, parameters: left(config, parameters) and right(config, parameters)
+
+
+def _compile_or(left: _Expression, right: _Expression) -> _Expression:
+    return lambda config, parameters: left(config, parameters) or right(config, parameters)
+
+
+def _compile_not(expression: _Expression) -> _Expression:
+    return lambda config, parameters: not expression(config, parameters)
+
+
+def _compile_test(test: Callable[[Any], bool], expression: _Expression) -> _Expression:
+    return lambda config, parameters: test(expression(config, parameters))
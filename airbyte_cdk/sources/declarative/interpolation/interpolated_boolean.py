@@ -5,6 +5,7 @@
 from dataclasses import InitVar, dataclass
 from typing import Any, Final, List, Mapping
 
+from airbyte_cdk.sources.declarative.interpolation.compiled_condition import compile_condition
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.types import Config
 
@@ -41,6 +42,8 @@ class InterpolatedBoolean:
         self._default = "False"
         self._interpolation = JinjaInterpolation()
         self._parameters = parameters
+        # Common conditions (comparisons, membership tests, boolean operators) are evaluated without rendering a Jinja template
+        self._compiled_condition = compile_condition(self.condition)
 
     def eval(self, config: Config, **additional_parameters: Any) -> bool:
         """
@@ -53,6 +56,12 @@ class InterpolatedBoolean:
         if isinstance(self.condition, bool):
             return self.condition
         else:
+            if self._compiled_condition:
+                result = self._compiled_condition.eval(
+                    config, parameters=self._parameters, **additional_parameters
+                )
+                if result is not None:
+                    return result
             evaluated = self._interpolation.eval(
                 self.condition,
                 config,
@@ -3,11 +3,13 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Mapping, Optional, Union
+from typing import Any, FrozenSet, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.types import Config
 
+_CONFIG_AND_PARAMETERS: FrozenSet[str] = frozenset({"config", "parameters"})
+
 
 @dataclass
 class InterpolatedString:
@@ -28,9 +30,8 @@ class InterpolatedString:
         self.default = self.default or self.string
         self._interpolation = JinjaInterpolation()
         self._parameters = parameters
-        # indicates whether passed string is just a plain string, not Jinja template
-        # This allows for optimization, but we do not know it yet at this stage
-        self._is_plain_string = None
+        # Constant strings and simple variable lookups are evaluated without rendering a Jinja template
+        self._evaluate = self._interpolation.compile(self.string)
 
     def eval(self, config: Config, **kwargs: Any) -> Any:
         """
@@ -40,19 +41,16 @@ class InterpolatedString:
         :param kwargs: Optional parameters used for interpolation
         :return: The interpolated string
         """
-        if self._is_plain_string:
-            return self.string
-        if self._is_plain_string is None:
-            # Let's check whether output from evaluation is the same as input.
-            # This indicates occurrence of a plain string, not a template and we can skip Jinja in subsequent runs.
-            evaluated = self._interpolation.eval(
-                self.string, config, self.default, parameters=self._parameters, **kwargs
-            )
-            self._is_plain_string = self.string == evaluated
-            return evaluated
-        return self._interpolation.eval(
-            self.string, config, self.default, parameters=self._parameters, **kwargs
-        )
+        return self._evaluate(config, self.default, parameters=self._parameters, **kwargs)
+
+    def depends_only_on_config(self) -> bool:
+        """
+        Return True if the string always evaluates to the same value for a given config, i.e. if it only refers to the config and the
+        parameters and does not call any macro.
+        """
+        return self._interpolation.depends_only_on(
+            self.string, _CONFIG_AND_PARAMETERS
+        ) and self._interpolation.depends_only_on(self.default, _CONFIG_AND_PARAMETERS)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, InterpolatedString):
@@ -3,12 +3,13 @@
 #
 
 import ast
+import re
 from functools import cache
-from typing import Any, Mapping, Optional, Set, Tuple, Type
+from typing import Any, Callable, FrozenSet, List, Mapping, Optional, Set, Tuple, Type
 
-from jinja2 import meta
+from jinja2 import meta, nodes
 from jinja2.environment import Template
-from jinja2.exceptions import UndefinedError
+from jinja2.exceptions import TemplateSyntaxError, UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
 
 from airbyte_cdk.models import FailureType
@@ -64,6 +65,21 @@ for builtin in _RESTRICTED_BUILTIN_FUNCTIONS:
     _ENVIRONMENT.globals.pop(builtin, None)
 
 
+# Matches templates only looking up a variable, like `{{ config['start_date'] }}` or `{{ stream_slice.start_time }}`
+_VARIABLE_LOOKUP_PATTERN = re.compile(
+    r"\{\{\s*([A-Za-z_]\w*)((?:\s*(?:\.\s*[A-Za-z_]\w*|\[\s*'[^'\\]*'\s*\]|\[\s*\"[^\"\\]*\"\s*\]))*)\s*\}\}"
+)
+_VARIABLE_LOOKUP_SEGMENT_PATTERN = re.compile(
+    r"\.\s*([A-Za-z_]\w*)|\[\s*'([^'\\]*)'\s*\]|\[\s*\"([^\"\\]*)\"\s*\]"
+)
+_TEMPLATE_DELIMITERS = ("{{", "{%", "{#")
+# Strings starting with one of these letters can't be Python literals, `ast.literal_eval` would return them as is
+_NON_LITERAL_PREFIXES = frozenset("_ACDEGHIJKLMOPQSVWXYZacdefghijklmnopqstvwxyz")
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+_Evaluator = Callable[..., Any]
+
+
 class JinjaInterpolation(Interpolation):
     """
     Interpolation strategy using the Jinja2 template engine.
@@ -122,6 +138,133 @@ class JinjaInterpolation(Interpolation):
         # If result is empty or resulted in an undefined error, evaluate and return the default string
         return self._literal_eval(self._eval(default, context), valid_types)
 
+    def compile(self, input_str: str) -> _Evaluator:
+        """
+        Return a function evaluating `input_str` with the same arguments and result as `eval` (without `input_str`).
+
+        Strings without any template are evaluated once. Templates only looking up a variable, like `{{ config['start_date'] }}` or
+        `{{ stream_slice.start_time }}`, read the value from the context without rendering a template. Whenever the result could differ
+        from the one of the Jinja template (e.g. the value is missing, the lookup could resolve to an attribute or the result is empty and
+        the default has to be evaluated), `eval` is used instead. Other templates are always evaluated with `eval`.
+        """
+        if not isinstance(input_str, str) or any(
+            variable_name in input_str for variable_name in _UNSUPPORTED_INTERPOLATION_VARIABLES
+        ):
+            return self._full_evaluator(input_str)
+        # Jinja normalizes the line endings of the templates it renders, so strings with carriage returns are rendered
+        if (
+            input_str
+            and not input_str.endswith("\n")
+            and "\r" not in input_str
+            and not any(delimiter in input_str for delimiter in _TEMPLATE_DELIMITERS)
+        ):
+            return self._constant_evaluator(input_str)
+        match = _VARIABLE_LOOKUP_PATTERN.fullmatch(input_str)
+        if match:
+            return self._variable_lookup_evaluator(input_str, match.group(1), match.group(2))
+        return self._full_evaluator(input_str)
+
+    def _full_evaluator(self, input_str: str) -> _Evaluator:
+        def evaluate(
+            config: Config,
+            default: Optional[str] = None,
+            valid_types: Optional[Tuple[Type[Any]]] = None,
+            **additional_parameters: Any,
+        ) -> Any:
+            return self.eval(input_str, config, default, valid_types, **additional_parameters)
+
+        return evaluate
+
+    def _constant_evaluator(self, input_str: str) -> _Evaluator:
+        # Rendering a string without template returns it as is (Jinja only removes a single trailing newline)
+        constant = self._literal_eval(input_str, None)
+        # Mutable values are evaluated on every call so that callers modifying them don't affect each other
+        is_immutable = isinstance(constant, _IMMUTABLE_TYPES)
+
+        def evaluate(
+            config: Config,
+            default: Optional[str] = None,
+            valid_types: Optional[Tuple[Type[Any]]] = None,
+            **additional_parameters: Any,
+        ) -> Any:
+            if _has_alias(additional_parameters):
+                return self.eval(input_str, config, default, valid_types, **additional_parameters)
+            if valid_types is None and is_immutable:
+                return constant
+            return self._literal_eval(input_str, valid_types)
+
+        return evaluate
+
+    def _variable_lookup_evaluator(self, input_str: str, variable: str, path: str) -> _Evaluator:
+        # Each segment is a key and whether it is accessed as an attribute (`.key`) rather than as an item (`['key']`)
+        segments: List[Tuple[str, bool]] = [
+            (attribute or single_quoted or double_quoted, bool(attribute))
+            for attribute, single_quoted, double_quoted in _VARIABLE_LOOKUP_SEGMENT_PATTERN.findall(
+                path
+            )
+        ]
+        variable = _ALIASES.get(variable, variable)
+        # The last result is kept as evaluating the same value again (e.g. a value from the config) is common
+        last_evaluation: Tuple[Any, ...] = (None, None, None)
+
+        def evaluate(
+            config: Config,
+            default: Optional[str] = None,
+            valid_types: Optional[Tuple[Type[Any]]] = None,
+            **additional_parameters: Any,
+        ) -> Any:
+            nonlocal last_evaluation
+            if _has_alias(additional_parameters):
+                return self.eval(input_str, config, default, valid_types, **additional_parameters)
+            if variable == "config":
+                value: Any = config
+            elif variable in additional_parameters:
+                value = additional_parameters[variable]
+            else:
+                return self.eval(input_str, config, default, valid_types, **additional_parameters)
+
+            for key, is_attribute in segments:
+                # Jinja looks up attributes before items when using the dot notation. It falls back to attributes for missing items.
+                if (
+                    not isinstance(value, Mapping)
+                    or key not in value
+                    or (is_attribute and hasattr(value, key))
+                ):
+                    return self.eval(
+                        input_str, config, default, valid_types, **additional_parameters
+                    )
+                value = value[key]
+
+            if type(value) is str:
+                result = value
+                if not result:
+                    return self.eval(
+                        input_str, config, default, valid_types, **additional_parameters
+                    )
+                if result[0] in _NON_LITERAL_PREFIXES:
+                    return result
+            elif type(value) is int or type(value) is bool:
+                # `str` and `ast.literal_eval` are inverse for these types
+                if not valid_types or isinstance(value, valid_types):
+                    return value
+                return str(value)
+            else:
+                result = str(value)
+                if not result:
+                    return self.eval(
+                        input_str, config, default, valid_types, **additional_parameters
+                    )
+
+            last_result, last_valid_types, last_evaluated = last_evaluation
+            if result == last_result and valid_types == last_valid_types:
+                return last_evaluated
+            evaluated = self._literal_eval(result, valid_types)
+            if isinstance(evaluated, _IMMUTABLE_TYPES):
+                last_evaluation = (result, valid_types, evaluated)
+            return evaluated
+
+        return evaluate
+
     def _literal_eval(self, result: Optional[str], valid_types: Optional[Tuple[Type[Any]]]) -> Any:
         try:
             evaluated = ast.literal_eval(result)  # type: ignore # literal_eval is able to handle None
@@ -145,6 +288,25 @@ class JinjaInterpolation(Interpolation):
             # It can be returned as is
             return s
 
+    @cache
+    def depends_only_on(self, s: Optional[str], variables: FrozenSet[str]) -> bool:
+        """
+        Return True if evaluating `s` always returns the same value for the same values of `variables`, i.e. if it only refers to these
+        variables and does not call any macro (e.g. `now_utc()`).
+        """
+        if s is None:
+            return True
+        if not isinstance(s, str):
+            return False
+        try:
+            template = _ENVIRONMENT.parse(s)
+        except TemplateSyntaxError:
+            return False
+        return (
+            not any(template.find_all(nodes.Call))
+            and meta.find_undeclared_variables(template) <= variables
+        )
+
     @cache
     def _find_undeclared_variables(self, s: Optional[str]) -> Set[str]:
         """
@@ -159,3 +321,10 @@ class JinjaInterpolation(Interpolation):
         We must cache the Jinja Template ourselves because we're using `from_string` instead of a template loader
         """
         return _ENVIRONMENT.from_string(s)
+
+
+def _has_alias(additional_parameters: Mapping[str, Any]) -> bool:
+    """
+    `eval` fails if an alias is part of the parameters
+    """
+    return any(alias in additional_parameters for alias in _ALIASES)
@@ -4,15 +4,13 @@
 
 import json
 import logging
-import pkgutil
+from contextlib import contextmanager
 from copy import deepcopy
 from importlib import metadata
 from types import ModuleType
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set
 
-import yaml
 from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
 from packaging.version import InvalidVersion, Version
 
 from airbyte_cdk.models import (
@@ -33,6 +31,10 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.parsers.custom_code_compiler import (
     get_registered_components_module,
 )
+from airbyte_cdk.sources.declarative.parsers.manifest_compilation_cache import (
+    ManifestCompilationCache,
+    validate_manifest,
+)
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import (
     ManifestComponentTransformer,
 )
@@ -83,12 +85,20 @@ class ManifestDeclarativeSource(DeclarativeSource):
         # If custom components are needed, locate and/or register them.
         self.components_module: ModuleType | None = get_registered_components_module(config=config)
 
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters(
-            "", resolved_source_config, {}
-        )
-        self._source_config = propagated_source_config
+        manifest_cache = ManifestCompilationCache.from_env()
+        cached_source_config = manifest_cache.get(manifest) if manifest_cache else None
+        self._source_config: Mapping[str, Any]
+        if cached_source_config is not None:
+            self._source_config = cached_source_config
+        else:
+            resolved_source_config = ManifestReferenceResolver().preprocess_manifest(
+                deepcopy(manifest) if manifest_cache else manifest
+            )
+            self._source_config = ManifestComponentTransformer().propagate_types_and_parameters(
+                "", resolved_source_config, {}
+            )
         self._debug = debug
+        self._stream_names_to_build: Optional[Set[str]] = None
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = (
             component_factory
@@ -100,7 +110,10 @@ class ManifestDeclarativeSource(DeclarativeSource):
             AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
         )
 
-        self._validate_source()
+        # Cached manifests were validated against the schema before being cached
+        self._validate_source(validate_schema=cached_source_config is None)
+        if manifest_cache and cached_source_config is None:
+            manifest_cache.put(manifest, self._source_config)
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
@@ -141,6 +154,18 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if api_budget_model:
             self._constructor.set_api_budget(api_budget_model, config)
 
+        stream_configs = self._initialize_cache_for_parent_streams(deepcopy(stream_configs))
+        if self._stream_names_to_build is not None:
+            # Parent streams are built from the definitions nested in their substreams so only the selected streams are needed
+            stream_configs = [
+                stream_config
+                for stream_config in stream_configs
+                if stream_config["name"] in self._stream_names_to_build
+            ]
+        self._constructor.set_shared_parent_stream_names(
+            self._get_shared_parent_stream_names(stream_configs)
+        )
+
         source_streams = [
             self._constructor.create_component(
                 DeclarativeStreamModel,
@@ -148,11 +173,38 @@ class ManifestDeclarativeSource(DeclarativeSource):
                 config,
                 emit_connector_builder_messages=self._emit_connector_builder_messages,
             )
-            for stream_config in self._initialize_cache_for_parent_streams(deepcopy(stream_configs))
+            for stream_config in stream_configs
         ]
 
         return source_streams
 
+    @contextmanager
+    def _only_build_streams(self, stream_names: Optional[Iterable[str]]) -> Iterator[None]:
+        """
+        Restrict the streams built by `streams` to `stream_names` within the context. Building a stream parses its definition and creates
+        all of its components, which is wasted work for the streams that a read or a check does not use. None builds all the streams.
+        """
+        previous_stream_names = self._stream_names_to_build
+        self._stream_names_to_build = set(stream_names) if stream_names is not None else None
+        try:
+            yield
+        finally:
+            self._stream_names_to_build = previous_stream_names
+
+    def _check_stream_names(self) -> Optional[List[str]]:
+        """
+        Return the names of the streams used by a CheckStream connection checker, None if the checker could use any stream. The names
+        are only returned if they are all defined in the manifest so that the checker can report the streams available otherwise.
+        """
+        check = self._source_config.get("check", {})
+        if check.get("type", "CheckStream") != "CheckStream" or not check.get("stream_names"):
+            return None
+        stream_names: List[str] = check["stream_names"]
+        defined_stream_names = {
+            stream_config.get("name") for stream_config in self._stream_configs(self._source_config)
+        }
+        return stream_names if defined_stream_names.issuperset(stream_names) else None
+
     @staticmethod
     def _initialize_cache_for_parent_streams(
         stream_configs: List[Dict[str, Any]],
@@ -189,6 +241,31 @@ class ManifestDeclarativeSource(DeclarativeSource):
 
         return stream_configs
 
+    @staticmethod
+    def _get_shared_parent_stream_names(stream_configs: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Return the names of the parent streams read by more than one substream, including the parents of parent streams.
+        """
+        readers_by_parent: Dict[str, int] = {}
+
+        def count_parents(stream_config: Mapping[str, Any]) -> None:
+            partition_routers = stream_config.get("retriever", {}).get("partition_router") or []
+            for partition_router in (
+                partition_routers if isinstance(partition_routers, list) else [partition_routers]
+            ):
+                if not isinstance(partition_router, dict):
+                    continue
+                for parent_config in partition_router.get("parent_stream_configs", []):
+                    parent_stream = parent_config["stream"]
+                    readers_by_parent[parent_stream["name"]] = (
+                        readers_by_parent.get(parent_stream["name"], 0) + 1
+                    )
+                    count_parents(parent_stream)
+
+        for stream_config in stream_configs:
+            count_parents(stream_config)
+        return {name for name, readers in readers_by_parent.items() if readers > 1}
+
     def spec(self, logger: logging.Logger) -> ConnectorSpecification:
         """
         Returns the connector specification (spec) as defined in the Airbyte Protocol. The spec is an object describing the possible
@@ -212,7 +289,11 @@ class ManifestDeclarativeSource(DeclarativeSource):
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         self._configure_logger_level(logger)
-        return super().check(logger, config)
+        with (
+            self._only_build_streams(self._check_stream_names()),
+            self._constructor.parent_record_cache_scope(),
+        ):
+            return super().check(logger, config)
 
     def read(
         self,
@@ -222,7 +303,13 @@ class ManifestDeclarativeSource(DeclarativeSource):
         state: Optional[List[AirbyteStateMessage]] = None,
     ) -> Iterator[AirbyteMessage]:
         self._configure_logger_level(logger)
-        yield from super().read(logger, config, catalog, state)
+        with (
+            self._only_build_streams(
+                configured_stream.stream.name for configured_stream in catalog.streams
+            ),
+            self._constructor.parent_record_cache_scope(),
+        ):
+            yield from super().read(logger, config, catalog, state)
 
     def _configure_logger_level(self, logger: logging.Logger) -> None:
         """
@@ -231,27 +318,10 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if self._debug:
             logger.setLevel(logging.DEBUG)
 
-    def _validate_source(self) -> None:
+    def _validate_source(self, validate_schema: bool = True) -> None:
         """
         Validates the connector manifest against the declarative component schema
         """
-        try:
-            raw_component_schema = pkgutil.get_data(
-                "airbyte_cdk", "sources/declarative/declarative_component_schema.yaml"
-            )
-            if raw_component_schema is not None:
-                declarative_component_schema = yaml.load(
-                    raw_component_schema, Loader=yaml.SafeLoader
-                )
-            else:
-                raise RuntimeError(
-                    "Failed to read manifest component json schema required for validation"
-                )
-        except FileNotFoundError as e:
-            raise FileNotFoundError(
-                f"Failed to read manifest component json schema required for validation: {e}"
-            )
-
         streams = self._source_config.get("streams")
         dynamic_streams = self._source_config.get("dynamic_streams")
         if not (streams or dynamic_streams):
@@ -259,12 +329,13 @@ class ManifestDeclarativeSource(DeclarativeSource):
                 f"A valid manifest should have at least one stream defined. Got {streams}"
             )
 
-        try:
-            validate(self._source_config, declarative_component_schema)
-        except ValidationError as e:
-            raise ValidationError(
-                "Validation against json schema defined in declarative_component_schema.yaml schema failed"
-            ) from e
+        if validate_schema:
+            try:
+                validate_manifest(self._source_config)
+            except ValidationError as e:
+                raise ValidationError(
+                    "Validation against json schema defined in declarative_component_schema.yaml schema failed"
+                ) from e
 
         cdk_version_str = metadata.version("airbyte_cdk")
         cdk_version = self._parse_version(cdk_version_str, "airbyte-cdk")
@@ -80,6 +80,11 @@ class ConcurrencyLevel(BaseModel):
         examples=[20, 100],
         title="Max Concurrency",
     )
+    adaptive: Optional[bool] = Field(
+        False,
+        description="If enabled, the number of partitions synced at the same time starts at default_concurrency and is adjusted between 1 and max_concurrency: it is increased while the API latency stays stable and decreased when the API latency grows or when requests are rate limited. max_concurrency is required when enabled.",
+        title="Adaptive Concurrency",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -844,6 +849,17 @@ class JsonlDecoder(BaseModel):
     type: Literal["JsonlDecoder"]
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal["StreamingJsonDecoder"]
+    field_path: Optional[List[str]] = Field(
+        [],
+        description="Path to the array of records in the response. Numeric segments select an element of an array. If the value at the path is not an array, it is the only record.",
+        examples=[["data"], ["data", "records"]],
+        title="Field Path",
+    )
+    encoding: Optional[str] = "utf-8"
+
+
 class KeysToLower(BaseModel):
     type: Literal["KeysToLower"]
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
@@ -1666,6 +1682,28 @@ class MovingWindowCallRatePolicy(BaseModel):
     )
 
 
+class TokenBucketCallRatePolicy(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    type: Literal["TokenBucketCallRatePolicy"]
+    rate: Rate = Field(
+        ...,
+        description="The rate at which calls are made available.",
+        title="Rate",
+    )
+    capacity: Optional[int] = Field(
+        None,
+        description="The maximum number of calls that can be made in a burst. Defaults to the limit of the rate.",
+        title="Capacity",
+    )
+    matchers: List[HttpRequestRegexMatcher] = Field(
+        ...,
+        description="List of matchers that define which requests this policy applies to.",
+        title="Matchers",
+    )
+
+
 class UnlimitedCallRatePolicy(BaseModel):
     class Config:
         extra = Extra.allow
@@ -1776,7 +1814,7 @@ class RecordSelector(BaseModel):
 
 class GzipDecoder(BaseModel):
     type: Literal["GzipDecoder"]
-    decoder: Union[CsvDecoder, GzipDecoder, JsonDecoder, JsonlDecoder]
+    decoder: Union[CsvDecoder, GzipDecoder, JsonDecoder, JsonlDecoder, StreamingJsonDecoder]
 
 
 class Spec(BaseModel):
@@ -1818,6 +1856,7 @@ class HTTPAPIBudget(BaseModel):
         Union[
             FixedWindowCallRatePolicy,
             MovingWindowCallRatePolicy,
+            TokenBucketCallRatePolicy,
             UnlimitedCallRatePolicy,
         ]
     ] = Field(
@@ -1847,10 +1886,12 @@ class ZipfileDecoder(BaseModel):
         extra = Extra.allow
 
     type: Literal["ZipfileDecoder"]
-    decoder: Union[CsvDecoder, GzipDecoder, JsonDecoder, JsonlDecoder] = Field(
-        ...,
-        description="Parser to parse the decompressed data from the zipfile(s).",
-        title="Parser",
+    decoder: Union[CsvDecoder, GzipDecoder, JsonDecoder, JsonlDecoder, StreamingJsonDecoder] = (
+        Field(
+            ...,
+            description="Parser to parse the decompressed data from the zipfile(s).",
+            title="Parser",
+        )
     )
 
 
@@ -2161,6 +2202,17 @@ class HttpRequester(BaseModel):
         description="Enables stream requests caching. This field is automatically set by the CDK.",
         title="Use Cache",
     )
+    cache_expire_after: Optional[str] = Field(
+        None,
+        description="The duration in ISO 8601 duration notation after which the cached responses of this requester expire when requests are cached. Omitting it will result in the responses being cached for the whole sync.",
+        examples=["PT5M", "PT1H"],
+        title="Cache Expiration",
+    )
+    use_http2: Optional[bool] = Field(
+        False,
+        description="Send the requests over HTTP/2 when the API supports it so that the requests sent concurrently to the API share a few multiplexed connections. Requires the `httpx[http2]` package to be installed.",
+        title="Use HTTP/2",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -2265,6 +2317,7 @@ class SimpleRetriever(BaseModel):
             GzipDecoder,
             JsonDecoder,
             JsonlDecoder,
+            StreamingJsonDecoder,
             IterableDecoder,
             XmlDecoder,
             ZipfileDecoder,
@@ -2343,6 +2396,7 @@ class AsyncRetriever(BaseModel):
             GzipDecoder,
             JsonDecoder,
             JsonlDecoder,
+            StreamingJsonDecoder,
             IterableDecoder,
             XmlDecoder,
             ZipfileDecoder,
@@ -2359,6 +2413,7 @@ class AsyncRetriever(BaseModel):
             GzipDecoder,
             JsonDecoder,
             JsonlDecoder,
+            StreamingJsonDecoder,
             IterableDecoder,
             XmlDecoder,
             ZipfileDecoder,
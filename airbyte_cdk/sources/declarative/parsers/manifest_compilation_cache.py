@@ -0,0 +1,161 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import pkgutil
+import stat
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import yaml
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+from airbyte_cdk.utils.constants import ENV_MANIFEST_CACHE_PATH
+
+LOGGER = logging.getLogger("airbyte")
+
+
+@lru_cache(maxsize=1)
+def _load_declarative_component_schema() -> bytes:
+    try:
+        raw_component_schema = pkgutil.get_data(
+            "airbyte_cdk", "sources/declarative/declarative_component_schema.yaml"
+        )
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            f"Failed to read manifest component json schema required for validation: {e}"
+        )
+    if raw_component_schema is None:
+        raise RuntimeError("Failed to read manifest component json schema required for validation")
+    return raw_component_schema
+
+
+@lru_cache(maxsize=1)
+def get_declarative_component_schema_validator() -> Validator:
+    """
+    Return the validator of the declarative component schema. The schema is parsed and checked once per process.
+    """
+    declarative_component_schema = yaml.load(
+        _load_declarative_component_schema(), Loader=yaml.SafeLoader
+    )
+    validator_class = validator_for(declarative_component_schema)
+    validator_class.check_schema(declarative_component_schema)
+    return validator_class(declarative_component_schema)  # type: ignore[no-any-return]  # jsonschema is not typed
+
+
+def validate_manifest(manifest: Mapping[str, Any]) -> None:
+    """
+    Raise the most relevant ValidationError of the manifest against the declarative component schema, as `jsonschema.validate` would.
+    """
+    error = best_match(get_declarative_component_schema_validator().iter_errors(manifest))
+    if error is not None:
+        raise error
+
+
+class ManifestCompilationCache:
+    """
+    On-disk cache of manifests that were resolved, propagated and validated against the declarative component schema so that processes
+    running the same manifest skip this work.
+
+    Entries are keyed by a hash of the manifest, of the declarative component schema and of the CDK version: a change to any of them
+    creates a new entry. Only manifests that passed the validation are cached.
+
+    As a cached manifest is not validated again, the cache is only used if its directory and its entries are owned by the current user
+    and can't be written by other users.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    @classmethod
+    def from_env(cls) -> Optional["ManifestCompilationCache"]:
+        """
+        Return the cache stored in the directory defined by the `MANIFEST_CACHE_PATH` environment variable, None if it is not set.
+        """
+        directory = os.getenv(ENV_MANIFEST_CACHE_PATH)
+        return cls(Path(directory)) if directory else None
+
+    def get(self, manifest: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        key = self._key(manifest)
+        if key is None or not self._is_directory_trusted():
+            return None
+        try:
+            with open(self._directory / f"{key}.json", "rb") as cache_file:
+                if not self._is_trusted(os.fstat(cache_file.fileno()), stat.S_ISREG):
+                    LOGGER.warning(
+                        f"Ignoring the compiled manifest {cache_file.name} as it can be written by other users"
+                    )
+                    return None
+                compiled_manifest: Dict[str, Any] = json.load(cache_file)
+                return compiled_manifest
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exception:
+            LOGGER.warning(f"Failed to read the compiled manifest from the cache: {exception}")
+            return None
+
+    def put(self, manifest: Mapping[str, Any], compiled_manifest: Mapping[str, Any]) -> None:
+        key = self._key(manifest)
+        if key is None:
+            return
+        try:
+            serialized_manifest = json.dumps(compiled_manifest).encode()
+        except (TypeError, ValueError):
+            # Manifests with values that are not JSON serializable (e.g. dates parsed from YAML) are not cached
+            return
+        try:
+            self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._is_directory_trusted():
+                return
+            # The entry is written to a temporary file first so that concurrent processes never read a partial entry. Temporary files are
+            # only readable and writable by the current user.
+            with tempfile.NamedTemporaryFile(dir=self._directory, delete=False) as temporary_file:
+                temporary_file.write(serialized_manifest)
+            os.replace(temporary_file.name, self._directory / f"{key}.json")
+        except OSError as exception:
+            LOGGER.warning(f"Failed to write the compiled manifest to the cache: {exception}")
+
+    def _is_directory_trusted(self) -> bool:
+        try:
+            # The directory itself must not be a symbolic link as its target could be changed by another user
+            status = self._directory.lstat()
+        except FileNotFoundError:
+            return False
+        except OSError as exception:
+            LOGGER.warning(f"Failed to access the manifest cache {self._directory}: {exception}")
+            return False
+        if not self._is_trusted(status, stat.S_ISDIR):
+            LOGGER.warning(
+                f"Not using the manifest cache {self._directory} as it is not a directory owned by the current user and only writable by them"
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _is_trusted(status: os.stat_result, is_expected_type: Callable[[int], bool]) -> bool:
+        if not is_expected_type(status.st_mode):
+            return False
+        if not hasattr(os, "getuid"):
+            # Permissions are not exposed through the mode and owner on Windows
+            return True
+        return status.st_uid == os.getuid() and not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    @staticmethod
+    def _key(manifest: Mapping[str, Any]) -> Optional[str]:
+        try:
+            serialized_manifest = json.dumps(manifest, sort_keys=True).encode()
+        except (TypeError, ValueError):
+            return None
+        digest = hashlib.sha256(serialized_manifest)
+        digest.update(_load_declarative_component_schema())
+        digest.update(metadata.version("airbyte_cdk").encode())
+        return digest.hexdigest()
@@ -5,18 +5,24 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import importlib
 import inspect
+import json
 import re
+from concurrent.futures import Executor
+from contextlib import nullcontext
 from functools import partial
 from typing import (
     Any,
     Callable,
+    ContextManager,
     Dict,
     List,
     Mapping,
     MutableMapping,
     Optional,
+    Set,
     Type,
     Union,
     get_args,
@@ -73,6 +79,7 @@ from airbyte_cdk.sources.declarative.decoders.composite_raw_decoder import (
     JsonLineParser,
     JsonParser,
     Parser,
+    StreamingJsonParser,
 )
 from airbyte_cdk.sources.declarative.extractors import (
     DpathExtractor,
@@ -354,9 +361,15 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     StreamConfig as StreamConfigModel,
 )
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
+    StreamingJsonDecoder as StreamingJsonDecoderModel,
+)
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     SubstreamPartitionRouter as SubstreamPartitionRouterModel,
 )
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
+    TokenBucketCallRatePolicy as TokenBucketCallRatePolicyModel,
+)
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     TypesMap as TypesMapModel,
 )
@@ -390,6 +403,12 @@ from airbyte_cdk.sources.declarative.partition_routers import (
 from airbyte_cdk.sources.declarative.partition_routers.async_job_partition_router import (
     AsyncJobPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.concurrent_parent_stream_reader import (
+    ConcurrentParentStreamReader,
+)
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
     ParentStreamConfig,
 )
@@ -483,8 +502,12 @@ from airbyte_cdk.sources.streams.call_rate import (
     HttpRequestRegexMatcher,
     MovingWindowCallRatePolicy,
     Rate,
+    TokenBucketCallRatePolicy,
     UnlimitedCallRatePolicy,
 )
+from airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.streams.concurrent.clamping import (
     ClampingEndProvider,
     ClampingStrategy,
@@ -527,6 +550,7 @@ class ModelToComponentFactory:
         disable_resumable_full_refresh: bool = False,
         message_repository: Optional[MessageRepository] = None,
         connector_state_manager: Optional[ConnectorStateManager] = None,
+        parent_record_cache: Optional[ParentRecordCache] = None,
     ):
         self._init_mappings()
         self._limit_pages_fetched_per_slice = limit_pages_fetched_per_slice
@@ -539,7 +563,16 @@ class ModelToComponentFactory:
             self._evaluate_log_level(emit_connector_builder_messages)
         )
         self._connector_state_manager = connector_state_manager or ConnectorStateManager()
+        # The Connector Builder shows the requests made to read parent streams so they are read for every substream
+        if parent_record_cache is None and not emit_connector_builder_messages:
+            parent_record_cache = ParentRecordCache()
+        self._parent_record_cache = parent_record_cache
+        self._shared_parent_stream_names: Set[str] = set()
         self._api_budget: Optional[Union[APIBudget, HttpAPIBudget]] = None
+        self._parent_stream_executor: Optional[Executor] = None
+        self._concurrency_controller: Optional[AdaptiveConcurrencyController] = None
+        self._connection_pool_size: Optional[int] = None
+        self._max_prefetched_parent_slices = 0
 
     def _init_mappings(self) -> None:
         self.PYDANTIC_MODEL_TO_CONSTRUCTOR: Mapping[Type[BaseModel], Callable[..., Any]] = {
@@ -583,6 +616,7 @@ class ModelToComponentFactory:
             InlineSchemaLoaderModel: self.create_inline_schema_loader,
             JsonDecoderModel: self.create_json_decoder,
             JsonlDecoderModel: self.create_jsonl_decoder,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             GzipDecoderModel: self.create_gzip_decoder,
             KeysToLowerModel: self.create_keys_to_lower_transformation,
             KeysToSnakeCaseModel: self.create_keys_to_snake_transformation,
@@ -628,6 +662,7 @@ class ModelToComponentFactory:
             HTTPAPIBudgetModel: self.create_http_api_budget,
             FixedWindowCallRatePolicyModel: self.create_fixed_window_call_rate_policy,
             MovingWindowCallRatePolicyModel: self.create_moving_window_call_rate_policy,
+            TokenBucketCallRatePolicyModel: self.create_token_bucket_call_rate_policy,
             UnlimitedCallRatePolicyModel: self.create_unlimited_call_rate_policy,
             RateModel: self.create_rate,
             HttpRequestRegexMatcherModel: self.create_http_request_matcher,
@@ -956,6 +991,7 @@ class ModelToComponentFactory:
             max_concurrency=model.max_concurrency,
             config=config,
             parameters={},
+            adaptive=model.adaptive or False,
         )
 
     @staticmethod
@@ -2074,8 +2110,14 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
             message_repository=self._message_repository,
             use_cache=use_cache,
+            cache_expire_after=parse_duration(model.cache_expire_after)
+            if model.cache_expire_after
+            else None,
             decoder=decoder,
             stream_response=decoder.is_stream_response() if decoder else False,
+            concurrency_controller=self._concurrency_controller,
+            connection_pool_size=self._connection_pool_size,
+            use_http2=bool(model.use_http2),
         )
 
     @staticmethod
@@ -2213,6 +2255,14 @@ class ModelToComponentFactory:
             stream_response=False if self._emit_connector_builder_messages else True,
         )
 
+    def create_streaming_json_decoder(
+        self, model: StreamingJsonDecoderModel, config: Config, **kwargs: Any
+    ) -> Decoder:
+        return CompositeRawDecoder(
+            parser=ModelToComponentFactory._get_parser(model, config),
+            stream_response=False if self._emit_connector_builder_messages else True,
+        )
+
     def create_gzip_decoder(
         self, model: GzipDecoderModel, config: Config, **kwargs: Any
     ) -> Decoder:
@@ -2279,6 +2329,10 @@ class ModelToComponentFactory:
             return JsonParser()
         elif isinstance(model, JsonlDecoderModel):
             return JsonLineParser()
+        elif isinstance(model, StreamingJsonDecoderModel):
+            return StreamingJsonParser(
+                field_path=model.field_path or [], encoding=model.encoding or "utf-8"
+            )
         elif isinstance(model, CsvDecoderModel):
             return CsvParser(encoding=model.encoding, delimiter=model.delimiter)
         elif isinstance(model, GzipDecoderModel):
@@ -2505,6 +2559,50 @@ class ModelToComponentFactory:
             incremental_dependency=model.incremental_dependency or False,
             parameters=model.parameters or {},
             extra_fields=model.extra_fields,
+            # Caching the records of a parent only read by one substream would cost without being reused
+            record_cache=self._parent_record_cache
+            if model.stream.name in self._shared_parent_stream_names
+            else None,
+            # Parents with an incremental dependency return different records for each substream so they can't be cached
+            record_cache_key=None
+            if model.incremental_dependency
+            else self._get_parent_record_cache_key(model, config),
+            concurrent_reader=self._create_concurrent_parent_stream_reader(
+                model, declarative_stream, config
+            ),
+        )
+
+    @staticmethod
+    def _get_parent_record_cache_key(model: ParentStreamConfigModel, config: Config) -> str:
+        # The records of a parent depend on its definition and on the config it is read with
+        fingerprint = hashlib.sha256(model.stream.json(sort_keys=True).encode())
+        fingerprint.update(json.dumps(config, sort_keys=True, default=str).encode())
+        return fingerprint.hexdigest()
+
+    def _create_concurrent_parent_stream_reader(
+        self, model: ParentStreamConfigModel, parent_stream: DeclarativeStream, config: Config
+    ) -> Optional[ConcurrentParentStreamReader]:
+        if (
+            self._parent_stream_executor is None
+            or self._max_prefetched_parent_slices < 1
+            or not isinstance(parent_stream.retriever, SimpleRetriever)
+        ):
+            return None
+        # The slices read ahead start from the state of the parent when the read started. Cursors that filter records on the state left by
+        # the previous slices are read serially, as are the cursors keeping pagination or per partition state.
+        cursor = parent_stream.get_cursor()
+        if cursor and (
+            not isinstance(cursor, DatetimeBasedCursor)
+            or isinstance(
+                getattr(parent_stream.retriever.record_selector, "record_filter", None),
+                ClientSideIncrementalRecordFilterDecorator,
+            )
+        ):
+            return None
+        return ConcurrentParentStreamReader(
+            executor=self._parent_stream_executor,
+            create_stream=lambda: self._create_component_from_model(model.stream, config=config),
+            max_prefetched_slices=self._max_prefetched_parent_slices,
         )
 
     @staticmethod
@@ -2984,12 +3082,23 @@ class ModelToComponentFactory:
             emit_connector_builder_messages=self._emit_connector_builder_messages,
             disable_retries=self._disable_retries,
             disable_cache=self._disable_cache,
+            disable_resumable_full_refresh=self._disable_resumable_full_refresh,
+            parent_record_cache=self._parent_record_cache,
             message_repository=LogAppenderMessageRepositoryDecorator(
                 {"airbyte_cdk": {"stream": {"is_substream": True}}, "http": {"is_auxiliary": True}},
                 self._message_repository,
                 self._evaluate_log_level(self._emit_connector_builder_messages),
             ),
         )
+        if self._parent_stream_executor:
+            substream_factory.set_parent_stream_executor(
+                self._parent_stream_executor, self._max_prefetched_parent_slices
+            )
+        if self._concurrency_controller:
+            substream_factory.set_concurrency_controller(self._concurrency_controller)
+        if self._connection_pool_size:
+            substream_factory.set_connection_pool_size(self._connection_pool_size)
+        substream_factory.set_shared_parent_stream_names(self._shared_parent_stream_names)
         return substream_factory._create_component_from_model(model=model, config=config)
 
     @staticmethod
@@ -3184,6 +3293,19 @@ class ModelToComponentFactory:
             matchers=matchers,
         )
 
+    def create_token_bucket_call_rate_policy(
+        self, model: TokenBucketCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> TokenBucketCallRatePolicy:
+        matchers = [
+            self._create_component_from_model(model=matcher, config=config)
+            for matcher in model.matchers
+        ]
+        return TokenBucketCallRatePolicy(
+            rate=self._create_component_from_model(model=model.rate, config=config),
+            matchers=matchers,
+            capacity=model.capacity,
+        )
+
     def create_unlimited_call_rate_policy(
         self, model: UnlimitedCallRatePolicyModel, config: Config, **kwargs: Any
     ) -> UnlimitedCallRatePolicy:
@@ -3218,3 +3340,43 @@ class ModelToComponentFactory:
         self._api_budget = self.create_component(
             model_type=HTTPAPIBudgetModel, component_definition=component_definition, config=config
         )
+
+    def parent_record_cache_scope(self) -> ContextManager[None]:
+        """
+        Scope the parent records shared between substreams to a read or a check. See `ParentRecordCache.sync_scope`.
+        """
+        if self._parent_record_cache is None:
+            return nullcontext()
+        return self._parent_record_cache.sync_scope()
+
+    def set_parent_stream_executor(
+        self, executor: Optional[Executor], max_prefetched_slices: int
+    ) -> None:
+        """
+        Read the slices of parent streams in parallel on `executor`, with up to `max_prefetched_slices` slices read ahead of the partitions
+        being generated. The executor must not be shut down while the streams created afterwards are read. If None, parent streams are
+        read serially.
+        """
+        self._parent_stream_executor = executor
+        self._max_prefetched_parent_slices = max_prefetched_slices
+
+    def set_shared_parent_stream_names(self, stream_names: Set[str]) -> None:
+        """
+        Share the records of the parent streams named `stream_names` between the substreams reading them. The records of other parent
+        streams are not cached.
+        """
+        self._shared_parent_stream_names = stream_names
+
+    def set_concurrency_controller(
+        self, concurrency_controller: AdaptiveConcurrencyController
+    ) -> None:
+        """
+        Report the latency and the rate limits of the requests made by the components created to `concurrency_controller`.
+        """
+        self._concurrency_controller = concurrency_controller
+
+    def set_connection_pool_size(self, connection_pool_size: int) -> None:
+        """
+        Keep up to `connection_pool_size` connections open to each API, ideally the number of threads sending requests.
+        """
+        self._connection_pool_size = connection_pool_size
@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import copy
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Any, Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.types import Record, StreamSlice, StreamState
+
+if TYPE_CHECKING:
+    from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+
+DEFAULT_MAX_BUFFERED_RECORDS_PER_SLICE = 1000
+_PUT_TIMEOUT_SECONDS = 0.1
+
+
+class _SliceDone:
+    pass
+
+
+class _SliceFailed:
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+_SLICE_DONE = _SliceDone()
+_NO_MORE_SLICES: Any = object()
+
+
+class ConcurrentParentStreamReader:
+    """
+    Reads the slices of a parent stream in parallel so that the partitions of a substream can be generated while the next parent slices
+    are being fetched.
+
+    Records are returned in the same order as when reading the parent stream serially: the records of a slice are returned as soon as they
+    are read but only once all the records of the previous slices were returned. At most `max_prefetched_slices` slices are read ahead of
+    the slice being returned. Each slice read ahead uses its own instance of the parent stream, created by `create_stream`, because the
+    retrievers keep the pagination state of the slice they read.
+
+    The executor can be shared with the readers of other parent streams. To ensure the reader never waits on a task that can't start
+    because all the workers are busy, a slice that is still pending once its records are needed is read by the calling thread instead.
+
+    If the parent stream has a cursor, the cursor of the parent stream observes the records and closes the slices in the same order as
+    when reading serially, so that its state at each record is the state of a serial read. This keeps the parent state checkpointed by
+    substreams with an incremental dependency correct. The streams reading slices ahead start from the state the parent stream had when
+    the read started. The cursor is therefore expected to filter records only on the boundaries of their slice, as a DatetimeBasedCursor
+    without client side filtering does, and not on the state left by the previous slices.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        create_stream: Callable[[], "DeclarativeStream"],
+        max_prefetched_slices: int,
+        max_buffered_records_per_slice: int = DEFAULT_MAX_BUFFERED_RECORDS_PER_SLICE,
+    ) -> None:
+        self._executor = executor
+        self._create_stream = create_stream
+        self._max_prefetched_slices = max_prefetched_slices
+        self._max_buffered_records_per_slice = max_buffered_records_per_slice
+        self._idle_streams: "queue.SimpleQueue[DeclarativeStream]" = queue.SimpleQueue()
+
+    def read(self, parent_stream: "DeclarativeStream") -> Iterable[StreamData]:
+        if self._max_prefetched_slices < 1:
+            yield from parent_stream.read_only_records()
+            return
+
+        stream_slices = iter(parent_stream.stream_slices(sync_mode=SyncMode.full_refresh))
+        cursor = parent_stream.get_cursor()
+        initial_state = copy.deepcopy(parent_stream.state) if cursor else None
+        in_flight: Deque[Tuple[Future[None], "queue.Queue[Any]", Optional[StreamSlice]]] = deque()
+        is_stopped = threading.Event()
+        try:
+            self._prefetch(stream_slices, in_flight, is_stopped, initial_state)
+            while in_flight:
+                future, records, stream_slice = in_flight.popleft()
+                # The next slices are read while the records of this one are being returned
+                self._prefetch(stream_slices, in_flight, is_stopped, initial_state)
+                if future.cancel():
+                    # No worker picked the slice yet so it is read by this thread instead of waiting for one. The parent stream updates its
+                    # own cursor.
+                    yield from parent_stream.read_records(
+                        sync_mode=SyncMode.full_refresh, stream_slice=stream_slice
+                    )
+                    continue
+                # Same as the slice SimpleRetriever.read_records observes and closes
+                cursor_slice = stream_slice or StreamSlice(partition={}, cursor_slice={})
+                while True:
+                    record = records.get()
+                    if record is _SLICE_DONE:
+                        break
+                    if isinstance(record, _SliceFailed):
+                        raise record.exception
+                    if cursor and isinstance(record, Record):
+                        cursor.observe(cursor_slice, record)
+                    yield record
+                if cursor:
+                    cursor.close_slice(cursor_slice)
+        finally:
+            is_stopped.set()
+            for future, _, _ in in_flight:
+                future.cancel()
+
+    def _prefetch(
+        self,
+        stream_slices: Iterator[Optional[StreamSlice]],
+        in_flight: Deque[Tuple[Future[None], "queue.Queue[Any]", Optional[StreamSlice]]],
+        is_stopped: threading.Event,
+        initial_state: Optional[StreamState],
+    ) -> None:
+        while len(in_flight) < self._max_prefetched_slices:
+            stream_slice = next(stream_slices, _NO_MORE_SLICES)
+            if stream_slice is _NO_MORE_SLICES:
+                return
+            records: "queue.Queue[Any]" = queue.Queue(maxsize=self._max_buffered_records_per_slice)
+            future = self._executor.submit(
+                self._read_slice, stream_slice, records, is_stopped, initial_state
+            )
+            in_flight.append((future, records, stream_slice))
+
+    def _read_slice(
+        self,
+        stream_slice: Optional[StreamSlice],
+        records: "queue.Queue[Any]",
+        is_stopped: threading.Event,
+        initial_state: Optional[StreamState],
+    ) -> None:
+        try:
+            stream = self._idle_streams.get_nowait()
+        except queue.Empty:
+            stream = None
+        result: Any = _SLICE_DONE
+        try:
+            if stream is None:
+                stream = self._create_stream()
+            if initial_state is not None:
+                # The cursor of the stream was moved by the slices it previously read
+                stream.state = copy.deepcopy(dict(initial_state))
+            for record in stream.read_records(
+                sync_mode=SyncMode.full_refresh, stream_slice=stream_slice
+            ):
+                if not self._put(records, record, is_stopped):
+                    return
+        except BaseException as exception:
+            result = _SliceFailed(exception)
+        finally:
+            # The stream is released before the slice is completed so that the next slice can reuse it
+            if stream is not None:
+                self._idle_streams.put(stream)
+        self._put(records, result, is_stopped)
+
+    @staticmethod
+    def _put(records: "queue.Queue[Any]", record: Any, is_stopped: threading.Event) -> bool:
+        while not is_stopped.is_set():
+            try:
+                records.put(record, timeout=_PUT_TIMEOUT_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
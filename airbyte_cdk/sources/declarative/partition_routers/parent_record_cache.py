@@ -0,0 +1,169 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import pickle
+import sqlite3
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional
+
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+_READ_BATCH_SIZE = 1000
+
+
+class _CachedValues:
+    def __init__(self, key_id: int) -> None:
+        self.key_id = key_id
+        self.in_memory: List[bytes] = []
+        self.memory_bytes = 0
+        self.spilled = 0
+        self.is_complete = False
+
+
+class ParentRecordCache:
+    """
+    Cache of the values extracted from the records of parent streams so that the substreams sharing a parent read it once per sync.
+
+    Values are pickled so that they can't be modified through the slices created from them. They are kept in memory until the cache holds
+    `max_memory_bytes` bytes, subsequent values are written to a temporary sqlite database on disk that is deleted once the cache is closed.
+
+    Values are only served from the cache once the values for their key were read entirely. While another reader is filling the cache for
+    a key, or if the values could not be read entirely (e.g. an error happened or the reader stopped early), values are read again.
+
+    Sources read within `sync_scope()` so that values are never shared between syncs, even when the source is used for several of them.
+    """
+
+    def __init__(self, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES) -> None:
+        self._max_memory_bytes = max_memory_bytes
+        self._memory_bytes = 0
+        self._values_by_key: Dict[Hashable, _CachedValues] = {}
+        self._next_key_id = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._open_scopes = 0
+        self._lock = Lock()
+
+    def read(self, key: Hashable, read_values: Callable[[], Iterable[Any]]) -> Iterable[Any]:
+        """
+        Yield the values cached for `key`. If they are not cached, yield the values returned by `read_values` and cache them.
+        """
+        with self._lock:
+            cached_values = self._values_by_key.get(key)
+            if cached_values is None:
+                cached_values = _CachedValues(self._next_key_id)
+                self._next_key_id += 1
+                self._values_by_key[key] = cached_values
+                is_caching = True
+            else:
+                is_caching = False
+
+        if is_caching:
+            yield from self._read_and_cache(key, cached_values, read_values)
+        elif cached_values.is_complete:
+            yield from self._read_cached(cached_values)
+        else:
+            # Another reader is filling the cache for this key
+            yield from read_values()
+
+    @contextmanager
+    def sync_scope(self) -> Iterator[None]:
+        """
+        Clear the cache when the outermost scope is entered and close it when it exits. Nested scopes, such as the synchronous streams
+        read within the read of a concurrent source, share the values of the outermost scope.
+        """
+        with self._lock:
+            is_outermost = self._open_scopes == 0
+            self._open_scopes += 1
+        if is_outermost:
+            self.close()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._open_scopes -= 1
+            if is_outermost:
+                self.close()
+
+    def close(self) -> None:
+        """
+        Drop the cached values and delete the temporary database. The cache can still be used afterwards.
+        """
+        with self._lock:
+            self._values_by_key.clear()
+            self._memory_bytes = 0
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    def _read_and_cache(
+        self, key: Hashable, cached_values: _CachedValues, read_values: Callable[[], Iterable[Any]]
+    ) -> Iterable[Any]:
+        is_caching = True
+        try:
+            for value in read_values():
+                if is_caching:
+                    try:
+                        self._append(cached_values, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+                    except (pickle.PicklingError, TypeError, AttributeError):
+                        self._discard(key, cached_values)
+                        is_caching = False
+                yield value
+        except BaseException:
+            if is_caching:
+                self._discard(key, cached_values)
+            raise
+        if is_caching:
+            cached_values.is_complete = True
+
+    def _append(self, cached_values: _CachedValues, value: bytes) -> None:
+        with self._lock:
+            if self._memory_bytes + len(value) <= self._max_memory_bytes:
+                cached_values.in_memory.append(value)
+                cached_values.memory_bytes += len(value)
+                self._memory_bytes += len(value)
+            else:
+                self._get_connection().execute(
+                    "INSERT INTO cached_values (key_id, position, value) VALUES (?, ?, ?)",
+                    (cached_values.key_id, cached_values.spilled, value),
+                )
+                cached_values.spilled += 1
+
+    def _read_cached(self, cached_values: _CachedValues) -> Iterable[Any]:
+        for value in cached_values.in_memory:
+            yield pickle.loads(value)
+        position = 0
+        while position < cached_values.spilled:
+            with self._lock:
+                rows = (
+                    self._get_connection()
+                    .execute(
+                        "SELECT value FROM cached_values WHERE key_id = ? AND position >= ? ORDER BY position LIMIT ?",
+                        (cached_values.key_id, position, _READ_BATCH_SIZE),
+                    )
+                    .fetchall()
+                )
+            for (value,) in rows:
+                yield pickle.loads(value)
+            position += len(rows)
+
+    def _discard(self, key: Hashable, cached_values: _CachedValues) -> None:
+        with self._lock:
+            if self._values_by_key.get(key) is cached_values:
+                del self._values_by_key[key]
+            self._memory_bytes -= cached_values.memory_bytes
+            cached_values.in_memory = []
+            cached_values.memory_bytes = 0
+            if cached_values.spilled and self._connection:
+                self._connection.execute(
+                    "DELETE FROM cached_values WHERE key_id = ?", (cached_values.key_id,)
+                )
+            cached_values.spilled = 0
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # An empty path creates a temporary database on disk that is deleted when the connection is closed
+            self._connection = sqlite3.connect("", check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE cached_values (key_id INTEGER, position INTEGER, value BLOB, PRIMARY KEY (key_id, position))"
+            )
+        return self._connection
@@ -4,13 +4,29 @@
 import copy
 import logging
 from dataclasses import InitVar, dataclass
-from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import dpath
 
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.concurrent_parent_stream_reader import (
+    ConcurrentParentStreamReader,
+)
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import (
     RequestOption,
@@ -34,6 +50,10 @@ class ParentStreamConfig:
     extra_fields: Additional field paths to include in the stream slice
     request_option: How to inject the slice value on an outgoing HTTP request
     incremental_dependency (bool): Indicates if the parent stream should be read incrementally.
+    record_cache: Cache shared by the substreams of a sync to read the parent stream once
+    record_cache_key: Identifies the definition of the parent stream in the record cache. Parent streams with the same key must return the
+        same records. If None, the values extracted from the parent records are not cached.
+    concurrent_reader: Reads the slices of the parent stream in parallel. If None, the parent stream is read serially.
     """
 
     stream: "DeclarativeStream"  # Parent streams must be DeclarativeStream because we can't know which part of the stream slice is a partition for regular Stream
@@ -46,6 +66,9 @@ class ParentStreamConfig:
     )
     request_option: Optional[RequestOption] = None
     incremental_dependency: bool = False
+    record_cache: Optional[ParentRecordCache] = None
+    record_cache_key: Optional[str] = None
+    concurrent_reader: Optional[ConcurrentParentStreamReader] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
@@ -150,7 +173,6 @@ class SubstreamPartitionRouter(PartitionRouter):
             yield from []
         else:
             for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
                 parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
                 partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
                 extra_fields = None
@@ -160,42 +182,9 @@ class SubstreamPartitionRouter(PartitionRouter):
                         for field_path in parent_stream_config.extra_fields
                     ]
 
-                # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
-                # not support either substreams or RFR, but something that needs to be considered once we do
-                for parent_record in parent_stream.read_only_records():
-                    parent_partition = None
-                    # Skip non-records (eg AirbyteLogMessage)
-                    if isinstance(parent_record, AirbyteMessage):
-                        self.logger.warning(
-                            f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
-                        )
-                        if parent_record.type == MessageType.RECORD:
-                            parent_record = parent_record.record.data  # type: ignore[union-attr, assignment]  # record is always a Record
-                        else:
-                            continue
-                    elif isinstance(parent_record, Record):
-                        parent_partition = (
-                            parent_record.associated_slice.partition
-                            if parent_record.associated_slice
-                            else {}
-                        )
-                        parent_record = parent_record.data
-                    elif not isinstance(parent_record, Mapping):
-                        # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
-                        raise AirbyteTracedException(
-                            message=f"Parent stream returned records as invalid type {type(parent_record)}"
-                        )
-                    try:
-                        partition_value = dpath.get(
-                            parent_record,  # type: ignore [arg-type]
-                            parent_field,
-                        )
-                    except KeyError:
-                        continue
-
-                    # Add extra fields
-                    extracted_extra_fields = self._extract_extra_fields(parent_record, extra_fields)
-
+                for partition_value, parent_partition, extracted_extra_fields in self._read_parent(
+                    parent_stream_config, parent_field, extra_fields
+                ):
                     yield StreamSlice(
                         partition={
                             partition_field: partition_value,
@@ -205,6 +194,80 @@ class SubstreamPartitionRouter(PartitionRouter):
                         extra_fields=extracted_extra_fields,
                     )
 
+    def _read_parent(
+        self,
+        parent_stream_config: ParentStreamConfig,
+        parent_field: Any,
+        extra_fields: Optional[List[List[str]]],
+    ) -> Iterable[Tuple[Any, Optional[Mapping[str, Any]], Mapping[str, Any]]]:
+        """
+        Yield the parent key value, the parent partition and the extra fields of each record of the parent stream.
+
+        Parents read incrementally can't be shared as their records depend on the state of each substream. Other parents are read once per
+        record cache for a given parent key and extra fields.
+        """
+        record_cache = parent_stream_config.record_cache
+        if (
+            record_cache is None
+            or parent_stream_config.record_cache_key is None
+            or parent_stream_config.incremental_dependency
+        ):
+            return self._read_parent_records(parent_stream_config, parent_field, extra_fields)
+        key = (parent_stream_config.record_cache_key, repr(parent_field), repr(extra_fields))
+        return record_cache.read(
+            key,
+            lambda: self._read_parent_records(parent_stream_config, parent_field, extra_fields),
+        )
+
+    def _read_parent_records(
+        self,
+        parent_stream_config: ParentStreamConfig,
+        parent_field: Any,
+        extra_fields: Optional[List[List[str]]],
+    ) -> Iterable[Tuple[Any, Optional[Mapping[str, Any]], Mapping[str, Any]]]:
+        parent_stream = parent_stream_config.stream
+        # The slices of the parent are read in parallel when a concurrent reader is set, else the parent is read serially
+        parent_records = (
+            parent_stream_config.concurrent_reader.read(parent_stream)
+            if parent_stream_config.concurrent_reader
+            else parent_stream.read_only_records()
+        )
+        for parent_record in parent_records:
+            parent_partition = None
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                self.logger.warning(
+                    f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
+                )
+                if parent_record.type == MessageType.RECORD:
+                    parent_record = parent_record.record.data  # type: ignore[union-attr, assignment]  # record is always a Record
+                else:
+                    continue
+            elif isinstance(parent_record, Record):
+                parent_partition = (
+                    parent_record.associated_slice.partition
+                    if parent_record.associated_slice
+                    else {}
+                )
+                parent_record = parent_record.data
+            elif not isinstance(parent_record, Mapping):
+                # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
+                raise AirbyteTracedException(
+                    message=f"Parent stream returned records as invalid type {type(parent_record)}"
+                )
+            try:
+                partition_value = dpath.get(
+                    parent_record,  # type: ignore [arg-type]
+                    parent_field,
+                )
+            except KeyError:
+                continue
+
+            # Add extra fields
+            extracted_extra_fields = self._extract_extra_fields(parent_record, extra_fields)
+
+            yield partition_value, parent_partition, extracted_extra_fields
+
     def _extract_extra_fields(
         self,
         parent_record: Mapping[str, Any] | AirbyteMessage,
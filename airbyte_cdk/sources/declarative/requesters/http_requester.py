@@ -5,10 +5,12 @@
 import logging
 import os
 from dataclasses import InitVar, dataclass, field
+from datetime import timedelta
 from typing import Any, Callable, Mapping, MutableMapping, Optional, Union
 from urllib.parse import urljoin
 
 import requests
+import requests_cache
 
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import (
     DeclarativeAuthenticator,
@@ -25,6 +27,9 @@ from airbyte_cdk.sources.declarative.requesters.request_options.interpolated_req
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod, Requester
 from airbyte_cdk.sources.message import MessageRepository, NoopMessageRepository
 from airbyte_cdk.sources.streams.call_rate import APIBudget
+from airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.streams.http import HttpClient
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler
 from airbyte_cdk.sources.types import Config, EmptyString, StreamSlice, StreamState
@@ -50,6 +55,11 @@ class HttpRequester(Requester):
         backoff_strategies (Optional[List[BackoffStrategy]]): List of backoff strategies to use when retrying requests
         config (Config): The user-provided configuration as specified by the source's spec
         use_cache (bool): Indicates that data should be cached for this stream
+        concurrency_controller (Optional[AdaptiveConcurrencyController]): Controller to report the latency and the rate limits of the requests to
+        connection_pool_size (Optional[int]): Number of connections kept open to the API, ideally the number of threads sending requests
+        use_http2 (bool): Indicates that the requests are sent over HTTP/2 when the API supports it
+        cache_expire_after (Optional[timedelta]): How long the responses are cached when use_cache is True. If None, they don't expire during the sync
+        cache_backend (Optional[requests_cache.BaseCache]): Backend storing the cached responses when use_cache is True. If None, the responses are shared with the other streams, see airbyte_cdk.sources.streams.http.response_cache
     """
 
     name: str
@@ -69,6 +79,11 @@ class HttpRequester(Requester):
     _exit_on_rate_limit: bool = False
     stream_response: bool = False
     decoder: Decoder = field(default_factory=lambda: JsonDecoder(parameters={}))
+    concurrency_controller: Optional[AdaptiveConcurrencyController] = None
+    connection_pool_size: Optional[int] = None
+    use_http2: bool = False
+    cache_expire_after: Optional[timedelta] = None
+    cache_backend: Optional[requests_cache.BaseCache] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._url_base = InterpolatedString.create(self.url_base, parameters=parameters)
@@ -107,6 +122,11 @@ class HttpRequester(Requester):
             backoff_strategy=backoff_strategies,
             disable_retries=self.disable_retries,
             message_repository=self.message_repository,
+            concurrency_controller=self.concurrency_controller,
+            connection_pool_size=self.connection_pool_size,
+            use_http2=self.use_http2,
+            cache_backend=self.cache_backend,
+            cache_expire_after=self.cache_expire_after,
         )
 
     @property
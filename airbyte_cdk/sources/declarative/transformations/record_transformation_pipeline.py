@@ -0,0 +1,204 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import dpath
+import dpath.exceptions
+
+from airbyte_cdk.sources.declarative.transformations import RecordTransformation
+from airbyte_cdk.sources.declarative.transformations.add_fields import (
+    AddFields,
+    ParsedAddFieldDefinition,
+)
+from airbyte_cdk.sources.declarative.transformations.keys_to_snake_transformation import (
+    KeysToSnakeCaseTransformation,
+)
+from airbyte_cdk.sources.declarative.transformations.remove_fields import RemoveFields
+from airbyte_cdk.sources.types import Config, StreamSlice, StreamState
+
+# A step transforms a record given the stream state and the stream slice, and returns the transformed record
+TransformationStep = Callable[
+    [Dict[str, Any], Optional[StreamState], Optional[StreamSlice]], Dict[str, Any]
+]
+
+_GLOB_CHARACTERS = frozenset("*?[]")
+_KEY_CACHE_SIZE = 4096
+
+
+class RecordTransformationPipeline:
+    """
+    Applies a list of transformations to records like calling `transform` for each transformation in order does, but with the work that
+    does not depend on the record done once when the pipeline is created:
+    * AddFields sets fields without dpath when their path is made of dictionary keys
+    * RemoveFields deletes fields without dpath, which walks the whole record, when their path is made of dictionary keys without globs
+      and has no condition
+    * KeysToSnakeCaseTransformation caches the snake case version of the keys and builds the transformed record without copying it again
+
+    Other transformations, including subclasses of the ones above, are applied by calling `transform`.
+    """
+
+    def __init__(self, transformations: Sequence[RecordTransformation], config: Config) -> None:
+        self.transformations = list(transformations)
+        self._steps = [
+            self._compile(transformation, config) for transformation in self.transformations
+        ]
+
+    def transform(
+        self,
+        record: Dict[str, Any],
+        stream_state: Optional[StreamState] = None,
+        stream_slice: Optional[StreamSlice] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return the transformed record. Transformations update the record in place unless they rebuild it in which case a new record is
+        returned.
+        """
+        for step in self._steps:
+            record = step(record, stream_state, stream_slice)
+        return record
+
+    def is_compiled_from(self, transformations: Sequence[RecordTransformation]) -> bool:
+        return len(transformations) == len(self.transformations) and all(
+            transformation is compiled_transformation
+            for transformation, compiled_transformation in zip(
+                transformations, self.transformations
+            )
+        )
+
+    @classmethod
+    def _compile(cls, transformation: RecordTransformation, config: Config) -> TransformationStep:
+        # The exact types are checked as subclasses could change the behavior of the transformation
+        if type(transformation) is AddFields:
+            return cls._compile_add_fields(transformation, config)
+        if type(transformation) is RemoveFields and not transformation.condition:
+            return cls._compile_remove_fields(transformation)
+        if type(transformation) is KeysToSnakeCaseTransformation:
+            return cls._compile_keys_to_snake_case(transformation)
+
+        def transform(
+            record: Dict[str, Any],
+            stream_state: Optional[StreamState],
+            stream_slice: Optional[StreamSlice],
+        ) -> Dict[str, Any]:
+            transformation.transform(
+                record, config=config, stream_state=stream_state, stream_slice=stream_slice
+            )
+            return record
+
+        return transform
+
+    @staticmethod
+    def _compile_add_fields(transformation: AddFields, config: Config) -> TransformationStep:
+        config = config if config is not None else {}
+        fields = [
+            (
+                parsed_field,
+                (parsed_field.value_type,) if parsed_field.value_type else None,
+                _is_dictionary_path(parsed_field.path),
+            )
+            for parsed_field in transformation._parsed_fields
+        ]
+
+        def add_fields(
+            record: Dict[str, Any],
+            stream_state: Optional[StreamState],
+            stream_slice: Optional[StreamSlice],
+        ) -> Dict[str, Any]:
+            for parsed_field, valid_types, is_dictionary_path in fields:
+                value = parsed_field.value.eval(
+                    config, valid_types=valid_types, record=record, stream_slice=stream_slice
+                )
+                if not (is_dictionary_path and _set_in_dictionaries(record, parsed_field, value)):
+                    dpath.new(record, parsed_field.path, value)
+            return record
+
+        return add_fields
+
+    @staticmethod
+    def _compile_remove_fields(transformation: RemoveFields) -> TransformationStep:
+        pointers = [
+            (
+                pointer,
+                _is_dictionary_path(pointer)
+                and not any(_GLOB_CHARACTERS.intersection(segment) for segment in pointer),
+            )
+            for pointer in transformation.field_pointers
+        ]
+
+        def remove_fields(
+            record: Dict[str, Any],
+            stream_state: Optional[StreamState],
+            stream_slice: Optional[StreamSlice],
+        ) -> Dict[str, Any]:
+            for pointer, is_dictionary_path in pointers:
+                if is_dictionary_path:
+                    parent: Any = record
+                    for segment in pointer[:-1]:
+                        if not isinstance(parent, dict):
+                            break
+                        parent = parent.get(segment)
+                    if isinstance(parent, dict):
+                        parent.pop(pointer[-1], None)
+                        continue
+                    if not isinstance(parent, list):
+                        # The path does not exist in the record
+                        continue
+                # dpath matches globs and list indices
+                try:
+                    dpath.delete(record, pointer)
+                except dpath.exceptions.PathNotFound:
+                    pass
+            return record
+
+        return remove_fields
+
+    @staticmethod
+    def _compile_keys_to_snake_case(
+        transformation: KeysToSnakeCaseTransformation,
+    ) -> TransformationStep:
+        process_key = lru_cache(maxsize=_KEY_CACHE_SIZE)(transformation.process_key)
+
+        def transform_record(record: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                process_key(key): transform_record(value) if isinstance(value, dict) else value
+                for key, value in record.items()
+            }
+
+        def keys_to_snake_case(
+            record: Dict[str, Any],
+            stream_state: Optional[StreamState],
+            stream_slice: Optional[StreamSlice],
+        ) -> Dict[str, Any]:
+            return transform_record(record)
+
+        return keys_to_snake_case
+
+
+def _is_dictionary_path(path: List[str]) -> bool:
+    """
+    Return True if each segment of the path is a dictionary key for dpath, i.e. a string that is not a list index.
+    """
+    return bool(path) and all(
+        isinstance(segment, str) and not segment.isdecimal() for segment in path
+    )
+
+
+def _set_in_dictionaries(
+    record: Dict[str, Any], parsed_field: ParsedAddFieldDefinition, value: Any
+) -> bool:
+    """
+    Set the value at the path of the field, creating the missing dictionaries, like `dpath.new` does. Return False without setting the
+    value if the path goes through a value that is not a dictionary.
+    """
+    current: Any = record
+    for segment in parsed_field.path[:-1]:
+        if segment not in current:
+            current[segment] = {}
+        current = current[segment]
+        if not isinstance(current, dict):
+            return False
+    current[parsed_field.path[-1]] = value
+    return True
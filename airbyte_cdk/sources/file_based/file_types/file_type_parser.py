@@ -43,6 +43,12 @@ class FileTypeParser(ABC):
         """
         return None
 
+    def get_byte_range_size(self, config: FileBasedStreamConfig) -> Optional[int]:
+        """
+        The size of the byte ranges in which files larger than it are split so that the ranges are parsed in parallel using `parse_records_in_byte_range`, or None if files are parsed as a whole.
+        """
+        return None
+
     @abstractmethod
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -77,6 +83,28 @@ class FileTypeParser(ABC):
         """
         ...
 
+    def parse_records_in_byte_range(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
+        byte_range: Optional[Tuple[int, Optional[int]]],
+    ) -> Iterable[Record]:
+        """
+        Parse and emit each record starting in the range of bytes `[start, end)` of the file, the end being None for the last range which
+        is read until the end of the file. If `byte_range` is None, all the records of the file are emitted.
+
+        By default, files are parsed as a whole with `parse_records`. Parsers returning a size from `get_byte_range_size` must override this
+        method to parse the ranges files are split in.
+        """
+        if byte_range is not None and byte_range != (0, None):
+            raise ValueError(
+                f"{type(self).__name__} parses files as a whole and can't parse the byte range {byte_range}"
+            )
+        return self.parse_records(config, file, stream_reader, logger, discovered_schema)
+
     @property
     @abstractmethod
     def file_read_mode(self) -> FileReadMode:
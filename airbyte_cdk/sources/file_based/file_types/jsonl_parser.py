@@ -2,7 +2,6 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import json
 import logging
 from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
 
@@ -21,11 +20,23 @@ from airbyte_cdk.sources.file_based.schema_helpers import (
     SchemaType,
     merge_schemas,
 )
+from airbyte_cdk.utils.line_reader import read_lines
 
 
 class JsonlParser(FileTypeParser):
     MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
-    ENCODING = "utf8"
+    # The file is read as bytes which orjson parses as UTF-8
+    ENCODING = None
+
+    def __init__(self, byte_range_size: Optional[int] = None) -> None:
+        """
+        :param byte_range_size: if set, files larger than this number of bytes are split in ranges of this size which are parsed in
+          parallel. The JSON objects must then be on a single line as a range can start in the middle of a multiline JSON object.
+        """
+        self._byte_range_size = byte_range_size
+
+    def get_byte_range_size(self, config: FileBasedStreamConfig) -> Optional[int]:
+        return self._byte_range_size
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -72,6 +83,43 @@ class JsonlParser(FileTypeParser):
         """
         yield from self._parse_jsonl_entries(file, stream_reader, logger)
 
+    def parse_records_in_byte_range(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
+        byte_range: Optional[Tuple[int, Optional[int]]],
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        A range yields the lines that start within it: unless the range starts the file, the line the range starts in belongs to the
+        previous range and is skipped, and the line that starts before the end of the range is read until its end.
+        """
+        start, end = byte_range or (0, None)
+        with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
+            position = start
+            if start > 0:
+                # Reading from the previous byte skips the partial line, or only the line break if the range starts a line
+                fp.seek(start - 1)
+                position += len(fp.readline()) - 1
+            line_no = 0
+            for line in read_lines(fp):
+                if end is not None and position >= end:
+                    break
+                position += len(line)
+                line_no += 1
+                if not line.strip():
+                    continue
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError as exc:
+                    raise RecordParseError(
+                        FileBasedSourceError.ERROR_PARSING_RECORD,
+                        filename=file.uri,
+                        lineno=f"{byte_range=}, {line_no=}",
+                    ) from exc
+
     @classmethod
     def _infer_schema_for_record(cls, record: Dict[str, Any]) -> Dict[str, Any]:
         record_schema = {}
@@ -85,7 +133,7 @@ class JsonlParser(FileTypeParser):
 
     @property
     def file_read_mode(self) -> FileReadMode:
-        return FileReadMode.READ
+        return FileReadMode.READ_BINARY
 
     def _parse_jsonl_entries(
         self,
@@ -101,14 +149,23 @@ class JsonlParser(FileTypeParser):
             has_warned_for_multiline_json_object = False
             yielded_at_least_once = False
 
-            accumulator = None
-            for line in fp:
-                if not accumulator:
-                    accumulator = self._instantiate_accumulator(line)
+            # Lines are only accumulated once a line can't be parsed on its own, i.e. when a JSON object is spread over multiple lines
+            accumulator: Optional[Union[bytes, str]] = None
+            for line in read_lines(fp):
                 read_bytes += len(line)
-                accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
+                to_parse: Union[bytes, str]
+                if accumulator is None:
+                    to_parse = line
+                else:
+                    accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
+                    to_parse = accumulator
                 try:
-                    record = orjson.loads(accumulator)
+                    record = orjson.loads(to_parse)
+                except orjson.JSONDecodeError:
+                    had_json_parsing_error = True
+                    if accumulator is None:
+                        accumulator = line
+                else:
                     if had_json_parsing_error and not has_warned_for_multiline_json_object:
                         logger.warning(
                             f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced"
@@ -117,9 +174,7 @@ class JsonlParser(FileTypeParser):
 
                     yield record
                     yielded_at_least_once = True
-                    accumulator = self._instantiate_accumulator(line)
-                except orjson.JSONDecodeError:
-                    had_json_parsing_error = True
+                    accumulator = None
 
                 if (
                     read_limit
@@ -136,10 +191,3 @@ class JsonlParser(FileTypeParser):
                 raise RecordParseError(
                     FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line
                 )
-
-    @staticmethod
-    def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
-        if isinstance(line, bytes):
-            return bytes("", json.detect_encoding(line))
-        elif isinstance(line, str):
-            return ""
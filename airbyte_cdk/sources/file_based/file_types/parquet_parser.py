@@ -5,7 +5,8 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -15,6 +16,7 @@ from pyarrow import DictionaryArray, Scalar
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import (
     FileBasedStreamConfig,
     ParquetFormat,
+    ValidationPolicy,
 )
 from airbyte_cdk.sources.file_based.exceptions import (
     ConfigValidationError,
@@ -29,9 +31,13 @@ from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeP
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 
+_UTC_TIME_ZONES = frozenset({"UTC", "utc", "Etc/UTC", "+00:00"})
+
 
 class ParquetParser(FileTypeParser):
     ENCODING = None
+    # Number of rows converted to records at once, which bounds the memory used by the row groups that are read
+    BATCH_SIZE = 10_000
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -88,19 +94,16 @@ class ParquetParser(FileTypeParser):
                 partition_columns = {
                     x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)
                 }
+                columns = self._columns_to_read(config, reader.schema_arrow, discovered_schema)
                 for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
-                        line_no += 1
-                        yield {
-                            **{
-                                column: ParquetParser._to_output_value(
-                                    batch.column(column)[row], parquet_format
-                                )
-                                for column in batch.column_names
-                            },
-                            **partition_columns,
-                        }
+                    for batch in reader.iter_batches(
+                        batch_size=self.BATCH_SIZE, row_groups=[row_group], columns=columns
+                    ):
+                        for record in self._batch_to_records(
+                            batch, parquet_format, partition_columns
+                        ):
+                            line_no += 1
+                            yield record
         except Exception as exc:
             raise RecordParseError(
                 FileBasedSourceError.ERROR_PARSING_RECORD,
@@ -108,6 +111,47 @@ class ParquetParser(FileTypeParser):
                 lineno=f"{row_group=}, {line_no=}",
             ) from exc
 
+    @staticmethod
+    def _columns_to_read(
+        config: FileBasedStreamConfig,
+        parquet_schema: pa.Schema,
+        discovered_schema: Optional[Mapping[str, SchemaType]],
+    ) -> Optional[List[str]]:
+        """
+        Return the columns of the file that are in the schema of the configured catalog, or None to read all the columns.
+
+        All the columns are read unless records are emitted regardless of the schema, as the other validation policies must see
+        the columns that are not in the schema.
+        """
+        if (
+            config.schemaless
+            or config.validation_policy != ValidationPolicy.emit_record
+            or not isinstance(discovered_schema, Mapping)
+        ):
+            return None
+        properties = discovered_schema.get("properties")
+        if not isinstance(properties, Mapping):
+            return None
+        return [name for name in parquet_schema.names if name in properties]
+
+    @staticmethod
+    def _batch_to_records(
+        batch: pa.RecordBatch, parquet_format: ParquetFormat, partition_columns: Mapping[str, str]
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Convert a batch to records column by column, which is much faster than converting each value of each row to a scalar.
+        """
+        column_names = batch.schema.names
+        columns = [
+            ParquetParser._column_to_python_values(column, parquet_format)
+            for column in batch.columns
+        ]
+        rows: Iterable[Tuple[Any, ...]] = zip(*columns) if columns else repeat((), batch.num_rows)
+        for row in rows:
+            record = dict(zip(column_names, row))
+            record.update(partition_columns)
+            yield record
+
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
         return [unquote(partition) for partition in filepath.split(os.sep) if "=" in partition]
@@ -133,53 +177,93 @@ class ParquetParser(FileTypeParser):
         """
         Convert a pyarrow scalar to a value that can be output by the source.
         """
-        if parquet_value.as_py() is None:
+        value = parquet_value.as_py()
+        if value is None:
             return None
+        convert = ParquetParser._python_value_converter(parquet_value.type, parquet_format)
+        return convert(value) if convert else value
+
+    @staticmethod
+    def _column_to_python_values(column: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a pyarrow array to values that can be output by the source, like `_scalar_to_python_value` does for each of its values.
+        """
+        if (
+            pa.types.is_timestamp(column.type)
+            and column.type.tz in _UTC_TIME_ZONES
+            and column.type.unit != "ns"
+        ):
+            # Building naive datetimes is much faster than building datetimes with a time zone
+            return [
+                None if value is None else f"{value.isoformat()}+00:00"
+                for value in column.cast(pa.timestamp(column.type.unit)).to_pylist()
+            ]
+        if pa.types.is_map(column.type):
+            # Slicing the keys and the items of all the maps is much faster than converting each map to a list of tuples
+            keys = column.keys.to_pylist()
+            items = column.items.to_pylist()
+            offsets = column.offsets.to_pylist()
+            return [
+                dict(zip(keys[offsets[i] : offsets[i + 1]], items[offsets[i] : offsets[i + 1]]))
+                if is_valid
+                else None
+                for i, is_valid in enumerate(column.is_valid().to_pylist())
+            ]
+
+        values: List[Any] = column.to_pylist()
+        convert = ParquetParser._python_value_converter(column.type, parquet_format)
+        if convert is None:
+            return values
+        return [None if value is None else convert(value) for value in values]
 
+    @staticmethod
+    def _python_value_converter(
+        parquet_type: pa.DataType, parquet_format: ParquetFormat
+    ) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting the python values of a pyarrow data type that are not None to values that can be output by the
+        source, or None if the python values are output as is.
+        """
         # Convert date and datetime objects to isoformat strings
         if (
-            pa.types.is_time(parquet_value.type)
-            or pa.types.is_timestamp(parquet_value.type)
-            or pa.types.is_date(parquet_value.type)
+            pa.types.is_time(parquet_type)
+            or pa.types.is_timestamp(parquet_type)
+            or pa.types.is_date(parquet_type)
         ):
-            return parquet_value.as_py().isoformat()
+            return lambda value: value.isoformat()
 
         # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda value: json.loads(json.dumps(value))
 
         # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            return parquet_value.as_py().decode("utf-8")
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
 
-        if pa.types.is_decimal(parquet_value.type):
-            if parquet_format.decimal_as_float:
-                return float(parquet_value.as_py())
-            else:
-                return str(parquet_value.as_py())
+        if pa.types.is_decimal(parquet_type):
+            return float if parquet_format.decimal_as_float else str
 
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
+        if pa.types.is_map(parquet_type):
+            return lambda value: {k: v for k, v in value}
 
-        if pa.types.is_null(parquet_value.type):
-            return None
+        if pa.types.is_null(parquet_type):
+            return lambda value: None
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        if pa.types.is_duration(parquet_type):
+            if parquet_type.unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif parquet_type.unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif parquet_type.unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif parquet_type.unit == "ns":
+                return (
+                    lambda duration: duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
+                )
             else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
-        else:
-            return parquet_value.as_py()
+                raise ValueError(f"Unknown duration unit: {parquet_type.unit}")
+        return None
 
     @staticmethod
     def _dictionary_array_to_python_value(parquet_value: DictionaryArray) -> Dict[str, Any]:
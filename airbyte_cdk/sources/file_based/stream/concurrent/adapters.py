@@ -5,7 +5,17 @@
 import copy
 import logging
 from functools import cache, lru_cache
-from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import deprecated
 
@@ -288,6 +298,8 @@ class FileBasedStreamPartition(Partition):
             len(self._slice["files"]) == 1
         ), f"Expected 1 file per partition but got {len(self._slice['files'])} for stream {self.stream_name()}"
         file = self._slice["files"][0]
+        if "byte_range" in self._slice:
+            return {"files": [file], "byte_range": self._slice["byte_range"]}
         return {"files": [file]}
 
     def __hash__(self) -> int:
@@ -299,6 +311,8 @@ class FileBasedStreamPartition(Partition):
                 )
             else:
                 s = f"{self._slice['files'][0].last_modified.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}_{self._slice['files'][0].uri}"
+                if "byte_range" in self._slice:
+                    s += f"_{self._slice['byte_range']}"
             return hash((self._stream.name, s))
         else:
             return hash(self._stream.name)
@@ -338,15 +352,38 @@ class FileBasedStreamPartitionGenerator(PartitionGenerator):
         ):
             if _slice is not None:
                 for file in _slice.get("files", []):
-                    pending_partitions.append(
-                        FileBasedStreamPartition(
-                            self._stream,
-                            {"files": [copy.deepcopy(file)]},
-                            self._message_repository,
-                            self._sync_mode,
-                            self._cursor_field,
-                            self._state,
+                    for byte_range in self._byte_ranges(file):
+                        partition_slice: MutableMapping[str, Any] = {"files": [copy.deepcopy(file)]}
+                        if byte_range is not None:
+                            partition_slice["byte_range"] = byte_range
+                        pending_partitions.append(
+                            FileBasedStreamPartition(
+                                self._stream,
+                                partition_slice,
+                                self._message_repository,
+                                self._sync_mode,
+                                self._cursor_field,
+                                self._state,
+                            )
                         )
-                    )
         self._cursor.set_pending_partitions(pending_partitions)
         yield from pending_partitions
+
+    def _byte_ranges(self, file: RemoteFile) -> List[Optional[Tuple[int, Optional[int]]]]:
+        """
+        Return the byte ranges in which the file is split so that they are read in parallel, or `[None]` if the file is read as a whole
+        because the parser does not split files or the file is not larger than a range. The last range is read until the end of the
+        file, which also covers the files whose size is not the number of bytes read from them, e.g. compressed files.
+        """
+        if getattr(self._stream, "use_file_transfer", False):
+            return [None]
+        byte_range_size = self._stream.get_parser().get_byte_range_size(self._stream.config)
+        if not byte_range_size:
+            return [None]
+        file_size = self._stream.stream_reader.file_size(file)
+        if file_size <= byte_range_size:
+            return [None]
+        return [
+            (start, start + byte_range_size if start + byte_range_size < file_size else None)
+            for start in range(0, file_size, byte_range_size)
+        ]
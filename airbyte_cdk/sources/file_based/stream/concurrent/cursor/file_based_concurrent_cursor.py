@@ -61,6 +61,8 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
         self._state_lock = RLock()
         self._pending_files_lock = RLock()
         self._pending_files: Optional[Dict[str, RemoteFile]] = None
+        # Files split in byte ranges are read by multiple partitions and are only added once all of them are read
+        self._pending_partitions_per_file: Dict[str, int] = {}
         self._file_to_datetime_history = stream_state.get("history", {}) if stream_state else {}
         self._prev_cursor_value = self._compute_prev_sync_cursor(stream_state)
         self._sync_start = self._compute_start_time()
@@ -82,15 +84,19 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
     def set_pending_partitions(self, partitions: List["FileBasedStreamPartition"]) -> None:
         with self._pending_files_lock:
             self._pending_files = {}
+            self._pending_partitions_per_file = {}
             for partition in partitions:
                 _slice = partition.to_slice()
                 if _slice is None:
                     continue
                 for file in _slice["files"]:
-                    if file.uri in self._pending_files.keys():
+                    if file.uri in self._pending_files.keys() and "byte_range" not in _slice:
                         raise RuntimeError(
                             f"Already found file {_slice} in pending files. This is unexpected. Please contact Support."
                         )
+                    self._pending_partitions_per_file[file.uri] = (
+                        self._pending_partitions_per_file.get(file.uri, 0) + 1
+                    )
                 self._pending_files.update({file.uri: file})
 
     def _compute_prev_sync_cursor(self, value: Optional[StreamState]) -> Tuple[datetime, str]:
@@ -152,6 +158,11 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
                         )
                     )
                 else:
+                    remaining_partitions = self._pending_partitions_per_file.pop(file.uri, 1) - 1
+                    if remaining_partitions > 0:
+                        # Other byte ranges of the file are still being read
+                        self._pending_partitions_per_file[file.uri] = remaining_partitions
+                        return
                     self._pending_files.pop(file.uri)
                 self._file_to_datetime_history[file.uri] = file.last_modified.strftime(
                     self.DATE_TIME_FORMAT
@@ -48,6 +48,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     FILE_TRANSFER_KW = "use_file_transfer"
     PRESERVE_DIRECTORY_STRUCTURE_KW = "preserve_directory_structure"
     FILES_KEY = "files"
+    BYTE_RANGE_KEY = "byte_range"
     DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
     ab_last_mod_col = "_ab_source_file_last_modified"
     ab_file_name_col = "_ab_source_file_url"
@@ -188,9 +189,17 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                             self.name, record, is_file_transfer_message=True
                         )
                 else:
-                    for record in parser.parse_records(
-                        self.config, file, self.stream_reader, self.logger, schema
-                    ):
+                    byte_range = stream_slice.get(self.BYTE_RANGE_KEY)
+                    records = (
+                        parser.parse_records_in_byte_range(
+                            self.config, file, self.stream_reader, self.logger, schema, byte_range
+                        )
+                        if byte_range
+                        else parser.parse_records(
+                            self.config, file, self.stream_reader, self.logger, schema
+                        )
+                    )
+                    for record in records:
                         line_no += 1
                         if self.config.schemaless:
                             record = {"data": record}
@@ -9,7 +9,7 @@ import logging
 import re
 import time
 from datetime import timedelta
-from threading import RLock
+from threading import Lock, RLock
 from typing import TYPE_CHECKING, Any, Mapping, Optional
 from urllib import parse
 
@@ -475,6 +475,130 @@ class MovingWindowCallRatePolicy(BaseCallRatePolicy):
         )
 
 
+class TokenBucketCallRatePolicy(BaseCallRatePolicy):
+    """
+    Policy to control requests rate with a token bucket: the bucket holds up to {capacity} calls and is refilled continuously at
+    {rate.limit} calls per {rate.interval}, using a monotonic clock.
+
+    Calls are reserved in the order they are requested. When the bucket is empty, a call is given the time at which the tokens it
+    reserved will be available, so that blocked threads sleep once and are served in FIFO order instead of competing for the next call.
+
+    When the API reports that no calls are left until the time of the next reset, the bucket stops refilling continuously until the reset
+    and then receives its whole capacity at once. As long as the API reports calls left, the bucket keeps refilling continuously.
+    """
+
+    def __init__(self, rate: Rate, matchers: list[RequestMatcher], capacity: Optional[int] = None):
+        """Constructor
+
+        :param rate: rate at which the bucket is refilled
+        :param matchers:
+        :param capacity: maximum number of calls that can be made in a burst, defaults to the limit of the rate
+        """
+        capacity = rate.limit if capacity is None else capacity
+        if rate.limit <= 0 or rate.interval <= timedelta(0) or capacity <= 0:
+            raise ValueError("The rate limit, the rate interval and the capacity must be positive")
+        self._rate = rate
+        self._capacity = capacity
+        self._refill_per_second = rate.limit / rate.interval.total_seconds()
+        # Negative when calls are reserved ahead of the tokens being available
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._refill_paused_until: Optional[float] = None
+        self._lock = Lock()
+        super().__init__(matchers=matchers)
+
+    def try_acquire(self, request: Any, weight: int) -> None:
+        self.reserve(request, weight, timeout=0)
+
+    def reserve(self, request: Any, weight: int, timeout: Optional[float] = None) -> timedelta:
+        """Reserve {weight} calls and return how long to wait before making them
+
+        :param request: a request object representing a single call to API
+        :param weight: number of requests to deduct from credit
+        :param timeout: maximum time to wait, if the calls are not available within this time they are not reserved
+        :raises: CallRateLimitHit - when the calls are not available within the timeout
+        """
+        if weight > self._capacity:
+            raise ValueError("Weight can not exceed the capacity")
+        if not self.matches(request):
+            raise ValueError("Request does not match the policy")
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= weight
+            time_to_wait = self._time_until_available(now)
+            if timeout is not None and time_to_wait > timeout:
+                self._tokens += weight
+                raise CallRateLimitHit(
+                    error=f"reached maximum number of allowed calls {self._capacity} for {self}",
+                    item=request,
+                    weight=weight,
+                    rate=f"{self._rate.limit} per {self._rate.interval}",
+                    time_to_wait=timedelta(seconds=time_to_wait),
+                )
+        return timedelta(seconds=time_to_wait)
+
+    def update(
+        self, available_calls: Optional[int], call_reset_ts: Optional[datetime.datetime]
+    ) -> None:
+        """Adjust the bucket to the state of the API server. Like FixedWindowCallRatePolicy, only decreasing updates of available_calls are
+        applied to support call rate limits that are lower than API limits.
+
+        :param available_calls:
+        :param call_reset_ts:
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if available_calls is not None and available_calls < self._tokens:
+                logger.debug(
+                    "got rate limit update from api, adjusting available calls from %s to %s",
+                    self._tokens,
+                    available_calls,
+                )
+                self._tokens = available_calls
+            if available_calls is None:
+                return
+            if available_calls > 0:
+                # The API serves calls again, e.g. its window was reset before the time it reported
+                self._refill_paused_until = None
+            elif call_reset_ts is not None:
+                reset_in = (call_reset_ts - datetime.datetime.now()).total_seconds()
+                if reset_in > 0:
+                    self._refill_paused_until = now + reset_in
+
+    def _refill(self, now: float) -> None:
+        if self._refill_paused_until is not None:
+            if now < self._refill_paused_until:
+                self._last_refill = now
+                return
+            self._tokens = min(self._capacity, self._tokens + self._capacity)
+            self._last_refill = self._refill_paused_until
+            self._refill_paused_until = None
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._refill_per_second
+        )
+        self._last_refill = now
+
+    def _time_until_available(self, now: float) -> float:
+        if self._tokens >= 0:
+            return 0.0
+        if self._refill_paused_until is None:
+            return -self._tokens / self._refill_per_second
+        tokens_after_reset = self._tokens + self._capacity
+        return (self._refill_paused_until - now) + max(
+            0.0, -tokens_after_reset / self._refill_per_second
+        )
+
+    def __str__(self) -> str:
+        matcher_str = ", ".join(f"{matcher}" for matcher in self._matchers)
+        return (
+            f"TokenBucketCallRatePolicy(rate={self._rate.limit} per {self._rate.interval}, capacity={self._capacity}, "
+            f"matchers=[{matcher_str}])"
+        )
+
+
 class AbstractAPIBudget(abc.ABC):
     """Interface to some API where a client allowed to have N calls per T interval.
 
@@ -593,6 +717,15 @@ class APIBudget(AbstractAPIBudget):
         """
         last_exception = None
         endpoint = self._extract_endpoint(request)
+        if block and isinstance(policy, TokenBucketCallRatePolicy):
+            # The call is reserved so that this thread sleeps once until its turn instead of competing with the other waiting threads
+            time_to_wait = policy.reserve(request, weight=1, timeout=timeout)
+            if time_to_wait:
+                logger.debug(
+                    f"Policy {policy} reserved a call for endpoint {endpoint}. Sleeping for {time_to_wait}."
+                )
+                time.sleep(time_to_wait.total_seconds())
+            return
         # sometimes we spend all budget before a second attempt, so we have a few more attempts
         for attempt in range(1, self._maximum_attempts_to_acquire):
             try:
@@ -0,0 +1,148 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import logging
+import threading
+import time
+from queue import Queue
+from typing import Any, Dict, Optional
+
+LOGGER = logging.getLogger("airbyte")
+
+
+class _EndpointLatency:
+    """
+    Exponential moving averages of the latency of an endpoint. Until enough responses were received, the averages are the mean of the
+    responses received so that the first responses don't weigh more than the next ones.
+    """
+
+    _LATENCY_SMOOTHING = 0.2
+    _BASELINE_SMOOTHING = 0.01
+
+    def __init__(self) -> None:
+        self._responses = 0
+        self.latency = 0.0
+        self.baseline = 0.0
+
+    def update(self, latency_seconds: float) -> None:
+        self._responses += 1
+        self.latency += (latency_seconds - self.latency) * max(
+            1 / self._responses, self._LATENCY_SMOOTHING
+        )
+        self.baseline += (latency_seconds - self.baseline) * max(
+            1 / self._responses, self._BASELINE_SMOOTHING
+        )
+
+
+class AdaptiveConcurrencyController:
+    """
+    Limits the number of partitions read at the same time and adjusts this limit from the feedback of the API using additive increase and
+    multiplicative decrease (AIMD):
+    * every response received while the limit is fully used and while the response latency stays close to the baseline latency increases
+      the limit by 1 / limit, i.e. by one partition per round of requests
+    * a rate limited response or a latency growing above `latency_tolerance` times the baseline latency multiplies the limit by
+      `decrease_factor`. Decreases are applied at most once per `decrease_cooldown_seconds` as the requests in flight all observe the
+      same congestion.
+
+    The latency compared to the baseline is averaged over the last responses and the baseline is averaged over a much longer period so that
+    noisy latencies are not taken for congestion. Both are tracked per endpoint as endpoints of the same API can have very different
+    latencies.
+
+    The limit is not increased while the queue of records waiting to be emitted is filled above `queue_high_watermark` because reading more
+    partitions would not increase the throughput of the sync if the records can't be emitted fast enough.
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: int,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        latency_tolerance: float = 2.0,
+        decrease_factor: float = 0.5,
+        decrease_cooldown_seconds: float = 1.0,
+        queue_high_watermark: float = 0.8,
+    ) -> None:
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                f"Expected 1 <= min_concurrency <= max_concurrency but got min_concurrency={min_concurrency} and max_concurrency={max_concurrency}"
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be between 0 and 1 but was {decrease_factor}")
+        self._min_concurrency = min_concurrency
+        self._max_concurrency = max_concurrency
+        self._limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self._latency_tolerance = latency_tolerance
+        self._decrease_factor = decrease_factor
+        self._decrease_cooldown_seconds = decrease_cooldown_seconds
+        self._queue_high_watermark = queue_high_watermark
+        self._queue: Optional["Queue[Any]"] = None
+        self._in_flight = 0
+        self._latencies: Dict[str, _EndpointLatency] = {}
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def concurrency_limit(self) -> int:
+        return int(self._limit)
+
+    def watch_queue(self, queue: "Queue[Any]") -> None:
+        """
+        :param queue: The queue of items waiting to be processed by the main thread. Its `maxsize` must be set.
+        """
+        self._queue = queue
+
+    def try_acquire(self) -> bool:
+        """
+        Return whether a partition can be read now. If so, the partition counts against the limit until it is released.
+        """
+        with self._lock:
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def on_response(self, latency_seconds: float, endpoint: str = "") -> None:
+        """
+        :param latency_seconds: The time it took to receive the response
+        :param endpoint: Identifies the endpoint or requester the response comes from. The latency of a response is only compared to the
+          latency of the previous responses of the same endpoint.
+        """
+        with self._lock:
+            latency = self._latencies.setdefault(endpoint, _EndpointLatency())
+            latency.update(latency_seconds)
+            if latency.latency > latency.baseline * self._latency_tolerance:
+                self._decrease(
+                    f"latency of {latency.latency:.3f}s{f' for {endpoint}' if endpoint else ''} is above {self._latency_tolerance} times the baseline of {latency.baseline:.3f}s"
+                )
+            elif self._in_flight >= int(self._limit) and not self._is_queue_congested():
+                previous_limit = int(self._limit)
+                self._limit = min(self._limit + 1 / self._limit, float(self._max_concurrency))
+                if int(self._limit) > previous_limit:
+                    LOGGER.debug(f"Increasing the concurrency limit to {int(self._limit)}")
+
+    def on_rate_limited(self) -> None:
+        with self._lock:
+            self._decrease("the API rate limited a request")
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self._decrease_cooldown_seconds:
+            return
+        self._last_decrease = now
+        previous_limit = int(self._limit)
+        self._limit = max(self._limit * self._decrease_factor, float(self._min_concurrency))
+        if int(self._limit) < previous_limit:
+            LOGGER.info(
+                f"Decreasing the concurrency limit from {previous_limit} to {int(self._limit)} because {reason}"
+            )
+
+    def _is_queue_congested(self) -> bool:
+        return (
+            self._queue is not None
+            and self._queue.maxsize > 0
+            and self._queue.qsize() >= self._queue.maxsize * self._queue_high_watermark
+        )
@@ -1,14 +1,19 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import time
 from queue import Queue
+from typing import Callable, List, Optional
 
+from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
+    RecordBatch,
 )
+from airbyte_cdk.sources.types import Record
 
 
 class PartitionReader:
@@ -18,11 +23,28 @@ class PartitionReader:
 
     _IS_SUCCESSFUL = True
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(
+        self,
+        queue: Queue[QueueItem],
+        batch_size: int = 1,
+        max_batch_wait_seconds: float = 1.0,
+        record_serializer: Optional[Callable[[Record], AirbyteMessage]] = None,
+    ) -> None:
         """
         :param queue: The queue to put the records in.
+        :param batch_size: The maximum number of records put in the queue as a single RecordBatch. If 1, records are put in the queue
+          one by one.
+        :param max_batch_wait_seconds: The maximum time a record can wait in a partially filled batch before the batch is put in the
+          queue. This is only evaluated when a new record is read.
+        :param record_serializer: If provided, each record is converted to an AirbyteMessage in the worker thread and the messages are put
+          in the RecordBatch along with the records. This implies that records are always put in the queue as batches.
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer but was {batch_size}")
         self._queue = queue
+        self._batch_size = batch_size
+        self._max_batch_wait_seconds = max_batch_wait_seconds
+        self._record_serializer = record_serializer
 
     def process_partition(self, partition: Partition) -> None:
         """
@@ -36,6 +58,12 @@ class PartitionReader:
         :param partition: The partition to read data from
         :return: None
         """
+        if self._batch_size == 1 and not self._record_serializer:
+            self._process_partition_record_by_record(partition)
+        else:
+            self._process_partition_in_batches(partition)
+
+    def _process_partition_record_by_record(self, partition: Partition) -> None:
         try:
             for record in partition.read():
                 self._queue.put(record)
@@ -43,3 +71,35 @@ class PartitionReader:
         except Exception as e:
             self._queue.put(StreamThreadException(e, partition.stream_name()))
             self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _process_partition_in_batches(self, partition: Partition) -> None:
+        serializer = self._record_serializer
+        batch: List[Record] = []
+        messages: List[AirbyteMessage] = []
+        batch_started_at = 0.0
+        try:
+            for record in partition.read():
+                if not batch:
+                    batch_started_at = time.monotonic()
+                if serializer:
+                    messages.append(serializer(record))
+                batch.append(record)
+                if (
+                    len(batch) >= self._batch_size
+                    or time.monotonic() - batch_started_at >= self._max_batch_wait_seconds
+                ):
+                    self._put_batch(batch, messages)
+                    batch = []
+                    messages = []
+            if batch:
+                self._put_batch(batch, messages)
+            self._queue.put(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
+        except Exception as e:
+            # records read before the failure are still emitted, the same way they are when records are not batched
+            if batch:
+                self._put_batch(batch, messages)
+            self._queue.put(StreamThreadException(e, partition.stream_name()))
+            self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _put_batch(self, records: List[Record], messages: List[AirbyteMessage]) -> None:
+        self._queue.put(RecordBatch(records, messages if self._record_serializer else None))
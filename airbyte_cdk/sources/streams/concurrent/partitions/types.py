@@ -2,8 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Union
+from typing import Any, Iterator, List, Optional, Union
 
+from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
 )
@@ -30,9 +31,40 @@ class PartitionCompleteSentinel:
         return False
 
 
+class RecordBatch:
+    """
+    A group of records read from the same partition and put in the queue as a single item.
+    Grouping records reduces the lock contention on the queue shared between the workers and the main thread.
+    """
+
+    def __init__(self, records: List[Record], messages: Optional[List[AirbyteMessage]] = None):
+        """
+        :param records: The records read from the partition, in the order they were read
+        :param messages: If the records were already converted to messages by the worker, the messages in the same order as the records
+        """
+        self.records = records
+        self.messages = messages
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self.records)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RecordBatch):
+            return self.records == other.records
+        return False
+
+
 """
 Typedef representing the items that can be added to the ThreadBasedConcurrentStream
 """
 QueueItem = Union[
-    Record, Partition, PartitionCompleteSentinel, PartitionGenerationCompletedSentinel, Exception
+    Record,
+    RecordBatch,
+    Partition,
+    PartitionCompleteSentinel,
+    PartitionGenerationCompletedSentinel,
+    Exception,
 ]
@@ -14,6 +14,9 @@ from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_sta
     AbstractStreamStateConverter,
     ConcurrencyCompatibleStateType,
 )
+from airbyte_cdk.sources.streams.concurrent.state_converters.format_learning_datetime_parser import (
+    FormatLearningDatetimeParser,
+)
 from airbyte_cdk.utils.datetime_helpers import AirbyteDateTime, ab_datetime_now, ab_datetime_parse
 
 
@@ -163,6 +166,9 @@ class IsoMillisConcurrentStreamStateConverter(DateTimeStreamStateConverter):
     ):
         super().__init__(is_sequential_state=is_sequential_state)
         self._cursor_granularity = cursor_granularity or timedelta(milliseconds=1)
+        self._cursor_value_parser = FormatLearningDatetimeParser(
+            self._parse_timestamp, to_datetime=AirbyteDateTime.from_datetime
+        )
 
     def increment(self, timestamp: datetime) -> datetime:
         return timestamp + self._cursor_granularity
@@ -182,6 +188,9 @@ class IsoMillisConcurrentStreamStateConverter(DateTimeStreamStateConverter):
         return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{millis:03d}Z"
 
     def parse_timestamp(self, timestamp: str) -> datetime:
+        return self._cursor_value_parser.parse(timestamp)
+
+    def _parse_timestamp(self, timestamp: str) -> datetime:
         dt_object = ab_datetime_parse(timestamp)
         if not isinstance(dt_object, AirbyteDateTime):
             raise ValueError(
@@ -210,11 +219,14 @@ class CustomFormatConcurrentStreamStateConverter(IsoMillisConcurrentStreamStateC
         self._input_datetime_formats = input_datetime_formats if input_datetime_formats else []
         self._input_datetime_formats += [self._datetime_format]
         self._parser = DatetimeParser()
+        self._cursor_value_parser = FormatLearningDatetimeParser(
+            self._parse_timestamp, datetime_format=self._input_datetime_formats[0]
+        )
 
     def output_format(self, timestamp: datetime) -> str:
         return self._parser.format(timestamp, self._datetime_format)
 
-    def parse_timestamp(self, timestamp: str) -> datetime:
+    def _parse_timestamp(self, timestamp: str) -> datetime:
         for datetime_format in self._input_datetime_formats:
             try:
                 return self._parser.parse(timestamp, datetime_format)
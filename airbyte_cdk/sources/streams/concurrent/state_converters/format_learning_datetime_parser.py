@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
+
+# Values are grouped by layout, i.e. the value where each digit is replaced by 0: "2021-01-18T21:18:20Z" -> "0000-00-00T00:00:00Z"
+_DIGITS_TO_ZERO = str.maketrans("123456789", "000000000")
+# Every field of the probe has a different value so that a format swapping fields does not parse the probe like `fromisoformat` does
+_PROBE = datetime(2013, 11, 22, 13, 44, 55, 123456, tzinfo=timezone.utc)
+
+
+class FormatLearningDatetimeParser:
+    """
+    Parses the cursor values of a stream like `parse` does, but faster, by learning the layout of the values. The values laid out in a
+    way that `datetime.fromisoformat` parses like `parse` are parsed by `datetime.fromisoformat`, which is implemented in C, and the
+    other values fall back to `parse`. The last `cache_size` values parsed are cached as the cursor values of consecutive records are
+    often the same.
+
+    When the values are expected to follow `datetime_format`, only the values laid out as this format are parsed with
+    `datetime.fromisoformat`, provided that both parse probe values formatted with `datetime_format` the same way. Otherwise, the first
+    value of each layout is parsed with both `parse` and `datetime.fromisoformat` to learn if the layout can be parsed with the latter.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[Any], datetime],
+        to_datetime: Callable[[datetime], datetime] = lambda dt: dt,
+        datetime_format: Optional[str] = None,
+        cache_size: int = 1024,
+        max_layouts: int = 16,
+    ) -> None:
+        self._parse = parse
+        self._to_datetime = to_datetime
+        self._learns_layouts = datetime_format is None
+        self._max_layouts = max_layouts
+        # Maps each known layout to whether its values can be parsed with `datetime.fromisoformat`
+        self._layouts: Dict[str, bool] = {}
+        if datetime_format is not None:
+            for probe in self._probes(datetime_format):
+                self._learn_layout(
+                    probe, lambda value: DatetimeParser().parse(value, datetime_format)
+                )
+        self._parse_with_cache = lru_cache(maxsize=cache_size)(self._parse_uncached)
+
+    def parse(self, value: Any) -> datetime:
+        if isinstance(value, (str, int)):
+            return self._parse_with_cache(value)
+        return self._parse(value)
+
+    def _parse_uncached(self, value: Any) -> datetime:
+        if not isinstance(value, str):
+            return self._parse(value)
+
+        layout = value.translate(_DIGITS_TO_ZERO)
+        parses_like_fromisoformat = self._layouts.get(layout)
+        if parses_like_fromisoformat:
+            try:
+                return self._fromisoformat(value)
+            except ValueError:
+                # Values that are not valid dates, such as "2021-02-30", are left to `parse` to raise the expected error
+                return self._parse(value)
+
+        if (
+            parses_like_fromisoformat is None
+            and self._learns_layouts
+            and len(self._layouts) < self._max_layouts
+        ):
+            self._learn_layout(value, self._parse)
+        return self._parse(value)
+
+    @staticmethod
+    def _probes(datetime_format: str) -> List[str]:
+        probe = DatetimeParser().format(_PROBE, datetime_format)
+        if "%f" not in datetime_format:
+            return [probe]
+        # "%f" parses from 1 to 6 digits
+        microseconds = f"{_PROBE.microsecond:06d}"
+        return [probe.replace(microseconds, microseconds[:digits]) for digits in range(1, 7)]
+
+    def _learn_layout(self, value: str, parse: Callable[[str], datetime]) -> None:
+        try:
+            expected = parse(value)
+        except ValueError:
+            # The layout is learned from the next value as this one is invalid
+            return
+        try:
+            actual = self._fromisoformat(value)
+        except ValueError:
+            self._layouts[value.translate(_DIGITS_TO_ZERO)] = False
+            return
+        self._layouts[value.translate(_DIGITS_TO_ZERO)] = (
+            type(actual) is type(expected)
+            and actual == expected
+            and actual.utcoffset() == expected.utcoffset()
+        )
+
+    def _fromisoformat(self, value: str) -> datetime:
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return self._to_datetime(parsed)
@@ -62,6 +62,7 @@ class HttpStream(Stream, CheckpointMixin, ABC):
             api_budget=api_budget or APIBudget(policies=[]),
             authenticator=authenticator,
             use_cache=self.use_cache,
+            cache_expire_after=self.cache_expire_after,
             backoff_strategy=self.get_backoff_strategy(),
             message_repository=InMemoryMessageRepository(),
         )
@@ -90,10 +91,13 @@ class HttpStream(Stream, CheckpointMixin, ABC):
         self._exit_on_rate_limit = value
 
     @property
+    @deprecated(
+        "Responses are no longer cached in a file per stream but in a cache shared by all the streams, "
+        "see airbyte_cdk.sources.streams.http.response_cache."
+    )
     def cache_filename(self) -> str:
         """
-        Override if needed. Return the name of cache file
-        Note that if the environment variable REQUEST_CACHE_PATH is not set, the cache will be in-memory only.
+        Return the name of the file the responses were cached in before they were cached by airbyte_cdk.sources.streams.http.response_cache.
         """
         return f"{self.name}.sqlite"
 
@@ -101,10 +105,17 @@ class HttpStream(Stream, CheckpointMixin, ABC):
     def use_cache(self) -> bool:
         """
         Override if needed. If True, all records will be cached.
-        Note that if the environment variable REQUEST_CACHE_PATH is not set, the cache will be in-memory only.
+        Note that responses are cached in memory, see airbyte_cdk.sources.streams.http.response_cache.
         """
         return False
 
+    @property
+    def cache_expire_after(self) -> Optional[timedelta]:
+        """
+        Override if needed. Return how long the responses are cached if use_cache is True. If None, they don't expire during the sync.
+        """
+        return None
+
     @property
     @abstractmethod
     def url_base(self) -> str:
@@ -0,0 +1,272 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import time
+from datetime import timedelta
+from threading import Lock
+from typing import Any, Iterator, List, Mapping, Optional, Tuple, Type, Union
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
+
+
+class ConnectionPoolStatistics:
+    """
+    Thread-safe counters describing how well the connections to the APIs are reused:
+    * `requests`: number of requests sent
+    * `connections_opened`: number of connections opened. A request sent on an existing connection is sent without a new handshake.
+    * `tls_handshakes`: number of TLS handshakes done when opening connections
+    * `tls_sessions_resumed`: number of TLS handshakes that resumed a previous TLS session instead of doing a full handshake
+    """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+        self.tls_sessions_resumed = 0
+        self._lock = Lock()
+
+    @property
+    def reused_connections(self) -> int:
+        """
+        Number of requests sent on a connection that was already open.
+        """
+        return max(self.requests - self.connections_opened, 0)
+
+    def on_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def on_connection_opened(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def on_tls_handshake(self, session_reused: bool) -> None:
+        with self._lock:
+            self.tls_handshakes += 1
+            if session_reused:
+                self.tls_sessions_resumed += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"ConnectionPoolStatistics(requests={self.requests}, connections_opened={self.connections_opened}, "
+            f"reused_connections={self.reused_connections}, tls_handshakes={self.tls_handshakes}, "
+            f"tls_sessions_resumed={self.tls_sessions_resumed})"
+        )
+
+
+class PoolStatisticsHTTPAdapter(HTTPAdapter):
+    """
+    `requests` adapter keeping up to `pool_size` connections open per host and counting the connections it opens.
+
+    The pool should be at least as large as the number of threads sending requests: once all the connections of the pool are used,
+    the connections opened for the additional requests are closed as soon as the response is read.
+    """
+
+    def __init__(self, pool_size: int = MAX_CONNECTION_POOL_SIZE, **kwargs: Any) -> None:
+        self.statistics = ConnectionPoolStatistics()
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.statistics),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.statistics),
+        }
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        self.statistics.on_request()
+        return super().send(request, *args, **kwargs)
+
+
+def _counting_pool_class(
+    pool_class: Type[HTTPConnectionPool], statistics: ConnectionPoolStatistics
+) -> Type[HTTPConnectionPool]:
+    class CountingConnectionPool(pool_class):  # type: ignore[valid-type, misc]  # the base class is only known at runtime
+        def _new_conn(self) -> Any:
+            statistics.on_connection_opened()
+            return super()._new_conn()
+
+    if issubclass(pool_class, HTTPSConnectionPool):
+
+        class CountingHTTPSConnection(HTTPSConnection):
+            def connect(self) -> None:
+                super().connect()
+                statistics.on_tls_handshake(getattr(self.sock, "session_reused", False))
+
+        CountingConnectionPool.ConnectionCls = CountingHTTPSConnection
+    return CountingConnectionPool
+
+
+class HttpxAdapter(BaseAdapter):
+    """
+    `requests` adapter sending the requests with `httpx` so that requests to a host supporting HTTP/2 are multiplexed on a few
+    connections instead of using one connection per thread. This allows to read many partitions from the same host concurrently without
+    opening as many connections.
+
+    `httpx` is not a dependency of the CDK. Using this adapter requires installing `httpx[http2]`.
+
+    Certificates verification and client certificates are configured once for the adapter through `verify` and `cert` while proxies are
+    read from the environment. Cookies set by the responses are available on the responses but are not stored in the session.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = MAX_CONNECTION_POOL_SIZE,
+        http2: bool = True,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+    ) -> None:
+        super().__init__()
+        try:
+            import httpx
+        except ImportError as exception:
+            raise ImportError(
+                "HttpxAdapter requires httpx. Install it with `pip install httpx[http2]`."
+            ) from exception
+        self._httpx = httpx
+        # httpx logs every request at the INFO level while HttpClient already logs the requests it sends
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        self.statistics = ConnectionPoolStatistics()
+        # httpx raises an ImportError if HTTP/2 is enabled while `h2` is not installed
+        self._client = httpx.Client(
+            http2=http2,
+            verify=verify,
+            cert=cert,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            follow_redirects=False,
+        )
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        self.statistics.on_request()
+        httpx_request = self._client.build_request(
+            method=request.method or "GET",
+            url=request.url or "",
+            headers=list(request.headers.items()),
+            content=request.body.encode("utf-8") if isinstance(request.body, str) else request.body,
+            timeout=self._to_httpx_timeout(timeout),
+            extensions={"trace": self._trace},
+        )
+        start_time = time.perf_counter()
+        try:
+            httpx_response = self._client.send(httpx_request, stream=True)
+        except self._httpx.ConnectTimeout as exception:
+            raise requests.exceptions.ConnectTimeout(exception, request=request) from exception
+        except self._httpx.ReadTimeout as exception:
+            raise requests.exceptions.ReadTimeout(exception, request=request) from exception
+        except self._httpx.TimeoutException as exception:
+            raise requests.exceptions.Timeout(exception, request=request) from exception
+        except self._httpx.TransportError as exception:
+            raise requests.exceptions.ConnectionError(exception, request=request) from exception
+
+        # Same as requests, the time elapsed until the headers of the response were parsed
+        elapsed = timedelta(seconds=time.perf_counter() - start_time)
+        response = self._build_response(request, httpx_response, elapsed)
+        if not stream:
+            try:
+                response._content = httpx_response.read()
+            except self._httpx.TransportError as exception:
+                raise requests.exceptions.ChunkedEncodingError(
+                    exception, request=request
+                ) from exception
+            finally:
+                httpx_response.close()
+        return response
+
+    def close(self) -> None:
+        self._client.close()
+
+    def _build_response(
+        self, request: requests.PreparedRequest, httpx_response: Any, elapsed: timedelta
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.url = str(httpx_response.url)
+        response.raw = _HttpxRawResponse(httpx_response)
+        response.request = request
+        response.connection = self  # type: ignore[assignment]  # requests only uses it to close the adapter
+        response.elapsed = elapsed
+        for cookie in httpx_response.cookies.jar:
+            response.cookies.set_cookie(cookie)
+        return response
+
+    def _to_httpx_timeout(
+        self, timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]
+    ) -> Any:
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return self._httpx.Timeout(None, connect=connect_timeout, read=read_timeout)
+        return self._httpx.Timeout(timeout)
+
+    def _trace(self, event_name: str, info: Mapping[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.statistics.on_connection_opened()
+        elif event_name == "connection.start_tls.complete":
+            ssl_object = info["return_value"].get_extra_info("ssl_object")
+            self.statistics.on_tls_handshake(getattr(ssl_object, "session_reused", False))
+
+
+class _HttpxRawResponse:
+    """
+    Exposes the body of an `httpx` response like the `urllib3` response `requests` expects as `Response.raw`. As for `urllib3`
+    responses read with `decode_content=True`, the body is decompressed according to its `Content-Encoding`.
+    """
+
+    def __init__(self, httpx_response: Any) -> None:
+        self._httpx_response = httpx_response
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._buffer = b""
+
+    def stream(
+        self, chunk_size: Optional[int] = None, decode_content: bool = True
+    ) -> Iterator[bytes]:
+        try:
+            yield from self._httpx_response.iter_bytes(chunk_size)
+        finally:
+            self._httpx_response.close()
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = True) -> bytes:
+        if self._chunks is None:
+            self._chunks = self._httpx_response.iter_bytes()
+        chunks: List[bytes] = [self._buffer]
+        size = len(self._buffer)
+        while amt is None or size < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._httpx_response.close()
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+        data = b"".join(chunks)
+        if amt is None:
+            self._buffer = b""
+            return data
+        self._buffer = data[amt:]
+        return data[:amt]
+
+    def close(self) -> None:
+        self._httpx_response.close()
+
+    def release_conn(self) -> None:
+        self._httpx_response.close()
@@ -3,15 +3,15 @@
 #
 
 import logging
-import os
 import urllib
-from pathlib import Path
+from datetime import timedelta
 from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 import orjson
 import requests
 import requests_cache
 from requests.auth import AuthBase
+from typing_extensions import deprecated
 
 from airbyte_cdk.models import (
     AirbyteMessageSerializer,
@@ -24,6 +24,9 @@ from airbyte_cdk.models import (
 from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.call_rate import APIBudget, CachedLimiterSession, LimiterSession
+from airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.streams.http.error_handlers import (
     BackoffStrategy,
     DefaultBackoffStrategy,
@@ -40,14 +43,19 @@ from airbyte_cdk.sources.streams.http.exceptions import (
     RequestBodyException,
     UserDefinedBackoffException,
 )
+from airbyte_cdk.sources.streams.http.http_adapters import (
+    ConnectionPoolStatistics,
+    HttpxAdapter,
+    PoolStatisticsHTTPAdapter,
+)
 from airbyte_cdk.sources.streams.http.rate_limiting import (
     http_client_default_backoff_handler,
     rate_limit_default_backoff_handler,
     user_defined_backoff_handler,
 )
+from airbyte_cdk.sources.streams.http.response_cache import shared_response_cache
 from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
-from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_cdk.utils.stream_status_utils import (
     as_airbyte_message as stream_status_as_airbyte_message,
 )
@@ -91,20 +99,31 @@ class HttpClient:
         error_message_parser: Optional[ErrorMessageParser] = None,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+        connection_pool_size: Optional[int] = None,
+        use_http2: bool = False,
+        cache_backend: Optional[requests_cache.BaseCache] = None,
+        cache_expire_after: Optional[timedelta] = None,
     ):
         self._name = name
         self._api_budget: APIBudget = api_budget or APIBudget(policies=[])
+        self._cache_backend = cache_backend
+        self._cache_expire_after = cache_expire_after
+        self._adapter: Optional[Union[PoolStatisticsHTTPAdapter, HttpxAdapter]] = None
         if session:
             self._session = session
         else:
             self._use_cache = use_cache
             self._session = self._request_session()
-            self._session.mount(
-                "https://",
-                requests.adapters.HTTPAdapter(
-                    pool_connections=MAX_CONNECTION_POOL_SIZE, pool_maxsize=MAX_CONNECTION_POOL_SIZE
-                ),
+            # The pool should have a connection for each thread sending requests else connections are closed and opened again
+            pool_size = max(connection_pool_size or MAX_CONNECTION_POOL_SIZE, 1)
+            self._adapter = (
+                HttpxAdapter(pool_size=pool_size)
+                if use_http2
+                else PoolStatisticsHTTPAdapter(pool_size=pool_size)
             )
+            self._session.mount("https://", self._adapter)
+            self._session.mount("http://", self._adapter)
         if isinstance(authenticator, AuthBase):
             self._session.auth = authenticator
         self._logger = logger
@@ -120,12 +139,23 @@ class HttpClient:
         self._request_attempt_count: Dict[requests.PreparedRequest, int] = {}
         self._disable_retries = disable_retries
         self._message_repository = message_repository
+        self._concurrency_controller = concurrency_controller
+
+    @property
+    def connection_pool_statistics(self) -> Optional[ConnectionPoolStatistics]:
+        """
+        Statistics on the reuse of the connections opened by the client. None if the session was provided to the client.
+        """
+        return self._adapter.statistics if self._adapter else None
 
     @property
+    @deprecated(
+        "Responses are no longer cached in a file per stream but in a cache shared by all the streams, "
+        "see airbyte_cdk.sources.streams.http.response_cache."
+    )
     def cache_filename(self) -> str:
         """
-        Override if needed. Return the name of cache file
-        Note that if the environment variable REQUEST_CACHE_PATH is not set, the cache will be in-memory only.
+        Return the name of the file the responses were cached in before they were cached by airbyte_cdk.sources.streams.http.response_cache.
         """
         return f"{self._name}.sqlite"
 
@@ -135,25 +165,14 @@ class HttpClient:
         :return: instance of request-based session
         """
         if self._use_cache:
-            cache_dir = os.getenv(ENV_REQUEST_CACHE_PATH)
-            # Use in-memory cache if cache_dir is not set
-            # This is a non-obvious interface, but it ensures we don't write sql files when running unit tests
-            # Use in-memory cache if cache_dir is not set
-            # This is a non-obvious interface, but it ensures we don't write sql files when running unit tests
-            sqlite_path = (
-                str(Path(cache_dir) / self.cache_filename)
-                if cache_dir
-                else "file::memory:?cache=shared"
+            # Responses are kept in memory up to a maximum size rather than in sqlite files growing for the whole sync. The in-memory
+            # responses are shared by all the clients so that a parent stream read by many substreams is requested once.
+            backend = self._cache_backend or shared_response_cache()
+            cache_settings: Dict[str, Any] = (
+                {"expire_after": self._cache_expire_after} if self._cache_expire_after else {}
             )
-            # By using `PRAGMA synchronous=OFF` and `PRAGMA journal_mode=WAL`, we reduce the possible occurrences of `database table is locked` errors.
-            # Note that those were blindly added at the same time and one or the other might be sufficient to prevent the issues but we have seen good results with both. Feel free to revisit given more information.
-            # There are strong signals that `fast_save` might create problems but if the sync crashes, we start back from the beginning in terms of sqlite anyway so the impact should be minimal. Signals are:
-            # * https://github.com/requests-cache/requests-cache/commit/7fa89ffda300331c37d8fad7f773348a3b5b0236#diff-f43db4a5edf931647c32dec28ea7557aae4cae8444af4b26c8ecbe88d8c925aaR238
-            # * https://github.com/requests-cache/requests-cache/commit/7fa89ffda300331c37d8fad7f773348a3b5b0236#diff-2e7f95b7d7be270ff1a8118f817ea3e6663cdad273592e536a116c24e6d23c18R164-R168
-            # * `If the application running SQLite crashes, the data will be safe, but the database [might become corrupted](https://www.sqlite.org/howtocorrupt.html#cfgerr) if the operating system crashes or the computer loses power before that data has been written to the disk surface.` in [this description](https://www.sqlite.org/pragma.html#pragma_synchronous).
-            backend = requests_cache.SQLiteCache(sqlite_path, fast_save=True, wal=True)
             return CachedLimiterSession(
-                sqlite_path, backend=backend, api_budget=self._api_budget, match_headers=True
+                backend=backend, api_budget=self._api_budget, match_headers=True, **cache_settings
             )
         else:
             return LimiterSession(api_budget=self._api_budget)
@@ -303,6 +322,16 @@ class HttpClient:
         except requests.RequestException as e:
             exc = e
 
+        # `elapsed` does not include the time spent waiting for the API budget
+        if (
+            self._concurrency_controller
+            and response is not None
+            and not getattr(response, "from_cache", False)
+        ):
+            self._concurrency_controller.on_response(
+                response.elapsed.total_seconds(), endpoint=self._name
+            )
+
         error_resolution: ErrorResolution = self._error_handler.interpret_response(
             response if response is not None else exc
         )
@@ -394,6 +423,9 @@ class HttpClient:
 
         # Emit stream status RUNNING with the reason RATE_LIMITED to log that the rate limit has been reached
         if error_resolution.response_action == ResponseAction.RATE_LIMITED:
+            if self._concurrency_controller:
+                self._concurrency_controller.on_rate_limited()
+
             # TODO: Update to handle with message repository when concurrent message repository is ready
             reasons = [AirbyteStreamStatusReason(type=AirbyteStreamStatusReasonType.RATE_LIMITED)]
             message = orjson.dumps(
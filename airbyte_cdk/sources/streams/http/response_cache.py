@@ -0,0 +1,248 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import logging
+import os
+import zlib
+from collections import OrderedDict
+from contextlib import suppress
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterator, Optional
+from weakref import WeakValueDictionary
+
+from requests_cache import BaseCache, BaseStorage, CachedResponse, DictStorage
+
+from airbyte_cdk.utils.constants import (
+    ENV_REQUEST_CACHE_COMPRESSION,
+    ENV_REQUEST_CACHE_MAX_BYTES,
+    ENV_REQUEST_CACHE_PATH,
+)
+
+LOGGER = logging.getLogger("airbyte")
+
+DEFAULT_MAX_CACHE_BYTES = 32 * 1024 * 1024
+DEFAULT_MAX_DISK_CACHE_BYTES = 256 * 1024 * 1024
+
+# Storages are mappings, which are not hashable, so they are registered by identity
+_storages: "WeakValueDictionary[int, BoundedResponseStorage]" = WeakValueDictionary()
+_shared_storage: Optional["BoundedResponseStorage"] = None
+_shared_storage_scope: Optional[str] = None
+_shared_redirects = DictStorage()  # type: ignore[no-untyped-call]  # requests_cache is not typed
+_shared_storage_lock = Lock()
+
+
+class ResponseCacheStatistics:
+    """
+    Thread-safe counters describing the use of a response cache:
+    * `hits`: number of requests served from the cache
+    * `misses`: number of requests that were not cached or whose cached response expired
+    * `evictions`: number of responses removed from the cache to make room for newer ones
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+
+    def on_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def on_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def on_eviction(self) -> None:
+        with self._lock:
+            self.evictions += 1
+
+
+class BoundedResponseStorage(BaseStorage):  # type: ignore[type-arg]  # the generic parameters are not exposed by requests_cache
+    """
+    Storage of serialized responses holding at most `max_bytes` bytes. Once full, the least recently used responses are evicted to make
+    room for the new ones. Responses larger than `max_bytes` are not stored.
+
+    The responses are kept in memory unless a `directory` is provided, in which case they are written to a file each and only their size is
+    kept in memory. With `compress`, the serialized responses are compressed, which trades CPU for memory or disk space on large JSON
+    bodies.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        compress: bool = False,
+        directory: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(serializer=kwargs.pop("serializer", "pickle"), **kwargs)
+        self.name = name
+        self.statistics = ResponseCacheStatistics()
+        self.stored_bytes = 0
+        self._max_bytes = max_bytes
+        self._compress = compress
+        self._directory = Path(directory) if directory else None
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._values: Dict[str, bytes] = {}
+        self._lock = Lock()
+        _storages[id(self)] = self
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            if key not in self._sizes:
+                raise KeyError(key)
+            self._sizes.move_to_end(key)
+            value = self._read(key)
+        return self.deserialize(key, zlib.decompress(value) if self._compress else value)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        serialized_value = self.serialize(value)
+        if self._compress:
+            serialized_value = zlib.compress(serialized_value, 1)
+        with self._lock:
+            self._remove(key)
+            if len(serialized_value) > self._max_bytes:
+                return
+            while self.stored_bytes + len(serialized_value) > self._max_bytes:
+                evicted_key, _ = next(iter(self._sizes.items()))
+                self._remove(evicted_key)
+                self.statistics.on_eviction()
+            try:
+                self._write(key, serialized_value)
+            except OSError as exception:
+                # Not caching the response only costs a new request so the read is not failed
+                LOGGER.warning(f"Could not cache response in {self._directory}: {exception}")
+                with suppress(OSError):
+                    self._path(key).unlink(missing_ok=True)
+                return
+            self._sizes[key] = len(serialized_value)
+            self.stored_bytes += len(serialized_value)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if not self._remove(key):
+                raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._sizes))
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._sizes):
+                self._remove(key)
+
+    def _remove(self, key: str) -> bool:
+        size = self._sizes.pop(key, None)
+        if size is None:
+            return False
+        self.stored_bytes -= size
+        if self._directory:
+            self._path(key).unlink(missing_ok=True)
+        else:
+            del self._values[key]
+        return True
+
+    def _read(self, key: str) -> bytes:
+        return self._path(key).read_bytes() if self._directory else self._values[key]
+
+    def _write(self, key: str, value: bytes) -> None:
+        if self._directory:
+            # The directory is created again if it was removed, for example when a temporary directory is reused by another command
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._path(key).write_bytes(value)
+        else:
+            self._values[key] = value
+
+    def _path(self, key: str) -> Path:
+        assert self._directory
+        return self._directory / hashlib.sha256(key.encode()).hexdigest()
+
+
+class BoundedResponseCache(BaseCache):
+    """
+    `requests_cache` backend keeping the responses in memory, or in files if a `directory` is provided, up to `max_bytes` bytes, evicting
+    the least recently used responses first.
+
+    `requests_cache` stores the settings of a session, such as the expiration of the responses, on its backend. Sessions with different
+    settings can share the same responses by using different instances of this backend created with the same `responses` storage.
+    """
+
+    def __init__(
+        self,
+        cache_name: str = "airbyte_response_cache",
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        compress: bool = False,
+        directory: Optional[str] = None,
+        responses: Optional[BoundedResponseStorage] = None,
+        redirects: Optional[DictStorage] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(cache_name=cache_name, **kwargs)
+        self.responses: BoundedResponseStorage = (
+            responses
+            if responses is not None
+            else BoundedResponseStorage(cache_name, max_bytes, compress, directory, **kwargs)
+        )
+        self.redirects: DictStorage = redirects if redirects is not None else DictStorage()  # type: ignore[no-untyped-call]
+
+    @property
+    def statistics(self) -> ResponseCacheStatistics:
+        return self.responses.statistics
+
+    def get_response(self, key: str, default: Any = None) -> Optional[CachedResponse]:
+        response = super().get_response(key, default)
+        if response is None or response is default or response.is_expired:
+            self.statistics.on_miss()
+        else:
+            self.statistics.on_hit()
+        return response  # type: ignore[no-any-return]  # requests_cache is not typed
+
+
+def shared_response_cache() -> BoundedResponseCache:
+    """
+    Return a backend over the responses shared by all the HttpClients of the process so that a parent stream read by many substreams is
+    requested once.
+
+    If the `REQUEST_CACHE_PATH` environment variable is set, the responses are written to files in this directory, up to
+    `DEFAULT_MAX_DISK_CACHE_BYTES`. Else they are kept in memory, up to `DEFAULT_MAX_CACHE_BYTES`. The size of the cache can be set with
+    the `REQUEST_CACHE_MAX_BYTES` environment variable and its responses are compressed if `REQUEST_CACHE_COMPRESSION` is set to "true".
+
+    The responses are shared as long as `REQUEST_CACHE_PATH` does not change: the entrypoint sets it to a new directory for each command
+    so that the responses cached during a command are not served to the next one.
+    """
+    global _shared_storage, _shared_storage_scope, _shared_redirects
+    cache_dir = os.getenv(ENV_REQUEST_CACHE_PATH, "")
+    with _shared_storage_lock:
+        if _shared_storage is None or _shared_storage_scope != cache_dir:
+            if _shared_storage is not None:
+                _shared_storage.clear()
+            _shared_storage_scope = cache_dir
+            default_max_bytes = (
+                DEFAULT_MAX_DISK_CACHE_BYTES if cache_dir else DEFAULT_MAX_CACHE_BYTES
+            )
+            _shared_storage = BoundedResponseStorage(
+                "shared",
+                max_bytes=int(os.getenv(ENV_REQUEST_CACHE_MAX_BYTES, default_max_bytes)),
+                compress=os.getenv(ENV_REQUEST_CACHE_COMPRESSION, "false").lower() == "true",
+                directory=str(Path(cache_dir) / "responses") if cache_dir else None,
+            )
+            _shared_redirects = DictStorage()  # type: ignore[no-untyped-call]  # requests_cache is not typed
+        return BoundedResponseCache(responses=_shared_storage, redirects=_shared_redirects)
+
+
+def log_response_cache_statistics(logger: logging.Logger) -> None:
+    for storage in list(_storages.values()):
+        statistics = storage.statistics
+        if statistics.hits or statistics.misses:
+            logger.info(
+                f"Response cache {storage.name}: {statistics.hits} hits, {statistics.misses} misses, "
+                f"{statistics.evictions} evictions, {storage.stored_bytes} bytes stored in {len(storage)} responses"
+            )
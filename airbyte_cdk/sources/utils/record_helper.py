@@ -13,9 +13,14 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.models.file_transfer_record_message import AirbyteFileTransferRecordMessage
+from airbyte_cdk.models.record_message_encoder import RecordMessageEncoder
+from airbyte_cdk.models.serialized_airbyte_message import SerializedAirbyteMessage
 from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.types import Record
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
+_RECORD_MESSAGE_ENCODER = RecordMessageEncoder()
+
 
 def stream_data_to_airbyte_message(
     stream_name: str,
@@ -51,3 +56,23 @@ def stream_data_to_airbyte_message(
             raise ValueError(
                 f"Unexpected type for data_or_message: {type(data_or_message)}: {data_or_message}"
             )
+
+
+def record_to_serialized_airbyte_message(record: Record) -> AirbyteMessage:
+    """
+    Convert a record to a RECORD message and serialize it right away. This is meant to be called from the thread that read the record so
+    that the thread emitting the messages does not have to serialize them.
+
+    If the data can't be serialized with orjson, the message is returned without serialization and the entrypoint falls back to its
+    usual serialization.
+    """
+    message = stream_data_to_airbyte_message(
+        stream_name=record.stream_name,
+        data_or_message=record.data,
+        is_file_transfer_message=record.is_file_transfer_message,
+    )
+    try:
+        serialized = _RECORD_MESSAGE_ENCODER.encode(message)
+    except Exception:
+        return message
+    return SerializedAirbyteMessage(message.record, serialized)  # type: ignore[arg-type] # record is set for RECORD messages
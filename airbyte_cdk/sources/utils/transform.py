@@ -3,12 +3,18 @@
 #
 
 import logging
+import numbers
+from collections import deque
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Generator, Mapping, Optional, cast
+from typing import Any, Callable, Dict, Generator, List, Mapping, Optional, Tuple, cast
 
 from jsonschema import Draft7Validator, RefResolver, ValidationError, Validator, validators
+from jsonschema.exceptions import RefResolutionError
 
 MAX_NESTING_DEPTH = 3
+# Number of compiled schemas kept by a TypeTransformer. Streams usually reuse the same schema object so this is only reached if schemas are
+# rebuilt for every record or page, in which case the cache is reset.
+MAX_COMPILED_SCHEMAS = 64
 json_to_python_simple = {
     "string": str,
     "number": float,
@@ -44,6 +50,21 @@ def _strtobool(value: str, /) -> int:
     raise ValueError(f"Invalid boolean value: {normalized_str}")
 
 
+# Same semantics as the type checker of the jsonschema validator used by TypeTransformer
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: (isinstance(instance, int) and not isinstance(instance, bool))
+    or (isinstance(instance, float) and instance.is_integer()),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: isinstance(instance, numbers.Number)
+    and not isinstance(instance, bool),
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+_JSON_SIMPLE_PYTHON_TYPES = frozenset(json_to_python_simple.values())
+
+
 class TransformConfig(Flag):
     """
     TypeTransformer class config. Configs can be combined using bitwise or operator e.g.
@@ -63,9 +84,160 @@ class TransformConfig(Flag):
     CustomSchemaNormalization = auto()
 
 
+class _UnsupportedSchemaError(Exception):
+    """
+    Raised when compiling a schema that relies on features only the jsonschema traversal handles (e.g. remote references or boolean
+    subschemas).
+    """
+
+
+class _CompiledSchema:
+    """
+    Normalization and type checks of a subschema, as a list of steps applied in the order jsonschema would apply the keywords.
+
+    Each step takes the instance and its path. The path is only used to build warnings so it is kept as nested `(key, parent_path)`
+    tuples, `None` being the root.
+    """
+
+    def __init__(self) -> None:
+        self.steps: List[Callable[[Any, Any], None]] = []
+        self.is_complete = False
+
+    def run(self, instance: Any, path: Any) -> None:
+        for step in self.steps:
+            step(instance, path)
+
+
+class _SchemaCompiler:
+    """
+    Compiles a schema into the `_CompiledSchema` applying the same normalization and emitting the same warnings as the jsonschema
+    traversal of TypeTransformer. References are resolved at compilation time so nothing is resolved or validated by jsonschema when
+    transforming records.
+    """
+
+    def __init__(self, transformer: "TypeTransformer", schema: Mapping[str, Any]) -> None:
+        self._transformer = transformer
+        self._root = schema
+        self._resolver = transformer._normalizer(schema).resolver
+        self._compiled_by_id: Dict[int, _CompiledSchema] = {}
+
+    def compile(self, subschema: Any) -> _CompiledSchema:
+        if not isinstance(subschema, Mapping):
+            raise _UnsupportedSchemaError("Only object subschemas can be compiled")
+        compiled = self._compiled_by_id.get(id(subschema))
+        if compiled is not None:
+            # either already compiled or recursive reference
+            return compiled
+        if subschema is not self._root and subschema.get("$id"):
+            raise _UnsupportedSchemaError("Changing the resolution scope is not supported")
+
+        compiled = _CompiledSchema()
+        self._compiled_by_id[id(subschema)] = compiled
+        for keyword, value in subschema.items():
+            if keyword == "type":
+                compiled.steps.append(self._compile_type(value))
+            elif keyword == "$ref":
+                compiled.steps.append(self.compile(self._resolve(value)).run)
+            elif keyword == "properties":
+                step = self._compile_properties(value)
+                if step:
+                    compiled.steps.append(step)
+            elif keyword == "items":
+                step = self._compile_items(value)
+                if step:
+                    compiled.steps.append(step)
+        compiled.is_complete = True
+        return compiled
+
+    def _compile_type(self, types: Any) -> Callable[[Any, Any], None]:
+        type_names = [types] if isinstance(types, str) else types
+        if not isinstance(type_names, list) or not all(
+            isinstance(type_name, str) and type_name in _TYPE_CHECKS for type_name in type_names
+        ):
+            raise _UnsupportedSchemaError(f"Unsupported type {types}")
+        checks = [_TYPE_CHECKS[type_name] for type_name in type_names]
+        warn = self._transformer._warn_type_error
+
+        def check_type(instance: Any, path: Any) -> None:
+            if not any(check(instance) for check in checks):
+                warn(instance, types, path)
+
+        return check_type
+
+    def _compile_properties(self, properties: Any) -> Optional[Callable[[Any, Any], None]]:
+        if not isinstance(properties, Mapping):
+            raise _UnsupportedSchemaError("properties must be an object")
+        conversions = []
+        children = []
+        for key, subschema in properties.items():
+            child = self.compile(subschema)
+            convert = self._transformer._get_converter(self._resolve_once(subschema))
+            if convert:
+                conversions.append((key, convert))
+            if child.steps or not child.is_complete:
+                children.append((key, child))
+        if not conversions and not children:
+            return None
+
+        def normalize_properties(instance: Any, path: Any) -> None:
+            if isinstance(instance, dict):
+                for key, convert in conversions:
+                    if key in instance:
+                        instance[key] = convert(instance[key])
+                for key, child in children:
+                    if key in instance:
+                        child.run(instance[key], (key, path))
+
+        return normalize_properties
+
+    def _compile_items(self, items: Any) -> Optional[Callable[[Any, Any], None]]:
+        if not isinstance(items, Mapping):
+            raise _UnsupportedSchemaError("Only a single items subschema is supported")
+        child = self.compile(items)
+        convert = self._transformer._get_converter(self._resolve_once(items))
+        has_child = bool(child.steps) or not child.is_complete
+        if not convert and not has_child:
+            return None
+
+        def normalize_items(instance: Any, path: Any) -> None:
+            if isinstance(instance, list):
+                if convert:
+                    for index, item in enumerate(instance):
+                        instance[index] = convert(item)
+                if has_child:
+                    for index, item in enumerate(instance):
+                        child.run(item, (index, path))
+
+        return normalize_items
+
+    def _resolve_once(self, subschema: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Like the jsonschema traversal, the subschema given to the normalization functions only has its own reference resolved.
+        """
+        if "$ref" in subschema:
+            resolved = self._resolve(subschema["$ref"])
+            if not isinstance(resolved, Mapping):
+                raise _UnsupportedSchemaError("Only object subschemas can be compiled")
+            return resolved
+        return subschema
+
+    def _resolve(self, reference: Any) -> Any:
+        if not isinstance(reference, str) or not reference.startswith("#"):
+            raise _UnsupportedSchemaError(f"Only local references are supported, got {reference}")
+        try:
+            _, resolved = self._resolver.resolve(reference)
+        except RefResolutionError as exception:
+            raise _UnsupportedSchemaError(str(exception)) from exception
+        return resolved
+
+
 class TypeTransformer:
     """
     Class for transforming object before output.
+
+    Schemas are compiled once into a plan of normalization functions and type checks and the plans are cached by schema identity, so a
+    schema should not be mutated once it has been used to transform records. Schemas the compilation does not support (e.g. with remote
+    references) are handled by traversing them with jsonschema for every record.
     """
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
@@ -87,6 +259,7 @@ class TypeTransformer:
         self._normalizer = validators.create(
             meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators
         )
+        self._compiled_schemas: Dict[int, Tuple[Mapping[str, Any], Optional[_CompiledSchema]]] = {}
 
     def registerCustomTransform(
         self, normalization_callback: Callable[[Any, dict[str, Any]], Any]
@@ -104,6 +277,8 @@ class TypeTransformer:
                 "Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer"
             )
         self._custom_normalizer = normalization_callback
+        # compiled schemas embed the normalization functions
+        self._compiled_schemas.clear()
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -163,6 +338,87 @@ class TypeTransformer:
             return original_item
         return original_item
 
+    def _get_converter(self, subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Return a function with the same result as `__normalize` for this subschema, or None if values are returned unchanged.
+        """
+        default_converter = None
+        if TransformConfig.DefaultSchemaNormalization in self._config:
+            if type(self).default_convert is TypeTransformer.default_convert:
+                default_converter = self._get_default_converter(subschema)
+            else:
+                default_converter = lambda original_item: self.default_convert(
+                    original_item, cast(Dict[str, Any], subschema)
+                )
+        custom_normalizer = self._custom_normalizer
+        if not custom_normalizer:
+            return default_converter
+        if not default_converter:
+            return lambda original_item: custom_normalizer(original_item, subschema)  # type: ignore[arg-type]
+        return lambda original_item: custom_normalizer(default_converter(original_item), subschema)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _get_default_converter(subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Return a function with the same result as `default_convert` for this subschema, or None if values are returned unchanged. The
+        type of the subschema is only interpreted once instead of once per value.
+        """
+        target_type = subschema.get("type", [])
+        items = subschema.get("items", {})
+        if not (
+            isinstance(target_type, str)
+            or (isinstance(target_type, list) and all(isinstance(t, str) for t in target_type))
+        ) or not isinstance(items, Mapping):
+            return lambda original_item: TypeTransformer.default_convert(
+                original_item, cast(Dict[str, Any], subschema)
+            )
+
+        nullable = "null" in target_type
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            if len(target_type) != 1:
+                return None
+            target_type = target_type[0]
+
+        if target_type == "string":
+            cast_function: Callable[[Any], Any] = str
+        elif target_type == "number":
+            cast_function = float
+        elif target_type == "integer":
+            cast_function = int
+        elif target_type == "boolean":
+            cast_function = (
+                lambda original_item: _strtobool(original_item) == 1
+                if isinstance(original_item, str)
+                else bool(original_item)
+            )
+        elif target_type == "array":
+            try:
+                item_types = set(items.get("type", set()))
+            except TypeError:
+                return lambda original_item: TypeTransformer.default_convert(
+                    original_item, cast(Dict[str, Any], subschema)
+                )
+            if not item_types.issubset(json_to_python_simple):
+                return None
+            cast_function = (
+                lambda original_item: [original_item]
+                if type(original_item) in _JSON_SIMPLE_PYTHON_TYPES
+                else original_item
+            )
+        else:
+            return None
+
+        def convert(original_item: Any) -> Any:
+            if original_item is None and nullable:
+                return None
+            try:
+                return cast_function(original_item)
+            except (ValueError, TypeError):
+                return original_item
+
+        return convert
+
     def __get_normalizer(
         self,
         schema_key: str,
@@ -238,6 +494,10 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        compiled_schema = self._get_compiled_schema(schema)
+        if compiled_schema:
+            compiled_schema.run(record, None)
+            return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -246,6 +506,40 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledSchema]:
+        cached = self._compiled_schemas.get(id(schema))
+        # the schema is kept in the cache so its id can't be reused by another object while it is cached
+        if cached and cached[0] is schema:
+            return cached[1]
+        try:
+            compiled_schema: Optional[_CompiledSchema] = _SchemaCompiler(self, schema).compile(
+                schema
+            )
+        except _UnsupportedSchemaError as exception:
+            logger.debug(
+                f"Schema can't be compiled, it will be traversed for every record: {exception}"
+            )
+            compiled_schema = None
+        if len(self._compiled_schemas) >= MAX_COMPILED_SCHEMAS:
+            self._compiled_schemas.clear()
+        self._compiled_schemas[id(schema)] = (schema, compiled_schema)
+        return compiled_schema
+
+    def _warn_type_error(self, instance: Any, types: Any, path: Any) -> None:
+        field_path: deque[Any] = deque()
+        while path is not None:
+            key, path = path
+            field_path.appendleft(key)
+        type_names = [types] if isinstance(types, str) else types
+        error = ValidationError(
+            f"{instance!r} is not of type {', '.join(repr(type_name) for type_name in type_names)}",
+            validator="type",
+            validator_value=types,
+            instance=instance,
+            path=field_path,
+        )
+        logger.warning(self.get_error_message(error))
+
     def get_error_message(self, e: ValidationError) -> str:
         """
         Construct a sanitized error message from a ValidationError instance.
@@ -4,17 +4,22 @@
 from __future__ import annotations
 
 import abc
+import bz2
+import copy
+import gzip
+import io
+import lzma
 from collections import defaultdict
 from contextlib import contextmanager
+from datetime import date, datetime, time
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, final
 
-import pandas as pd
+import orjson
 import sqlalchemy
 import ulid
 from airbyte_protocol_dataclasses.models import AirbyteStateMessage
-from pandas import Index
 from pydantic import BaseModel, Field
 from sqlalchemy import Column, Table, and_, create_engine, insert, null, select, text, update
 from sqlalchemy.exc import ProgrammingError, SQLAlchemyError
@@ -30,9 +35,10 @@ from airbyte_cdk.sql.constants import (
 )
 from airbyte_cdk.sql.secrets import SecretString
 from airbyte_cdk.sql.types import SQLTypeConverter
+from airbyte_cdk.utils.line_reader import read_lines
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
     from sqlalchemy.engine import Connection, Engine
     from sqlalchemy.engine.cursor import CursorResult
@@ -48,6 +54,59 @@ class SQLRuntimeError(Exception):
     """Raised when an SQL operation fails."""
 
 
+def _open_file(file_path: Path) -> io.BufferedIOBase:
+    """Open a file as bytes, decompressing it based on its extension."""
+    file_path = Path(file_path)
+    if file_path.suffix == ".gz":
+        return gzip.open(file_path, "rb")
+    if file_path.suffix == ".bz2":
+        return bz2.open(file_path, "rb")
+    if file_path.suffix == ".xz":
+        return lzma.open(file_path, "rb")
+    return open(file_path, "rb")
+
+
+def _none_as_null(column_type: TypeEngine[Any]) -> TypeEngine[Any]:
+    """Return the column type, making JSON types insert missing values as SQL NULL rather than
+    as JSON 'null'.
+    """
+    if isinstance(column_type, sqlalchemy.types.JSON) and not column_type.none_as_null:
+        json_type = copy.copy(column_type)
+        json_type.none_as_null = True
+        return json_type
+    return column_type
+
+
+def _get_value_converter(
+    column_type: TypeEngine[Any],
+) -> Callable[[Any], Any] | None:
+    """Return the function converting the JSON values of a column to the Python objects expected
+    by DBAPI drivers, or None if the values are inserted as is.
+
+    Date and time strings are parsed as ISO 8601 strings. Values that are not ISO 8601 strings are
+    left as is for the database to handle.
+    """
+    parse: Callable[[str], Any]
+    if isinstance(column_type, sqlalchemy.types.DateTime):
+        parse = datetime.fromisoformat
+    elif isinstance(column_type, sqlalchemy.types.Date):
+        parse = date.fromisoformat
+    elif isinstance(column_type, sqlalchemy.types.Time):
+        parse = time.fromisoformat
+    else:
+        return None
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        try:
+            return parse(value)
+        except ValueError:
+            return value
+
+    return convert
+
+
 class SqlConfig(BaseModel, abc.ABC):
     """Common configuration for SQL connections."""
 
@@ -124,6 +183,9 @@ class SqlProcessorBase(abc.ABC):
     supports_merge_insert = False
     """True if the database supports the MERGE INTO syntax."""
 
+    bulk_insert_batch_size = 10_000
+    """The number of records read from the files and inserted at once when loading them."""
+
     def __init__(
         self,
         *,
@@ -520,43 +582,84 @@ class SqlProcessorBase(abc.ABC):
 
         This is a generic implementation, which can be overridden by subclasses
         to improve performance.
+
+        The JSONL files are read in chunks of `bulk_insert_batch_size` records, which are
+        inserted with `_bulk_insert_records` using a single connection.
         """
         temp_table_name = self._create_table_for_loading(stream_name, batch_id)
-        for file_path in files:
-            dataframe = pd.read_json(file_path, lines=True)
-
-            sql_column_definitions: dict[str, TypeEngine[Any]] = self._get_sql_column_definitions(
-                stream_name
+        if not self._table_exists(temp_table_name):
+            raise exc.AirbyteInternalError(
+                message="Table does not exist after creation.",
+                context={
+                    "temp_table_name": temp_table_name,
+                },
             )
 
-            # Remove fields that are not in the schema
-            for col_name in dataframe.columns:
-                if col_name not in sql_column_definitions:
-                    dataframe = dataframe.drop(columns=col_name)
-
-            # Pandas will auto-create the table if it doesn't exist, which we don't want.
-            if not self._table_exists(temp_table_name):
-                raise exc.AirbyteInternalError(
-                    message="Table does not exist after creation.",
-                    context={
-                        "temp_table_name": temp_table_name,
-                    },
-                )
-
-            # Normalize all column names to lower case.
-            dataframe.columns = Index([self.normalizer.normalize(col) for col in dataframe.columns])
-
-            # Write the data to the table.
-            dataframe.to_sql(
-                temp_table_name,
-                self.get_sql_alchemy_url(),
-                schema=self.sql_config.schema_name,
-                if_exists="append",
-                index=False,
-                dtype=sql_column_definitions,  # type: ignore[arg-type]
-            )
+        sql_column_definitions = self._get_sql_column_definitions(stream_name)
+        table = Table(
+            temp_table_name,
+            sqlalchemy.MetaData(schema=self.sql_config.schema_name),
+            *[
+                Column(column_name, _none_as_null(column_type))
+                for column_name, column_type in sql_column_definitions.items()
+            ],
+        )
+        with self.get_sql_connection() as connection:
+            for file_path in files:
+                for records in self._read_jsonl_file_in_batches(file_path, sql_column_definitions):
+                    self._bulk_insert_records(connection, table, records)
         return temp_table_name
 
+    def _bulk_insert_records(
+        self,
+        connection: Connection,
+        table: Table,
+        records: list[dict[str, Any]],
+    ) -> None:
+        """Insert a batch of records in the given table.
+
+        Each record has a value for each column of the table. The generic implementation issues a
+        single `executemany` insert. Subclasses can override this method to use a vendor-specific
+        bulk path, such as `COPY`.
+        """
+        connection.execute(insert(table), records)
+
+    def _read_jsonl_file_in_batches(
+        self,
+        file_path: Path,
+        sql_column_definitions: dict[str, TypeEngine[Any]],
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Read a JSONL file, optionally compressed, in batches of `bulk_insert_batch_size` records.
+
+        Fields that are not in the column definitions are dropped, and the values of date and time
+        columns are converted to Python objects as DBAPI drivers such as SQLite require them.
+        """
+        # Fields are matched before being normalized, as with the column names of a dataframe
+        fields = {
+            column_name: (self.normalizer.normalize(column_name), _get_value_converter(column_type))
+            for column_name, column_type in sql_column_definitions.items()
+        }
+        empty_record = dict.fromkeys(sql_column_definitions)
+        batch: list[dict[str, Any]] = []
+        with _open_file(file_path) as file:
+            for line in read_lines(file):
+                if not line.strip():
+                    continue
+                record = empty_record.copy()
+                for field_name, value in orjson.loads(line).items():
+                    field = fields.get(field_name)
+                    if field is not None:
+                        column_name, converter = field
+                        record[column_name] = (
+                            converter(value) if converter and value is not None else value
+                        )
+                batch.append(record)
+                if len(batch) >= self.bulk_insert_batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
     def _add_column_to_table(
         self,
         table: Table,
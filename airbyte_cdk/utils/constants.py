@@ -3,3 +3,15 @@
 #
 
 ENV_REQUEST_CACHE_PATH = "REQUEST_CACHE_PATH"
+
+# Set to "false" to print the messages output by `launch` one by one instead of writing them in batches to the binary stdout
+ENV_BUFFERED_OUTPUT = "AIRBYTE_BUFFERED_OUTPUT"
+
+# Maximum number of bytes of responses kept by the in-memory request cache shared by streams with `use_cache`
+ENV_REQUEST_CACHE_MAX_BYTES = "REQUEST_CACHE_MAX_BYTES"
+
+# Set to "true" to compress the responses kept by the in-memory request cache
+ENV_REQUEST_CACHE_COMPRESSION = "REQUEST_CACHE_COMPRESSION"
+
+# Directory where the manifests of declarative sources are cached once resolved and validated
+ENV_MANIFEST_CACHE_PATH = "MANIFEST_CACHE_PATH"
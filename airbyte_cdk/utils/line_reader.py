@@ -0,0 +1,35 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+from typing import IO, AnyStr, Iterable, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def read_lines(
+    data: Union[IO[AnyStr], Iterable[AnyStr]], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterable[AnyStr]:
+    """
+    Yield the lines of `data` with their trailing line feed, like iterating over a binary file would, but reading `chunk_size` characters
+    at a time and splitting each chunk at once instead of reading line by line. Only `\\n` is considered a line separator.
+
+    Objects without a `read` method (e.g. lists of lines) are iterated as is.
+    """
+    read = getattr(data, "read", None)
+    if read is None:
+        yield from data  # type: ignore[misc]  # data is an iterable if it can't be read
+        return
+
+    remainder: Optional[AnyStr] = None
+    while True:
+        chunk: AnyStr = read(chunk_size)
+        if not chunk:
+            break
+        newline = b"\n" if isinstance(chunk, bytes) else "\n"
+        lines = chunk.split(newline)  # type: ignore[arg-type]  # the newline has the same type as the chunk
+        if remainder:
+            lines[0] = remainder + lines[0]
+        remainder = lines.pop()
+        for line in lines:
+            yield line + newline  # type: ignore[operator]  # the newline has the same type as the line
+    if remainder:
+        yield remainder
@@ -0,0 +1,83 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+import time
+from threading import Lock
+from types import TracebackType
+from typing import BinaryIO, List, Optional, TextIO
+
+
+class BufferedMessageWriter:
+    """
+    Buffers serialized messages and writes them to a binary stream, typically `sys.stdout.buffer`.
+
+    Each message is written as a full line and the buffer is only written with complete lines in a single call, so lines are never split or
+    interleaved even when several threads write at the same time. The buffer is written once it holds `max_buffer_size` bytes, once
+    `flush_interval` seconds elapsed since the last write to the stream (evaluated when a message is written) or when a message is written
+    with `flush=True`, which should be used for STATE messages so that the checkpoint is emitted as soon as the records it covers are.
+
+    If a text stream wrapping the binary stream is provided, it is flushed before writing the buffer so that text printed before the
+    messages is output first.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        text_stream: Optional[TextIO] = None,
+        max_buffer_size: int = 64 * 1024,
+        flush_interval: float = 0.1,
+    ) -> None:
+        """
+        :param stream: The binary stream to write the messages to
+        :param text_stream: The text stream wrapping `stream`, if any
+        :param max_buffer_size: The number of bytes after which the buffer is written to the stream
+        :param flush_interval: The maximum number of seconds between two writes to the stream
+        """
+        self._stream = stream
+        self._text_stream = text_stream
+        self._max_buffer_size = max_buffer_size
+        self._flush_interval = flush_interval
+        self._lines: List[bytes] = []
+        self._buffer_size = 0
+        self._last_flush_time = time.monotonic()
+        self._lock = Lock()
+
+    def write(self, message: bytes, flush: bool = False) -> None:
+        """
+        :param message: A serialized message, without trailing newline
+        :param flush: If True, the buffer is written to the stream right away
+        """
+        with self._lock:
+            self._lines.append(message)
+            self._lines.append(b"\n")
+            self._buffer_size += len(message) + 1
+            if (
+                flush
+                or self._buffer_size >= self._max_buffer_size
+                or time.monotonic() - self._last_flush_time >= self._flush_interval
+            ):
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._lines:
+            if self._text_stream:
+                self._text_stream.flush()
+            self._stream.write(b"".join(self._lines))
+            self._lines = []
+            self._buffer_size = 0
+        self._stream.flush()
+        self._last_flush_time = time.monotonic()
+
+    def __enter__(self) -> "BufferedMessageWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[BaseException],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.flush()
@@ -55,6 +55,7 @@ class PrintBuffer:
         with self.lock:
             combined_message = self.buffer.getvalue()
             sys.__stdout__.write(combined_message)  # type: ignore[union-attr]
+            sys.__stdout__.flush()  # type: ignore[union-attr]
             self.buffer = StringIO()
 
     def __enter__(self) -> "PrintBuffer":
@@ -2,12 +2,22 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Optional
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
 from unittest.mock import ANY, MagicMock, call
 
 import pytest
 
-from airbyte_cdk.destinations.vector_db_based import ProcessingConfigModel, Writer
+from airbyte_cdk.destinations.vector_db_based import (
+    Chunk,
+    FakeEmbedder,
+    FakeEmbeddingConfigModel,
+    Indexer,
+    ProcessingConfigModel,
+    Writer,
+)
+from airbyte_cdk.destinations.vector_db_based.embedder import Document
 from airbyte_cdk.models import (
     AirbyteLogMessage,
     AirbyteMessage,
@@ -191,3 +201,201 @@ def test_write_stream_namespace_split():
         ]
     )
     assert mock_embedder.embed_documents.call_count == 4
+
+
+class CountingFakeEmbedder(FakeEmbedder):
+    def __init__(self) -> None:
+        super().__init__(FakeEmbeddingConfigModel(mode="fake"))
+        self.embedded_texts: List[str] = []
+
+    def embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        self.embedded_texts.extend(document.page_content for document in documents)
+        return super().embed_documents(documents)
+
+
+class FakeIndexer(Indexer):
+    def __init__(self, release: Optional[threading.Event] = None) -> None:
+        super().__init__(None)
+        self.release = release
+        self.operations: List[Tuple[str, Optional[str], str, int]] = []
+
+    def index(self, document_chunks: List[Chunk], namespace: str, stream: str) -> None:
+        if self.release is not None:
+            assert self.release.wait(timeout=10)
+        assert all(chunk.embedding is not None for chunk in document_chunks)
+        self.operations.append(("index", namespace, stream, len(document_chunks)))
+
+    def delete(self, delete_ids: List[str], namespace: str, stream: str) -> None:
+        self.operations.append(("delete", namespace, stream, len(delete_ids)))
+
+    def check(self) -> Optional[str]:
+        return None
+
+
+def _processing_config() -> ProcessingConfigModel:
+    return ProcessingConfigModel(
+        chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"]
+    )
+
+
+def _catalog() -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalogSerializer.load({"streams": [generate_stream()]})
+
+
+def test_write_pipelined_batches_are_indexed_in_order():
+    indexer = FakeIndexer()
+    writer = Writer(
+        _processing_config(),
+        indexer,
+        CountingFakeEmbedder(),
+        BATCH_SIZE,
+        False,
+        max_concurrent_embedding_requests=4,
+        max_pending_batches=3,
+    )
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 5 + 3)]
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage())
+    input_messages.append(state_message)
+
+    output_messages = writer.write(_catalog(), input_messages)
+
+    assert next(output_messages) == state_message
+    # every batch is deleted then indexed, in order, before the state message is emitted
+    assert indexer.operations == [
+        operation
+        for batch_size in [BATCH_SIZE] * 5 + [3]
+        for operation in [
+            ("delete", None, "example_stream", batch_size),
+            ("index", None, "example_stream", batch_size),
+        ]
+    ]
+    assert list(output_messages) == []
+
+
+def test_write_applies_backpressure_while_indexing_is_blocked():
+    release = threading.Event()
+    indexer = FakeIndexer(release)
+    writer = Writer(
+        _processing_config(), indexer, CountingFakeEmbedder(), 1, False, max_pending_batches=1
+    )
+    consumed = []
+
+    def input_messages() -> Iterable[AirbyteMessage]:
+        for i in range(50):
+            consumed.append(i)
+            yield _generate_record_message(i)
+
+    thread = threading.Thread(target=lambda: list(writer.write(_catalog(), input_messages())))
+    thread.start()
+    time.sleep(0.2)
+    # one batch is being indexed and one is pending, so reading stops right after them
+    assert len(consumed) <= 3
+    release.set()
+    thread.join(timeout=10)
+
+    assert len(consumed) == 50
+    assert len([operation for operation in indexer.operations if operation[0] == "index"]) == 50
+
+
+def test_write_flushes_batches_after_flush_interval():
+    indexer = FakeIndexer()
+    writer = Writer(
+        _processing_config(),
+        indexer,
+        CountingFakeEmbedder(),
+        BATCH_SIZE,
+        False,
+        flush_interval_seconds=0,
+    )
+
+    list(writer.write(_catalog(), [_generate_record_message(i) for i in range(3)]))
+
+    assert [operation for operation in indexer.operations if operation[0] == "index"] == [
+        ("index", None, "example_stream", 1)
+    ] * 3
+
+
+@pytest.mark.parametrize(
+    "embedding_cache_size, expected_embedded_texts",
+    [
+        pytest.param(0, 15, id="cache_disabled"),
+        pytest.param(100, 10, id="cache_enabled"),
+    ],
+)
+def test_write_embedding_cache_skips_unchanged_chunks(
+    embedding_cache_size: int, expected_embedded_texts: int
+):
+    embedder = CountingFakeEmbedder()
+    writer = Writer(
+        _processing_config(),
+        FakeIndexer(),
+        embedder,
+        BATCH_SIZE,
+        True,
+        embedding_cache_size=embedding_cache_size,
+    )
+
+    list(writer.write(_catalog(), [_generate_record_message(i) for i in range(5)]))
+    # records 0 to 4 are unchanged, records 5 to 9 are new
+    list(writer.write(_catalog(), [_generate_record_message(i) for i in range(10)]))
+
+    assert len(embedder.embedded_texts) == expected_embedded_texts
+
+
+class SlowFakeEmbedder(FakeEmbedder):
+    def __init__(self) -> None:
+        super().__init__(FakeEmbeddingConfigModel(mode="fake"))
+
+    def embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        # the latency of an embedding API call
+        time.sleep(0.05)
+        return super().embed_documents(documents)
+
+
+class SlowFakeIndexer(FakeIndexer):
+    def index(self, document_chunks: List[Chunk], namespace: str, stream: str) -> None:
+        # the latency of an upsert to the vector database
+        time.sleep(0.02)
+        super().index(document_chunks, namespace, stream)
+
+
+@pytest.mark.slow
+def test_write_time():
+    catalog = ConfiguredAirbyteCatalogSerializer.load(
+        {"streams": [generate_stream(f"stream_{i}") for i in range(4)]}
+    )
+    input_messages = [
+        _generate_record_message(i, f"stream_{i % 4}") for i in range(BATCH_SIZE * 20)
+    ]
+
+    start = time.perf_counter()
+    # one embedding request and one batch in flight, the closest to embedding and indexing each batch before reading the next one
+    synchronous_writer = Writer(
+        _processing_config(),
+        SlowFakeIndexer(),
+        SlowFakeEmbedder(),
+        BATCH_SIZE,
+        False,
+        max_pending_batches=1,
+    )
+    for _ in synchronous_writer.write(catalog, input_messages):
+        pass
+    synchronous_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    pipelined_writer = Writer(
+        _processing_config(),
+        SlowFakeIndexer(),
+        SlowFakeEmbedder(),
+        BATCH_SIZE,
+        False,
+        max_concurrent_embedding_requests=4,
+        max_pending_batches=4,
+    )
+    for _ in pipelined_writer.write(catalog, input_messages):
+        pass
+    pipelined_duration = time.perf_counter() - start
+    print(
+        f"Synchronous: {len(input_messages) / synchronous_duration:,.0f} records/s, "
+        f"pipelined: {len(input_messages) / pipelined_duration:,.0f} records/s"
+    )
+    assert pipelined_duration < synchronous_duration
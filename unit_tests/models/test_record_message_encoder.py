@@ -0,0 +1,169 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+import datetime
+import time
+import uuid
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteMessageSerializer,
+    AirbyteRecordMessage,
+    Type,
+)
+from airbyte_cdk.models.airbyte_protocol import (
+    AirbyteRecordMessageMeta,  # type: ignore[attr-defined]
+)
+from airbyte_cdk.models.file_transfer_record_message import AirbyteFileTransferRecordMessage
+from airbyte_cdk.models.record_message_encoder import RecordMessageEncoder
+
+_EMITTED_AT = 1577836800000
+
+
+def _record_message(record) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=record)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        pytest.param(
+            AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=_EMITTED_AT),
+            id="simple",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(stream="stream", data={}, emitted_at=_EMITTED_AT),
+            id="empty_data",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream="stream", data={"id": 1}, emitted_at=_EMITTED_AT, namespace="public"
+            ),
+            id="with_namespace",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream='stream "quoted" ünicode', data={"name": "é😀"}, emitted_at=_EMITTED_AT
+            ),
+            id="escaped_stream_name_and_unicode_data",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream="stream",
+                data={"root_none": None, "nested": {"none": None, "list": [None, {"none": None}]}},
+                emitted_at=_EMITTED_AT,
+            ),
+            id="none_values",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream="stream",
+                data={
+                    "datetime": datetime.datetime(2020, 1, 1, 12, 30),
+                    "date": datetime.date(2020, 1, 1),
+                    "uuid": uuid.UUID("7693cdff-551c-4a0f-8734-e3342681e775"),
+                    "tuple": (1, 2),
+                    "float": 1.5,
+                    "bool": True,
+                },
+                emitted_at=_EMITTED_AT,
+            ),
+            id="types_handled_by_orjson",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream="stream",
+                data={"id": 1},
+                emitted_at=_EMITTED_AT,
+                meta=AirbyteRecordMessageMeta(changes=[]),
+            ),
+            id="with_meta",
+        ),
+        pytest.param(
+            AirbyteFileTransferRecordMessage(
+                stream="stream", file={"path": "a/file.csv"}, emitted_at=_EMITTED_AT, data={}
+            ),
+            id="file_transfer",
+        ),
+    ],
+)
+def test_encode_is_identical_to_airbyte_message_serializer(record):
+    message = _record_message(record)
+
+    assert RecordMessageEncoder().encode(message) == orjson.dumps(
+        AirbyteMessageSerializer.dump(message)
+    )
+
+
+def test_given_same_stream_with_different_namespaces_when_encode_then_use_each_namespace():
+    encoder = RecordMessageEncoder()
+    with_namespace = _record_message(
+        AirbyteRecordMessage(stream="stream", data={}, emitted_at=1, namespace="public")
+    )
+    without_namespace = _record_message(
+        AirbyteRecordMessage(stream="stream", data={}, emitted_at=1)
+    )
+
+    assert encoder.encode(with_namespace) == orjson.dumps(
+        AirbyteMessageSerializer.dump(with_namespace)
+    )
+    assert encoder.encode(without_namespace) == orjson.dumps(
+        AirbyteMessageSerializer.dump(without_namespace)
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param({"big_int": 2**64}, id="integer_too_big_for_orjson"),
+        pytest.param({"decimal": Decimal("1.1")}, id="decimal"),
+    ],
+)
+def test_given_data_not_serializable_by_orjson_when_encode_then_raise(data):
+    message = _record_message(AirbyteRecordMessage(stream="stream", data=data, emitted_at=1))
+
+    with pytest.raises(orjson.JSONEncodeError):
+        RecordMessageEncoder().encode(message)
+
+
+@pytest.mark.slow
+def test_encode_microbenchmark():
+    """
+    Compares the encoder with the AirbyteMessageSerializer path. Run with `-m slow -s` to see the results.
+    """
+    messages = [
+        _record_message(
+            AirbyteRecordMessage(
+                stream="benchmark_stream",
+                data={
+                    "id": index,
+                    "name": f"name {index}",
+                    "email": f"user{index}@example.com",
+                    "updated_at": "2024-01-01T00:00:00Z",
+                    "tags": ["a", "b", "c"],
+                    "address": {"city": "Montreal", "zip": "H0H 0H0"},
+                    "deleted_at": None,
+                },
+                emitted_at=_EMITTED_AT,
+            )
+        )
+        for index in range(50_000)
+    ]
+    encoder = RecordMessageEncoder()
+
+    start = time.perf_counter()
+    expected = [orjson.dumps(AirbyteMessageSerializer.dump(message)) for message in messages]
+    serializer_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    encoded = [encoder.encode(message) for message in messages]
+    encoder_duration = time.perf_counter() - start
+
+    assert encoded == expected
+    print(
+        f"\nAirbyteMessageSerializer: {len(messages) / serializer_duration:,.0f} records/s, "
+        f"RecordMessageEncoder: {len(messages) / encoder_duration:,.0f} records/s"
+    )
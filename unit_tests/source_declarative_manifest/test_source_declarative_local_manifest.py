@@ -53,3 +53,22 @@ def test_given_valid_config_with_successful_check(capsys, valid_local_config_fil
     _run.handle_command(["check", "--config", str(valid_local_config_file)])
     stdout = capsys.readouterr()
     assert SUCCESS_CHECK_SUBSTRING in stdout.out
+
+
+def test_given_xdg_cache_home_when_default_manifest_cache_path_then_use_user_cache_directory(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert _run._default_manifest_cache_path() == str(tmp_path / "airbyte-manifest-cache")
+
+
+def test_given_no_xdg_cache_home_when_default_manifest_cache_path_then_use_home_cache_directory(
+    monkeypatch, tmp_path
+):
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    assert _run._default_manifest_cache_path() == str(
+        tmp_path / ".cache" / "airbyte-manifest-cache"
+    )
@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import logging
+import time
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.entrypoint import AirbyteEntrypoint
+from airbyte_cdk.models import Type
+from airbyte_cdk.models.serialized_airbyte_message import SerializedAirbyteMessage
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import (
+    AlwaysAvailableAvailabilityStrategy,
+)
+from airbyte_cdk.sources.streams.concurrent.cursor import FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.default_stream import DefaultStream
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.types import Record
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+
+_LOGGER = logging.getLogger("airbyte.test")
+_STREAM_NAME = "benchmark_stream"
+
+
+class _InMemoryPartition(Partition):
+    def __init__(self, partition_id: int, number_of_records: int) -> None:
+        self._partition_id = partition_id
+        self._number_of_records = number_of_records
+
+    def read(self) -> Iterable[Record]:
+        for index in range(self._number_of_records):
+            yield Record(
+                {
+                    "id": f"{self._partition_id}-{index}",
+                    "partition": self._partition_id,
+                    "name": "a name long enough to make serialization cost something",
+                    "values": [index, index * 2, index * 3],
+                    "nested": {"updated_at": "2024-01-01T00:00:00Z", "active": True},
+                },
+                _STREAM_NAME,
+            )
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return {"partition": self._partition_id}
+
+    def stream_name(self) -> str:
+        return _STREAM_NAME
+
+    def __hash__(self) -> int:
+        return hash(self._partition_id)
+
+
+class _InMemoryPartitionGenerator(PartitionGenerator):
+    def __init__(self, number_of_partitions: int, records_per_partition: int) -> None:
+        self._number_of_partitions = number_of_partitions
+        self._records_per_partition = records_per_partition
+
+    def generate(self) -> Iterable[Partition]:
+        for partition_id in range(self._number_of_partitions):
+            yield _InMemoryPartition(partition_id, self._records_per_partition)
+
+
+def _read(
+    num_workers: int,
+    serialize_records_in_workers: bool,
+    number_of_partitions: int,
+    records_per_partition: int,
+) -> List[str]:
+    message_repository = InMemoryMessageRepository()
+    stream = DefaultStream(
+        _InMemoryPartitionGenerator(number_of_partitions, records_per_partition),
+        _STREAM_NAME,
+        {},
+        AlwaysAvailableAvailabilityStrategy(),
+        [],
+        None,
+        _LOGGER,
+        FinalStateCursor(_STREAM_NAME, None, message_repository),
+    )
+    source = ConcurrentSource.create(
+        num_workers,
+        1,
+        _LOGGER,
+        Mock(spec=DebugSliceLogger, should_log_slice_message=Mock(return_value=False)),
+        message_repository,
+        serialize_records_in_workers=serialize_records_in_workers,
+    )
+    return [
+        AirbyteEntrypoint.airbyte_message_to_string(message)
+        for message in source.read([stream])
+        if message.type == Type.RECORD
+    ]
+
+
+def test_given_serialize_records_in_workers_when_read_then_emit_same_records():
+    records = _read(2, False, 3, 10)
+    serialized_records = _read(2, True, 3, 10)
+
+    def _without_emitted_at(lines: List[str]) -> List[str]:
+        return sorted(line.rsplit(',"emitted_at"', 1)[0] for line in lines)
+
+    assert len(serialized_records) == 30
+    assert _without_emitted_at(serialized_records) == _without_emitted_at(records)
+
+
+def test_given_serialize_records_in_workers_when_read_then_messages_are_serialized():
+    message_repository = InMemoryMessageRepository()
+    stream = DefaultStream(
+        _InMemoryPartitionGenerator(1, 2),
+        _STREAM_NAME,
+        {},
+        AlwaysAvailableAvailabilityStrategy(),
+        [],
+        None,
+        _LOGGER,
+        FinalStateCursor(_STREAM_NAME, None, message_repository),
+    )
+    source = ConcurrentSource.create(
+        2, 1, _LOGGER, DebugSliceLogger(), message_repository, serialize_records_in_workers=True
+    )
+
+    records = [message for message in source.read([stream]) if message.type == Type.RECORD]
+
+    assert len(records) == 2
+    assert all(isinstance(record, SerializedAirbyteMessage) for record in records)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("serialize_records_in_workers", [False, True])
+def test_records_per_second_by_number_of_workers(serialize_records_in_workers):
+    """
+    Benchmark reporting the throughput of a concurrent read for an increasing number of workers. Run with `-m slow -s` to see the results.
+    """
+    number_of_partitions = 20
+    records_per_partition = 2_000
+    results = {}
+    for num_workers in [2, 4, 8, 16]:
+        start = time.perf_counter()
+        records = _read(
+            num_workers, serialize_records_in_workers, number_of_partitions, records_per_partition
+        )
+        elapsed = time.perf_counter() - start
+        assert len(records) == number_of_partitions * records_per_partition
+        results[num_workers] = len(records) / elapsed
+
+    print(
+        f"\nserialize_records_in_workers={serialize_records_in_workers}: "
+        + ", ".join(
+            f"{num_workers} workers: {records_per_second:,.0f} records/s"
+            for num_workers, records_per_second in results.items()
+        )
+    )
@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+from unittest.mock import Mock
+
+from airbyte_cdk.sources.concurrent_source.record_count_bounded_queue import (
+    RecordCountBoundedQueue,
+)
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PartitionCompleteSentinel,
+    RecordBatch,
+)
+from airbyte_cdk.sources.types import Record
+
+_A_RECORD = Record({"id": 1}, "stream")
+
+
+def test_given_record_batch_when_qsize_then_count_records():
+    queue = RecordCountBoundedQueue()
+    queue.put(RecordBatch([_A_RECORD, _A_RECORD, _A_RECORD]))
+    queue.put(PartitionCompleteSentinel(Mock(spec=Partition)))
+
+    assert queue.qsize() == 4
+
+
+def test_given_records_fill_maxsize_when_full_then_return_true():
+    queue = RecordCountBoundedQueue(maxsize=3)
+    queue.put(RecordBatch([_A_RECORD, _A_RECORD, _A_RECORD]))
+
+    assert queue.full()
+
+
+def test_given_items_consumed_when_qsize_then_size_is_decremented_by_item_weight():
+    queue = RecordCountBoundedQueue(maxsize=10)
+    batch = RecordBatch([_A_RECORD, _A_RECORD])
+    queue.put(batch)
+    queue.put(_A_RECORD)
+
+    assert queue.get() == batch
+    assert queue.qsize() == 1
+    assert queue.get() == _A_RECORD
+    assert queue.empty()
+
+
+def test_given_empty_batch_when_put_then_queue_is_not_empty():
+    queue = RecordCountBoundedQueue()
+    queue.put(RecordBatch([]))
+
+    assert not queue.empty()
+    assert queue.get() == RecordBatch([])
+    assert queue.empty()
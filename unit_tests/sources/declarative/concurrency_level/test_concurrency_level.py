@@ -92,3 +92,14 @@ def test_max_concurrency_is_required_for_default_concurrency_using_config() -> N
             config=config,
             parameters={},
         )
+
+
+def test_given_adaptive_without_max_concurrency_when_create_then_raise() -> None:
+    with pytest.raises(ValueError):
+        ConcurrencyLevel(
+            default_concurrency=10,
+            max_concurrency=None,
+            config={},
+            parameters={},
+            adaptive=True,
+        )
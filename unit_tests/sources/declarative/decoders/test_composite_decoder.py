@@ -20,7 +20,9 @@ from airbyte_cdk.sources.declarative.decoders.composite_raw_decoder import (
     GzipParser,
     JsonLineParser,
     JsonParser,
+    StreamingJsonParser,
 )
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor
 from airbyte_cdk.utils import AirbyteTracedException
 
 
@@ -321,3 +323,114 @@ def test_given_response_is_not_streamed_when_decode_then_can_be_called_multiple_
     content_second_time = list(composite_raw_decoder.decode(response))
 
     assert content == content_second_time
+
+
+def test_given_integer_over_64_bits_when_jsonline_parser_then_fall_back_on_json():
+    data = BytesIO(b'{"id": 1}\n{"id": 340282366920938463463374607431768211456}\n')
+
+    assert list(JsonLineParser().parse(data)) == [
+        {"id": 1},
+        {"id": 340282366920938463463374607431768211456},
+    ]
+
+
+def test_given_invalid_line_when_jsonline_parser_then_skip_line():
+    data = BytesIO(b'{"id": 1}\nnot json\n{"id": 2}')
+
+    assert list(JsonLineParser().parse(data)) == [{"id": 1}, {"id": 2}]
+
+
+_PAGE = {
+    "meta": {"count": 3, "escaped": 'a "quoted" string with [brackets] and {braces} \\'},
+    "data": [
+        {"id": 1, "name": "first", "nested": {"values": [1, [2, 3], {"a": None}]}},
+        {"id": 2, "name": 'é \\ " ]'},
+        {"id": 3, "tags": []},
+    ],
+    "next": "cursor",
+}
+
+
+@pytest.mark.parametrize(
+    "field_path, expected",
+    [
+        pytest.param(["data"], _PAGE["data"], id="array"),
+        pytest.param(["meta"], [_PAGE["meta"]], id="object"),
+        pytest.param(["next"], ["cursor"], id="scalar"),
+        pytest.param(["data", "1"], [_PAGE["data"][1]], id="array_index"),
+        pytest.param(["data", "5"], [], id="array_index_out_of_range"),
+        pytest.param(["data", "0", "nested", "values"], [1, [2, 3], {"a": None}], id="nested"),
+        pytest.param(["missing"], [], id="missing"),
+        pytest.param(["next", "missing"], [], id="path_through_scalar"),
+        pytest.param([], [_PAGE], id="root"),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_streaming_json_parser(field_path, expected, chunk_size):
+    data = BytesIO(json.dumps(_PAGE, indent=2).encode())
+
+    parser = StreamingJsonParser(field_path=field_path, chunk_size=chunk_size)
+
+    assert list(parser.parse(data)) == expected
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16", "iso-8859-1"])
+def test_streaming_json_parser_with_encoding(encoding):
+    data = BytesIO(json.dumps({"data": [{"name": "é"}]}, ensure_ascii=False).encode(encoding))
+
+    parser = StreamingJsonParser(field_path=["data"], encoding=encoding, chunk_size=3)
+
+    assert list(parser.parse(data)) == [{"name": "é"}]
+
+
+def test_given_root_array_when_streaming_json_parser_then_yield_elements():
+    data = BytesIO(b' [1, {"id": 2}, "three", null] ')
+
+    assert list(StreamingJsonParser(chunk_size=2).parse(data)) == [1, {"id": 2}, "three", None]
+
+
+@pytest.mark.parametrize(
+    "raw_data",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b'{"data": [{"id": 1}, {"id": ', id="truncated"),
+        pytest.param(b'{"data": [{"id": 1} {"id": 2}]}', id="missing_comma"),
+        pytest.param(b'{"data": [{"id": tru}]}', id="invalid_value"),
+        pytest.param(b"{data: []}", id="unquoted_key"),
+    ],
+)
+def test_given_invalid_json_when_streaming_json_parser_then_raise_traced_exception(raw_data):
+    with pytest.raises(AirbyteTracedException):
+        list(StreamingJsonParser(field_path=["data"], chunk_size=4).parse(BytesIO(raw_data)))
+
+
+def test_streaming_json_parser_yields_records_before_reading_whole_data():
+    records = [{"id": index, "padding": "x" * 100} for index in range(1_000)]
+    data = BytesIO(json.dumps({"data": records}).encode())
+
+    parsed = StreamingJsonParser(field_path=["data"], chunk_size=1024).parse(data)
+
+    assert next(parsed) == records[0]
+    assert data.tell() <= 1024
+    assert list(parsed) == records[1:]
+
+
+def test_streaming_json_parser_with_gzip_and_dpath_extractor(requests_mock):
+    requests_mock.register_uri(
+        "GET",
+        "https://airbyte.io/",
+        content=compress_with_gzip(json.dumps(_PAGE)),
+        headers={"Content-Encoding": "gzip"},
+    )
+    response = requests.get("https://airbyte.io/", stream=True)
+    extractor = DpathExtractor(
+        field_path=[],
+        config={},
+        parameters={},
+        decoder=CompositeRawDecoder(
+            parser=GzipParser(inner_parser=StreamingJsonParser(field_path=["data"])),
+            stream_response=True,
+        ),
+    )
+
+    assert list(extractor.extract_records(response)) == _PAGE["data"]
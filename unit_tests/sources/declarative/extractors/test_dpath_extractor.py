@@ -3,8 +3,11 @@
 #
 import io
 import json
+import time
 from typing import Dict, List, Union
+from unittest.mock import patch
 
+import dpath
 import pytest
 import requests
 
@@ -122,3 +125,112 @@ def test_dpath_extractor(field_path: List, decoder: Decoder, body, expected_reco
     actual_records = list(extractor.extract_records(response))
 
     assert actual_records == expected_records
+
+
+_BODY_FOR_COMPILED_PATHS = {
+    "data": {
+        "items": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}],
+        "item": {"id": 3},
+        "empty": {},
+        "text": "a string",
+    },
+    "list": [{"values": {"x": 1, "y": 2}}, {"values": [3, 4]}, {"other": 5}, "leaf"],
+    "item_1": {"id": 4},
+    "item_2": {"id": 5},
+}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param(["data", "items"], id="list"),
+        pytest.param(["data", "item"], id="object"),
+        pytest.param(["data", "empty"], id="empty_object"),
+        pytest.param(["data", "missing"], id="missing_key"),
+        pytest.param(["data", "text", "nested"], id="path_through_leaf"),
+        pytest.param(["data", "items", "1"], id="list_index"),
+        pytest.param(["data", "items", "-1"], id="negative_list_index"),
+        pytest.param(["data", "items", "{{ 0 }}"], id="integer_list_index"),
+        pytest.param(["data", "items", "5"], id="list_index_out_of_range"),
+        pytest.param(["data", "items", "id"], id="key_on_list"),
+        pytest.param(["data", "items", "*", "tags"], id="wildcard"),
+        pytest.param(["data", "items", "*", "tags", "*"], id="several_wildcards"),
+        pytest.param(["list", "*", "values", "*"], id="wildcard_on_objects_and_lists"),
+        pytest.param(["*", "id"], id="wildcard_at_root"),
+        pytest.param(["item_1*"], id="glob_pattern"),
+        pytest.param(["data", "ite?"], id="single_character_glob_pattern"),
+        pytest.param(["*", "item_[12]"], id="wildcard_and_glob_pattern"),
+    ],
+)
+def test_compiled_path_then_same_result_as_dpath(path):
+    extractor = DpathExtractor(field_path=path, config=config, parameters=parameters)
+    evaluated_path = [segment.eval(config) for segment in extractor._field_path]
+    if "*" in evaluated_path:
+        expected = dpath.values(_BODY_FOR_COMPILED_PATHS, evaluated_path)
+    else:
+        expected = dpath.get(_BODY_FOR_COMPILED_PATHS, evaluated_path, default=[])
+
+    assert extractor._get_path_extractor()(_BODY_FOR_COMPILED_PATHS) == expected
+
+
+def test_given_static_path_when_extract_records_then_evaluate_path_once():
+    extractor = DpathExtractor(
+        field_path=["{{ config['field'] }}"], config=config, parameters=parameters
+    )
+
+    with patch.object(
+        extractor._field_path[0], "eval", wraps=extractor._field_path[0].eval
+    ) as eval_mock:
+        for _ in range(3):
+            records = list(
+                extractor.extract_records(create_response({"record_array": [{"id": 1}]}))
+            )
+
+    assert records == [{"id": 1}]
+    assert eval_mock.call_count == 1
+
+
+def test_given_path_depending_on_macro_when_extract_records_then_evaluate_path_for_every_body():
+    extractor = DpathExtractor(
+        field_path=["{{ 'record_array' if now_utc() else 'other' }}"],
+        config=config,
+        parameters=parameters,
+    )
+
+    with patch.object(
+        extractor._field_path[0], "eval", wraps=extractor._field_path[0].eval
+    ) as eval_mock:
+        for _ in range(3):
+            records = list(
+                extractor.extract_records(create_response({"record_array": [{"id": 1}]}))
+            )
+
+    assert records == [{"id": 1}]
+    assert eval_mock.call_count == 3
+
+
+@pytest.mark.slow
+def test_records_per_second_with_compiled_path():
+    """
+    Benchmark comparing the extraction of a page of small records with dpath and with the compiled path. Run with `-m slow -s` to see the
+    results.
+    """
+    body = {
+        "data": {"items": [{"id": index, "name": f"record {index}"} for index in range(20_000)]}
+    }
+    path = ["data", "items"]
+    extractor = DpathExtractor(field_path=path, config=config, parameters=parameters)
+
+    start = time.perf_counter()
+    expected = dpath.get(body, path, default=[])
+    dpath_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extracted = extractor._get_path_extractor()(body)
+    compiled_elapsed = time.perf_counter() - start
+
+    assert extracted == expected
+    print(
+        f"\ndpath: {len(expected) / dpath_elapsed:,.0f} records/s, "
+        f"compiled path: {len(extracted) / compiled_elapsed:,.0f} records/s"
+    )
@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+
+from airbyte_cdk.sources.declarative.interpolation.compiled_condition import compile_condition
+from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
+from airbyte_cdk.sources.types import StreamSlice
+
+_CONFIG = {"start_date": "2024-01-01", "statuses": ["open", "closed"]}
+_STREAM_SLICE = StreamSlice(
+    partition={"parent_id": "1"},
+    cursor_slice={"start_time": "2024-01-10", "end_time": "2024-01-20"},
+    extra_fields={"updated_at": "2024-01-15"},
+)
+_RECORDS = [
+    {"id": 1, "updated_at": "2024-01-05", "status": "open", "tags": ["a"], "owner": None},
+    {"id": 2, "updated_at": "2024-01-15", "status": "closed", "tags": [], "owner": "me"},
+    {"id": 3, "updated_at": None, "status": "deleted", "tags": ["a", "b"]},
+    {"id": 4, "status": "open", "items": 3},
+]
+
+
+@pytest.mark.parametrize(
+    "condition, is_compiled",
+    [
+        pytest.param(
+            "{{ record['updated_at'] >= stream_interval['start_time'] }}", True, id="gteq"
+        ),
+        pytest.param(
+            "{{ record.updated_at < stream_slice.end_time }}", True, id="lt_with_attributes"
+        ),
+        pytest.param(
+            "{{ record['updated_at'] > config['start_date'] }}", True, id="gt_with_config"
+        ),
+        pytest.param("{{ record['status'] == 'open' }}", True, id="eq"),
+        pytest.param("{{ record['status'] != 'open' }}", True, id="ne"),
+        pytest.param("{{ record['status'] in ['open', 'closed'] }}", True, id="in_list"),
+        pytest.param("{{ record['status'] not in config['statuses'] }}", True, id="not_in"),
+        pytest.param("{{ 'a' in record['tags'] }}", True, id="in_record_value"),
+        pytest.param("{{ record['tags'][0] == 'a' }}", True, id="list_index"),
+        pytest.param("{{ record['id'] > 1 and record['status'] == 'open' }}", True, id="and"),
+        pytest.param("{{ record['id'] == 1 or record['status'] == 'deleted' }}", True, id="or"),
+        pytest.param("{{ not record['status'] == 'open' }}", True, id="not"),
+        pytest.param("{{ record['owner'] is none }}", True, id="is_none"),
+        pytest.param("{{ record['owner'] is not none }}", True, id="is_not_none"),
+        pytest.param("{{ 1 < record['id'] <= 3 }}", True, id="chained_comparison"),
+        pytest.param(
+            "{{ record['updated_at'] >= stream_interval.extra_fields['updated_at'] }}",
+            True,
+            id="stream_slice_property",
+        ),
+        pytest.param("{{ record.items == 3 }}", True, id="attribute_shadowing_item"),
+        pytest.param("{{ record['id'] == 1 or unknown['id'] == 1 }}", True, id="unknown_variable"),
+        pytest.param("{{ record['updated_at'] }}", False, id="not_a_boolean"),
+        pytest.param("{{ record['id'] | int > 1 }}", False, id="filter"),
+        pytest.param("{{ record['updated_at'] > now_utc() }}", False, id="macro"),
+        pytest.param(" {{ record['id'] == 1 }}", False, id="text_around_expression"),
+        pytest.param("{{ record['id'] == stream_state['id'] }}", False, id="stream_state"),
+    ],
+)
+def test_compiled_condition_then_same_result_as_jinja(condition, is_compiled):
+    compiled_condition = compile_condition(condition)
+    interpolated_boolean = InterpolatedBoolean(condition=condition, parameters={})
+    jinja_boolean = InterpolatedBoolean(condition=condition, parameters={})
+    jinja_boolean._compiled_condition = None
+
+    assert (compiled_condition is not None) == is_compiled
+    for record in _RECORDS:
+        kwargs = {"record": record, "stream_slice": _STREAM_SLICE, "next_page_token": None}
+        assert _outcome(interpolated_boolean, kwargs) == _outcome(jinja_boolean, kwargs)
+
+
+def _outcome(interpolated_boolean, kwargs):
+    try:
+        return interpolated_boolean.eval(_CONFIG, **kwargs)
+    except Exception as error:
+        return type(error)
+
+
+def test_given_missing_value_when_eval_then_defer_to_jinja():
+    compiled_condition = compile_condition("{{ record['updated_at'] >= '2024-01-01' }}")
+
+    assert compiled_condition.eval({}, record={"id": 1}) is None
+    assert compiled_condition.eval({}, record={"updated_at": None}) is None
+    assert compiled_condition.eval({}, record={"updated_at": "2024-01-02"}) is True
+
+
+def test_given_alias_in_parameters_when_eval_then_defer_to_jinja():
+    compiled_condition = compile_condition("{{ record['id'] == 1 }}")
+
+    assert compiled_condition.eval({}, record={"id": 1}, stream_interval={}) is None
@@ -2,9 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import time
+
 import pytest
 
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
+from airbyte_cdk.sources.types import StreamSlice
 
 config = {"field": "value"}
 parameters = {"hello": "world"}
@@ -24,3 +28,60 @@ kwargs = {"c": "airbyte"}
 def test_interpolated_string(test_name, input_string, expected_value):
     s = InterpolatedString.create(input_string, parameters=parameters)
     assert s.eval(config, **{"kwargs": kwargs}) == expected_value
+
+
+@pytest.mark.slow
+def test_evaluations_per_second_for_typical_templates():
+    """
+    Benchmark comparing InterpolatedString with evaluating the templates with JinjaInterpolation.eval. Run with `-m slow -s` to see the
+    results.
+    """
+    templates = [
+        "/v1/users",
+        "application/json",
+        "{{ config['api_key'] }}",
+        "{{ config['page_size'] }}",
+        "{{ stream_slice.start_time }}",
+        "{{ stream_partition.parent_id }}",
+        "{{ parameters['name'] }}",
+        "/v1/parents/{{ stream_partition.parent_id }}/children",
+    ]
+    benchmark_config = {"api_key": "a-secret-key", "page_size": 100}
+    benchmark_parameters = {"name": "users"}
+    stream_slice = StreamSlice(
+        partition={"parent_id": "123"}, cursor_slice={"start_time": "2024-01-01T00:00:00Z"}
+    )
+    number_of_iterations = 5_000
+    interpolation = JinjaInterpolation()
+    for template in templates:
+        interpolated_string = InterpolatedString.create(template, parameters=benchmark_parameters)
+
+        start = time.perf_counter()
+        for _ in range(number_of_iterations):
+            interpolation.eval(
+                template,
+                benchmark_config,
+                template,
+                parameters=benchmark_parameters,
+                stream_slice=stream_slice,
+            )
+        eval_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(number_of_iterations):
+            interpolated_string.eval(benchmark_config, stream_slice=stream_slice)
+        compiled_elapsed = time.perf_counter() - start
+
+        assert interpolated_string.eval(
+            benchmark_config, stream_slice=stream_slice
+        ) == interpolation.eval(
+            template,
+            benchmark_config,
+            template,
+            parameters=benchmark_parameters,
+            stream_slice=stream_slice,
+        )
+        print(
+            f"\n{template}: {number_of_iterations / eval_elapsed:,.0f} evaluations/s with eval, "
+            f"{number_of_iterations / compiled_elapsed:,.0f} evaluations/s with InterpolatedString"
+        )
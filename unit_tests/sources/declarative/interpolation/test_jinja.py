@@ -357,3 +357,100 @@ def test_interpolation_private_partition_attribute():
     actual_output = JinjaInterpolation().eval(template, {}, **{"stream_slice": stream_slice})
 
     assert actual_output == expected_output
+
+
+_COMPILE_CONFIG = {
+    "start_date": "2024-01-01T00:00:00Z",
+    "page_size": 100,
+    "page_size_as_string": "100",
+    "ratio": 1.5,
+    "enabled": True,
+    "nothing": None,
+    "empty": "",
+    "list_as_string": "[1, 2]",
+    "name": "airbyte",
+    "nested": {"key": "value", "items": "an item"},
+}
+_COMPILE_STREAM_SLICE = StreamSlice(
+    partition={"parent_id": "123"},
+    cursor_slice={"start_time": "2024-01-01", "end_time": "2024-01-31"},
+)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        pytest.param("/v1/users", id="constant"),
+        pytest.param("100", id="constant_number"),
+        pytest.param("[1, 2]", id="constant_list"),
+        pytest.param("a line\n", id="constant_with_trailing_newline"),
+        pytest.param("a\r\nb", id="constant_with_windows_newline"),
+        pytest.param("a\rb", id="constant_with_carriage_return"),
+        pytest.param("", id="empty_constant"),
+        pytest.param("{{ config['start_date'] }}", id="config_item"),
+        pytest.param('{{ config["page_size"] }}', id="config_item_double_quotes"),
+        pytest.param("{{ config.page_size_as_string }}", id="config_attribute"),
+        pytest.param("{{config['ratio']}}", id="float_without_spaces"),
+        pytest.param("{{ config['enabled'] }}", id="boolean"),
+        pytest.param("{{ config['nothing'] }}", id="none"),
+        pytest.param("{{ config['empty'] }}", id="empty_string"),
+        pytest.param("{{ config['missing'] }}", id="missing_key"),
+        pytest.param("{{ config['list_as_string'] }}", id="list_as_string"),
+        pytest.param("{{ config['nested'] }}", id="mapping"),
+        pytest.param("{{ config['nested']['key'] }}", id="nested_item"),
+        pytest.param("{{ config.nested.items }}", id="attribute_shadowing_item"),
+        pytest.param("{{ config['nested']['items'] }}", id="item_named_like_attribute"),
+        pytest.param("{{ config.name.upper }}", id="attribute_of_string"),
+        pytest.param("{{ parameters['name'] }}", id="parameters"),
+        pytest.param("{{ stream_slice.start_time }}", id="stream_slice_attribute"),
+        pytest.param("{{ stream_slice['end_time'] }}", id="stream_slice_item"),
+        pytest.param("{{ stream_slice.partition }}", id="stream_slice_property"),
+        pytest.param("{{ stream_partition.parent_id }}", id="alias"),
+        pytest.param("{{ stream_interval['start_time'] }}", id="other_alias"),
+        pytest.param("{{ next_page_token['next_page_url'] }}", id="variable_missing_from_context"),
+        pytest.param("{{ config['start_date'] | string }}", id="filter"),
+        pytest.param("{{ config['page_size'] }}/{{ config['name'] }}", id="several_lookups"),
+    ],
+)
+@pytest.mark.parametrize("valid_types", [None, (str,), (int,)])
+@pytest.mark.parametrize("default", [None, "a default"])
+def test_compile_then_same_result_as_eval(template, valid_types, default):
+    kwargs = {"parameters": {"name": "stream"}, "stream_slice": _COMPILE_STREAM_SLICE}
+    if template.startswith("{{ next_page_token"):
+        kwargs["next_page_token"] = {"next_page_url": "https://airbyte.io/?page=2"}
+
+    expected = interpolation.eval(template, _COMPILE_CONFIG, default, valid_types, **kwargs)
+    evaluate = interpolation.compile(template)
+
+    # evaluating twice makes sure that the cached last evaluation is correct
+    assert evaluate(_COMPILE_CONFIG, default, valid_types, **kwargs) == expected
+    assert evaluate(_COMPILE_CONFIG, default, valid_types, **kwargs) == expected
+
+
+def test_given_constant_list_when_compile_then_return_new_list_on_every_evaluation():
+    evaluate = interpolation.compile("[1, 2]")
+
+    evaluate({}).append(3)
+
+    assert evaluate({}) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        pytest.param("/v1/constant", id="constant"),
+        pytest.param("{{ config['name'] }}", id="lookup"),
+    ],
+)
+def test_given_alias_in_parameters_when_compile_then_raise_like_eval(template):
+    evaluate = interpolation.compile(template)
+
+    with pytest.raises(ValueError):
+        evaluate({"name": "airbyte"}, stream_interval={})
+
+
+def test_given_stream_state_when_compile_then_raise_like_eval():
+    evaluate = interpolation.compile("{{ stream_state['updated_at'] }}")
+
+    with pytest.raises(AirbyteTracedException):
+        evaluate({}, stream_state={"updated_at": "2024-01-01"})
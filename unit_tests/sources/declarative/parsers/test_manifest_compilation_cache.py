@@ -0,0 +1,197 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import os
+import time
+from copy import deepcopy
+from unittest.mock import patch
+
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.parsers.manifest_compilation_cache import (
+    ManifestCompilationCache,
+    validate_manifest,
+)
+from airbyte_cdk.utils.constants import ENV_MANIFEST_CACHE_PATH
+
+
+def _manifest(number_of_streams: int = 2):
+    return {
+        "version": "6.7.0",
+        "definitions": {
+            "requester": {
+                "type": "HttpRequester",
+                "url_base": "https://api.airbyte.io/v1/",
+                "http_method": "GET",
+                "authenticator": {
+                    "type": "BearerAuthenticator",
+                    "api_token": "{{ config['api_key'] }}",
+                },
+            },
+        },
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "$parameters": {"name": f"stream_{index}", "primary_key": "id"},
+                "retriever": {
+                    "type": "SimpleRetriever",
+                    "requester": {"$ref": "#/definitions/requester", "path": f"stream_{index}"},
+                    "record_selector": {
+                        "type": "RecordSelector",
+                        "extractor": {"type": "DpathExtractor", "field_path": ["data"]},
+                    },
+                },
+                "schema_loader": {
+                    "type": "InlineSchemaLoader",
+                    "schema": {"type": "object", "properties": {"id": {"type": "string"}}},
+                },
+            }
+            for index in range(number_of_streams)
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["stream_0"]},
+        "spec": {
+            "type": "Spec",
+            "connection_specification": {
+                "type": "object",
+                "required": ["api_key"],
+                "properties": {"api_key": {"type": "string"}},
+            },
+        },
+    }
+
+
+def test_given_manifest_cached_when_get_then_return_compiled_manifest(tmp_path):
+    cache = ManifestCompilationCache(tmp_path)
+    cache.put(_manifest(), {"compiled": True})
+
+    assert cache.get(_manifest()) == {"compiled": True}
+    assert cache.get(_manifest(number_of_streams=3)) is None
+
+
+def test_given_corrupted_entry_when_get_then_return_none(tmp_path):
+    cache = ManifestCompilationCache(tmp_path)
+    cache.put(_manifest(), {"compiled": True})
+    for entry in tmp_path.iterdir():
+        entry.write_text("{not json")
+
+    assert cache.get(_manifest()) is None
+
+
+def test_given_manifest_not_json_serializable_when_put_then_do_not_cache(tmp_path):
+    cache = ManifestCompilationCache(tmp_path)
+
+    cache.put({"version": object()}, {"compiled": True})
+    cache.put(_manifest(), {"value": object()})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_given_directory_writable_by_other_users_when_get_then_ignore_cache(tmp_path):
+    cache = ManifestCompilationCache(tmp_path)
+    cache.put(_manifest(), {"compiled": True})
+    tmp_path.chmod(0o777)
+
+    cache.put(_manifest(number_of_streams=3), {"compiled": True})
+
+    assert cache.get(_manifest()) is None
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_given_entry_writable_by_other_users_when_get_then_ignore_entry(tmp_path):
+    cache = ManifestCompilationCache(tmp_path)
+    cache.put(_manifest(), {"compiled": True})
+    for entry in tmp_path.iterdir():
+        entry.chmod(0o666)
+
+    assert cache.get(_manifest()) is None
+
+
+def test_given_directory_owned_by_other_user_when_get_then_ignore_cache(tmp_path):
+    cache = ManifestCompilationCache(tmp_path)
+    cache.put(_manifest(), {"compiled": True})
+
+    with patch(
+        "airbyte_cdk.sources.declarative.parsers.manifest_compilation_cache.os.getuid",
+        return_value=os.getuid() + 1,
+    ):
+        assert cache.get(_manifest()) is None
+
+
+def test_given_directory_is_symbolic_link_when_get_then_ignore_cache(tmp_path):
+    (tmp_path / "target").mkdir(mode=0o700)
+    ManifestCompilationCache(tmp_path / "target").put(_manifest(), {"compiled": True})
+    (tmp_path / "link").symlink_to(tmp_path / "target")
+
+    assert ManifestCompilationCache(tmp_path / "link").get(_manifest()) is None
+
+
+def test_when_put_then_create_directory_only_accessible_by_user(tmp_path):
+    cache = ManifestCompilationCache(tmp_path / "cache")
+
+    cache.put(_manifest(), {"compiled": True})
+
+    assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+    assert all(entry.stat().st_mode & 0o077 == 0 for entry in (tmp_path / "cache").iterdir())
+    assert cache.get(_manifest()) == {"compiled": True}
+
+
+def test_given_cache_path_when_create_source_twice_then_reuse_compiled_manifest(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setenv(ENV_MANIFEST_CACHE_PATH, str(tmp_path))
+    source = ManifestDeclarativeSource(source_config=_manifest())
+
+    with (
+        patch(
+            "airbyte_cdk.sources.declarative.manifest_declarative_source.ManifestReferenceResolver"
+        ) as resolver,
+        patch(
+            "airbyte_cdk.sources.declarative.manifest_declarative_source.validate_manifest"
+        ) as validate,
+    ):
+        cached_source = ManifestDeclarativeSource(source_config=_manifest())
+
+    resolver.assert_not_called()
+    validate.assert_not_called()
+    assert cached_source.resolved_manifest == source.resolved_manifest
+    assert [stream.name for stream in cached_source.streams({"api_key": "key"})] == [
+        "stream_0",
+        "stream_1",
+    ]
+
+
+def test_given_invalid_manifest_when_create_source_then_do_not_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv(ENV_MANIFEST_CACHE_PATH, str(tmp_path))
+    manifest = _manifest()
+    manifest["streams"][0]["retriever"]["requester"]["http_method"] = "INVALID"
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            ManifestDeclarativeSource(source_config=deepcopy(manifest))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_given_invalid_manifest_when_validate_manifest_then_raise_validation_error():
+    with pytest.raises(ValidationError):
+        validate_manifest({"type": "DeclarativeSource", "streams": "not a list"})
+
+
+@pytest.mark.slow
+def test_source_creation_time_with_manifest_cache(monkeypatch, tmp_path):
+    manifest = _manifest(number_of_streams=200)
+    durations = {}
+    for label, cache_path in (("without cache", None), ("with cache", str(tmp_path))):
+        if cache_path:
+            monkeypatch.setenv(ENV_MANIFEST_CACHE_PATH, cache_path)
+            ManifestDeclarativeSource(source_config=deepcopy(manifest))
+        start = time.perf_counter()
+        for _ in range(5):
+            ManifestDeclarativeSource(source_config=deepcopy(manifest))
+        durations[label] = (time.perf_counter() - start) / 5
+        print(f"Source creation {label}: {durations[label] * 1000:.1f} ms")
+
+    assert durations["with cache"] < durations["without cache"]
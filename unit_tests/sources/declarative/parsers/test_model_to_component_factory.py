@@ -5,6 +5,7 @@
 # mypy: ignore-errors
 from datetime import datetime, timedelta, timezone
 from typing import Any, Iterable, Mapping
+from unittest.mock import Mock
 
 import freezegun
 import pytest
@@ -35,6 +36,11 @@ from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.decoders import JsonDecoder, PaginationDecoderDecorator
+from airbyte_cdk.sources.declarative.decoders.composite_raw_decoder import (
+    CompositeRawDecoder,
+    GzipParser,
+    StreamingJsonParser,
+)
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.extractors.record_filter import (
@@ -65,6 +71,7 @@ from airbyte_cdk.sources.declarative.models import CustomSchemaLoader as CustomS
 from airbyte_cdk.sources.declarative.models import DatetimeBasedCursor as DatetimeBasedCursorModel
 from airbyte_cdk.sources.declarative.models import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models import DefaultPaginator as DefaultPaginatorModel
+from airbyte_cdk.sources.declarative.models import GzipDecoder as GzipDecoderModel
 from airbyte_cdk.sources.declarative.models import HttpRequester as HttpRequesterModel
 from airbyte_cdk.sources.declarative.models import JwtAuthenticator as JwtAuthenticatorModel
 from airbyte_cdk.sources.declarative.models import ListPartitionRouter as ListPartitionRouterModel
@@ -72,6 +79,9 @@ from airbyte_cdk.sources.declarative.models import OAuthAuthenticator as OAuthAu
 from airbyte_cdk.sources.declarative.models import RecordSelector as RecordSelectorModel
 from airbyte_cdk.sources.declarative.models import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models import (
+    StreamingJsonDecoder as StreamingJsonDecoderModel,
+)
 from airbyte_cdk.sources.declarative.models import (
     SubstreamPartitionRouter as SubstreamPartitionRouterModel,
 )
@@ -100,6 +110,9 @@ from airbyte_cdk.sources.declarative.partition_routers import (
     SinglePartitionRouter,
     SubstreamPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.concurrent_parent_stream_reader import (
+    ConcurrentParentStreamReader,
+)
 from airbyte_cdk.sources.declarative.requesters import HttpRequester
 from airbyte_cdk.sources.declarative.requesters.error_handlers import (
     CompositeErrorHandler,
@@ -711,6 +724,248 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[1].request_option is None
 
 
+def test_given_different_configs_when_create_substream_partition_router_then_parent_record_cache_keys_differ():
+    content = """
+    partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream:
+            type: DeclarativeStream
+            name: "A"
+            primary_key: "id"
+            retriever:
+              requester:
+                type: "HttpRequester"
+                url_base: "https://airbyte.io"
+                path: "kek"
+              record_selector:
+                extractor:
+                  field_path: []
+          parent_key: id
+          partition_field: repository_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    partition_router_manifest = transformer.propagate_types_and_parameters(
+        "", resolved_manifest["partition_router"], {}
+    )
+
+    def _record_cache_key(config):
+        partition_router = factory.create_component(
+            model_type=SubstreamPartitionRouterModel,
+            component_definition=partition_router_manifest,
+            config=config,
+        )
+        return partition_router.parent_stream_configs[0].record_cache_key
+
+    assert _record_cache_key({"api_key": "first"}) == _record_cache_key({"api_key": "first"})
+    assert _record_cache_key({"api_key": "first"}) != _record_cache_key({"api_key": "second"})
+
+
+@pytest.mark.parametrize(
+    "shared_parent_stream_names, expect_record_cache",
+    [
+        pytest.param({"A"}, True, id="test_parent_shared_by_several_substreams"),
+        pytest.param(set(), False, id="test_parent_read_by_one_substream"),
+    ],
+)
+def test_given_shared_parent_stream_names_when_create_substream_partition_router_then_only_cache_shared_parents(
+    shared_parent_stream_names, expect_record_cache
+):
+    partition_router_manifest = transformer.propagate_types_and_parameters(
+        "",
+        {
+            "type": "SubstreamPartitionRouter",
+            "parent_stream_configs": [
+                {
+                    "stream": {
+                        "type": "DeclarativeStream",
+                        "name": "A",
+                        "primary_key": "id",
+                        "retriever": {
+                            "type": "SimpleRetriever",
+                            "requester": {
+                                "type": "HttpRequester",
+                                "url_base": "https://airbyte.io",
+                                "path": "kek",
+                            },
+                            "record_selector": {"extractor": {"field_path": []}},
+                        },
+                    },
+                    "parent_key": "id",
+                    "partition_field": "repository_id",
+                }
+            ],
+        },
+        {},
+    )
+    caching_factory = ModelToComponentFactory()
+    caching_factory.set_shared_parent_stream_names(shared_parent_stream_names)
+
+    partition_router = caching_factory.create_component(
+        model_type=SubstreamPartitionRouterModel,
+        component_definition=partition_router_manifest,
+        config=input_config,
+    )
+
+    record_cache = partition_router.parent_stream_configs[0].record_cache
+    assert (record_cache is not None) == expect_record_cache
+
+
+def test_given_parent_stream_executor_when_create_substream_partition_router_then_read_parents_without_state_filtering_concurrently():
+    content = """
+    retriever:
+      requester:
+        type: "HttpRequester"
+        path: "kek"
+      record_selector:
+        extractor:
+          field_path: []
+    incremental_sync:
+      type: DatetimeBasedCursor
+      $parameters:
+        datetime_format: "%Y-%m-%dT%H:%M:%S.%f%z"
+      start_datetime: "{{ config.get('start_date', '1970-01-01T00:00:00.0Z') }}"
+      cursor_field: "created"
+    stream_A:
+      type: DeclarativeStream
+      name: "A"
+      primary_key: "id"
+      $parameters:
+        retriever: "#/retriever"
+        url_base: "https://airbyte.io"
+    stream_B:
+      type: DeclarativeStream
+      name: "B"
+      primary_key: "id"
+      incremental_sync: "#/incremental_sync"
+      $parameters:
+        retriever: "#/retriever"
+        url_base: "https://airbyte.io"
+    stream_C:
+      type: DeclarativeStream
+      name: "C"
+      primary_key: "id"
+      incremental_sync:
+        $ref: "#/incremental_sync"
+        is_client_side_incremental: true
+      $parameters:
+        retriever: "#/retriever"
+        url_base: "https://airbyte.io"
+    partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream: "#/stream_A"
+          parent_key: id
+          partition_field: repository_id
+        - stream: "#/stream_B"
+          parent_key: id
+          partition_field: repository_id
+          incremental_dependency: true
+        - stream: "#/stream_C"
+          parent_key: id
+          partition_field: repository_id
+          incremental_dependency: true
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    partition_router_manifest = transformer.propagate_types_and_parameters(
+        "", resolved_manifest["partition_router"], {}
+    )
+    concurrent_factory = ModelToComponentFactory(disable_resumable_full_refresh=True)
+    concurrent_factory.set_parent_stream_executor(Mock(), max_prefetched_slices=2)
+
+    partition_router = concurrent_factory.create_component(
+        model_type=SubstreamPartitionRouterModel,
+        component_definition=partition_router_manifest,
+        config=input_config,
+    )
+
+    concurrent_reader = partition_router.parent_stream_configs[0].concurrent_reader
+    assert isinstance(concurrent_reader, ConcurrentParentStreamReader)
+    parent_stream = concurrent_reader._create_stream()
+    assert isinstance(parent_stream, DeclarativeStream)
+    assert parent_stream.name == "A"
+    assert parent_stream is not partition_router.parent_stream_configs[0].stream
+    assert isinstance(
+        partition_router.parent_stream_configs[1].concurrent_reader, ConcurrentParentStreamReader
+    )
+    assert partition_router.parent_stream_configs[2].concurrent_reader is None
+
+
+@pytest.mark.parametrize(
+    "parent_retriever",
+    [
+        pytest.param(
+            {
+                "paginator": {
+                    "type": "DefaultPaginator",
+                    "pagination_strategy": {
+                        "type": "CursorPagination",
+                        "cursor_value": "{{ response.next }}",
+                    },
+                    "page_token_option": {"type": "RequestPath"},
+                }
+            },
+            id="paginated_parent",
+        ),
+        pytest.param(
+            {
+                "partition_router": {
+                    "type": "ListPartitionRouter",
+                    "cursor_field": "region",
+                    "values": ["eu", "us"],
+                }
+            },
+            id="routed_parent",
+        ),
+    ],
+)
+def test_given_parent_stream_executor_when_create_substream_partition_router_then_read_paginated_and_routed_parents_concurrently(
+    parent_retriever,
+):
+    partition_router_manifest = transformer.propagate_types_and_parameters(
+        "",
+        {
+            "type": "SubstreamPartitionRouter",
+            "parent_stream_configs": [
+                {
+                    "stream": {
+                        "type": "DeclarativeStream",
+                        "name": "A",
+                        "primary_key": "id",
+                        "retriever": {
+                            "type": "SimpleRetriever",
+                            "requester": {
+                                "type": "HttpRequester",
+                                "url_base": "https://airbyte.io",
+                                "path": "kek",
+                            },
+                            "record_selector": {"extractor": {"field_path": []}},
+                            **parent_retriever,
+                        },
+                    },
+                    "parent_key": "id",
+                    "partition_field": "repository_id",
+                }
+            ],
+        },
+        {},
+    )
+    concurrent_factory = ModelToComponentFactory(disable_resumable_full_refresh=True)
+    concurrent_factory.set_parent_stream_executor(Mock(), max_prefetched_slices=2)
+
+    partition_router = concurrent_factory.create_component(
+        model_type=SubstreamPartitionRouterModel,
+        component_definition=partition_router_manifest,
+        config=input_config,
+    )
+
+    parent_stream_config = partition_router.parent_stream_configs[0]
+    assert parent_stream_config.stream.get_cursor() is None
+    assert isinstance(parent_stream_config.concurrent_reader, ConcurrentParentStreamReader)
+
+
 def test_datetime_based_cursor():
     content = """
     incremental:
@@ -1468,6 +1723,50 @@ requester:
     )
 
 
+def test_given_connection_pool_size_when_create_requester_then_size_connection_pool():
+    requester_manifest = {
+        "type": "HttpRequester",
+        "path": "/v3/marketing/lists",
+        "url_base": "https://api.sendgrid.com",
+    }
+    pool_sized_factory = ModelToComponentFactory()
+    pool_sized_factory.set_connection_pool_size(32)
+
+    requester = pool_sized_factory.create_component(
+        model_type=HttpRequesterModel,
+        component_definition=requester_manifest,
+        config=input_config,
+        name="lists",
+        decoder=None,
+    )
+
+    assert requester.connection_pool_size == 32
+    assert not requester.use_http2
+    adapter = requester._http_client._session.get_adapter("https://api.sendgrid.com")
+    assert adapter._pool_maxsize == 32
+
+
+def test_given_cache_expire_after_when_create_requester_then_expire_cached_responses():
+    requester_manifest = {
+        "type": "HttpRequester",
+        "path": "/v3/marketing/lists",
+        "url_base": "https://api.sendgrid.com",
+        "use_cache": True,
+        "cache_expire_after": "PT5M",
+    }
+
+    requester = factory.create_component(
+        model_type=HttpRequesterModel,
+        component_definition=requester_manifest,
+        config=input_config,
+        name="lists",
+        decoder=None,
+    )
+
+    assert requester.cache_expire_after == timedelta(minutes=5)
+    assert requester._http_client._session.settings.expire_after == timedelta(minutes=5)
+
+
 def test_create_request_with_legacy_session_authenticator():
     content = """
 requester:
@@ -3840,3 +4139,71 @@ def test_api_budget_fixed_window_policy():
     assert matcher._method == "GET"
     assert matcher._url_base == "https://example.org"
     assert matcher._url_path_pattern.pattern == "/v2/data"
+
+
+def test_api_budget_token_bucket_policy():
+    api_budget_definition = {
+        "type": "HTTPAPIBudget",
+        "policies": [
+            {
+                "type": "TokenBucketCallRatePolicy",
+                "rate": {
+                    "type": "Rate",
+                    "limit": "{{ config['calls_per_minute'] }}",
+                    "interval": "PT1M",
+                },
+                "capacity": 5,
+                "matchers": [
+                    {"type": "HttpRequestRegexMatcher", "url_base": "https://example.org"}
+                ],
+            }
+        ],
+    }
+    factory = ModelToComponentFactory()
+
+    factory.set_api_budget(api_budget_definition, {"calls_per_minute": 30})
+
+    from airbyte_cdk.sources.streams.call_rate import TokenBucketCallRatePolicy
+
+    policy = factory._api_budget._policies[0]
+    assert isinstance(policy, TokenBucketCallRatePolicy)
+    assert policy._rate.limit == 30
+    assert policy._rate.interval.total_seconds() == 60
+    assert policy._capacity == 5
+    assert policy._matchers[0]._url_base == "https://example.org"
+
+
+def test_create_streaming_json_decoder():
+    decoder = factory.create_component(
+        model_type=StreamingJsonDecoderModel,
+        component_definition={
+            "type": "StreamingJsonDecoder",
+            "field_path": ["data", "records"],
+            "encoding": "utf-16",
+        },
+        config=input_config,
+    )
+
+    assert isinstance(decoder, CompositeRawDecoder)
+    assert decoder.is_stream_response()
+    assert isinstance(decoder.parser, StreamingJsonParser)
+    assert decoder.parser.field_path == ["data", "records"]
+    assert decoder.parser.encoding == "utf-16"
+
+
+def test_given_gzip_decoder_with_streaming_json_decoder_then_decompressed_data_is_parsed_as_it_is_read():
+    decoder = factory.create_component(
+        model_type=GzipDecoderModel,
+        component_definition={
+            "type": "GzipDecoder",
+            "decoder": {"type": "StreamingJsonDecoder", "field_path": ["data"]},
+        },
+        config=input_config,
+    )
+
+    gzip_parser = decoder._parsers_by_header["Content-Encoding"]["gzip"]
+    assert isinstance(decoder, CompositeRawDecoder)
+    assert isinstance(gzip_parser, GzipParser)
+    assert isinstance(gzip_parser.inner_parser, StreamingJsonParser)
+    assert gzip_parser.inner_parser.field_path == ["data"]
+    assert decoder.parser is gzip_parser.inner_parser
@@ -0,0 +1,184 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
+from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
+from airbyte_cdk.sources.declarative.partition_routers.concurrent_parent_stream_reader import (
+    ConcurrentParentStreamReader,
+)
+from airbyte_cdk.sources.types import Record, StreamSlice
+
+_SLICES = [StreamSlice(partition={"page": index}, cursor_slice={}) for index in range(10)]
+
+
+def _records(stream_slice, delay=0.0):
+    for index in range(3):
+        if delay:
+            time.sleep(delay)
+        yield {"slice": stream_slice["page"], "index": index}
+
+
+def _expected_records():
+    return [record for stream_slice in _SLICES for record in _records(stream_slice)]
+
+
+def _stream(read_records=_records):
+    stream = Mock()
+    stream.get_cursor.return_value = None
+    stream.stream_slices.side_effect = lambda **kwargs: iter(_SLICES)
+    stream.read_records.side_effect = lambda sync_mode, stream_slice: read_records(stream_slice)
+    return stream
+
+
+@pytest.mark.parametrize("max_prefetched_slices", [1, 3, 20])
+def test_given_slices_read_in_parallel_when_read_then_return_records_in_slice_order(
+    max_prefetched_slices,
+):
+    created_streams = []
+
+    def create_stream():
+        stream = _stream(lambda stream_slice: _records(stream_slice, delay=0.001))
+        created_streams.append(stream)
+        return stream
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        reader = ConcurrentParentStreamReader(
+            executor, create_stream, max_prefetched_slices, max_buffered_records_per_slice=1
+        )
+        records = list(reader.read(_stream()))
+
+    assert records == _expected_records()
+    assert len(created_streams) <= min(max_prefetched_slices + 1, 4)
+
+
+def test_given_no_available_worker_when_read_then_read_slices_in_calling_thread():
+    is_released = threading.Event()
+    create_stream = Mock(side_effect=_stream)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(is_released.wait)
+        reader = ConcurrentParentStreamReader(executor, create_stream, max_prefetched_slices=2)
+
+        records = list(reader.read(_stream()))
+        is_released.set()
+
+    assert records == _expected_records()
+    create_stream.assert_not_called()
+
+
+def test_given_error_while_reading_slice_when_read_then_raise_after_previous_records():
+    def read_records(stream_slice):
+        if stream_slice["page"] == 2:
+            raise ValueError("failed to read slice")
+        return _records(stream_slice)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        reader = ConcurrentParentStreamReader(
+            executor, lambda: _stream(read_records), max_prefetched_slices=3
+        )
+        records = []
+        with pytest.raises(ValueError, match="failed to read slice"):
+            for record in reader.read(_stream(read_records)):
+                records.append(record)
+
+    assert records == _expected_records()[:6]
+
+
+def test_given_reader_closed_early_when_read_then_stop_reading_slices():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        reader = ConcurrentParentStreamReader(
+            executor, _stream, max_prefetched_slices=3, max_buffered_records_per_slice=1
+        )
+        records = iter(reader.read(_stream()))
+        first_record = next(records)
+        records.close()  # type: ignore[attr-defined]
+
+    assert first_record == {"slice": 0, "index": 0}
+
+
+def test_given_no_prefetched_slices_when_read_then_read_parent_stream_serially():
+    parent_stream = Mock()
+    parent_stream.read_only_records.return_value = iter([{"id": 1}])
+    create_stream = Mock()
+    reader = ConcurrentParentStreamReader(Mock(), create_stream, max_prefetched_slices=0)
+
+    assert list(reader.read(parent_stream)) == [{"id": 1}]
+    create_stream.assert_not_called()
+
+
+class _IncrementalStream:
+    """
+    Reads one record per day and updates its cursor the same way SimpleRetriever does. Later slices are read faster so that they are
+    completed before the previous ones.
+    """
+
+    def __init__(self):
+        self._cursor = DatetimeBasedCursor(
+            start_datetime=MinMaxDatetime(datetime="2024-01-01", parameters={}),
+            end_datetime=MinMaxDatetime(datetime="2024-01-08", parameters={}),
+            step="P1D",
+            cursor_granularity="P1D",
+            cursor_field="updated_at",
+            datetime_format="%Y-%m-%d",
+            config={},
+            parameters={},
+        )
+
+    def get_cursor(self):
+        return self._cursor
+
+    @property
+    def state(self):
+        return self._cursor.get_stream_state()
+
+    @state.setter
+    def state(self, value):
+        self._cursor.set_initial_state(value)
+
+    def stream_slices(self, **kwargs):
+        return self._cursor.stream_slices()
+
+    def read_records(self, sync_mode, stream_slice):
+        day = int(stream_slice["start_time"][-2:])
+        time.sleep(0.01 * (8 - day))
+        record = Record(
+            data={"updated_at": stream_slice["start_time"]},
+            stream_name="parent",
+            associated_slice=stream_slice,
+        )
+        self._cursor.observe(stream_slice, record)
+        yield record
+        self._cursor.close_slice(stream_slice)
+
+
+def _read_with_states(parent_stream, records):
+    return [(record.data, parent_stream.state) for record in records]
+
+
+def test_given_parent_stream_with_cursor_when_read_then_parent_state_follows_serial_read():
+    serial_stream = _IncrementalStream()
+    serial_stream.state = {"updated_at": "2024-01-02"}
+    expected = _read_with_states(
+        serial_stream,
+        (
+            record
+            for stream_slice in serial_stream.stream_slices()
+            for record in serial_stream.read_records(None, stream_slice)
+        ),
+    )
+
+    parent_stream = _IncrementalStream()
+    parent_stream.state = {"updated_at": "2024-01-02"}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        reader = ConcurrentParentStreamReader(executor, _IncrementalStream, max_prefetched_slices=3)
+        records = _read_with_states(parent_stream, reader.read(parent_stream))
+
+    assert records == expected
+    assert parent_stream.state == {"updated_at": "2024-01-08"}
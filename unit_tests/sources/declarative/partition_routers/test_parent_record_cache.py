@@ -0,0 +1,121 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from threading import Lock
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
+
+_VALUES = [(index, {"parent_slice": index % 3}, {"extra": f"value {index}"}) for index in range(50)]
+
+
+def _reader(values):
+    read_values = Mock(side_effect=lambda: iter(values))
+    return read_values
+
+
+@pytest.mark.parametrize("max_memory_bytes", [0, 1_000, 1_000_000])
+def test_given_values_read_when_read_again_then_return_cached_values(max_memory_bytes):
+    cache = ParentRecordCache(max_memory_bytes=max_memory_bytes)
+    read_values = _reader(_VALUES)
+
+    first_read = list(cache.read("parent", read_values))
+    second_read = list(cache.read("parent", read_values))
+
+    assert first_read == _VALUES
+    assert second_read == _VALUES
+    assert read_values.call_count == 1
+
+
+def test_given_different_keys_when_read_then_read_values_for_each_key():
+    cache = ParentRecordCache()
+    read_values = _reader(_VALUES)
+
+    list(cache.read("parent", read_values))
+    list(cache.read("other_parent", read_values))
+
+    assert read_values.call_count == 2
+
+
+def test_given_cached_values_when_modify_returned_value_then_cache_is_not_modified():
+    cache = ParentRecordCache()
+    read_values = _reader([(1, {"parent_slice": 1}, {})])
+    list(cache.read("parent", read_values))
+
+    next(iter(cache.read("parent", read_values)))[1]["parent_slice"] = 2
+
+    assert list(cache.read("parent", read_values)) == [(1, {"parent_slice": 1}, {})]
+
+
+def test_given_read_stopped_early_when_read_again_then_read_values_again():
+    cache = ParentRecordCache(max_memory_bytes=0)
+    read_values = _reader(_VALUES)
+
+    values = iter(cache.read("parent", read_values))
+    next(values)
+    values.close()
+
+    assert list(cache.read("parent", read_values)) == _VALUES
+    assert list(cache.read("parent", read_values)) == _VALUES
+    assert read_values.call_count == 2
+
+
+def test_given_error_while_reading_when_read_again_then_read_values_again():
+    def _failing_values():
+        yield _VALUES[0]
+        raise ValueError("error while reading the parent")
+
+    cache = ParentRecordCache()
+
+    with pytest.raises(ValueError):
+        list(cache.read("parent", _failing_values))
+
+    assert list(cache.read("parent", _reader(_VALUES))) == _VALUES
+
+
+def test_given_values_being_cached_when_read_then_read_values_without_cache():
+    cache = ParentRecordCache()
+    read_values = _reader(_VALUES)
+
+    first_reader = iter(cache.read("parent", read_values))
+    next(first_reader)
+    concurrent_values = list(cache.read("parent", read_values))
+    list(first_reader)
+
+    assert concurrent_values == _VALUES
+    assert read_values.call_count == 2
+    assert list(cache.read("parent", read_values)) == _VALUES
+    assert read_values.call_count == 2
+
+
+def test_given_value_that_cannot_be_pickled_when_read_then_values_are_not_cached():
+    cache = ParentRecordCache()
+    values = [(1, {}, {"lock": Lock()})]
+    read_values = _reader(values)
+
+    assert list(cache.read("parent", read_values)) == values
+    assert list(cache.read("parent", read_values)) == values
+    assert read_values.call_count == 2
+
+
+def test_given_sync_scope_when_next_scope_then_values_are_read_again():
+    cache = ParentRecordCache(max_memory_bytes=0)
+    read_values = _reader(_VALUES)
+
+    with cache.sync_scope():
+        list(cache.read("parent", read_values))
+        with cache.sync_scope():
+            # Nested scopes share the values of the outermost one
+            assert list(cache.read("parent", read_values)) == _VALUES
+        assert list(cache.read("parent", read_values)) == _VALUES
+        assert read_values.call_count == 1
+    assert cache._connection is None
+
+    with cache.sync_scope():
+        assert list(cache.read("parent", read_values)) == _VALUES
+    assert read_values.call_count == 2
@@ -3,8 +3,10 @@
 #
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from unittest.mock import Mock
 
 import pytest as pytest
 
@@ -24,6 +26,12 @@ from airbyte_cdk.sources.declarative.partition_routers import (
     CartesianProductStreamSlicer,
     ListPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.concurrent_parent_stream_reader import (
+    ConcurrentParentStreamReader,
+)
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
     ParentStreamConfig,
     SubstreamPartitionRouter,
@@ -1367,3 +1375,88 @@ def test_cartesian_product_stream_slicer_warning_log_message(
         assert warning_message in logged_warnings
     else:
         assert warning_message not in logged_warnings
+
+
+@pytest.mark.parametrize(
+    "incremental_dependency, expected_parent_reads",
+    [
+        pytest.param(False, 1, id="test_parent_read_once"),
+        pytest.param(True, 2, id="test_incremental_dependency_parent_read_for_each_substream"),
+    ],
+)
+def test_given_record_cache_when_substreams_share_parent_then_read_parent_once(
+    incremental_dependency, expected_parent_reads
+):
+    record_cache = ParentRecordCache()
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    parent_stream.read_only_records = Mock(wraps=parent_stream.read_only_records)
+
+    def _create_router():
+        return SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=parent_stream,
+                    parent_key="id",
+                    partition_field="first_stream_id",
+                    extra_fields=[["data"]],
+                    parameters={},
+                    config={},
+                    incremental_dependency=incremental_dependency,
+                    record_cache=record_cache,
+                    record_cache_key="first_stream_definition",
+                )
+            ],
+            parameters={},
+            config={},
+        )
+
+    first_slices = list(_create_router().stream_slices())
+    second_slices = list(_create_router().stream_slices())
+
+    assert first_slices == second_slices
+    assert [stream_slice.extra_fields for stream_slice in second_slices] == [
+        {"data": "A"},
+        {"data": "B"},
+        {"data": "C"},
+    ]
+    assert [stream_slice["parent_slice"] for stream_slice in second_slices] == [
+        {"slice": "first"},
+        {"slice": "first"},
+        {"slice": "second"},
+    ]
+    assert parent_stream.read_only_records.call_count == expected_parent_reads
+
+
+def test_given_concurrent_reader_when_stream_slices_then_return_same_slices_as_serial_read():
+    def _create_router(concurrent_reader):
+        return SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=MockStream(parent_slices, all_parent_data, "first_stream"),
+                    parent_key="id",
+                    partition_field="first_stream_id",
+                    extra_fields=[["data"]],
+                    parameters={},
+                    config={},
+                    concurrent_reader=concurrent_reader,
+                )
+            ],
+            parameters={},
+            config={},
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        concurrent_reader = ConcurrentParentStreamReader(
+            executor,
+            lambda: MockStream(parent_slices, all_parent_data, "first_stream"),
+            max_prefetched_slices=2,
+        )
+        concurrent_slices = list(_create_router(concurrent_reader).stream_slices())
+
+    serial_slices = list(_create_router(None).stream_slices())
+    assert concurrent_slices == serial_slices
+    assert [stream_slice["parent_slice"] for stream_slice in concurrent_slices] == [
+        {"slice": "first"},
+        {"slice": "first"},
+        {"slice": "second"},
+    ]
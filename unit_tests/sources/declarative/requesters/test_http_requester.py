@@ -40,6 +40,7 @@ from airbyte_cdk.sources.streams.http.exceptions import (
     RequestBodyException,
     UserDefinedBackoffException,
 )
+from airbyte_cdk.sources.streams.http.response_cache import BoundedResponseCache
 from airbyte_cdk.sources.types import Config
 
 
@@ -966,3 +967,23 @@ def test_http_requester_with_mock_api_budget(http_requester_factory, monkeypatch
     assert response.status_code == 200
 
     assert mock_budget.acquire_call.call_count == 1
+
+
+def test_given_cache_backend_when_send_request_then_cache_responses_in_backend(requests_mock):
+    requests_mock.get("https://example.com/deals", json={"id": 1})
+    backend = BoundedResponseCache()
+    requester = HttpRequester(
+        name="name",
+        url_base="https://example.com",
+        path="deals",
+        config={},
+        parameters={},
+        use_cache=True,
+        cache_backend=backend,
+    )
+
+    requester.send_request()
+    requester.send_request()
+
+    assert requests_mock.call_count == 1
+    assert backend.statistics.hits == 1
@@ -11,6 +11,7 @@ from unittest.mock import patch
 
 import freezegun
 import isodate
+import pytest
 from typing_extensions import deprecated
 
 from airbyte_cdk.models import (
@@ -37,6 +38,9 @@ from airbyte_cdk.sources.declarative.extractors.record_filter import (
     ClientSideIncrementalRecordFilterDecorator,
 )
 from airbyte_cdk.sources.declarative.partition_routers import AsyncJobPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers.concurrent_parent_stream_reader import (
+    ConcurrentParentStreamReader,
+)
 from airbyte_cdk.sources.declarative.stream_slicers.declarative_partition_generator import (
     StreamSlicerPartitionGenerator,
 )
@@ -1587,6 +1591,153 @@ def test_read_concurrent_skip_streams_not_in_catalog():
     assert len(get_states_for_stream(stream_name="party_members_skills", messages=messages)) == 0
 
 
+def test_read_concurrent_only_builds_streams_in_catalog():
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name="palaces", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            ),
+        ]
+    )
+    source = ConcurrentDeclarativeSource(
+        source_config=_MANIFEST, config=_CONFIG, catalog=catalog, state=None
+    )
+
+    with (
+        HttpMocker() as http_mocker,
+        patch.object(
+            source._constructor, "create_component", wraps=source._constructor.create_component
+        ) as create_component,
+    ):
+        http_mocker.get(HttpRequest("https://persona.metaverse.com/palaces"), _PALACES_RESPONSE)
+        messages = list(
+            source.read(logger=source.logger, config=_CONFIG, catalog=catalog, state=[])
+        )
+
+    assert len(get_records_for_stream("palaces", messages)) == 7
+    assert {
+        create_call.args[1]["name"]
+        for create_call in create_component.call_args_list
+        if create_call.args[0].__name__ == "DeclarativeStream"
+    } == {"palaces"}
+
+
+def test_read_concurrent_stream_then_synchronous_substream_reads_parent_concurrently():
+    """
+    Verifies that the parent of a synchronous substream can still be read concurrently once the concurrent streams are read and the
+    threadpool of the concurrent source is shut down
+    """
+
+    def _stream(name, path, **kwargs):
+        return {
+            "type": "DeclarativeStream",
+            "name": name,
+            "primary_key": "id",
+            "schema_loader": {
+                "type": "InlineSchemaLoader",
+                "schema": {"type": "object", "properties": {"id": {"type": "string"}}},
+            },
+            "retriever": {
+                "type": "SimpleRetriever",
+                "requester": {
+                    "type": "HttpRequester",
+                    "url_base": "https://persona.metaverse.com",
+                    "path": path,
+                    "http_method": "GET",
+                },
+                "record_selector": {
+                    "type": "RecordSelector",
+                    "extractor": {"type": "DpathExtractor", "field_path": []},
+                },
+                **kwargs.pop("retriever", {}),
+            },
+            **kwargs,
+        }
+
+    palaces_stream = _stream("palaces", "/palaces")
+    manifest = {
+        "version": "6.7.0",
+        "type": "DeclarativeSource",
+        "check": {"type": "CheckStream", "stream_names": ["palaces"]},
+        # Leaves a thread to read parent slices once the workers are reserved
+        "concurrency_level": {"type": "ConcurrencyLevel", "default_concurrency": 4},
+        "streams": [
+            palaces_stream,
+            # A global substream cursor isn't supported by the concurrent source so this stream is read synchronously
+            _stream(
+                "palace_treasures",
+                "/palaces/{{ stream_partition.palace_id }}/treasures",
+                retriever={
+                    "partition_router": {
+                        "type": "SubstreamPartitionRouter",
+                        "parent_stream_configs": [
+                            {
+                                "type": "ParentStreamConfig",
+                                "stream": palaces_stream,
+                                "parent_key": "id",
+                                "partition_field": "palace_id",
+                            }
+                        ],
+                    }
+                },
+                incremental_sync={
+                    "type": "DatetimeBasedCursor",
+                    "cursor_field": "updated_at",
+                    "datetime_format": "%Y-%m-%dT%H:%M:%S.%fZ",
+                    "start_datetime": "{{ config['start_date'] }}",
+                    "global_substream_cursor": True,
+                },
+            ),
+        ],
+    }
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name=name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for name in ["palaces", "palace_treasures"]
+        ]
+    )
+    source = ConcurrentDeclarativeSource(
+        source_config=manifest, config=_CONFIG, catalog=catalog, state=None
+    )
+    concurrent_streams, synchronous_streams = source._group_streams(config=_CONFIG)
+    assert [stream.name for stream in concurrent_streams] == ["palaces"]
+    assert [stream.name for stream in synchronous_streams] == ["palace_treasures"]
+
+    with HttpMocker() as http_mocker:
+        http_mocker.get(HttpRequest("https://persona.metaverse.com/palaces"), _PALACES_RESPONSE)
+        for palace_id in range(7):
+            http_mocker.get(
+                HttpRequest(f"https://persona.metaverse.com/palaces/{palace_id}/treasures"),
+                HttpResponse(json.dumps([{"id": f"treasure {palace_id}"}])),
+            )
+        with patch.object(
+            ConcurrentParentStreamReader,
+            "read",
+            autospec=True,
+            side_effect=ConcurrentParentStreamReader.read,
+        ) as concurrent_parent_read:
+            messages = list(
+                source.read(logger=source.logger, config=_CONFIG, catalog=catalog, state=[])
+            )
+
+    assert len(get_records_for_stream("palaces", messages)) == 7
+    assert [
+        record.data["id"] for record in get_records_for_stream("palace_treasures", messages)
+    ] == [f"treasure {palace_id}" for palace_id in range(7)]
+    assert concurrent_parent_read.call_count == 1
+    assert source._constructor._parent_stream_executor is None
+
+
 def test_default_perform_interpolation_on_concurrency_level():
     config = {"start_date": "2024-07-01T00:00:00.000Z", "num_workers": 20}
     catalog = ConfiguredAirbyteCatalog(
@@ -1658,6 +1809,53 @@ def test_concurrency_level_initial_number_partitions_to_generate_is_always_one_o
     assert source._concurrent_source._initial_number_partitions_to_generate == 1
 
 
+def test_given_adaptive_concurrency_level_then_size_threadpool_for_max_concurrency():
+    config = {"start_date": "2024-07-01T00:00:00.000Z", "num_workers": 4}
+    manifest = copy.deepcopy(_MANIFEST)
+    manifest["concurrency_level"] = {
+        "type": "ConcurrencyLevel",
+        "default_concurrency": "{{ config['num_workers'] }}",
+        "max_concurrency": 25,
+        "adaptive": True,
+    }
+
+    source = ConcurrentDeclarativeSource(
+        source_config=manifest, config=config, catalog=None, state=[]
+    )
+
+    concurrency_controller = source._concurrent_source._concurrency_controller
+    assert concurrency_controller.concurrency_limit == 4
+    assert source._concurrent_source._initial_number_partitions_to_generate == 2
+    assert source._concurrent_source.executor._max_workers == 23
+    assert source._max_prefetched_parent_slices == 2
+    assert source._constructor._concurrency_controller is concurrency_controller
+
+
+@pytest.mark.parametrize(
+    "num_workers, expected_parent_stream_threads",
+    [
+        pytest.param(20, 9, id="test_parent_threads_leave_a_worker_for_reading_partitions"),
+        pytest.param(7, 3, id="test_parent_threads_are_bounded_by_the_partitions_to_generate"),
+        pytest.param(2, 0, id="test_no_parent_threads_when_workers_are_all_needed"),
+    ],
+)
+def test_given_concurrency_level_then_parent_stream_threads_are_taken_out_of_the_workers(
+    num_workers, expected_parent_stream_threads
+):
+    config = {"start_date": "2024-07-01T00:00:00.000Z", "num_workers": num_workers}
+
+    source = ConcurrentDeclarativeSource(
+        source_config=_MANIFEST, config=config, catalog=None, state=[]
+    )
+
+    assert source._max_prefetched_parent_slices == expected_parent_stream_threads
+    assert (
+        source._concurrent_source.executor._max_workers + source._max_prefetched_parent_slices
+        == num_workers
+    )
+    assert source._constructor._connection_pool_size == num_workers
+
+
 def test_given_partition_routing_and_incremental_sync_then_stream_is_concurrent():
     manifest = {
         "version": "5.0.0",
@@ -5,7 +5,9 @@
 import json
 import logging
 import os
+import re
 import sys
+import time
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, List, Mapping
@@ -25,6 +27,7 @@ from airbyte_cdk.models import (
     ConfiguredAirbyteStream,
     DestinationSyncMode,
     Level,
+    Status,
     SyncMode,
     Type,
 )
@@ -1172,7 +1175,7 @@ class TestManifestDeclarativeSource:
         source = ManifestDeclarativeSource(source_config=any_valid_manifest, debug=True)
 
         debug_logger = logging.getLogger("logger.debug")
-        list(source.read(debug_logger, {}, {}, {}))
+        list(source.read(debug_logger, {}, ConfiguredAirbyteCatalog(streams=[]), {}))
 
         assert debug_logger.isEnabledFor(logging.DEBUG)
 
@@ -1778,6 +1781,42 @@ def test_read_manifest_declarative_source(
         mock_retriever.assert_has_calls(expected_calls)
 
 
+def _substream_config(name, *parents):
+    return {
+        "name": name,
+        "retriever": {
+            "partition_router": {
+                "type": "SubstreamPartitionRouter",
+                "parent_stream_configs": [{"stream": parent} for parent in parents],
+            }
+        },
+    }
+
+
+def test_given_parents_when_get_shared_parent_stream_names_then_return_parents_read_by_several_substreams():
+    grandparent = {"name": "grandparent", "retriever": {}}
+    parent = _substream_config("parent", grandparent)
+    only_read_once = {"name": "only_read_once", "retriever": {}}
+    stream_configs = [
+        parent,
+        _substream_config("first_child", parent, only_read_once),
+        {
+            "name": "second_child",
+            "retriever": {
+                "partition_router": [
+                    {"type": "ListPartitionRouter"},
+                    {"parent_stream_configs": [{"stream": parent}]},
+                ]
+            },
+        },
+    ]
+
+    assert ManifestDeclarativeSource._get_shared_parent_stream_names(stream_configs) == {
+        "parent",
+        "grandparent",
+    }
+
+
 def test_only_parent_streams_use_cache():
     applications_stream = {
         "type": "DeclarativeStream",
@@ -2140,3 +2179,197 @@ def test_slice_checkpoint(test_name, manifest, pages, expected_states_qty):
     with patch.object(SimpleRetriever, "_fetch_next_page", side_effect=pages):
         states = [message.state for message in _run_read(manifest, _stream_name) if message.state]
         assert len(states) == expected_states_qty
+
+
+def _large_manifest(number_of_streams: int) -> Mapping[str, Any]:
+    """
+    Manifest shaped like the ones of real world connectors: paginated and incremental streams sharing definitions, with substreams of
+    the first stream.
+    """
+    streams = []
+    for index in range(number_of_streams):
+        stream = {
+            "type": "DeclarativeStream",
+            "name": f"stream_{index}",
+            "primary_key": "id",
+            "retriever": {
+                "type": "SimpleRetriever",
+                "requester": {"$ref": "#/definitions/requester", "path": f"stream_{index}"},
+                "record_selector": {"$ref": "#/definitions/selector"},
+                "paginator": {"$ref": "#/definitions/paginator"},
+            },
+            "incremental_sync": {"$ref": "#/definitions/incremental_sync"},
+            "schema_loader": {
+                "type": "InlineSchemaLoader",
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "updated_at": {"type": "string", "format": "date-time"},
+                    },
+                },
+            },
+        }
+        if index > 0 and index % 10 == 0:
+            stream["retriever"]["partition_router"] = {
+                "type": "SubstreamPartitionRouter",
+                "parent_stream_configs": [
+                    {
+                        "type": "ParentStreamConfig",
+                        "stream": {"$ref": "#/definitions/parent_stream"},
+                        "parent_key": "id",
+                        "partition_field": "parent_id",
+                    }
+                ],
+            }
+            stream["retriever"]["requester"]["path"] = (
+                f"parents/{{{{ stream_partition.parent_id }}}}/stream_{index}"
+            )
+        streams.append(stream)
+    return {
+        "version": "6.7.0",
+        "definitions": {
+            "requester": {
+                "type": "HttpRequester",
+                "url_base": "https://api.airbyte.io/v1/",
+                "http_method": "GET",
+                "authenticator": {
+                    "type": "BearerAuthenticator",
+                    "api_token": "{{ config['api_key'] }}",
+                },
+            },
+            "selector": {
+                "type": "RecordSelector",
+                "extractor": {"type": "DpathExtractor", "field_path": ["data"]},
+            },
+            "paginator": {
+                "type": "DefaultPaginator",
+                "page_token_option": {
+                    "type": "RequestOption",
+                    "inject_into": "request_parameter",
+                    "field_name": "cursor",
+                },
+                "pagination_strategy": {
+                    "type": "CursorPagination",
+                    "cursor_value": "{{ response.next }}",
+                    "stop_condition": "{{ not response.next }}",
+                },
+            },
+            "incremental_sync": {
+                "type": "DatetimeBasedCursor",
+                "cursor_field": "updated_at",
+                "datetime_format": "%Y-%m-%dT%H:%M:%SZ",
+                "start_datetime": "2024-01-01T00:00:00Z",
+                "end_datetime": "2024-01-02T00:00:00Z",
+                "step": "P1D",
+                "cursor_granularity": "PT1S",
+            },
+            "parent_stream": {
+                "type": "DeclarativeStream",
+                "name": "stream_0",
+                "primary_key": "id",
+                "retriever": {
+                    "type": "SimpleRetriever",
+                    "requester": {"$ref": "#/definitions/requester", "path": "stream_0"},
+                    "record_selector": {"$ref": "#/definitions/selector"},
+                },
+                "schema_loader": {
+                    "type": "InlineSchemaLoader",
+                    "schema": {"type": "object", "properties": {"id": {"type": "string"}}},
+                },
+            },
+        },
+        "streams": streams,
+        "check": {"type": "CheckStream", "stream_names": ["stream_1"]},
+        "spec": {
+            "type": "Spec",
+            "connection_specification": {
+                "type": "object",
+                "required": ["api_key"],
+                "properties": {"api_key": {"type": "string"}},
+            },
+        },
+    }
+
+
+def _catalog(stream_names: List[str]) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name=stream_name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for stream_name in stream_names
+        ]
+    )
+
+
+def _built_stream_names(create_component) -> List[str]:
+    return [
+        create_call.args[1]["name"]
+        for create_call in create_component.call_args_list
+        if create_call.args[0].__name__ == "DeclarativeStream"
+    ]
+
+
+def test_given_catalog_when_read_then_only_build_selected_streams(requests_mock):
+    requests_mock.get(
+        "https://api.airbyte.io/v1/parents/parent/stream_10", json={"data": [{"id": "child"}]}
+    )
+    requests_mock.get("https://api.airbyte.io/v1/stream_0", json={"data": [{"id": "parent"}]})
+    source = ManifestDeclarativeSource(source_config=_large_manifest(20))
+
+    with patch.object(
+        source._constructor, "create_component", wraps=source._constructor.create_component
+    ) as create_component:
+        messages = list(source.read(logger, {"api_key": "key"}, _catalog(["stream_10"]), []))
+
+    assert _built_stream_names(create_component) == ["stream_10"]
+    assert {message.record.stream for message in messages if message.record} == {"stream_10"}
+    assert len(source.streams({"api_key": "key"})) == 20
+
+
+def test_given_check_stream_when_check_then_only_build_checked_stream(requests_mock):
+    requests_mock.get("https://api.airbyte.io/v1/stream_1", json={"data": [{"id": "1"}]})
+    source = ManifestDeclarativeSource(source_config=_large_manifest(20))
+
+    with patch.object(
+        source._constructor, "create_component", wraps=source._constructor.create_component
+    ) as create_component:
+        status = source.check(logger, {"api_key": "key"})
+
+    assert status.status == Status.SUCCEEDED
+    assert _built_stream_names(create_component) == ["stream_1"]
+
+
+def test_given_check_stream_not_defined_when_check_then_report_available_streams():
+    manifest = _large_manifest(2)
+    manifest["check"]["stream_names"] = ["unknown_stream"]
+    source = ManifestDeclarativeSource(source_config=manifest)
+
+    with pytest.raises(ValueError, match="stream_0.*stream_1"):
+        source.check(logger, {"api_key": "key"})
+
+
+@pytest.mark.slow
+def test_read_startup_time_with_large_manifest(requests_mock):
+    requests_mock.get(re.compile("https://api.airbyte.io/v1/"), json={"data": []})
+    manifest = _large_manifest(150)
+    config = {"api_key": "key"}
+    source = ManifestDeclarativeSource(source_config=manifest)
+
+    start = time.perf_counter()
+    source.streams(config)
+    all_streams_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    list(source.read(logger, config, _catalog(["stream_1", "stream_2"]), []))
+    selected_streams_duration = time.perf_counter() - start
+    print(
+        f"Building all 150 streams: {all_streams_duration * 1000:.1f} ms, "
+        f"reading 2 of 150 streams: {selected_streams_duration * 1000:.1f} ms"
+    )
+
+    assert selected_streams_duration < all_streams_duration
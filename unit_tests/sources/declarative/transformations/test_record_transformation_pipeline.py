@@ -0,0 +1,207 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import time
+from copy import deepcopy
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from airbyte_cdk.sources.declarative.transformations import (
+    AddFields,
+    RecordTransformation,
+    RemoveFields,
+)
+from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
+from airbyte_cdk.sources.declarative.transformations.flatten_fields import FlattenFields
+from airbyte_cdk.sources.declarative.transformations.keys_to_lower_transformation import (
+    KeysToLowerTransformation,
+)
+from airbyte_cdk.sources.declarative.transformations.keys_to_snake_transformation import (
+    KeysToSnakeCaseTransformation,
+)
+from airbyte_cdk.sources.declarative.transformations.record_transformation_pipeline import (
+    RecordTransformationPipeline,
+)
+from airbyte_cdk.sources.types import StreamSlice
+
+_CONFIG = {"shop": "airbyte"}
+_STREAM_SLICE = StreamSlice(partition={"parent_id": "1"}, cursor_slice={"start": "2024-01-01"})
+
+
+def _add_fields(*fields) -> AddFields:
+    return AddFields(
+        fields=[
+            AddedFieldDefinition(path=path, value=value, value_type=value_type, parameters={})
+            for path, value, value_type in fields
+        ],
+        parameters={},
+    )
+
+
+def _remove_fields(*field_pointers, condition: str = "") -> RemoveFields:
+    return RemoveFields(field_pointers=list(field_pointers), condition=condition, parameters={})
+
+
+def _transform_one_at_a_time(
+    transformations: List[RecordTransformation], record: Dict[str, Any]
+) -> Dict[str, Any]:
+    for transformation in transformations:
+        transformation.transform(
+            record, config=_CONFIG, stream_state={}, stream_slice=_STREAM_SLICE
+        )
+    return record
+
+
+def _outcome(transform: Callable[[], Dict[str, Any]]) -> Any:
+    """
+    Return the transformed record or the type of the error raised while transforming it, e.g. when adding a field under a value that is
+    not a dictionary.
+    """
+    try:
+        return transform()
+    except Exception as error:
+        return type(error)
+
+
+_RECORD = {
+    "id": 1,
+    "userName": "john",
+    "Address": {"streetName": "main", "zipCode": "123", "geo": {"lat": 1, "lng": 2}},
+    "tags": [{"tagName": "a"}, {"tagName": "b"}],
+    "HTTPStatus": 200,
+    "1stField": None,
+    "nested": {"value": "x", "empty": {}},
+    "text": "not a dictionary",
+}
+
+
+@pytest.mark.parametrize(
+    "transformations",
+    [
+        pytest.param([_add_fields((["shop"], "{{ config['shop'] }}", None))], id="add_constant"),
+        pytest.param(
+            [_add_fields((["user", "name"], "{{ record['userName'] }}", None))],
+            id="add_nested_from_record",
+        ),
+        pytest.param(
+            [_add_fields((["Address", "geo", "alt"], "3", int))], id="add_in_existing_dictionary"
+        ),
+        pytest.param(
+            [_add_fields((["tags", "0", "tagName"], "c", None))], id="add_with_list_index"
+        ),
+        pytest.param(
+            [_add_fields((["parent"], "{{ stream_slice.parent_id }}", None))],
+            id="add_from_stream_slice",
+        ),
+        pytest.param(
+            [
+                _add_fields(
+                    (["first"], "{{ record['id'] }}", None),
+                    (["second"], "{{ record['first'] + 1 }}", None),
+                )
+            ],
+            id="add_from_added_field",
+        ),
+        pytest.param([_remove_fields(["id"], ["userName"])], id="remove_fields"),
+        pytest.param([_remove_fields(["Address", "geo", "lat"])], id="remove_nested_field"),
+        pytest.param(
+            [_remove_fields(["missing"], ["Address", "missing", "lat"], ["text", "missing"])],
+            id="remove_missing_fields",
+        ),
+        pytest.param([_remove_fields(["tags", "0"])], id="remove_list_element"),
+        pytest.param([_remove_fields(["tags", "*", "tagName"])], id="remove_with_glob"),
+        pytest.param([_remove_fields(["**", "lat"])], id="remove_with_recursive_glob"),
+        pytest.param(
+            [_remove_fields(["Address"], ["Address", "zipCode"])], id="remove_parent_then_child"
+        ),
+        pytest.param(
+            [_remove_fields(["**"], condition="{{ property == 200 }}")],
+            id="remove_with_condition",
+        ),
+        pytest.param([KeysToSnakeCaseTransformation()], id="keys_to_snake_case"),
+        pytest.param([FlattenFields()], id="flatten_fields"),
+        pytest.param([KeysToLowerTransformation()], id="keys_to_lower"),
+        pytest.param(
+            [
+                _add_fields((["Shop", "ShopName"], "{{ config['shop'] }}", None)),
+                KeysToSnakeCaseTransformation(),
+                _remove_fields(["address", "geo"], ["shop", "shop_name"]),
+                _add_fields((["address", "full"], "{{ record['address'] }}", None)),
+            ],
+            id="chain",
+        ),
+        pytest.param(
+            [KeysToSnakeCaseTransformation(), FlattenFields(), _remove_fields(["id"])],
+            id="chain_with_transformations_not_compiled",
+        ),
+    ],
+)
+def test_pipeline_transforms_records_like_transformations_one_at_a_time(transformations):
+    pipeline = RecordTransformationPipeline(transformations, _CONFIG)
+
+    for record in (_RECORD, {}, {"id": 2, "Address": "not a dictionary"}):
+        expected = _outcome(lambda: _transform_one_at_a_time(transformations, deepcopy(record)))
+        actual = _outcome(
+            lambda: pipeline.transform(
+                deepcopy(record), stream_state={}, stream_slice=_STREAM_SLICE
+            )
+        )
+
+        assert actual == expected
+        if isinstance(expected, dict):
+            assert list(actual) == list(expected)
+
+
+def test_given_subclass_of_compiled_transformation_when_transform_then_call_transform():
+    class UppercaseAddFields(AddFields):
+        def transform(self, record, config=None, stream_state=None, stream_slice=None):
+            super().transform(record, config, stream_state, stream_slice)
+            record["shop"] = record["shop"].upper()
+
+    pipeline = RecordTransformationPipeline(
+        [
+            UppercaseAddFields(
+                fields=[AddedFieldDefinition(["shop"], "shop", None, {})], parameters={}
+            )
+        ],
+        _CONFIG,
+    )
+
+    assert pipeline.transform({}) == {"shop": "SHOP"}
+
+
+def test_is_compiled_from():
+    transformations = [_remove_fields(["id"])]
+    pipeline = RecordTransformationPipeline(transformations, _CONFIG)
+
+    assert pipeline.is_compiled_from(transformations)
+    assert not pipeline.is_compiled_from([_remove_fields(["id"])])
+    assert not pipeline.is_compiled_from(transformations + [KeysToLowerTransformation()])
+
+
+@pytest.mark.slow
+def test_record_transformation_time():
+    transformations = [
+        _add_fields((["shop"], "{{ config['shop'] }}", None)),
+        _remove_fields(["Address", "geo"], ["1stField"]),
+        KeysToSnakeCaseTransformation(),
+    ]
+    records = [deepcopy(_RECORD) | {"id": index} for index in range(20_000)]
+    pipeline = RecordTransformationPipeline(transformations, _CONFIG)
+
+    start = time.perf_counter()
+    for record in deepcopy(records):
+        _transform_one_at_a_time(transformations, record)
+    one_at_a_time_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    for record in deepcopy(records):
+        pipeline.transform(record, stream_state={}, stream_slice=_STREAM_SLICE)
+    pipeline_duration = time.perf_counter() - start
+    print(
+        f"Transformations one at a time: {len(records) / one_at_a_time_duration:,.0f} records/s, "
+        f"pipeline: {len(records) / pipeline_duration:,.0f} records/s"
+    )
+
+    assert pipeline_duration < one_at_a_time_duration
@@ -785,3 +785,26 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+@pytest.mark.parametrize(
+    "byte_range", [pytest.param(None, id="no_range"), pytest.param((0, None), id="whole_file")]
+)
+def test_given_parser_without_byte_ranges_when_parse_records_in_byte_range_then_parse_whole_file(
+    byte_range,
+) -> None:
+    parser = CsvParser()
+    with mock.patch.object(parser, "parse_records", return_value=iter([{"a": "1"}])) as parse:
+        records = list(
+            parser.parse_records_in_byte_range(Mock(), Mock(), Mock(), Mock(), None, byte_range)
+        )
+
+    assert records == [{"a": "1"}]
+    parse.assert_called_once()
+
+
+def test_given_parser_without_byte_ranges_when_parse_records_in_partial_byte_range_then_raise() -> (
+    None
+):
+    with pytest.raises(ValueError):
+        CsvParser().parse_records_in_byte_range(Mock(), Mock(), Mock(), Mock(), None, (0, 10))
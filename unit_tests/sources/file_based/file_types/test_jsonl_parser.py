@@ -5,13 +5,18 @@
 import asyncio
 import io
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 from unittest.mock import MagicMock, Mock
 
 import pytest
 
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
-from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
+from airbyte_cdk.sources.file_based.file_based_stream_reader import (
+    AbstractFileBasedStreamReader,
+    FileReadMode,
+)
 from airbyte_cdk.sources.file_based.file_types import JsonlParser
 
 JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS = [
@@ -201,3 +206,166 @@ def test_given_unparsable_json_when_parse_records_then_raise_error(
     with pytest.raises(RecordParseError):
         list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
     assert logger.warning.call_count == 0
+
+
+def test_given_crlf_line_endings_when_parse_records_then_return_records(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(
+        b'{"a": 1, "b": "1"}\r\n{"a": 2, "b": "2"}\r\n'
+    )
+    logger = Mock()
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
+
+    assert records == [{"a": 1, "b": "1"}, {"a": 2, "b": "2"}]
+    assert logger.warning.call_count == 0
+
+
+def test_given_multiline_json_object_after_single_line_objects_when_parse_records_then_return_records(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(
+        b'{"a": 1}\n{\n  "a": 2\n}\n{"a": 3}\n'
+    )
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+
+def test_when_parse_records_then_open_file_in_binary_mode(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b'{"a": 1}')
+    file = Mock()
+    logger = Mock()
+
+    list(JsonlParser().parse_records(Mock(), file, stream_reader, logger, None))
+
+    stream_reader.open_file.assert_called_once_with(file, FileReadMode.READ_BINARY, None, logger)
+
+
+_JSONL_CONTENT_FOR_BYTE_RANGES = (
+    b'{"a": 1}\n{"a": 22}\n\n{"a": 333, "b": "x\\ny"}\r\n{"a": 4444}\n{"a": 5}'
+)
+
+
+@pytest.mark.parametrize("byte_range_size", [1, 2, 5, 9, 10, 11, 19, 100])
+def test_given_byte_ranges_when_parse_records_in_byte_range_then_return_each_record_once(
+    stream_reader: MagicMock, byte_range_size: int
+) -> None:
+    parser = JsonlParser(byte_range_size=byte_range_size)
+    content_size = len(_JSONL_CONTENT_FOR_BYTE_RANGES)
+    byte_ranges = [
+        (start, start + byte_range_size if start + byte_range_size < content_size else None)
+        for start in range(0, content_size, byte_range_size)
+    ]
+
+    records = []
+    for byte_range in byte_ranges:
+        stream_reader.open_file.return_value = io.BytesIO(_JSONL_CONTENT_FOR_BYTE_RANGES)
+        records.extend(
+            parser.parse_records_in_byte_range(
+                Mock(), Mock(), stream_reader, Mock(), None, byte_range
+            )
+        )
+
+    assert parser.get_byte_range_size(Mock()) == byte_range_size
+    assert records == [{"a": 1}, {"a": 22}, {"a": 333, "b": "x\ny"}, {"a": 4444}, {"a": 5}]
+
+
+def test_given_last_byte_range_ends_before_end_of_file_when_parse_records_in_byte_range_then_read_until_end_of_file(
+    stream_reader: MagicMock,
+) -> None:
+    # e.g. compressed files for which the size of the file is smaller than the number of bytes read
+    stream_reader.open_file.return_value = io.BytesIO(b'{"a": 1}\n{"a": 2}\n{"a": 3}\n')
+
+    records = list(
+        JsonlParser().parse_records_in_byte_range(
+            Mock(), Mock(), stream_reader, Mock(), None, (5, None)
+        )
+    )
+
+    assert records == [{"a": 2}, {"a": 3}]
+
+
+def test_given_no_byte_range_when_parse_records_in_byte_range_then_return_all_records(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value = io.BytesIO(b'{"a": 1}\n{"a": 2}\n')
+
+    records = list(
+        JsonlParser().parse_records_in_byte_range(Mock(), Mock(), stream_reader, Mock(), None, None)
+    )
+
+    assert records == [{"a": 1}, {"a": 2}]
+
+
+def test_given_multiline_json_object_when_parse_records_in_byte_range_then_raise_error(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value = io.BytesIO(b'{"a": 1}\n{\n  "a": 2\n}\n')
+
+    with pytest.raises(RecordParseError):
+        list(
+            JsonlParser().parse_records_in_byte_range(
+                Mock(), Mock(), stream_reader, Mock(), None, (0, None)
+            )
+        )
+
+
+class _RemoteFile(io.BytesIO):
+    """
+    A file read at a bounded throughput, like a file read from a remote storage.
+    """
+
+    _BYTES_PER_SECOND = 20_000_000
+
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        time.sleep(len(data) / self._BYTES_PER_SECOND)
+        return data
+
+    def readline(self, size: int = -1) -> bytes:
+        line = super().readline(size)
+        time.sleep(len(line) / self._BYTES_PER_SECOND)
+        return line
+
+
+@pytest.mark.slow
+def test_parse_records_in_byte_ranges_time() -> None:
+    content = b"".join(
+        json.dumps({"id": i, "name": f"name {i}", "values": list(range(10))}).encode() + b"\n"
+        for i in range(200_000)
+    )
+    stream_reader = MagicMock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda *args, **kwargs: _RemoteFile(content)
+    byte_range_size = len(content) // 8 + 1
+    parser = JsonlParser(byte_range_size=byte_range_size)
+
+    start = time.perf_counter()
+    records = list(parser.parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    whole_file_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        records_per_range = executor.map(
+            lambda range_start: list(
+                parser.parse_records_in_byte_range(
+                    Mock(),
+                    Mock(),
+                    stream_reader,
+                    Mock(),
+                    None,
+                    (range_start, range_start + byte_range_size),
+                )
+            ),
+            range(0, len(content), byte_range_size),
+        )
+        records_in_ranges = [record for records in records_per_range for record in records]
+    byte_ranges_duration = time.perf_counter() - start
+    print(
+        f"Whole file: {len(records) / whole_file_duration:,.0f} records/s, "
+        f"8 byte ranges in parallel: {len(records_in_ranges) / byte_ranges_duration:,.0f} records/s"
+    )
+
+    assert records_in_ranges == records
+    assert byte_ranges_duration < whole_file_duration
@@ -4,11 +4,15 @@
 
 import asyncio
 import datetime
+import io
 import math
+import time
+from decimal import Decimal
 from typing import Any, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pyarrow import Scalar
 
@@ -517,3 +521,201 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
         asyncio.get_event_loop().run_until_complete(
             parser.infer_schema(config, file, stream_reader, logger)
         )
+
+
+def _parquet_file(table: pa.Table, row_group_size: int) -> io.BytesIO:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=row_group_size)
+    buffer.seek(0)
+    return buffer
+
+
+def _parse_records(
+    table: pa.Table,
+    parquet_format: ParquetFormat = _default_parquet_format,
+    validation_policy: ValidationPolicy = ValidationPolicy.emit_record,
+    discovered_schema: Any = None,
+    uri: str = "s3://mybucket/test.parquet",
+    row_group_size: int = 5,
+):
+    config = FileBasedStreamConfig(
+        name="test",
+        format=parquet_format,
+        validation_policy=validation_policy,
+    )
+    stream_reader = Mock()
+    stream_reader.open_file.return_value = _parquet_file(table, row_group_size)
+    return list(
+        ParquetParser().parse_records(
+            config,
+            RemoteFile(uri=uri, last_modified=datetime.datetime.now()),
+            stream_reader,
+            Mock(),
+            discovered_schema,
+        )
+    )
+
+
+def _records_one_value_at_a_time(
+    table: pa.Table, parquet_format: ParquetFormat
+) -> list[dict[str, Any]]:
+    return [
+        {
+            column: ParquetParser._to_output_value(table.column(column)[row], parquet_format)
+            for column in table.column_names
+        }
+        for row in range(table.num_rows)
+    ]
+
+
+_TABLE = pa.table(
+    {
+        "id": pa.array(range(12), type=pa.int64()),
+        "name": pa.array([f"name {i}" if i % 3 else None for i in range(12)]),
+        "score": pa.array([i / 3 for i in range(12)], type=pa.float32()),
+        "created_at": pa.array(
+            [
+                datetime.datetime(2024, 1, 1, i, 0, 0, i * 1000, tzinfo=datetime.timezone.utc)
+                if i % 5
+                else None
+                for i in range(12)
+            ],
+            type=pa.timestamp("ms", "utc"),
+        ),
+        "updated_at": pa.array(
+            [datetime.datetime(2024, 1, 1, i, 30) for i in range(12)],
+            type=pa.timestamp("us", "America/New_York"),
+        ),
+        "day": pa.array([datetime.date(2024, 1, i + 1) for i in range(12)], type=pa.date32()),
+        "price": pa.array([Decimal(f"{i}.25") for i in range(12)], type=pa.decimal128(8, 2)),
+        "payload": pa.array([f"payload {i}".encode() for i in range(12)], type=pa.binary()),
+        "elapsed": pa.array([i * 1000 for i in range(12)], type=pa.duration("ms")),
+        "attributes": pa.array(
+            [[("key", i), ("other", i + 1)] if i % 4 else None for i in range(12)],
+            type=pa.map_(pa.string(), pa.int32()),
+        ),
+        "address": pa.array(
+            [{"city": f"city {i}", "zip": i} for i in range(12)],
+            type=pa.struct([pa.field("city", pa.string()), pa.field("zip", pa.int32())]),
+        ),
+        "tags": pa.array([[str(i)] * (i % 3) for i in range(12)], type=pa.list_(pa.string())),
+        "nothing": pa.array([None] * 12, type=pa.null()),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "parquet_format",
+    [
+        pytest.param(_default_parquet_format, id="decimal_as_string"),
+        pytest.param(_decimal_as_float_parquet_format, id="decimal_as_float"),
+    ],
+)
+def test_parse_records_converts_values_like_to_output_value(parquet_format, monkeypatch) -> None:
+    monkeypatch.setattr(ParquetParser, "BATCH_SIZE", 2)
+
+    records = _parse_records(_TABLE, parquet_format)
+
+    assert records == _records_one_value_at_a_time(_TABLE, parquet_format)
+    assert all(list(record) == _TABLE.column_names for record in records)
+
+
+def test_sliced_map_array_converts_values_like_to_output_value() -> None:
+    maps = pa.array(
+        [[("a", 1)], None, [("b", 2), ("c", 3)], [], [("d", 4)]],
+        type=pa.map_(pa.string(), pa.int32()),
+    ).slice(1, 3)
+
+    assert ParquetParser._column_to_python_values(maps, _default_parquet_format) == [
+        ParquetParser._to_output_value(value, _default_parquet_format) for value in maps
+    ]
+
+
+def test_parse_records_adds_partition_columns() -> None:
+    records = _parse_records(
+        _TABLE.select(["id"]), uri="s3://mybucket/year=2024/month=01/test.parquet"
+    )
+
+    assert records == [{"id": i, "year": "2024", "month": "01"} for i in range(12)]
+
+
+@pytest.mark.parametrize(
+    "validation_policy, schemaless, expected_columns",
+    [
+        pytest.param(ValidationPolicy.emit_record, False, ["id", "price"], id="emit_record"),
+        pytest.param(ValidationPolicy.skip_record, False, _TABLE.column_names, id="skip_record"),
+        pytest.param(
+            ValidationPolicy.wait_for_discover,
+            False,
+            _TABLE.column_names,
+            id="wait_for_discover",
+        ),
+        pytest.param(ValidationPolicy.emit_record, True, _TABLE.column_names, id="schemaless"),
+    ],
+)
+def test_parse_records_reads_only_columns_of_the_catalog_when_records_are_emitted_regardless_of_the_schema(
+    validation_policy, schemaless, expected_columns
+) -> None:
+    config = FileBasedStreamConfig(
+        name="test",
+        format=_default_parquet_format,
+        validation_policy=validation_policy,
+        schemaless=schemaless,
+    )
+    discovered_schema = {
+        "type": "object",
+        "properties": {
+            "price": {"type": ["null", "string"]},
+            "id": {"type": ["null", "integer"]},
+            "_ab_source_file_url": {"type": "string"},
+        },
+    }
+    stream_reader = Mock()
+    stream_reader.open_file.return_value = _parquet_file(_TABLE, row_group_size=5)
+
+    records = list(
+        ParquetParser().parse_records(
+            config,
+            RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now()),
+            stream_reader,
+            Mock(),
+            discovered_schema,
+        )
+    )
+
+    assert len(records) == _TABLE.num_rows
+    assert all(list(record) == expected_columns for record in records)
+
+
+def test_given_no_column_of_the_catalog_in_the_file_when_parse_records_then_emit_partition_columns() -> (
+    None
+):
+    records = _parse_records(
+        _TABLE,
+        discovered_schema={"type": "object", "properties": {"year": {"type": "string"}}},
+        uri="s3://mybucket/year=2024/test.parquet",
+    )
+
+    assert records == [{"year": "2024"}] * _TABLE.num_rows
+
+
+@pytest.mark.slow
+def test_parquet_record_parsing_time() -> None:
+    table = pa.concat_tables([_TABLE.drop_columns(["nothing"])] * 5_000)
+    data = _parquet_file(table, row_group_size=10_000).getvalue()
+
+    start = time.perf_counter()
+    reader = pq.ParquetFile(io.BytesIO(data))
+    for row_group in range(reader.num_row_groups):
+        batch = reader.read_row_group(row_group)
+        _records_one_value_at_a_time(batch, _default_parquet_format)
+    one_value_at_a_time_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    records = _parse_records(table, row_group_size=10_000)
+    vectorized_duration = time.perf_counter() - start
+    print(
+        f"Values converted one at a time: {table.num_rows / one_value_at_a_time_duration:,.0f} records/s, "
+        f"column by column: {len(records) / vectorized_duration:,.0f} records/s"
+    )
+
+    assert vectorized_duration < one_value_at_a_time_duration
@@ -70,6 +70,47 @@ def test_file_based_stream_partition_generator(sync_mode):
     )
 
 
+@pytest.mark.parametrize(
+    "byte_range_size, expected_byte_ranges",
+    [
+        pytest.param(None, {"big": [None], "small": [None]}, id="test_parser_without_byte_ranges"),
+        pytest.param(
+            10,
+            {"big": [(0, 10), (10, 20), (20, None)], "small": [None]},
+            id="test_files_larger_than_byte_range_are_split",
+        ),
+    ],
+)
+def test_file_based_stream_partition_generator_splits_files_in_byte_ranges(
+    byte_range_size, expected_byte_ranges
+):
+    stream = Mock()
+    stream.use_file_transfer = False
+    stream.get_parser.return_value.get_byte_range_size.return_value = byte_range_size
+    stream.stream_reader.file_size.side_effect = lambda file: {"big": 25, "small": 10}[file.uri]
+    files = [
+        RemoteFile(uri="big", last_modified=datetime.now()),
+        RemoteFile(uri="small", last_modified=datetime.now()),
+    ]
+    stream.stream_slices.return_value = [{"files": files}]
+    cursor = Mock(spec=FileBasedFinalStateCursor)
+
+    partitions = list(
+        FileBasedStreamPartitionGenerator(
+            stream, Mock(), _ANY_SYNC_MODE, _ANY_CURSOR_FIELD, _ANY_STATE, cursor
+        ).generate()
+    )
+
+    expected_slices = [
+        {"files": [file], "byte_range": byte_range} if byte_range else {"files": [file]}
+        for file in files
+        for byte_range in expected_byte_ranges[file.uri]
+    ]
+    assert [partition.to_slice() for partition in partitions] == expected_slices
+    assert len({hash(partition) for partition in partitions}) == len(partitions)
+    cursor.set_pending_partitions.assert_called_once_with(partitions)
+
+
 @pytest.mark.parametrize(
     "transformer, expected_records",
     [
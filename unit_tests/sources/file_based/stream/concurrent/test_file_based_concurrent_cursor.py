@@ -294,6 +294,59 @@ def test_add_file_invalid(
     )
 
 
+def test_given_file_split_in_byte_ranges_when_add_file_then_add_file_once_all_byte_ranges_are_read():
+    cursor = _make_cursor({"history": {}})
+    message_repository = MagicMock()
+    cursor._message_repository = message_repository
+    big_file = RemoteFile(
+        uri="big.jsonl",
+        last_modified=datetime.strptime("2021-01-01T00:00:00.000000Z", DATE_TIME_FORMAT),
+    )
+    small_file = RemoteFile(
+        uri="small.jsonl",
+        last_modified=datetime.strptime("2021-01-02T00:00:00.000000Z", DATE_TIME_FORMAT),
+    )
+    slices = [
+        {"files": [big_file], "byte_range": (0, 10)},
+        {"files": [big_file], "byte_range": (10, 20)},
+        {"files": [big_file], "byte_range": (20, None)},
+        {"files": [small_file]},
+    ]
+    cursor.set_pending_partitions(
+        [
+            FileBasedStreamPartition(
+                MagicMock(),
+                _slice,
+                message_repository,
+                SyncMode.full_refresh,
+                FileBasedConcurrentCursor.CURSOR_FIELD,
+                {},
+            )
+            for _slice in slices
+        ]
+    )
+
+    # the byte ranges and the files are read out of order
+    for file in [big_file, small_file, big_file]:
+        cursor.add_file(file)
+        assert "big.jsonl" not in cursor._file_to_datetime_history
+        assert (
+            cursor.get_state()["_ab_source_file_last_modified"]
+            == "2021-01-01T00:00:00.000000Z_big.jsonl"
+        )
+    cursor.add_file(big_file)
+
+    assert cursor._file_to_datetime_history == {
+        "big.jsonl": "2021-01-01T00:00:00.000000Z",
+        "small.jsonl": "2021-01-02T00:00:00.000000Z",
+    }
+    assert cursor._pending_files == {}
+    assert (
+        cursor.get_state()["_ab_source_file_last_modified"]
+        == "2021-01-02T00:00:00.000000Z_small.jsonl"
+    )
+
+
 @pytest.mark.parametrize(
     "input_state, pending_files, expected_cursor_value",
     [
@@ -118,6 +118,28 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         )
         assert list(map(lambda message: message.record.data["data"], messages)) == [self._A_RECORD]
 
+    def test_given_byte_range_when_read_records_from_slice_then_parse_records_in_byte_range(
+        self,
+    ) -> None:
+        file = RemoteFile(uri="uri", last_modified=self._NOW)
+        self._parser.parse_records_in_byte_range.return_value = [self._A_RECORD]
+
+        messages = list(
+            self._stream.read_records_from_slice({"files": [file], "byte_range": (10, 20)})
+        )
+
+        assert list(map(lambda message: message.record.data["data"], messages)) == [self._A_RECORD]
+        self._parser.parse_records_in_byte_range.assert_called_once_with(
+            self._stream_config,
+            file,
+            self._stream_reader,
+            self._stream.logger,
+            self._catalog_schema,
+            (10, 20),
+        )
+        self._parser.parse_records.assert_not_called()
+        self._cursor.add_file.assert_called_once_with(file)
+
     def test_when_transform_record_then_return_updated_record(self) -> None:
         file = RemoteFile(uri="uri", last_modified=self._NOW)
         last_updated = self._NOW.isoformat()
@@ -0,0 +1,203 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import random
+import threading
+from queue import Queue
+from typing import Callable
+from unittest.mock import patch
+
+import pytest
+
+from airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
+
+_MONOTONIC = "airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller.time.monotonic"
+
+
+def _acquire(controller: AdaptiveConcurrencyController, times: int) -> None:
+    for _ in range(times):
+        assert controller.try_acquire()
+
+
+def test_given_limit_fully_used_and_stable_latency_when_on_response_then_increase_limit_by_one_per_round():
+    controller = AdaptiveConcurrencyController(initial_concurrency=4, max_concurrency=10)
+    _acquire(controller, 4)
+
+    for _ in range(3):
+        controller.on_response(0.1)
+    assert controller.concurrency_limit == 4
+    for _ in range(2):
+        controller.on_response(0.1)
+
+    assert controller.concurrency_limit == 5
+
+
+def test_given_limit_not_fully_used_when_on_response_then_keep_limit():
+    controller = AdaptiveConcurrencyController(initial_concurrency=4, max_concurrency=10)
+    _acquire(controller, 2)
+
+    for _ in range(20):
+        controller.on_response(0.1)
+
+    assert controller.concurrency_limit == 4
+
+
+def test_given_limit_reaches_max_concurrency_when_on_response_then_stay_within_max_concurrency():
+    controller = AdaptiveConcurrencyController(initial_concurrency=4, max_concurrency=5)
+    _acquire(controller, 4)
+
+    for _ in range(100):
+        controller.on_response(0.1)
+
+    assert controller.concurrency_limit == 5
+
+
+def test_given_queue_congested_when_on_response_then_keep_limit():
+    controller = AdaptiveConcurrencyController(initial_concurrency=2, max_concurrency=10)
+    queue: Queue[int] = Queue(maxsize=10)
+    for item in range(9):
+        queue.put(item)
+    controller.watch_queue(queue)
+    _acquire(controller, 2)
+
+    for _ in range(20):
+        controller.on_response(0.1)
+
+    assert controller.concurrency_limit == 2
+
+
+def test_given_rate_limited_when_on_rate_limited_then_decrease_limit_once_per_cooldown():
+    controller = AdaptiveConcurrencyController(
+        initial_concurrency=8, max_concurrency=10, decrease_cooldown_seconds=1.0
+    )
+
+    with patch(_MONOTONIC) as monotonic:
+        monotonic.return_value = 100.0
+        controller.on_rate_limited()
+        monotonic.return_value = 100.5
+        controller.on_rate_limited()
+        assert controller.concurrency_limit == 4
+        monotonic.return_value = 101.5
+        controller.on_rate_limited()
+
+    assert controller.concurrency_limit == 2
+
+
+def test_given_rate_limited_when_on_rate_limited_then_stay_above_min_concurrency():
+    controller = AdaptiveConcurrencyController(
+        initial_concurrency=2, max_concurrency=10, min_concurrency=2
+    )
+
+    controller.on_rate_limited()
+
+    assert controller.concurrency_limit == 2
+
+
+def test_given_latency_grows_when_on_response_then_decrease_limit():
+    controller = AdaptiveConcurrencyController(
+        initial_concurrency=8, max_concurrency=10, latency_tolerance=2.0
+    )
+    for _ in range(20):
+        controller.on_response(0.1)
+
+    for _ in range(10):
+        controller.on_response(1.0)
+
+    assert controller.concurrency_limit == 4
+
+
+def _simulate_responses(
+    controller: AdaptiveConcurrencyController,
+    on_response: Callable[[int], None],
+    responses: int,
+) -> int:
+    """
+    Keeps the limit fully used and returns the lowest limit observed. Each response moves the clock past the decrease cooldown so that any
+    latency taken for congestion decreases the limit.
+    """
+    lowest_limit = controller.concurrency_limit
+    with patch(_MONOTONIC) as monotonic:
+        for response in range(responses):
+            monotonic.return_value = float(response)
+            _acquire(controller, controller.concurrency_limit - controller._in_flight)
+            on_response(response)
+            lowest_limit = min(lowest_limit, controller.concurrency_limit)
+    return lowest_limit
+
+
+@pytest.mark.parametrize(
+    "latency",
+    [
+        pytest.param(lambda rng: rng.choice([0.05, 0.4]), id="test_bimodal_latency"),
+        pytest.param(lambda rng: rng.uniform(0.1, 0.3), id="test_uniform_latency"),
+    ],
+)
+def test_given_noisy_latency_without_congestion_when_on_response_then_never_decrease_limit(latency):
+    rng = random.Random(42)
+    controller = AdaptiveConcurrencyController(initial_concurrency=4, max_concurrency=20)
+
+    lowest_limit = _simulate_responses(
+        controller, lambda _: controller.on_response(latency(rng)), 1000
+    )
+
+    assert lowest_limit == 4
+    assert controller.concurrency_limit == 20
+
+
+def test_given_endpoints_with_different_latencies_when_on_response_then_never_decrease_limit():
+    controller = AdaptiveConcurrencyController(initial_concurrency=4, max_concurrency=20)
+
+    lowest_limit = _simulate_responses(
+        controller,
+        lambda response: controller.on_response(
+            *((0.05, "fast") if response % 2 else (1.0, "slow"))
+        ),
+        200,
+    )
+
+    assert lowest_limit == 4
+    assert controller.concurrency_limit == 20
+
+
+def test_given_latency_grows_after_noisy_latency_when_on_response_then_decrease_limit():
+    rng = random.Random(42)
+    controller = AdaptiveConcurrencyController(initial_concurrency=8, max_concurrency=8)
+
+    _simulate_responses(controller, lambda _: controller.on_response(rng.uniform(0.1, 0.3)), 200)
+    lowest_limit = _simulate_responses(
+        controller, lambda _: controller.on_response(rng.uniform(1.0, 3.0)), 10
+    )
+
+    assert lowest_limit < 8
+
+
+def test_given_limit_reached_when_try_acquire_then_refuse_until_release():
+    controller = AdaptiveConcurrencyController(initial_concurrency=1, max_concurrency=2)
+    assert controller.try_acquire()
+
+    assert not controller.try_acquire()
+
+    controller.release()
+    assert controller.try_acquire()
+
+
+@pytest.mark.parametrize(
+    "min_concurrency, max_concurrency, decrease_factor",
+    [
+        pytest.param(0, 10, 0.5, id="test_min_concurrency_below_one"),
+        pytest.param(5, 4, 0.5, id="test_min_concurrency_above_max_concurrency"),
+        pytest.param(1, 10, 1.0, id="test_decrease_factor_not_decreasing"),
+    ],
+)
+def test_given_invalid_parameters_when_init_then_raise(
+    min_concurrency, max_concurrency, decrease_factor
+):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyController(
+            initial_concurrency=1,
+            min_concurrency=min_concurrency,
+            max_concurrency=max_concurrency,
+            decrease_factor=decrease_factor,
+        )
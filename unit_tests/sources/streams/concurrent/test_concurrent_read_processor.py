@@ -22,6 +22,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.models import Level as LogLevel
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.models.serialized_airbyte_message import SerializedAirbyteMessage
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
@@ -30,10 +31,16 @@ from airbyte_cdk.sources.concurrent_source.stream_thread_exception import Stream
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 from airbyte_cdk.sources.message import LogMessage, MessageRepository
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
+from airbyte_cdk.sources.streams.concurrent.adaptive_concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PartitionCompleteSentinel,
+    RecordBatch,
+)
 from airbyte_cdk.sources.types import Record
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
@@ -185,6 +192,67 @@ class TestConcurrentReadProcessor(unittest.TestCase):
             self._a_closed_partition in handler._streams_to_running_partitions[_ANOTHER_STREAM_NAME]
         )
 
+    def test_given_concurrency_limit_reached_when_on_partition_then_submit_partition_once_another_is_complete(
+        self,
+    ):
+        a_second_partition = Mock(spec=Partition)
+        a_second_partition.stream_name.return_value = _ANOTHER_STREAM_NAME
+        handler = ConcurrentReadProcessor(
+            [self._another_stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+            AdaptiveConcurrencyController(initial_concurrency=1, max_concurrency=2),
+        )
+
+        handler.on_partition(self._a_closed_partition)
+        handler.on_partition(a_second_partition)
+
+        self._thread_pool_manager.submit.assert_called_once_with(
+            self._partition_reader.process_partition, self._a_closed_partition
+        )
+        assert a_second_partition in handler._streams_to_running_partitions[_ANOTHER_STREAM_NAME]
+
+        list(
+            handler.on_partition_complete_sentinel(
+                PartitionCompleteSentinel(self._a_closed_partition, not _IS_SUCCESSFUL)
+            )
+        )
+
+        self._thread_pool_manager.submit.assert_called_with(
+            self._partition_reader.process_partition, a_second_partition
+        )
+        assert self._thread_pool_manager.submit.call_count == 2
+
+    def test_given_concurrency_limit_increased_when_on_record_then_submit_held_partition(self):
+        self._a_closed_partition.stream_name.return_value = _STREAM_NAME
+        concurrency_controller = AdaptiveConcurrencyController(
+            initial_concurrency=1, max_concurrency=2
+        )
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+            concurrency_controller,
+        )
+        handler.on_partition(self._an_open_partition)
+        handler.on_partition(self._a_closed_partition)
+
+        concurrency_controller.on_response(0.1)
+        list(handler.on_record(self._record))
+
+        self._thread_pool_manager.submit.assert_called_with(
+            self._partition_reader.process_partition, self._a_closed_partition
+        )
+        assert self._thread_pool_manager.submit.call_count == 2
+
     def test_handle_partition_emits_log_message_if_it_should_be_logged(self):
         stream_instances_to_read_from = [self._stream]
         self._slice_logger = Mock(spec=SliceLogger)
@@ -478,6 +546,81 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         assert messages == expected_messages
         assert handler._record_counter[_STREAM_NAME] == 2
 
+    @freezegun.freeze_time("2020-01-01T00:00:00")
+    def test_on_record_batch_emits_every_record_and_consumes_repository_once(self):
+        stream_instances_to_read_from = [self._stream]
+        repository_message = AirbyteMessage(
+            type=MessageType.LOG,
+            log=AirbyteLogMessage(
+                level=LogLevel.INFO, message="message emitted from the repository"
+            ),
+        )
+        self._message_repository.consume_queue.return_value = [repository_message]
+
+        handler = ConcurrentReadProcessor(
+            stream_instances_to_read_from,
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+
+        messages = list(handler.on_record_batch(RecordBatch([self._record, self._record])))
+
+        record_message = AirbyteMessage(
+            type=MessageType.RECORD,
+            record=AirbyteRecordMessage(
+                stream=_STREAM_NAME,
+                data=self._record_data,
+                emitted_at=1577836800000,
+            ),
+        )
+        assert messages == [
+            AirbyteMessage(
+                type=MessageType.TRACE,
+                trace=AirbyteTraceMessage(
+                    type=TraceType.STREAM_STATUS,
+                    emitted_at=1577836800000.0,
+                    stream_status=AirbyteStreamStatusTraceMessage(
+                        stream_descriptor=StreamDescriptor(name=_STREAM_NAME),
+                        status=AirbyteStreamStatus(AirbyteStreamStatus.RUNNING),
+                    ),
+                ),
+            ),
+            record_message,
+            record_message,
+            repository_message,
+        ]
+        assert handler._record_counter[_STREAM_NAME] == 2
+        assert self._stream.cursor.observe.call_count == 2
+        self._message_repository.consume_queue.assert_called_once()
+
+    def test_given_batch_with_messages_when_on_record_batch_then_emit_messages_from_batch(self):
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        # Simulate a first record so that no status message is emitted
+        list(handler.on_record(self._record))
+        serialized_message = SerializedAirbyteMessage(
+            AirbyteRecordMessage(stream=_STREAM_NAME, data=self._record_data, emitted_at=1),
+            b"serialized",
+        )
+
+        messages = list(handler.on_record_batch(RecordBatch([self._record], [serialized_message])))
+
+        assert messages == [serialized_message]
+        assert messages[0] is serialized_message
+        self._stream.cursor.observe.assert_called_with(self._record)
+        assert handler._record_counter[_STREAM_NAME] == 2
+
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_on_record_emits_status_message_on_first_record_no_repository_message(self):
         self._streams_currently_generating_partitions = [_STREAM_NAME]
@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
+from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import (
+    CustomFormatConcurrentStreamStateConverter,
+    IsoMillisConcurrentStreamStateConverter,
+)
+from airbyte_cdk.sources.streams.concurrent.state_converters.format_learning_datetime_parser import (
+    FormatLearningDatetimeParser,
+)
+from airbyte_cdk.utils.datetime_helpers import AirbyteDateTime, ab_datetime_parse
+
+
+def _spy(parse):
+    return Mock(side_effect=parse)
+
+
+def test_given_iso_layout_learned_when_parse_then_do_not_use_parse():
+    parse = _spy(ab_datetime_parse)
+    parser = FormatLearningDatetimeParser(parse, to_datetime=AirbyteDateTime.from_datetime)
+
+    parser.parse("2021-01-18T21:18:20.000Z")
+    parsed = parser.parse("2022-02-19T22:19:21.000Z")
+
+    assert parse.call_count == 2  # learning the layout parses the first value twice
+    assert parsed == datetime(2022, 2, 19, 22, 19, 21, tzinfo=timezone.utc)
+    assert isinstance(parsed, AirbyteDateTime)
+
+
+def test_given_layout_not_parsed_like_fromisoformat_when_parse_then_use_parse():
+    # values made only of digits are unix timestamps for ab_datetime_parse but dates for fromisoformat
+    parse = _spy(ab_datetime_parse)
+    parser = FormatLearningDatetimeParser(parse, to_datetime=AirbyteDateTime.from_datetime)
+
+    assert parser.parse("1617030403") == ab_datetime_parse("1617030403")
+    assert parser.parse("1617030404") == ab_datetime_parse("1617030404")
+    assert parse.call_count == 3
+
+
+def test_given_repeated_value_when_parse_then_return_cached_value():
+    parse = _spy(lambda value: DatetimeParser().parse(value, "%d/%m/%Y"))
+    parser = FormatLearningDatetimeParser(parse, datetime_format="%d/%m/%Y")
+
+    for _ in range(3):
+        assert parser.parse("18/01/2021") == datetime(2021, 1, 18, tzinfo=timezone.utc)
+
+    assert parse.call_count == 1
+
+
+def test_given_invalid_date_with_learned_layout_when_parse_then_raise_error_from_parse():
+    parser = FormatLearningDatetimeParser(
+        lambda value: DatetimeParser().parse(value, "%Y-%m-%d"), datetime_format="%Y-%m-%d"
+    )
+
+    with pytest.raises(ValueError, match="day is out of range"):
+        parser.parse("2021-02-30")
+
+
+def test_given_first_value_of_layout_invalid_when_parse_then_learn_layout_from_next_value():
+    parse = _spy(ab_datetime_parse)
+    parser = FormatLearningDatetimeParser(parse, to_datetime=AirbyteDateTime.from_datetime)
+
+    with pytest.raises(ValueError):
+        parser.parse("2021-02-30T21:18:20.000Z")
+    parser.parse("2021-01-18T21:18:20.000Z")
+    parse.reset_mock()
+    parser.parse("2022-02-19T22:19:21.000Z")
+
+    parse.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "datetime_format, value, expected",
+    [
+        pytest.param(
+            "%Y-%m-%dT%H:%M:%S.%fZ",
+            "2021-01-18T21:18:20.123456Z",
+            datetime(2021, 1, 18, 21, 18, 20, 123456, tzinfo=timezone.utc),
+            id="iso_with_microseconds",
+        ),
+        pytest.param(
+            "%Y-%m-%dT%H:%M:%S%z",
+            "2021-01-18T21:18:20+0200",
+            datetime.fromisoformat("2021-01-18T21:18:20+02:00"),
+            id="iso_with_offset",
+        ),
+        pytest.param(
+            "%Y-%d-%m",
+            "2021-05-01",
+            datetime(2021, 1, 5, tzinfo=timezone.utc),
+            id="swapped_day_and_month",
+        ),
+        pytest.param(
+            "%s", "1611004700", datetime(2021, 1, 18, 21, 18, 20, tzinfo=timezone.utc), id="epoch"
+        ),
+    ],
+)
+def test_custom_format_converter_parses_like_datetime_parser(datetime_format, value, expected):
+    converter = CustomFormatConcurrentStreamStateConverter(datetime_format=datetime_format)
+
+    for _ in range(2):
+        parsed = converter.parse_timestamp(value)
+        assert parsed == expected
+        assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_given_first_input_format_does_not_match_when_parse_then_use_next_formats():
+    converter = CustomFormatConcurrentStreamStateConverter(
+        datetime_format="%Y-%m-%dT%H:%M:%SZ", input_datetime_formats=["%Y-%m-%d"]
+    )
+
+    assert converter.parse_timestamp("2021-01-18") == datetime(2021, 1, 18, tzinfo=timezone.utc)
+    assert converter.parse_timestamp("2021-01-18T21:18:20Z") == datetime(
+        2021, 1, 18, 21, 18, 20, tzinfo=timezone.utc
+    )
+    with pytest.raises(ValueError):
+        converter.parse_timestamp("18/01/2021")
+
+
+@pytest.mark.slow
+def test_cursor_value_parsing_time():
+    # the values are unique so that none is served from the cache
+    values = [
+        f"2021-01-{day:02d}T{hour:02d}:{minute:02d}:20.000Z"
+        for day in range(1, 29)
+        for hour in range(24)
+        for minute in range(60)
+    ][:20_000]
+    parsers = {
+        "ab_datetime_parse": ab_datetime_parse,
+        "IsoMillisConcurrentStreamStateConverter": IsoMillisConcurrentStreamStateConverter().parse_timestamp,
+        "DatetimeParser": lambda value: DatetimeParser().parse(value, "%Y-%m-%dT%H:%M:%S.%fZ"),
+        "CustomFormatConcurrentStreamStateConverter": CustomFormatConcurrentStreamStateConverter(
+            datetime_format="%Y-%m-%dT%H:%M:%S.%fZ"
+        ).parse_timestamp,
+    }
+    durations = {}
+    for name, parse in parsers.items():
+        start = time.perf_counter()
+        for value in values:
+            parse(value)
+        durations[name] = time.perf_counter() - start
+        print(f"{name}: {len(values) / durations[name]:,.0f} values/s")
+
+    assert (
+        durations["IsoMillisConcurrentStreamStateConverter"] < durations["ab_datetime_parse"]
+        and durations["CustomFormatConcurrentStreamStateConverter"] < durations["DatetimeParser"]
+    )
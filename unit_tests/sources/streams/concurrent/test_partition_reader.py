@@ -4,7 +4,7 @@
 import unittest
 from queue import Queue
 from typing import Callable, Iterable, List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -14,6 +14,7 @@ from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partitio
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
+    RecordBatch,
 )
 from airbyte_cdk.sources.types import Record
 
@@ -61,6 +62,75 @@ class PartitionReaderTest(unittest.TestCase):
             PartitionCompleteSentinel(partition),
         ]
 
+    def test_given_batch_size_when_process_partition_then_queue_records_in_batches(self):
+        partition = self._a_partition(_RECORDS + _RECORDS[:1])
+        PartitionReader(self._queue, batch_size=2).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch(_RECORDS),
+            RecordBatch(_RECORDS[:1]),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_batch_wait_exceeded_when_process_partition_then_queue_partial_batch(self):
+        partition = self._a_partition(_RECORDS)
+        with patch(
+            "airbyte_cdk.sources.streams.concurrent.partition_reader.time.monotonic",
+            side_effect=[0.0, 5.0, 5.1, 5.2],
+        ):
+            PartitionReader(
+                self._queue, batch_size=10, max_batch_wait_seconds=1.0
+            ).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch(_RECORDS[:1]),
+            RecordBatch(_RECORDS[1:]),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_exception_when_process_partition_in_batches_then_queue_pending_batch_before_exception(
+        self,
+    ):
+        partition = Mock()
+        exception = ValueError()
+        partition.read.side_effect = self._read_with_exception(_RECORDS, exception)
+        PartitionReader(self._queue, batch_size=10).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch(_RECORDS),
+            StreamThreadException(exception, partition.stream_name()),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_record_serializer_when_process_partition_then_queue_batches_with_messages(self):
+        partition = self._a_partition(_RECORDS)
+        serializer = Mock(side_effect=lambda record: f"message for {record['id']}")
+        PartitionReader(self._queue, batch_size=1, record_serializer=serializer).process_partition(
+            partition
+        )
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch(_RECORDS[:1]),
+            RecordBatch(_RECORDS[1:]),
+            PartitionCompleteSentinel(partition),
+        ]
+        assert [batch.messages for batch in queue_content[:2]] == [
+            ["message for 1"],
+            ["message for 2"],
+        ]
+
+    def test_given_invalid_batch_size_when_init_then_raise(self):
+        with pytest.raises(ValueError):
+            PartitionReader(self._queue, batch_size=0)
+
     def _a_partition(self, records: List[Record]) -> Partition:
         partition = Mock(spec=Partition)
         partition.read.return_value = iter(records)
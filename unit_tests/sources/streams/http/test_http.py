@@ -457,7 +457,8 @@ class CacheHttpSubStream(HttpSubStream):
 
 def test_caching_filename():
     stream = CacheHttpStream()
-    assert stream.cache_filename == f"{stream.name}.sqlite"
+    with pytest.warns(DeprecationWarning):
+        assert stream.cache_filename == f"{stream.name}.sqlite"
 
 
 def test_caching_sessions_are_different():
@@ -465,7 +466,8 @@ def test_caching_sessions_are_different():
     stream_2 = CacheHttpStream()
 
     assert stream_1._http_client._session != stream_2._http_client._session
-    assert stream_1.cache_filename == stream_2.cache_filename
+    with pytest.warns(DeprecationWarning):
+        assert stream_1.cache_filename == stream_2.cache_filename
 
 
 # def test_cached_streams_wortk_when_request_path_is_not_set(mocker, requests_mock):
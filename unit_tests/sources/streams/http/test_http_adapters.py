@@ -0,0 +1,202 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import json
+import logging
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+import requests
+
+from airbyte_cdk.sources.streams.http import HttpClient
+from airbyte_cdk.sources.streams.http.http_adapters import (
+    ConnectionPoolStatistics,
+    HttpxAdapter,
+    PoolStatisticsHTTPAdapter,
+)
+
+_RESPONSE_DELAY_SECONDS = 0.01
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        time.sleep(_RESPONSE_DELAY_SECONDS)
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if self.path == "/gzip":
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("localhost", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        yield f"http://localhost:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+def _send_concurrently(session: requests.Session, url: str, number_of_threads: int) -> None:
+    with ThreadPoolExecutor(max_workers=number_of_threads) as executor:
+        responses = list(executor.map(lambda _: session.get(url), range(number_of_threads * 10)))
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_given_pool_as_large_as_threads_when_send_concurrently_then_reuse_connections(server_url):
+    adapter = PoolStatisticsHTTPAdapter(pool_size=8)
+    session = requests.Session()
+    session.mount("http://", adapter)
+
+    _send_concurrently(session, f"{server_url}/records", number_of_threads=8)
+
+    assert adapter.statistics.requests == 80
+    assert adapter.statistics.connections_opened <= 8
+    assert adapter.statistics.reused_connections >= 72
+
+
+def test_given_pool_smaller_than_threads_when_send_concurrently_then_open_more_connections(
+    server_url,
+):
+    small_pool_adapter = PoolStatisticsHTTPAdapter(pool_size=1)
+    small_pool_session = requests.Session()
+    small_pool_session.mount("http://", small_pool_adapter)
+    large_pool_adapter = PoolStatisticsHTTPAdapter(pool_size=8)
+    large_pool_session = requests.Session()
+    large_pool_session.mount("http://", large_pool_adapter)
+
+    _send_concurrently(small_pool_session, f"{server_url}/records", number_of_threads=8)
+    _send_concurrently(large_pool_session, f"{server_url}/records", number_of_threads=8)
+
+    assert (
+        small_pool_adapter.statistics.connections_opened
+        > large_pool_adapter.statistics.connections_opened
+    )
+
+
+def test_http_client_sizes_the_connection_pool(server_url):
+    http_client = HttpClient(name="test", logger=logging.getLogger("test"), connection_pool_size=4)
+
+    request, response = http_client.send_request(
+        http_method="GET", url=f"{server_url}/records", request_kwargs={}
+    )
+
+    assert response.json() == {"path": "/records"}
+    assert http_client._session.get_adapter(server_url)._pool_maxsize == 4
+    assert http_client.connection_pool_statistics.requests == 1
+    assert http_client.connection_pool_statistics.connections_opened == 1
+
+
+def test_given_session_when_connection_pool_statistics_then_return_none():
+    http_client = HttpClient(
+        name="test", logger=logging.getLogger("test"), session=requests.Session()
+    )
+
+    assert http_client.connection_pool_statistics is None
+
+
+def test_connection_pool_statistics():
+    statistics = ConnectionPoolStatistics()
+    for _ in range(3):
+        statistics.on_request()
+    statistics.on_connection_opened()
+    statistics.on_tls_handshake(session_reused=False)
+    statistics.on_tls_handshake(session_reused=True)
+
+    assert statistics.reused_connections == 2
+    assert statistics.tls_handshakes == 2
+    assert statistics.tls_sessions_resumed == 1
+
+
+class TestHttpxAdapter:
+    @pytest.fixture(autouse=True)
+    def requires_httpx(self):
+        pytest.importorskip("httpx")
+
+    @pytest.fixture
+    def session(self):
+        adapter = HttpxAdapter(pool_size=4, http2=False)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        yield session
+        session.close()
+
+    def test_send_request(self, server_url, session):
+        response = session.get(f"{server_url}/records")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"path": "/records"}
+        assert response.elapsed.total_seconds() >= _RESPONSE_DELAY_SECONDS
+
+    def test_when_send_then_measure_elapsed_time_until_response(self, server_url):
+        adapter = HttpxAdapter(pool_size=1, http2=False)
+        request = requests.Request("GET", f"{server_url}/records").prepare()
+
+        try:
+            response = adapter.send(request)
+        finally:
+            adapter.close()
+
+        assert response.elapsed.total_seconds() >= _RESPONSE_DELAY_SECONDS
+
+    def test_given_compressed_response_when_stream_then_return_decompressed_content(
+        self, server_url, session
+    ):
+        response = session.get(f"{server_url}/gzip", stream=True)
+
+        assert b"".join(response.iter_content(chunk_size=4)) == b'{"path": "/gzip"}'
+
+    def test_given_compressed_response_when_read_raw_then_return_decompressed_content(
+        self, server_url, session
+    ):
+        response = session.get(f"{server_url}/gzip", stream=True)
+
+        assert response.raw.read(3) == b'{"p'
+        assert response.raw.read() == b'ath": "/gzip"}'
+
+    def test_when_send_concurrently_then_reuse_connections(self, server_url, session):
+        _send_concurrently(session, f"{server_url}/records", number_of_threads=4)
+
+        statistics = session.get_adapter(server_url).statistics
+        assert statistics.requests == 40
+        assert statistics.connections_opened <= 4
+
+    def test_given_server_unavailable_when_send_then_raise_requests_connection_error(self, session):
+        with socket.socket() as unused_socket:
+            unused_socket.bind(("localhost", 0))
+            port = unused_socket.getsockname()[1]
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get(f"http://localhost:{port}/records")
+
+    def test_http_client_with_http2(self, server_url):
+        pytest.importorskip("h2")
+        http_client = HttpClient(name="test", logger=logging.getLogger("test"), use_http2=True)
+
+        _, response = http_client.send_request(
+            http_method="GET", url=f"{server_url}/records", request_kwargs={}
+        )
+
+        assert response.json() == {"path": "/records"}
+        assert http_client.connection_pool_statistics.requests == 1
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 import requests
@@ -38,7 +38,8 @@ def test_cache_http_client():
 
 def test_cache_filename():
     http_client = test_http_client()
-    http_client.cache_filename == f"{http_client._name}.sqlite"
+    with pytest.warns(DeprecationWarning):
+        assert http_client.cache_filename == f"{http_client._name}.sqlite"
 
 
 @pytest.mark.parametrize(
@@ -689,6 +690,45 @@ def test_send_emit_stream_status_with_rate_limit_reason(capsys):
         assert len(trace_messages) == mocked_send.call_count
 
 
+def test_given_concurrency_controller_when_send_request_then_report_latency_and_rate_limits():
+    class BackoffStrategy:
+        def backoff_time(self, *args, **kwargs):
+            return 0.001
+
+    concurrency_controller = MagicMock()
+    http_client = HttpClient(
+        name="test",
+        logger=MagicMock(),
+        error_handler=HttpStatusErrorHandler(logger=MagicMock(), max_retries=1),
+        backoff_strategy=BackoffStrategy(),
+        concurrency_controller=concurrency_controller,
+    )
+
+    rate_limited_response = MagicMock(spec=requests.Response)
+    rate_limited_response.status_code = 429
+    rate_limited_response.headers = {}
+    rate_limited_response.ok = False
+    rate_limited_response.elapsed = timedelta(seconds=0.5)
+    successful_response = MagicMock(spec=requests.Response)
+    successful_response.status_code = 200
+    successful_response.headers = {}
+    successful_response.ok = True
+    successful_response.elapsed = timedelta(seconds=0.2)
+
+    with patch.object(
+        requests.Session, "send", side_effect=[rate_limited_response, successful_response]
+    ):
+        http_client.send_request(
+            http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={}
+        )
+
+    assert concurrency_controller.on_response.call_args_list == [
+        call(0.5, endpoint="test"),
+        call(0.2, endpoint="test"),
+    ]
+    concurrency_controller.on_rate_limited.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "exit_on_rate_limit, expected_call_count, expected_error",
     [[True, 6, DefaultBackoffException], [False, 6, RateLimitBackoffException]],
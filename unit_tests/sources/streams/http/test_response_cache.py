@@ -0,0 +1,236 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from freezegun import freeze_time
+
+from airbyte_cdk.sources.streams.http import HttpClient
+from airbyte_cdk.sources.streams.http.response_cache import (
+    DEFAULT_MAX_CACHE_BYTES,
+    DEFAULT_MAX_DISK_CACHE_BYTES,
+    BoundedResponseCache,
+    BoundedResponseStorage,
+    log_response_cache_statistics,
+    shared_response_cache,
+)
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+
+_URL = "https://api.airbyte.io/records"
+
+
+def _send(http_client: HttpClient, url: str = _URL):
+    _, response = http_client.send_request(http_method="GET", url=url, request_kwargs={})
+    return response
+
+
+def _cached_http_client(backend: BoundedResponseCache, **kwargs) -> HttpClient:
+    return HttpClient(
+        name="test",
+        logger=logging.getLogger("test"),
+        use_cache=True,
+        cache_backend=backend,
+        **kwargs,
+    )
+
+
+def test_given_storage_full_when_set_then_evict_least_recently_used_values():
+    storage = BoundedResponseStorage("test", max_bytes=3 * len(json.dumps({"value": 0}).encode()))
+    storage.serializer = None
+    for index in range(3):
+        storage[f"key_{index}"] = json.dumps({"value": index}).encode()
+
+    storage["key_0"]  # makes key_1 the least recently used value
+    storage["key_3"] = json.dumps({"value": 3}).encode()
+
+    assert sorted(storage) == ["key_0", "key_2", "key_3"]
+    assert storage.statistics.evictions == 1
+    assert storage.stored_bytes == 3 * len(json.dumps({"value": 0}).encode())
+
+
+def test_given_value_larger_than_storage_when_set_then_do_not_store():
+    storage = BoundedResponseStorage("test", max_bytes=10)
+    storage.serializer = None
+    storage["small"] = b"small"
+
+    storage["large"] = b"x" * 11
+
+    assert list(storage) == ["small"]
+    assert storage.statistics.evictions == 0
+
+
+def test_given_compression_when_set_then_store_compressed_values():
+    value = json.dumps([{"id": index, "name": "a repeated name"} for index in range(100)]).encode()
+    storage = BoundedResponseStorage("test", compress=True)
+    storage.serializer = None
+    uncompressed_storage = BoundedResponseStorage("test")
+    uncompressed_storage.serializer = None
+
+    storage["key"] = value
+    uncompressed_storage["key"] = value
+
+    assert storage["key"] == value
+    assert storage.stored_bytes < uncompressed_storage.stored_bytes / 5
+
+
+def test_when_delete_then_release_bytes():
+    storage = BoundedResponseStorage("test")
+    storage["key"] = {"id": 1}
+
+    del storage["key"]
+
+    assert storage.stored_bytes == 0
+    with pytest.raises(KeyError):
+        del storage["key"]
+
+
+def test_given_directory_when_set_then_store_values_in_files(tmp_path):
+    storage = BoundedResponseStorage(
+        "test", max_bytes=2 * len(json.dumps({"value": 0}).encode()), directory=str(tmp_path)
+    )
+    storage.serializer = None
+    for index in range(3):
+        storage[f"key_{index}"] = json.dumps({"value": index}).encode()
+
+    assert sorted(storage) == ["key_1", "key_2"]
+    assert storage["key_2"] == json.dumps({"value": 2}).encode()
+    assert len(list(tmp_path.iterdir())) == 2
+    assert not storage._values
+
+    storage.clear()
+
+    assert storage.stored_bytes == 0
+    assert not list(tmp_path.iterdir())
+
+
+def test_given_directory_not_writable_when_set_then_do_not_store(tmp_path):
+    storage = BoundedResponseStorage("test", directory=str(tmp_path / "responses"))
+    storage.serializer = None
+    (tmp_path / "responses").write_bytes(b"not a directory")
+
+    storage["key"] = b"value"
+
+    assert list(storage) == []
+    assert storage.stored_bytes == 0
+
+
+def test_given_request_cache_path_when_shared_response_cache_then_store_responses_on_disk(
+    monkeypatch, requests_mock, tmp_path
+):
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path))
+    requests_mock.get(_URL, json={"id": 1})
+
+    _send(HttpClient(name="test", logger=logging.getLogger("test"), use_cache=True))
+
+    storage = shared_response_cache().responses
+    assert storage._max_bytes == DEFAULT_MAX_DISK_CACHE_BYTES
+    assert not storage._values
+    assert len(list((tmp_path / "responses").iterdir())) == 1
+
+
+def test_given_no_request_cache_path_when_shared_response_cache_then_store_responses_in_memory(
+    monkeypatch, requests_mock
+):
+    monkeypatch.delenv(ENV_REQUEST_CACHE_PATH, raising=False)
+    requests_mock.get(_URL, json={"id": 1})
+
+    _send(HttpClient(name="test", logger=logging.getLogger("test"), use_cache=True))
+
+    storage = shared_response_cache().responses
+    assert storage._max_bytes == DEFAULT_MAX_CACHE_BYTES
+    assert len(storage._values) == 1
+
+
+def test_given_cached_response_when_send_request_then_count_hits_and_misses(requests_mock):
+    requests_mock.get(_URL, json={"id": 1})
+    backend = BoundedResponseCache(compress=True)
+    http_client = _cached_http_client(backend)
+
+    assert _send(http_client).json() == {"id": 1}
+    assert _send(http_client).json() == {"id": 1}
+
+    assert requests_mock.call_count == 1
+    assert backend.statistics.hits == 1
+    assert backend.statistics.misses == 1
+
+
+def test_given_cache_full_when_send_request_then_request_evicted_response_again(requests_mock):
+    requests_mock.get(f"{_URL}/1", json={"id": 1, "padding": "x" * 2000})
+    requests_mock.get(f"{_URL}/2", json={"id": 2, "padding": "x" * 2000})
+    backend = BoundedResponseCache(max_bytes=3000)
+    http_client = _cached_http_client(backend)
+
+    _send(http_client, f"{_URL}/1")
+    _send(http_client, f"{_URL}/2")
+    _send(http_client, f"{_URL}/1")
+
+    assert requests_mock.call_count == 3
+    assert backend.statistics.evictions >= 1
+    assert backend.responses.stored_bytes <= 3000
+
+
+def test_given_expire_after_when_response_expired_then_send_request_again(requests_mock):
+    requests_mock.get(_URL, json={"id": 1})
+    storage = BoundedResponseStorage("test")
+    expiring_client = _cached_http_client(
+        BoundedResponseCache(responses=storage), cache_expire_after=timedelta(minutes=5)
+    )
+    # sharing the responses with a client without expiration must not change the expiration of the first client
+    _cached_http_client(BoundedResponseCache(responses=storage))
+
+    with freeze_time("2025-01-01T00:00:00Z"):
+        _send(expiring_client)
+    with freeze_time("2025-01-01T00:04:00Z"):
+        _send(expiring_client)
+    with freeze_time("2025-01-01T00:06:00Z"):
+        _send(expiring_client)
+
+    assert requests_mock.call_count == 2
+    assert storage.statistics.hits == 1
+    assert storage.statistics.misses == 2
+
+
+def test_shared_response_cache_shares_responses_between_clients(
+    monkeypatch, requests_mock, tmp_path
+):
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path))
+    requests_mock.get(f"{_URL}/shared", json={"id": 1})
+    first_client = HttpClient(name="first", logger=logging.getLogger("test"), use_cache=True)
+    second_client = HttpClient(name="second", logger=logging.getLogger("test"), use_cache=True)
+
+    _send(first_client, f"{_URL}/shared")
+    _send(second_client, f"{_URL}/shared")
+
+    assert requests_mock.call_count == 1
+    assert first_client._session.cache.responses is shared_response_cache().responses
+
+
+def test_given_request_cache_path_changed_when_shared_response_cache_then_do_not_share_responses(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path / "first_command"))
+    first_command_cache = shared_response_cache()
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path / "second_command"))
+
+    assert shared_response_cache().responses is not first_command_cache.responses
+    assert shared_response_cache().responses is shared_response_cache().responses
+
+
+def test_log_response_cache_statistics(requests_mock):
+    requests_mock.get(_URL, json={"id": 1})
+    backend = BoundedResponseCache(cache_name="logged_cache")
+    _send(_cached_http_client(backend))
+    logger = Mock()
+
+    log_response_cache_statistics(logger)
+
+    messages = [call.args[0] for call in logger.info.call_args_list]
+    assert any(
+        message.startswith("Response cache logged_cache: 0 hits, 1 misses, 0 evictions")
+        for message in messages
+    )
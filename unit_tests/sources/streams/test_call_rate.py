@@ -3,6 +3,7 @@
 #
 import os
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Any, Iterable, Mapping, Optional
@@ -20,6 +21,7 @@ from airbyte_cdk.sources.streams.call_rate import (
     HttpRequestRegexMatcher,
     MovingWindowCallRatePolicy,
     Rate,
+    TokenBucketCallRatePolicy,
     UnlimitedCallRatePolicy,
 )
 from airbyte_cdk.sources.streams.http import HttpStream
@@ -303,6 +305,151 @@ class TestMovingWindowCallRatePolicy:
         assert str(excinfo.value) == "Bucket for item=call with Rate limit=2/1.0h is already full"
 
 
+class TestTokenBucketCallRatePolicy:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            TokenBucketCallRatePolicy(rate=Rate(0, timedelta(seconds=1)), matchers=[])
+
+    def test_limit_rate(self, mocker):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(minutes=1)), matchers=[])
+        for _ in range(10):
+            policy.try_acquire(mocker.Mock(), weight=1)
+        with pytest.raises(ValueError, match="Weight can not exceed the capacity"):
+            policy.try_acquire(mocker.Mock(), weight=11)
+
+        with pytest.raises(CallRateLimitHit) as exc:
+            policy.try_acquire(mocker.Mock(), weight=1)
+
+        # one token is refilled every 6 seconds
+        assert exc.value.time_to_wait.total_seconds() == pytest.approx(6, 0.1)
+        assert exc.value.weight == 1
+
+    def test_reserve_returns_time_to_wait_in_fifo_order(self, mocker):
+        policy = TokenBucketCallRatePolicy(
+            rate=Rate(10, timedelta(seconds=10)), matchers=[], capacity=1
+        )
+
+        times_to_wait = [policy.reserve(mocker.Mock(), weight=1) for _ in range(4)]
+
+        assert [time_to_wait.total_seconds() for time_to_wait in times_to_wait] == pytest.approx(
+            [0, 1, 2, 3], abs=0.1
+        )
+
+    def test_reserve_over_timeout_does_not_consume_tokens(self, mocker):
+        policy = TokenBucketCallRatePolicy(
+            rate=Rate(1, timedelta(seconds=10)), matchers=[], capacity=1
+        )
+        policy.reserve(mocker.Mock(), weight=1)
+
+        with pytest.raises(CallRateLimitHit):
+            policy.reserve(mocker.Mock(), weight=1, timeout=1)
+
+        assert policy.reserve(mocker.Mock(), weight=1).total_seconds() == pytest.approx(10, 0.1)
+
+    def test_update_available_calls(self, mocker):
+        policy = TokenBucketCallRatePolicy(rate=Rate(100, timedelta(hours=1)), matchers=[])
+        policy.update(available_calls=2, call_reset_ts=None)
+        with pytest.raises(CallRateLimitHit):
+            policy.try_acquire(mocker.Mock(), weight=3)
+        policy.try_acquire(mocker.Mock(), weight=1)
+
+        # increasing the number of calls available is ignored
+        policy.update(available_calls=20, call_reset_ts=None)
+        with pytest.raises(CallRateLimitHit):
+            policy.try_acquire(mocker.Mock(), weight=3)
+
+    def test_update_with_reset_refills_whole_capacity_at_reset(self, mocker):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(seconds=1)), matchers=[])
+        policy.update(available_calls=0, call_reset_ts=datetime.now() + timedelta(seconds=0.3))
+
+        with pytest.raises(CallRateLimitHit) as exc:
+            policy.try_acquire(mocker.Mock(), weight=10)
+        assert exc.value.time_to_wait.total_seconds() == pytest.approx(0.3, abs=0.05)
+
+        time.sleep(0.35)
+        policy.try_acquire(mocker.Mock(), weight=10)
+
+    def test_given_api_reports_calls_left_when_update_with_reset_then_keep_refilling(self, mocker):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(seconds=1)), matchers=[])
+        for _ in range(10):
+            policy.try_acquire(mocker.Mock(), weight=1)
+
+        policy.update(available_calls=4990, call_reset_ts=datetime.now() + timedelta(hours=1))
+
+        assert policy.reserve(mocker.Mock(), weight=1).total_seconds() <= 0.1
+
+    def test_given_calls_left_after_pause_when_update_then_resume_refilling(self, mocker):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(seconds=1)), matchers=[])
+        policy.update(available_calls=0, call_reset_ts=datetime.now() + timedelta(hours=1))
+
+        policy.update(available_calls=100, call_reset_ts=datetime.now() + timedelta(hours=1))
+
+        assert policy.reserve(mocker.Mock(), weight=1).total_seconds() <= 0.1
+
+    def test_api_budget_blocks_until_reserved_call_is_available(self):
+        policy = TokenBucketCallRatePolicy(
+            rate=Rate(20, timedelta(seconds=1)), matchers=[], capacity=1
+        )
+        api_budget = APIBudget(policies=[policy])
+
+        start = time.monotonic()
+        for _ in range(5):
+            api_budget.acquire_call(Request("GET", "https://example.com"))
+
+        assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
+        with pytest.raises(CallRateLimitHit):
+            api_budget.acquire_call(Request("GET", "https://example.com"), block=False)
+
+
+@pytest.mark.slow
+def test_achieved_call_rate_under_contention():
+    """
+    Benchmark comparing the call rate achieved by 24 threads sharing a budget with the configured limit. Run with `-m slow -s` to see the
+    results.
+    """
+    limit = 200
+    duration = 2.0
+    policies = {
+        "moving window": MovingWindowCallRatePolicy(
+            rates=[Rate(limit // 10, timedelta(seconds=0.1))], matchers=[]
+        ),
+        "token bucket": TokenBucketCallRatePolicy(
+            rate=Rate(limit, timedelta(seconds=1)), matchers=[], capacity=limit // 10
+        ),
+    }
+
+    results = {}
+    cpu_times = {}
+    for name, policy in policies.items():
+        api_budget = APIBudget(policies=[policy])
+        calls = []
+        cpu_start = time.process_time()
+        deadline = time.monotonic() + duration
+
+        def make_calls():
+            while time.monotonic() < deadline:
+                api_budget.acquire_call("call")
+                calls.append(time.monotonic())
+
+        threads = [threading.Thread(target=make_calls) for _ in range(24)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results[name] = len([call for call in calls if call < deadline]) / duration
+        cpu_times[name] = time.process_time() - cpu_start
+
+    assert results["token bucket"] <= limit * 1.1 + limit // 10 / duration
+    print(
+        "\n"
+        + ", ".join(
+            f"{name}: {rate:,.0f} calls/s using {cpu_times[name]:.2f}s of CPU"
+            for name, rate in results.items()
+        )
+        + f" (limit: {limit} calls/s)"
+    )
+
+
 class TestHttpStreamIntegration:
     def test_without_cache(self, mocker, requests_mock):
         """Test that HttpStream will use call budget when provided"""
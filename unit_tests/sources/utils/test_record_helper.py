@@ -4,11 +4,13 @@
 
 from unittest.mock import MagicMock
 
+import orjson
 import pytest
 
 from airbyte_cdk.models import (
     AirbyteLogMessage,
     AirbyteMessage,
+    AirbyteMessageSerializer,
     AirbyteRecordMessage,
     AirbyteStateMessage,
     AirbyteStateType,
@@ -17,7 +19,12 @@ from airbyte_cdk.models import (
     TraceType,
 )
 from airbyte_cdk.models import Type as MessageType
-from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.models.serialized_airbyte_message import SerializedAirbyteMessage
+from airbyte_cdk.sources.types import Record
+from airbyte_cdk.sources.utils.record_helper import (
+    record_to_serialized_airbyte_message,
+    stream_data_to_airbyte_message,
+)
 
 NOW = 1234567
 STREAM_NAME = "my_stream"
@@ -94,3 +101,27 @@ def test_state_message_to_message(test_name, data):
     schema = {}
     with pytest.raises(ValueError):
         stream_data_to_airbyte_message(STREAM_NAME, data, transformer, schema)
+
+
+def test_record_to_serialized_airbyte_message():
+    message = record_to_serialized_airbyte_message(Record({"id": 0, "field_A": 1.0}, STREAM_NAME))
+
+    assert isinstance(message, SerializedAirbyteMessage)
+    assert message == AirbyteMessage(
+        type=MessageType.RECORD,
+        record=AirbyteRecordMessage(
+            stream=STREAM_NAME,
+            data={"id": 0, "field_A": 1.0},
+            emitted_at=message.record.emitted_at,
+        ),
+    )
+    assert message.serialized == orjson.dumps(AirbyteMessageSerializer.dump(message))
+
+
+def test_given_data_not_serializable_by_orjson_when_record_to_serialized_airbyte_message_then_return_plain_message():
+    message = record_to_serialized_airbyte_message(
+        Record({"id": 0, "big_number": 2**64}, STREAM_NAME)
+    )
+
+    assert not isinstance(message, SerializedAirbyteMessage)
+    assert message.record.data == {"id": 0, "big_number": 2**64}
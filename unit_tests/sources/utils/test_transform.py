@@ -3,10 +3,13 @@
 #
 
 import json
+import time
+from copy import deepcopy
+from unittest.mock import patch
 
 import pytest
 
-from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer, _SchemaCompiler
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 COMPLEX_SCHEMA = {
@@ -385,3 +388,156 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+RECURSIVE_SCHEMA = {
+    "type": "object",
+    "properties": {"root": {"$ref": "#/definitions/node"}},
+    "definitions": {
+        "node": {
+            "type": ["null", "object"],
+            "properties": {
+                "value": {"type": "integer"},
+                "children": {"type": "array", "items": {"$ref": "#/definitions/node"}},
+            },
+        }
+    },
+}
+
+
+def _transform_with_jsonschema(transformer, record, schema):
+    with patch.object(TypeTransformer, "_get_compiled_schema", return_value=None):
+        transformer.transform(record, schema)
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        (COMPLEX_SCHEMA, {"value": "false", "prop": None, "int_prop": 1.0, "number_prop": True}),
+        (COMPLEX_SCHEMA, {"int_prop": "1.5", "def": {}, "array": "not an array"}),
+        (COMPLEX_SCHEMA, {"too_many_types": {"a": 1}, "nested": "a string", "list_of_lists": [1]}),
+        (COMPLEX_SCHEMA, {"value": "not a boolean", "prop_with_null": 1, "array": [None, [1]]}),
+        (VERY_NESTED_SCHEMA, {"very_nested_value": {"very_nested_value": [1, 2]}}),
+        (RECURSIVE_SCHEMA, {"root": {"value": "1", "children": [{"value": "a"}, None, 1]}}),
+        (
+            {"properties": {"a": {"type": "number"}}, "type": "integer"},
+            {"a": "1.5"},
+        ),
+        (
+            {
+                "type": "object",
+                "properties": {"a": {"$ref": "#/definitions/a", "type": "string"}},
+                "definitions": {"a": {"type": "integer"}},
+            },
+            {"a": "1"},
+        ),
+        (
+            {"type": "object", "properties": {"a": {"type": "array", "items": {"type": "string"}}}},
+            {"a": 1},
+        ),
+        ({"type": "object", "properties": {"a": {"type": "boolean"}}}, {"a": None}),
+    ],
+)
+@pytest.mark.parametrize(
+    "config",
+    [
+        TransformConfig.DefaultSchemaNormalization,
+        TransformConfig.CustomSchemaNormalization,
+        TransformConfig.DefaultSchemaNormalization | TransformConfig.CustomSchemaNormalization,
+    ],
+)
+def test_compiled_schema_behaves_like_jsonschema_traversal(schema, record, config, caplog):
+    transformer = TypeTransformer(config)
+    if TransformConfig.CustomSchemaNormalization in config:
+        transformer.registerCustomTransform(
+            lambda value, subschema: f"{value}!" if subschema.get("type") == "string" else value
+        )
+    expected_record = deepcopy(record)
+    _transform_with_jsonschema(transformer, expected_record, schema)
+    expected_warnings = [log.message for log in caplog.records]
+    caplog.clear()
+
+    transformer.transform(record, schema)
+
+    assert record == expected_record
+    assert [
+        log.message for log in caplog.records if log.levelname == "WARNING"
+    ] == expected_warnings
+
+
+def test_given_same_schema_when_transform_then_compile_schema_once():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    with patch(
+        "airbyte_cdk.sources.utils.transform._SchemaCompiler", wraps=_SchemaCompiler
+    ) as compiler:
+        transformer.transform({"value": 1}, SIMPLE_SCHEMA)
+        transformer.transform({"value": 2}, SIMPLE_SCHEMA)
+
+    assert compiler.call_count == 1
+
+
+def test_given_custom_transform_registered_after_transform_then_apply_custom_transform():
+    transformer = TypeTransformer(
+        TransformConfig.DefaultSchemaNormalization | TransformConfig.CustomSchemaNormalization
+    )
+    transformer.transform({"value": 1}, SIMPLE_SCHEMA)
+
+    transformer.registerCustomTransform(lambda value, subschema: f"{value}!")
+    record = {"value": 1}
+    transformer.transform(record, SIMPLE_SCHEMA)
+
+    assert record == {"value": "1!"}
+
+
+def test_given_remote_reference_when_transform_then_traverse_with_jsonschema():
+    schema = {
+        "type": "object",
+        "properties": {
+            "value": {"type": "string"},
+            "remote": {"$ref": "https://example.com/schema.json"},
+        },
+    }
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    record = {"value": 1}
+
+    transformer.transform(record, schema)
+
+    assert record == {"value": "1"}
+    assert transformer._get_compiled_schema(schema) is None
+
+
+@pytest.mark.slow
+def test_transform_wide_schema_benchmark():
+    """
+    Compares the compiled schemas with the jsonschema traversal. Run with `-m slow -s` to see the results.
+    """
+    schema = {
+        "type": "object",
+        "properties": {
+            **{f"string_{index}": {"type": ["null", "string"]} for index in range(50)},
+            **{f"integer_{index}": {"type": ["null", "integer"]} for index in range(50)},
+        },
+    }
+    records = [
+        {
+            **{f"string_{index}": f"value {index}" for index in range(50)},
+            **{f"integer_{index}": str(index) for index in range(50)},
+        }
+        for _ in range(2_000)
+    ]
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    start = time.perf_counter()
+    for record in deepcopy(records):
+        _transform_with_jsonschema(transformer, record, schema)
+    jsonschema_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for record in deepcopy(records):
+        transformer.transform(record, schema)
+    compiled_elapsed = time.perf_counter() - start
+
+    print(
+        f"\njsonschema traversal: {len(records) / jsonschema_elapsed:,.0f} records/s, "
+        f"compiled schema: {len(records) / compiled_elapsed:,.0f} records/s"
+    )
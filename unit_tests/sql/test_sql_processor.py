@@ -0,0 +1,212 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import json
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from airbyte_cdk.models import (
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+)
+from airbyte_cdk.sql.secrets import SecretString
+from airbyte_cdk.sql.shared.catalog_providers import CatalogProvider
+from airbyte_cdk.sql.shared.sql_processor import SqlConfig, SqlProcessorBase
+
+_STREAM_NAME = "users"
+_EVENTS_STREAM_NAME = "events"
+_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": ["null", "string"]},
+        "birthday": {"type": "string", "format": "date"},
+        "updated_at": {"type": "string", "format": "date-time"},
+        "address": {"type": "object"},
+    },
+}
+# The dataframe implementation does not support date columns with SQLite
+_EVENTS_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": ["null", "string"]},
+        "updated_at": {"type": "string", "format": "date-time"},
+        "address": {"type": "object"},
+    },
+}
+
+
+class _SqliteConfig(SqlConfig):
+    path: str
+    schema_name: str = "main"
+
+    def get_sql_alchemy_url(self) -> SecretString:
+        return SecretString(f"sqlite:///{self.path}")
+
+    def get_database_name(self) -> str:
+        return "main"
+
+
+class _SqliteProcessor(SqlProcessorBase):
+    pass
+
+
+def _processor(tmp_path: Path) -> _SqliteProcessor:
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name=stream_name,
+                    json_schema=json_schema,
+                    supported_sync_modes=[SyncMode.full_refresh],
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for stream_name, json_schema in [
+                (_STREAM_NAME, _JSON_SCHEMA),
+                (_EVENTS_STREAM_NAME, _EVENTS_JSON_SCHEMA),
+            ]
+        ]
+    )
+    return _SqliteProcessor(
+        sql_config=_SqliteConfig(path=str(tmp_path / "test.sqlite")),
+        catalog_provider=CatalogProvider(catalog),
+    )
+
+
+def _record(index: int) -> Dict[str, Any]:
+    return {
+        "id": index,
+        "name": f"name {index}" if index % 2 else None,
+        "birthday": "2000-01-02",
+        "updated_at": "2024-01-02T03:04:05",
+        "address": {"city": f"city {index}"},
+        "unknown": "dropped",
+        "_airbyte_raw_id": f"raw-{index}",
+        "_airbyte_extracted_at": "2024-01-02T03:04:05.678000",
+        "_airbyte_meta": {"changes": []},
+    }
+
+
+def _write_jsonl(file_path: Path, records: List[Dict[str, Any]]) -> Path:
+    lines = "".join(json.dumps(record) + "\n" for record in records).encode()
+    if file_path.suffix == ".gz":
+        lines = gzip.compress(lines)
+    file_path.write_bytes(lines)
+    return file_path
+
+
+def _rows(processor: SqlProcessorBase, table_name: str) -> List[Dict[str, Any]]:
+    with processor.get_sql_connection() as connection:
+        result = connection.execute(
+            text(f"SELECT * FROM {processor._fully_qualified(table_name)} ORDER BY id")
+        )
+        return [dict(row._mapping) for row in result]
+
+
+def test_write_files_to_new_table_inserts_records_of_all_files_in_batches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    processor = _processor(tmp_path)
+    monkeypatch.setattr(processor, "bulk_insert_batch_size", 2)
+    inserted_batch_sizes = []
+    bulk_insert_records = processor._bulk_insert_records
+
+    def _bulk_insert_records(connection, table, records):
+        inserted_batch_sizes.append(len(records))
+        bulk_insert_records(connection, table, records)
+
+    monkeypatch.setattr(processor, "_bulk_insert_records", _bulk_insert_records)
+    files = [
+        _write_jsonl(tmp_path / "1.jsonl", [_record(index) for index in range(3)]),
+        _write_jsonl(tmp_path / "2.jsonl.gz", [_record(index) for index in range(3, 5)]),
+    ]
+
+    table_name = processor._write_files_to_new_table(files, _STREAM_NAME, "batch")
+
+    assert inserted_batch_sizes == [2, 1, 2]
+    rows = _rows(processor, table_name)
+    assert [row["id"] for row in rows] == list(range(5))
+    assert rows[1] == {
+        "id": 1,
+        "name": "name 1",
+        "birthday": "2000-01-02",
+        "updated_at": "2024-01-02 03:04:05.000000",
+        "address": '{"city": "city 1"}',
+        "_airbyte_raw_id": "raw-1",
+        "_airbyte_extracted_at": "2024-01-02 03:04:05.678000",
+        "_airbyte_meta": '{"changes": []}',
+    }
+    assert rows[0]["name"] is None
+
+
+def test_given_missing_fields_when_write_files_to_new_table_then_insert_nulls(
+    tmp_path: Path,
+) -> None:
+    processor = _processor(tmp_path)
+    files = [_write_jsonl(tmp_path / "1.jsonl", [{"id": 1}, _record(2)])]
+
+    table_name = processor._write_files_to_new_table(files, _STREAM_NAME, "batch")
+
+    rows = _rows(processor, table_name)
+    assert rows[0] == {
+        "id": 1,
+        "name": None,
+        "birthday": None,
+        "updated_at": None,
+        "address": None,
+        "_airbyte_raw_id": None,
+        "_airbyte_extracted_at": None,
+        "_airbyte_meta": None,
+    }
+    assert rows[1]["name"] is None and rows[1]["birthday"] == "2000-01-02"
+
+
+@pytest.mark.slow
+def test_bulk_load_time(tmp_path: Path) -> None:
+    processor = _processor(tmp_path)
+    records = [_record(index) for index in range(50_000)]
+    for record in records:
+        del record["birthday"]
+    files = [_write_jsonl(tmp_path / "records.jsonl", records)]
+
+    start = time.perf_counter()
+    # The previous implementation, loading the whole file in a dataframe inserted with `to_sql`
+    temp_table_name = processor._create_table_for_loading(_EVENTS_STREAM_NAME, "pandas")
+    sql_column_definitions = processor._get_sql_column_definitions(_EVENTS_STREAM_NAME)
+    dataframe = pd.read_json(files[0], lines=True)
+    dataframe = dataframe.drop(
+        columns=[column for column in dataframe.columns if column not in sql_column_definitions]
+    )
+    dataframe.to_sql(
+        temp_table_name,
+        processor.get_sql_alchemy_url(),
+        schema=processor.sql_config.schema_name,
+        if_exists="append",
+        index=False,
+        dtype=sql_column_definitions,
+    )
+    dataframe_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    table_name = processor._write_files_to_new_table(files, _EVENTS_STREAM_NAME, "bulk")
+    bulk_load_duration = time.perf_counter() - start
+    print(
+        f"Dataframe to_sql: {len(records) / dataframe_duration:,.0f} records/s, "
+        f"streaming bulk load: {len(records) / bulk_load_duration:,.0f} records/s"
+    )
+
+    assert len(_rows(processor, table_name)) == len(records)
+    assert bulk_load_duration < dataframe_duration
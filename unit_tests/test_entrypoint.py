@@ -43,6 +43,7 @@ from airbyte_cdk.models import (
     TraceType,
     Type,
 )
+from airbyte_cdk.models.serialized_airbyte_message import SerializedAirbyteMessage
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.connector_state_manager import HashableStreamDescriptor
 from airbyte_cdk.utils import AirbyteTracedException
@@ -791,3 +792,58 @@ def test_given_serialization_error_using_orjson_then_fallback_on_json(
     # There will be multiple messages here because the fixture `entrypoint` sets a control message. We only care about records here
     record_messages = list(filter(lambda message: "RECORD" in message, messages))
     assert len(record_messages) == 2
+
+
+def test_given_serialized_message_then_airbyte_message_to_string_returns_serialization():
+    message = SerializedAirbyteMessage(
+        AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1),
+        b'{"type":"RECORD","record":{"stream":"stream","data":{"id":1},"emitted_at":1}}',
+    )
+
+    assert (
+        AirbyteEntrypoint.airbyte_message_to_string(message)
+        == '{"type":"RECORD","record":{"stream":"stream","data":{"id":1},"emitted_at":1}}'
+    )
+
+
+@pytest.mark.parametrize("buffered_output", ["true", "false"])
+def test_launch_read_outputs_one_message_per_line(
+    entrypoint: AirbyteEntrypoint,
+    mocker,
+    monkeypatch,
+    capsys,
+    spec_mock,
+    config_mock,
+    buffered_output,
+):
+    monkeypatch.setenv("AIRBYTE_BUFFERED_OUTPUT", buffered_output)
+    record = AirbyteMessage(
+        record=AirbyteRecordMessage(stream="stream", data={"id": 1}, emitted_at=1),
+        type=Type.RECORD,
+    )
+    state = AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(
+                stream_descriptor=StreamDescriptor(name="stream"),
+                stream_state=AirbyteStateBlob({"cursor": 1}),
+            ),
+        ),
+    )
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[record, state, record])
+
+    entrypoint_module.launch(
+        entrypoint.source, ["read", "--config", "config_path", "--catalog", "catalog_path"]
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [orjson.loads(line)["type"] for line in lines] == [
+        "CONTROL",
+        "RECORD",
+        "STATE",
+        "RECORD",
+    ]
+    assert lines[1] == AirbyteEntrypoint.airbyte_message_to_string(record)
@@ -0,0 +1,92 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import airbyte_cdk
+
+_HEAVY_MODULES = [
+    "airbyte_cdk.sources.declarative.models.declarative_component_schema",
+    "airbyte_cdk.sources.declarative.manifest_declarative_source",
+    "pandas",
+]
+
+
+def _imported_modules(statement: str) -> Dict[str, bool]:
+    cmd = (
+        f"import json, sys; {statement}; "
+        f"print(json.dumps({{module: module in sys.modules for module in {_HEAVY_MODULES!r}}}))"
+    )
+    return json.loads(subprocess.check_output([sys.executable, "-c", cmd]))  # type: ignore[no-any-return]
+
+
+def _import_time_in_microseconds(statement: str) -> int:
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    import_time = 0
+    for line in output.splitlines():
+        # Lines look like "import time: self [us] | cumulative | imported package", nested imports being indented
+        _, cumulative, imported_module = line.split("|")
+        if not imported_module.startswith("  ") and cumulative.strip().isdigit():
+            import_time += int(cumulative)
+    return import_time
+
+
+def test_when_import_entrypoint_then_declarative_framework_is_not_imported():
+    assert _imported_modules("from airbyte_cdk.entrypoint import launch") == {
+        module: False for module in _HEAVY_MODULES
+    }
+
+
+def test_when_access_lazy_attribute_then_import_declarative_framework():
+    assert _imported_modules("from airbyte_cdk import ManifestDeclarativeSource") == {
+        "airbyte_cdk.sources.declarative.models.declarative_component_schema": True,
+        "airbyte_cdk.sources.declarative.manifest_declarative_source": True,
+        "pandas": False,
+    }
+
+
+def test_lazy_attributes_are_the_classes_of_their_modules():
+    from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+
+    assert airbyte_cdk.DeclarativeStream is DeclarativeStream
+    assert "DeclarativeStream" in dir(airbyte_cdk)
+
+
+def test_given_unknown_attribute_when_access_then_raise_attribute_error():
+    with pytest.raises(AttributeError):
+        airbyte_cdk.UnknownAttribute
+
+
+@pytest.mark.slow
+def test_entrypoint_import_time():
+    # the first run compiles the modules that were not compiled yet
+    _import_time_in_microseconds(
+        "import airbyte_cdk.sources.declarative.manifest_declarative_source"
+    )
+    entrypoint_import_time = min(
+        _import_time_in_microseconds("from airbyte_cdk.entrypoint import launch") for _ in range(3)
+    )
+    declarative_import_time = min(
+        _import_time_in_microseconds(
+            "from airbyte_cdk.entrypoint import launch; "
+            "from airbyte_cdk import ManifestDeclarativeSource"
+        )
+        for _ in range(3)
+    )
+    print(
+        f"Importing airbyte_cdk.entrypoint: {entrypoint_import_time / 1000:.1f} ms, "
+        f"with the declarative framework: {declarative_import_time / 1000:.1f} ms"
+    )
+
+    assert entrypoint_import_time < declarative_import_time
@@ -0,0 +1,31 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import io
+
+import pytest
+
+from airbyte_cdk.utils.line_reader import read_lines
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b'{"a": 1}\n{"a": 2}\n', id="trailing_line_feed"),
+        pytest.param(b'{"a": 1}\n{"a": 2}', id="no_trailing_line_feed"),
+        pytest.param(b'{"a": 1}\r\n\n{"a": 2}\r\n', id="crlf_and_empty_line"),
+        pytest.param(b"", id="empty"),
+    ],
+)
+def test_read_lines_is_equivalent_to_iterating_over_binary_file(content, chunk_size):
+    assert list(read_lines(io.BytesIO(content), chunk_size)) == list(io.BytesIO(content))
+
+
+def test_given_text_stream_when_read_lines_then_return_str_lines():
+    assert list(read_lines(io.StringIO("a\nb"), 1)) == ["a\n", "b"]
+
+
+def test_given_iterable_without_read_when_read_lines_then_return_elements():
+    assert list(read_lines([b"a", b"b"])) == [b"a", b"b"]
@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from airbyte_cdk.utils.message_writer import BufferedMessageWriter
+
+_A_LONG_FLUSH_INTERVAL = 3600.0
+
+
+def test_given_buffer_not_full_when_write_then_nothing_is_written():
+    stream = io.BytesIO()
+    writer = BufferedMessageWriter(
+        stream, max_buffer_size=1024, flush_interval=_A_LONG_FLUSH_INTERVAL
+    )
+
+    writer.write(b'{"type":"RECORD"}')
+
+    assert stream.getvalue() == b""
+
+
+def test_given_buffer_full_when_write_then_write_all_lines():
+    stream = io.BytesIO()
+    writer = BufferedMessageWriter(
+        stream, max_buffer_size=10, flush_interval=_A_LONG_FLUSH_INTERVAL
+    )
+
+    writer.write(b"12345")
+    writer.write(b"6789")
+
+    assert stream.getvalue() == b"12345\n6789\n"
+
+
+def test_given_flush_when_write_then_write_buffer():
+    stream = io.BytesIO()
+    writer = BufferedMessageWriter(
+        stream, max_buffer_size=1024, flush_interval=_A_LONG_FLUSH_INTERVAL
+    )
+
+    writer.write(b"record")
+    writer.write(b"state", flush=True)
+
+    assert stream.getvalue() == b"record\nstate\n"
+
+
+@patch("airbyte_cdk.utils.message_writer.time")
+def test_given_flush_interval_elapsed_when_write_then_write_buffer(time_mock):
+    time_mock.monotonic.side_effect = [0.0, 0.05, 0.2, 0.2]
+    stream = io.BytesIO()
+    writer = BufferedMessageWriter(stream, max_buffer_size=1024, flush_interval=0.1)
+
+    writer.write(b"first")
+    assert stream.getvalue() == b""
+    writer.write(b"second")
+
+    assert stream.getvalue() == b"first\nsecond\n"
+
+
+def test_when_exit_context_then_write_buffer():
+    stream = io.BytesIO()
+
+    with BufferedMessageWriter(stream, flush_interval=_A_LONG_FLUSH_INTERVAL) as writer:
+        writer.write(b"record")
+
+    assert stream.getvalue() == b"record\n"
+
+
+def test_given_text_stream_when_flush_then_flush_text_stream_before_writing():
+    stream = io.BytesIO()
+    text_stream = Mock()
+    text_stream.flush.side_effect = lambda: stream.write(b"log\n")
+    writer = BufferedMessageWriter(stream, text_stream=text_stream)
+
+    writer.write(b"record", flush=True)
+
+    assert stream.getvalue() == b"log\nrecord\n"
+
+
+def test_given_concurrent_writes_then_lines_are_not_split():
+    stream = io.BytesIO()
+    writer = BufferedMessageWriter(stream, max_buffer_size=100)
+    lines = [str(index).encode() * 10 for index in range(1_000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(writer.write, lines))
+    writer.flush()
+
+    assert sorted(stream.getvalue().splitlines()) == sorted(lines)